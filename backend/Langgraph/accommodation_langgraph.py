@@ -15,6 +15,7 @@ from agents.tool.accommodation_tools import (
     search_accommodations,
     summarize_reviews,
     compare_booking_prices,
+    compare_booking_prices_batch,
     get_recommended_accommodations
 )
 
@@ -23,6 +24,7 @@ tools = [
     search_accommodations,
     summarize_reviews,
     compare_booking_prices,
+    compare_booking_prices_batch,
     get_recommended_accommodations
 ]
 
@@ -33,6 +35,7 @@ system_prompt = """당신은 숙소 추천 전문 AI입니다.
 1. search_accommodations - 숙소 검색
 2. summarize_reviews - AI 리뷰 요약
 3. compare_booking_prices - 가격 비교
+   compare_booking_prices_batch - 검색된 숙소 여러 곳의 가격을 한 번에 비교 (숙소마다 compare_booking_prices를 반복 호출하지 마세요)
 4. get_recommended_accommodations - AI 추천
 
 사용자 요청에 가장 적합한 tool을 선택하세요.
@@ -70,6 +73,18 @@ class AccommodationGraphWrapper:
         return {
             "final_response": final_message
         }
+    
+    async def ainvoke(self, state: dict) -> dict:
+        """invoke의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        user_input = state.get("user_input", "")
+        
+        result = await _accommodation_react_agent.ainvoke({
+            "messages": [("user", user_input)]
+        })
+        
+        return {
+            "final_response": result["messages"][-1].content
+        }
 
 # Export
 accommodation_graph = AccommodationGraphWrapper()
@@ -70,6 +70,18 @@ class DessertGraphWrapper:
         return {
             "final_response": final_message
         }
+    
+    async def ainvoke(self, state: dict) -> dict:
+        """invoke의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        user_input = state.get("user_input", "")
+        
+        result = await _dessert_react_agent.ainvoke({
+            "messages": [("user", user_input)]
+        })
+        
+        return {
+            "final_response": result["messages"][-1].content
+        }
 
 # Export
 dessert_graph = DessertGraphWrapper()
@@ -1,7 +1,9 @@
 """Region LangGraph Orchestrator"""
 from typing import TypedDict, Literal, Optional
 from langgraph.graph import StateGraph, END
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
+import asyncio
 import os
 from dotenv import load_dotenv
 
@@ -22,19 +24,8 @@ class RegionState(TypedDict):
     final_response: str
 
 
-def classify_intent(state: RegionState) -> RegionState:
-    """
-    사용자 의도 파악 + 목적지 추출
-    
-    - "recommend": 특정 도시의 지역 추천
-    - "attraction": 명소 검색
-    - "best_time": 최적 방문 시기
-    - "popular": 인기 여행지 추천
-    """
-    user_input = state["user_input"]
-    
-    # 의도 파악
-    prompt = f"""다음 사용자 입력의 의도를 파악하세요:
+def _build_intent_prompt(user_input: str) -> str:
+    return f"""다음 사용자 입력의 의도를 파악하세요:
 
 "{user_input}"
 
@@ -46,20 +37,17 @@ def classify_intent(state: RegionState) -> RegionState:
 
 의도만 답하세요 (recommend, attraction, best_time, popular 중 하나):"""
 
-    response = get_llm().invoke(prompt)
-    intent = response.content.strip().lower()
-    
-    # 목적지 추출
-    destination_prompt = f"""다음 텍스트에서 목적지만 추출하세요:
+
+def _build_destination_prompt(user_input: str) -> str:
+    return f"""다음 텍스트에서 목적지만 추출하세요:
 
 "{user_input}"
 
 목적지만 답하세요 (예: 부산, 제주도, 춘천, 강릉 등).
 목적지가 없으면 "없음"이라고 답하세요:"""
 
-    dest_response = get_llm().invoke(destination_prompt)
-    destination = dest_response.content.strip()
-    
+
+def _apply_intent(state: RegionState, intent: str, destination: str) -> RegionState:
     if destination == "없음":
         destination = None
     
@@ -70,6 +58,45 @@ def classify_intent(state: RegionState) -> RegionState:
     return state
 
 
+def classify_intent(state: RegionState) -> RegionState:
+    """
+    사용자 의도 파악 + 목적지 추출
+    
+    - "recommend": 특정 도시의 지역 추천
+    - "attraction": 명소 검색
+    - "best_time": 최적 방문 시기
+    - "popular": 인기 여행지 추천
+    """
+    user_input = state["user_input"]
+    
+    # 의도 파악
+    response = get_llm().invoke(_build_intent_prompt(user_input))
+    intent = response.content.strip().lower()
+    
+    # 목적지 추출
+    dest_response = get_llm().invoke(_build_destination_prompt(user_input))
+    destination = dest_response.content.strip()
+    
+    return _apply_intent(state, intent, destination)
+
+
+async def aclassify_intent(state: RegionState) -> RegionState:
+    """classify_intent의 비동기 버전 - 의도 파악/목적지 추출 LLM 호출을 동시에 실행"""
+    user_input = state["user_input"]
+    llm = get_llm()
+    
+    response, dest_response = await asyncio.gather(
+        llm.ainvoke(_build_intent_prompt(user_input)),
+        llm.ainvoke(_build_destination_prompt(user_input))
+    )
+    
+    return _apply_intent(
+        state,
+        response.content.strip().lower(),
+        dest_response.content.strip()
+    )
+
+
 def recommend_agent(state: RegionState) -> RegionState:
     """Recommend Agent - 지역 추천"""
     from agents.tool.region_tools import recommend_regions_tool
@@ -140,7 +167,7 @@ def route_to_agent(state: RegionState) -> Literal["recommend", "attraction", "be
 workflow = StateGraph(RegionState)
 
 # 노드 추가
-workflow.add_node("classify", classify_intent)
+workflow.add_node("classify", RunnableLambda(classify_intent, afunc=aclassify_intent))  # ainvoke 시 비동기 노드 사용
 workflow.add_node("recommend", recommend_agent)
 workflow.add_node("attraction", attraction_agent)
 workflow.add_node("best_time", best_time_agent)
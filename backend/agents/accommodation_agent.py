@@ -15,6 +15,7 @@ from tools.accommodation_tools import (
     search_accommodations,
     summarize_reviews,
     compare_booking_prices,
+    compare_booking_prices_batch,
     get_recommended_accommodations,
     accommodation_tools  # 전체 툴 리스트
 )
@@ -47,6 +48,10 @@ class AccommodationAgent:
         """가격 비교 (편의 메서드)"""
         return compare_booking_prices.func(place_name, check_in, check_out, **kwargs)
     
+    def compare_prices_batch(self, places: list, check_in: str, check_out: str, **kwargs):
+        """검색 결과 숙소 전체 가격 비교 (편의 메서드)"""
+        return compare_booking_prices_batch.func(places, check_in, check_out, **kwargs)
+    
     def recommend(self, region: str, user_preference: str, num_results: int = 3):
         """AI 추천 (편의 메서드)"""
         return get_recommended_accommodations.func(region, user_preference, num_results)
@@ -0,0 +1,190 @@
+"""
+Token-Budgeted Conversation Memory
+Coordinator 대화 기록을 토큰 예산 안에서 유지하는 메모리
+
+- 최근 K턴은 원문 그대로 유지
+- 오래된 턴은 누적 요약(running summary)에 점진적으로 합침 (기존 요약 + 새 턴만 요약)
+- 에이전트 결과(TravelFlowState.agent_results에 저장됨)가 담긴 답변은 짧은 참조로 치환
+  - 요약에 합치는 턴: 항상
+  - 최근 K턴: 같은 종류의 결과가 더 최근 턴에 다시 나왔으면 (사용자가 번호로 고를 최신 목록만 원문 유지)
+- 요약은 예산의 SUMMARY_MAX_SHARE 이하로 유지 (넘으면 오래된 줄부터 삭제, LLM 요약/로컬 요약 모두)
+- 토큰 수는 로컬에서 계산 (agents/utils/token_counter.py)
+"""
+
+import os
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+from agents.utils.token_counter import count_message_tokens, count_tokens
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TOKENS = int(os.getenv("COORDINATOR_MEMORY_MAX_TOKENS", 3000))
+DEFAULT_KEEP_TURNS = int(os.getenv("COORDINATOR_MEMORY_KEEP_TURNS", 6))
+# 요약이 차지할 수 있는 토큰 예산 비율
+SUMMARY_MAX_SHARE = 0.3
+
+# agent_results 키 → 참조 문구
+RESULT_LABELS = {
+    'region_recommendations': "지역 추천",
+    'restaurant_recommendations': "맛집 추천",
+    'cafe_recommendations': "카페 추천",
+    'accommodation_recommendations': "숙소 추천",
+    'landmark_recommendations': "관광지 추천",
+}
+
+# (기존 요약, 새로 합칠 대화 텍스트) -> 갱신된 요약
+Summarizer = Callable[[str, str], str]
+
+
+def llm_summarizer(previous_summary: str, new_lines: str) -> str:
+    """gpt-4o-mini로 누적 요약 갱신 (기존 요약 + 새 대화만 입력)"""
+    from langchain_openai import ChatOpenAI
+
+    prompt = f"""여행 플래너와 사용자의 대화 요약을 갱신하세요.
+
+기존 요약:
+{previous_summary or "(없음)"}
+
+새 대화:
+{new_lines}
+
+규칙:
+- 사용자가 정한 목적지/지역/날짜/예산/인원/선택한 장소는 반드시 유지
+- 인사말, 추천 목록 나열은 생략
+- 5줄 이내 한국어 요약만 출력"""
+
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    return llm.invoke(prompt).content.strip()
+
+
+def _fallback_summarizer(previous_summary: str, new_lines: str) -> str:
+    """LLM 요약 실패 시: 각 줄을 잘라 붙이는 로컬 요약"""
+    clipped = "\n".join(line[:80] for line in new_lines.splitlines() if line.strip())
+    return f"{previous_summary}\n{clipped}".strip()
+
+
+def clip_summary(summary: str, max_tokens: int) -> str:
+    """요약이 max_tokens를 넘으면 오래된(앞쪽) 줄부터 삭제 (마지막 한 줄도 넘으면 뒤쪽만 남김)"""
+    lines = summary.splitlines()
+    while len(lines) > 1 and count_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    clipped = "\n".join(lines)
+    while clipped and count_tokens(clipped) > max_tokens:
+        clipped = clipped[len(clipped) // 4 or 1:]
+    return clipped
+
+
+class TokenBudgetMemory:
+    """토큰 예산 기반 Coordinator 대화 메모리"""
+
+    def __init__(
+        self,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        keep_turns: int = DEFAULT_KEEP_TURNS,
+        summarizer: Optional[Summarizer] = None
+    ):
+        self.max_tokens = max_tokens
+        self.keep_turns = keep_turns
+        self.summarizer = summarizer or llm_summarizer
+        self.summary = ""
+        # [{"user": str, "ai": str, "refs": [agent_results 키]}]
+        self.turns: List[Dict[str, Any]] = []
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """프롬프트에 넣을 메시지 (요약 + 최근 턴 원문)"""
+        messages: List[BaseMessage] = []
+        if self.summary:
+            messages.append(SystemMessage(content=f"## 이전 대화 요약\n{self.summary}"))
+        for turn, ai in zip(self.turns, self._ai_texts(self.turns)):
+            messages.append(HumanMessage(content=turn["user"]))
+            messages.append(AIMessage(content=ai))
+        return messages
+
+    @classmethod
+    def _ai_texts(cls, turns: List[Dict[str, Any]]) -> List[str]:
+        """최근 턴 답변 (같은 종류의 결과가 더 최근 턴에 다시 나왔으면 참조로 치환)"""
+        texts = []
+        newer_refs = set()
+        for turn in reversed(turns):
+            refs = set(turn.get("refs") or ())
+            superseded = bool(refs) and refs <= newer_refs
+            texts.append(cls._compact_ai(turn) if superseded else turn["ai"])
+            newer_refs |= refs
+        return texts[::-1]
+
+    def token_count(self) -> int:
+        return self._count_tokens(self.turns)
+
+    def _count_tokens(self, turns: List[Dict[str, Any]]) -> int:
+        """요약 + turns를 프롬프트에 넣었을 때의 토큰 수"""
+        contents = [self.summary] if self.summary else []
+        for turn, ai in zip(turns, self._ai_texts(turns)):
+            contents.extend([turn["user"], ai])
+        return count_message_tokens(contents)
+
+    def save_turn(self, user_input: str, ai_output: str, result_refs: Optional[List[str]] = None) -> None:
+        """턴 추가 후 예산을 넘으면 오래된 턴을 요약에 합침
+
+        Args:
+            result_refs: 이 턴의 답변에 포함된 agent_results 키 (예: ["restaurant_recommendations"])
+        """
+        self.turns.append({"user": user_input, "ai": ai_output, "refs": list(result_refs or [])})
+        self._enforce_budget()
+
+    def clear(self) -> None:
+        self.summary = ""
+        self.turns = []
+
+    def _enforce_budget(self) -> None:
+        # 1) K턴 초과분
+        fold_count = max(len(self.turns) - self.keep_turns, 0)
+
+        # 2) 토큰 예산 초과 시 최소 1턴은 남기고 더 합침
+        while fold_count < len(self.turns) - 1:
+            if self._count_tokens(self.turns[fold_count:]) <= self.max_tokens:
+                break
+            fold_count += 1
+
+        if fold_count > 0:
+            folded, self.turns = self.turns[:fold_count], self.turns[fold_count:]
+            self._fold(folded)
+
+    def _fold(self, turns: List[Dict[str, Any]]) -> None:
+        """오래된 턴을 누적 요약에 합침 (기존 요약은 다시 요약하지 않고 입력으로만 사용)"""
+        lines = []
+        for turn in turns:
+            lines.append(f"사용자: {turn['user']}")
+            lines.append(f"플래너: {self._compact_ai(turn)}")
+        new_lines = "\n".join(lines)
+
+        try:
+            self.summary = self.summarizer(self.summary, new_lines)
+        except Exception as e:
+            logger.warning(f"⚠️ 대화 요약 실패, 로컬 요약 사용: {e}")
+            self.summary = _fallback_summarizer(self.summary, new_lines)
+        self.summary = clip_summary(self.summary, int(self.max_tokens * SUMMARY_MAX_SHARE))
+
+        logger.info(f"🧠 대화 {len(turns)}턴 요약에 합침 (현재 {self.token_count()} 토큰)")
+
+    @staticmethod
+    def _compact_ai(turn: Dict[str, Any]) -> str:
+        """에이전트 결과가 담긴 답변은 FlowState 참조로 치환"""
+        if not turn.get("refs"):
+            return turn["ai"]
+        labels = ", ".join(RESULT_LABELS.get(ref, ref) for ref in turn["refs"])
+        return f"[{labels} 결과 제시 - FlowState.agent_results 참조]"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """세션 저장소 직렬화용"""
+        return {"summary": self.summary, "turns": self.turns}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TokenBudgetMemory":
+        memory = cls()
+        memory.summary = data.get("summary", "")
+        memory.turns = data.get("turns", [])
+        return memory
@@ -0,0 +1,117 @@
+"""
+Cat Speech Transformer
+LLM 호출 없이 문장 끝(다/요/까/니)을 고양이 말투로 바꾸는 규칙 기반 변환기
+
+- "~다."      → "~다냥."           (예: "맛있다." → "맛있다냥.")
+- "~에요/예요" → "~다냥"            (예: "맛집이에요" → "맛집이다냥", "아니에요" → "아니다냥")
+- 받침 없는 "~요" → 요를 빼고 "냥"   (예: "있어요" → "있어냥", "할게요" → "할게냥")
+- 그 외 "~요"  → "~요냥"           (예: "필요." → "필요냥.", "가세요" → "가세요냥")
+- "~까"       → "~까냥"           (예: "갈까?" → "갈까냥?")
+- "~니?"      → "~냥?"            (의문형만, 예: "먹었니?" → "먹었냥?")
+
+이미 "냥"이 있는 줄, 코드 블록, URL, 번호 목록/제목/표 줄은 건드리지 않는다.
+결정적(deterministic) 변환이라 같은 입력이면 항상 같은 출력.
+
+환경 변수:
+- CAT_SPEECH_MODE: "rule"(기본, 규칙 기반) / "llm"(기존 LLM 변환)
+- CAT_SPEECH_INTENSITY: 변환할 문장 비율 0.0~1.0 (기본 0.6, 마지막 문장은 항상 변환)
+"""
+
+import os
+import re
+from typing import List, Tuple
+
+CAT_SPEECH_MODE = os.getenv("CAT_SPEECH_MODE", "rule").lower()
+CAT_SPEECH_INTENSITY = min(max(float(os.getenv("CAT_SPEECH_INTENSITY", 0.6)), 0.0), 1.0)
+
+# 문장 끝 어미: 뒤에 문장부호가 오거나, 줄 끝(뒤에 이모지/마크다운 기호만 있는 경우 포함)
+_ENDING_RE = re.compile(
+    r"(?P<prev>[가-힣]?)(?P<end>에요|예요|[다요까니])"
+    r"(?=(?P<punct>[.!?~…]+)|[ \t]*[^\w\s]*[ \t]*$)",
+    re.M,
+)
+
+# 받침 없는 음절 뒤의 요는 빼고 냥을 붙임 (있어요 → 있어냥, 예뻐요 → 예뻐냥)
+# 단, "~세요"는 "~세냥"이 어색하므로 제외
+_YO_KEEP_PREV = {"세"}
+
+# 변환하지 않는 줄: 번호 목록 항목("**1. 이름**"), 제목, 표, URL
+_SKIP_LINE_RE = re.compile(r"^\s*(?:\**\d+\.|#|\|)|https?://")
+
+_FENCE = "```"
+
+
+def _has_no_final(syllable: str) -> bool:
+    """한글 음절에 받침이 없는지"""
+    return (ord(syllable) - 0xAC00) % 28 == 0
+
+
+def _convert(match: re.Match) -> str:
+    """어미 하나를 고양이 말투로 변환 (변환하지 않으면 원문 그대로)"""
+    prev, end, punct = match.group("prev"), match.group("end"), match.group("punct")
+
+    if end in ("에요", "예요"):
+        return f"{prev}다냥"
+    if end == "요":
+        if prev and prev not in _YO_KEEP_PREV and _has_no_final(prev):
+            return f"{prev}냥"
+        return f"{prev}요냥"
+    if end == "니":
+        # 서술형 "언니", "어머니" 등 명사와 구분하기 위해 의문형만
+        if punct and punct.startswith("?"):
+            return f"{prev}냥"
+        return match.group(0)
+    # 다, 까
+    return f"{prev}{end}냥"
+
+
+def _find_candidates(lines: List[str]) -> List[Tuple[int, re.Match]]:
+    """변환 후보 어미 목록 (줄 번호, 매치)"""
+    candidates = []
+    in_code = False
+    for idx, line in enumerate(lines):
+        if line.lstrip().startswith(_FENCE):
+            in_code = not in_code
+            continue
+        if in_code or "냥" in line or "`" in line or _SKIP_LINE_RE.search(line):
+            continue
+        for match in _ENDING_RE.finditer(line):
+            candidates.append((idx, match))
+    return candidates
+
+
+def _is_selected(index: int, total: int, intensity: float) -> bool:
+    """intensity 비율만큼 고르게 분산 선택 (마지막 문장은 항상 선택)"""
+    if intensity <= 0:
+        return False
+    if index == total - 1:
+        return True
+    return int((index + 1) * intensity) > int(index * intensity)
+
+
+def to_cat_speech(text: str, intensity: float = CAT_SPEECH_INTENSITY) -> str:
+    """텍스트의 문장 끝을 고양이 말투로 변환
+
+    Args:
+        text: 원문
+        intensity: 변환할 문장 비율 (0.0이면 변환 안 함, 1.0이면 모든 문장)
+
+    Returns:
+        변환된 텍스트 (이미 "냥"이 포함된 텍스트는 그대로)
+    """
+    if not text or "냥" in text:
+        return text
+
+    lines = text.split("\n")
+    candidates = _find_candidates(lines)
+    total = len(candidates)
+
+    # 같은 줄 안에서 뒤쪽 매치부터 치환해야 앞쪽 위치가 유지됨
+    for i in range(total - 1, -1, -1):
+        if not _is_selected(i, total, intensity):
+            continue
+        idx, match = candidates[i]
+        line = lines[idx]
+        lines[idx] = line[:match.start()] + _convert(match) + line[match.end():]
+
+    return "\n".join(lines)
@@ -1,12 +1,24 @@
-"""Kkachil Character Layer - 까칠이 톤 변환 (입출력 라우터)"""
+"""Kkachil Character Layer - 까칠이 톤 변환 (입출력 라우터)
+
+환경 변수:
+- KKACHIL_MODE: "rule"(기본, 로컬 규칙 기반 변환) / "remote"(까칠이 모델 서버, 실패 시 규칙 기반)
+"""
+
+import os
 
 from openai import OpenAI
 from .state import TravelAgentState
+from .cat_speech import to_cat_speech
 
 
 # 까칠이 서버 설정
 KKACHIL_SERVER = "https://lapgr-125-6-60-4.a.free.pinggy.link/v1"
 KKACHIL_MODEL = "/home/kampuser/notebooks/models/kkachil-cat-merged"
+KKACHIL_MODE = os.getenv("KKACHIL_MODE", "rule").lower()
+
+# 규칙 기반 변환의 츤데레 시작/마무리
+KKACHIL_OPENING = "...흠, 귀찮지만 알려주겠다냥."
+KKACHIL_CLOSING = "별로 기대는 하지 말라냥."
 
 KKACHIL_SYSTEM_PROMPT = """너의 이름은 까칠이고 츤데레 성격의 새끼고양이이며 여행을 도와주는 도우미야.
 사용자를 집사로 여기고 겉으로는 귀찮아하지만 속으로는 챙겨주는 성격이야. 말투는 까칠하게 하고 말끝에 '냥'을 붙여줘.
@@ -19,17 +31,28 @@ KKACHIL_SYSTEM_PROMPT = """너의 이름은 까칠이고 츤데레 성격의 새
 **너는 전문가 에이전트가 작성한 정보를 까칠이 말투로만 변환하는 역할이야. 정보 자체는 바꾸지 마!**"""
 
 
+def to_kkachil_speech(text: str) -> str:
+    """규칙 기반 까칠이 톤 변환 (문장 끝 변환 + 츤데레 시작/마무리)"""
+    return f"{KKACHIL_OPENING}\n\n{to_cat_speech(text)}\n\n{KKACHIL_CLOSING}"
+
+
 def kkachil_character_node(state: TravelAgentState) -> TravelAgentState:
     """
     까칠이 캐릭터 레이어
     - GPT-4 에이전트의 전문적 응답을 까칠이 톤으로 변환
     - 정보는 유지하되 말투만 변경
+    - 기본은 로컬 규칙 기반, KKACHIL_MODE=remote면 까칠이 모델 서버 사용
     """
     agent_response = state.get("final_response", "")
     
     if not agent_response:
         return state
     
+    if KKACHIL_MODE != "remote":
+        return {
+            "final_response": to_kkachil_speech(agent_response)
+        }
+    
     print(f"[Kkachil Character Layer] 톤 변환 중...")
     
     client = OpenAI(
@@ -69,8 +92,7 @@ def kkachil_character_node(state: TravelAgentState) -> TravelAgentState:
         
     except Exception as e:
         print(f"까칠이 톤 변환 실패: {e}")
-        # 폴백: 간단한 프리픽스/포스트픽스 추가
-        kkachil_fallback = f"...흠, 귀찮지만 알려주겠다냥.\n\n{agent_response}\n\n별로 기대는 하지 말라냥."
+        # 폴백: 규칙 기반 변환
         return {
-            "final_response": kkachil_fallback
+            "final_response": to_kkachil_speech(agent_response)
         }
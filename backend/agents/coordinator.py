@@ -4,14 +4,23 @@ LangChain Agent 기반 - 10단계 플로우 + 자율 판단
 """
 
 import os
+import asyncio
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
-from langchain.agents import create_openai_functions_agent, AgentExecutor
+from langchain.agents import create_openai_tools_agent, AgentExecutor
 from langchain.tools import tool
+from langchain_core.tools import StructuredTool
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.memory import ConversationBufferMemory
+from agents.budgeted_memory import TokenBudgetMemory
+from agents.coordinator_prompt import SHARED_PROMPT, compose_prompt_for_state
+from agents.flow_tracker import track_turn
+from agents import fast_path
+from agents.parallel_executor import ParallelAgentExecutor
+from agents.direct_search import try_direct_search, atry_direct_search
+from agents.session_store import session_store, register_codec, NS_MEMORY, NS_PERSONA
 from agents.itinerary_generator import generate_daily_itinerary
+from agents.utils.keyword_engine import match_keywords
 
 load_dotenv()
 
@@ -22,14 +31,126 @@ def get_llm():
 
 # ==================== Agent Tools ====================
 
-@tool
-def call_restaurant_agent(query: str) -> str:
+def tool_with_async(coroutine):
+    """sync 함수 + async 버전을 함께 가진 Tool 생성 데코레이터
+
+    invoke()는 sync 함수를, ainvoke()는 coroutine을 사용하므로
+    비동기 Coordinator에서 하위 에이전트를 ainvoke로 호출할 수 있다.
+    """
+    def decorator(func):
+        return StructuredTool.from_function(func=func, coroutine=coroutine)
+    return decorator
+
+
+async def _ainvoke_subagent(graph_loader, query: str, not_found: str, error_label: str, direct=None) -> str:
+    """하위 LangGraph 에이전트 비동기 호출 공통 처리
+
+    Args:
+        direct: (agent, region, category) - 지정되면 direct 검색 먼저 시도 (agents/direct_search.py)
+    """
+    try:
+        if direct:
+            response = await atry_direct_search(*direct)
+            if response is not None:
+                return response
+        graph = graph_loader()
+        result = await graph.ainvoke({"user_input": query})
+        return result.get("final_response", not_found)
+    except Exception as e:
+        return f"{error_label} 에러냥... 😿 ({str(e)})"
+
+
+def _load_restaurant_graph():
+    from Langgraph.restaurant_langgraph import restaurant_graph
+    return restaurant_graph
+
+
+def _load_dessert_graph():
+    from Langgraph.dessert_langgraph import dessert_graph
+    return dessert_graph
+
+
+def _load_accommodation_graph():
+    from Langgraph.accommodation_langgraph import accommodation_graph
+    return accommodation_graph
+
+
+def _load_landmark_graph():
+    from Langgraph.landmark_langgraph import landmark_graph
+    return landmark_graph
+
+
+def _load_region_graph():
+    from Langgraph.region_langgraph import region_graph
+    return region_graph
+
+
+async def _acall_restaurant_agent(query: str, region: Optional[str] = None, category: Optional[str] = None) -> str:
+    return await _ainvoke_subagent(
+        _load_restaurant_graph, query, "맛집 정보를 찾지 못했어냥...", "맛집 Agent",
+        direct=("restaurant", region, category)
+    )
+
+
+async def _acall_dessert_agent(query: str, region: Optional[str] = None, category: Optional[str] = None) -> str:
+    return await _ainvoke_subagent(
+        _load_dessert_graph, query, "카페 정보를 찾지 못했어냥...", "카페 Agent",
+        direct=("dessert", region, category)
+    )
+
+
+async def _acall_accommodation_agent(query: str, region: Optional[str] = None, category: Optional[str] = None) -> str:
+    return await _ainvoke_subagent(
+        _load_accommodation_graph, query, "숙소 정보를 찾지 못했어냥...", "숙소 Agent",
+        direct=("accommodation", region, category)
+    )
+
+
+async def _acall_landmark_agent(query: str, region: Optional[str] = None, category: Optional[str] = None) -> str:
+    return await _ainvoke_subagent(
+        _load_landmark_graph, query, "관광지 정보를 찾지 못했어냥...", "관광지 Agent",
+        direct=("landmark", region, category)
+    )
+
+
+async def _acall_region_agent(query: str) -> str:
+    return await _ainvoke_subagent(_load_region_graph, query, "지역 정보를 찾지 못했어냥...", "지역 Agent")
+
+
+async def _acall_chat_agent(query: str) -> str:
+    try:
+        response = await get_llm().ainvoke(_build_chat_prompt(query))
+        return response.content
+    except Exception as e:
+        return f"대화 Agent 에러냥... 😿 ({str(e)})"
+
+
+def _build_chat_prompt(query: str) -> str:
+    return f"""
+        사용자 질문: {query}
+        
+        귀여운 고양이 말투로 답변하세요.
+        - 문장 끝: "~냥", "~다냥", "~할까냥?"
+        - 이모지 사용: 😸, 🐾, 😻
+        - 짧고 친근하게
+        """
+
+
+@tool_with_async(_acall_restaurant_agent)
+def call_restaurant_agent(query: str, region: Optional[str] = None, category: Optional[str] = None) -> str:
     """맛집 추천 Agent 호출
     
     Args:
         query: 맛집 검색 요청 (예: "강남 한식 맛집", "부산 해운대 일식")
+        region: 검색 지역 - 목적지 + 세부 지역 (예: "부산 해운대"), 알면 지정
+        category: 음식 종류 (예: "일식", "라멘"), 알면 지정
+        (region과 category를 모두 지정하면 하위 Agent 없이 바로 검색)
     """
     try:
+        direct = try_direct_search("restaurant", region, category)
+        if direct is not None:
+            return direct
+        
         from Langgraph.restaurant_langgraph import restaurant_graph
         result = restaurant_graph.invoke({"user_input": query})
         return result.get("final_response", "맛집 정보를 찾지 못했어냥...")
@@ -37,14 +158,21 @@ def call_restaurant_agent(query: str) -> str:
         return f"맛집 Agent 에러냥... 😿 ({str(e)})"
 
 
-@tool
-def call_dessert_agent(query: str) -> str:
+@tool_with_async(_acall_dessert_agent)
+def call_dessert_agent(query: str, region: Optional[str] = None, category: Optional[str] = None) -> str:
     """카페/디저트 추천 Agent 호출
     
     Args:
         query: 카페/디저트 검색 요청 (예: "홍대 루프탑 카페", "강남 오션뷰 카페")
+        region: 검색 지역 - 목적지 + 세부 지역 (예: "부산 해운대"), 알면 지정
+        category: 카페 종류 (예: "루프탑 카페", "베이커리 카페"), 알면 지정
+        (region과 category를 모두 지정하면 하위 Agent 없이 바로 검색)
     """
     try:
+        direct = try_direct_search("dessert", region, category)
+        if direct is not None:
+            return direct
+        
         from Langgraph.dessert_langgraph import dessert_graph
         result = dessert_graph.invoke({"user_input": query})
         return result.get("final_response", "카페 정보를 찾지 못했어냥...")
@@ -52,14 +180,21 @@ def call_dessert_agent(query: str) -> str:
         return f"카페 Agent 에러냥... 😿 ({str(e)})"
 
 
-@tool
-def call_accommodation_agent(query: str) -> str:
+@tool_with_async(_acall_accommodation_agent)
+def call_accommodation_agent(query: str, region: Optional[str] = None, category: Optional[str] = None) -> str:
     """숙소 추천 Agent 호출
     
     Args:
         query: 숙소 검색 요청 (예: "제주도 한옥스테이", "부산 풀빌라")
+        region: 검색 지역 - 목적지 + 세부 지역 (예: "부산 해운대"), 알면 지정
+        category: 숙소 종류 (예: "호텔", "한옥스테이"), 알면 지정
+        (region과 category를 모두 지정하면 하위 Agent 없이 바로 검색)
     """
     try:
+        direct = try_direct_search("accommodation", region, category)
+        if direct is not None:
+            return direct
+        
         from Langgraph.accommodation_langgraph import accommodation_graph
         result = accommodation_graph.invoke({"user_input": query})
         return result.get("final_response", "숙소 정보를 찾지 못했어냥...")
@@ -67,14 +202,21 @@ def call_accommodation_agent(query: str) -> str:
         return f"숙소 Agent 에러냥... 😿 ({str(e)})"
 
 
-@tool
-def call_landmark_agent(query: str) -> str:
+@tool_with_async(_acall_landmark_agent)
+def call_landmark_agent(query: str, region: Optional[str] = None, category: Optional[str] = None) -> str:
     """관광지 추천 Agent 호출
     
     Args:
         query: 관광지 검색 요청 (예: "서울 랜드마크", "경주 자연 명소")
+        region: 검색 지역 - 목적지 + 세부 지역 (예: "부산 해운대"), 알면 지정
+        category: 관광지 종류 (예: "자연", "박물관"), 알면 지정
+        (region과 category를 모두 지정하면 하위 Agent 없이 바로 검색)
     """
     try:
+        direct = try_direct_search("landmark", region, category)
+        if direct is not None:
+            return direct
+        
         from Langgraph.landmark_langgraph import landmark_graph
         result = landmark_graph.invoke({"user_input": query})
         return result.get("final_response", "관광지 정보를 찾지 못했어냥...")
@@ -118,7 +260,7 @@ def call_itinerary_generator(day_number: int, date: str, departure_time: str, de
         return f"일정표 생성 에러냥... 😿 ({str(e)})"
 
 
-@tool
+@tool_with_async(_acall_region_agent)
 def call_region_agent(query: str) -> str:
     """지역 정보 Agent 호출
     
@@ -133,7 +275,7 @@ def call_region_agent(query: str) -> str:
         return f"지역 Agent 에러냥... 😿 ({str(e)})"
 
 
-@tool
+@tool_with_async(_acall_chat_agent)
 def call_chat_agent(query: str) -> str:
     """일반 대화 Agent 호출
     
@@ -142,15 +284,7 @@ def call_chat_agent(query: str) -> str:
     """
     try:
         llm = get_llm()
-        prompt = f"""
-        사용자 질문: {query}
-        
-        귀여운 고양이 말투로 답변하세요.
-        - 문장 끝: "~냥", "~다냥", "~할까냥?"
-        - 이모지 사용: 😸, 🐾, 😻
-        - 짧고 친근하게
-        """
-        response = llm.invoke(prompt)
+        response = llm.invoke(_build_chat_prompt(query))
         return response.content
     except Exception as e:
         return f"대화 Agent 에러냥... 😿 ({str(e)})"
@@ -158,374 +292,44 @@ def call_chat_agent(query: str) -> str:
 
 # ==================== Coordinator Agent ====================
 
-COORDINATOR_PROMPT = """당신은 귀여운 냥이 여행 플래너입니다냥! 🐱
-
-## 🚨 핵심 규칙 (절대 위반 금지!)
-
-**❌ 절대 금지: 에이전트 결과 1개만 표시**
-- 에이전트가 반환한 **모든 결과**를 표시하세요
-- 1개만 선택해서 보여주면 안 됩니다
-- 예: 5개 결과 → 5개 모두 표시
-- 예: 2개 결과 → 2개 모두 표시
-
-
-### 규칙 1: 에이전트 자동 호출 (최우선!)
-플로우 내에서 사용자가 선호도를 말하면 **즉시 해당 에이전트를 호출**하세요!
-
-**중요: 에이전트 결과는 모두 표시!**
-- 에이전트가 반환한 **모든 결과**를 사용자에게 보여주세요
-- 1개만 선택하지 말고 **전체 리스트** 표시
-- 예: 5개 결과 → 5개 모두 표시
-
-**6단계 (맛집)**: 사용자가 음식 종류를 말하면 → **즉시 call_restaurant_agent 호출**
-- 예: "일식" → call_restaurant_agent("[지역] 일식")
-- 예: "이자카야" → call_restaurant_agent("[지역] 이자카야")  
-- 예: "라멘 먹고 싶어" → call_restaurant_agent("[지역] 라멘")
-- 예: "파스타랑 닭갈비" → call_restaurant_agent("[지역] 파스타") + call_restaurant_agent("[지역] 닭갈비")
-
-**중요: 에이전트 호출 후 반드시 선택 요청!**
-- 맛집 (점심/저녁): "1개만 골라달라냥! 😸 (예: 1)"
-- 카페: "1개만 골라달라냥! 😸 (예: 2)"
-- 숙소: "1개만 골라달라냥! 😸 (예: 1)"
-- 관광지: "여러 개 골라도 된다냥! 😸 (예: 1,2,3)"
-
-**7단계 (카페)**: 사용자가 카페 종류를 말하면 → **즉시 call_dessert_agent 호출** → 선택 요청
-- 예: "루프탑 카페" → call_dessert_agent("[지역] 루프탑 카페") → "골라달라냥!"
-
-**8단계 (숙소)**: 사용자가 숙소 종류를 말하면 → **즉시 call_accommodation_agent 호출** → 선택 요청
-- 예: "한옥스테이" → call_accommodation_agent("[지역] 한옥스테이") → "골라달라냥!"
-
-**9단계 (관광지)**: 사용자가 관광지 종류를 말하면 → **즉시 call_landmark_agent 호출** → 선택 요청
-- 예: "랜드마크" → call_landmark_agent("[지역] 랜드마크") → "골라달라냥!"
-
-**[지역]**: 수집된 목적지 + 세부 지역 (예: "부산 해운대")
-
-### 규칙 2: 플로우 관리
-- 단계별로 **순차 진행** (1→2→3→...→10)
-- 각 단계 완료 후 다음 단계로 자동 이동
-- 예외 처리 시: 플로우 일시 정지 → 예외 처리 → 플로우 재개
-- 예외 처리 완료 후: "자, 다시 [단계 이름]로 돌아가자냥! 😸"
-- 중단된 질문을 다시 물어보기
-
-### 규칙 2-1: 선택 처리 (중요!)
-**사용자가 숫자로 응답하면 (예: "1,2", "1번 2번", "첫번째"):
-- ✅ 선택으로 인식
-- ❌ 에이전트 재호출 절대 금지!
-- ✅ 선택 확인 후 다음 단계로 이동
-
-예시:
-사용자: "1,2"
-AI: "디에이블 광안점이랑 피클스를 선택했구나냥! 😸 
-     좋은 선택이다냥! 다음 단계로 갈까냥?"
-
-
-
-### 규칙 2-2: 일차별 완료 조건 (매우 중요!)
-
-**1일차 완료 순서:**
-1. 점심 맛집 → 선택 완료
-2. 저녁 맛집 → 선택 완료
-3. 카페 → 선택 완료 ← 저녁 후 반드시 카페!
-4. 숙소 → 선택 완료
-5. 관광지 → 선택 완료
-
-**모든 5가지 활동을 완료한 후에만:**
-"1일차 완료! 일정표를 만들어줄게냥! 📝"
-
-**중요: 반드시 call_itinerary_generator 호출!**
-- 인수: day_number=1, date="2025-12-13", departure_time="오전 9시", departure_location="서울역", transport_mode="car"
-- FlowState에서 수집한 정보 사용
-
-**일정표 생성:**
-- 출발지, 도착지, 이동 수단 포함
-- GPS 기반 경로 + 구글 맵 URL
-- 시간별 상세 일정
-- 모든 선택한 활동 포함
-
-**일정표 표시 후:**
-"2일차 계획할까냥? 😸"
-
-**절대 금지:**
-- 저녁 후 바로 2일차로 넘어가기 ❌
-- 카페/숙소/관광지 건너뛰기 ❌
-
-### 규칙 3: 말투 유지
-
-- 문장 끝: "~냥", "~다냥", "~할까냥?", "~이냥!"
-- 이모지 사용: 😸, 🐾, 😻, 🎉, ✨
-
----
-
-## 📋 10단계 플로우
-
-### 1단계: 목적지 (대분류)
-"안녕하다냥! 😸 어디로 가고 싶냥? (예: 부산, 제주도, 서울)"
-
-**중요: 다중 목적지 vs 단일 목적지 구분!**
-
-**다중 목적지 감지:**
-사용자가 "대구에서 놀다가 부산 가고싶어" 또는 "부산 제주 가고싶어!" 같이 **여러 목적지**를 말하면:
-
-"부산이랑 제주 둘 다 가고 싶냥? 😸
-어느 곳을 먼저 계획할까냥?
-
-1️⃣ 부산
-2️⃣ 제주
-3️⃣ 둘 다 (각각 따로 계획)
-
-골라달라냥! 🐾"
-
-→ 사용자가 선택하면 해당 목적지로 진행
-→ "둘 다" 선택 시: 첫 번째 목적지 계획 완료 후 두 번째 목적지 계획 시작
-
-**단일 목적지:**
-사용자가 "부산" 또는 "제주도" 같이 **하나의 목적지**만 말하면:
-→ 바로 2단계(세부 지역)로 이동
-
-
-### 2단계: 세부 지역 (소분류)
-목적지를 받으면 → **call_region_agent("[목적지]")** 호출
-예: "부산이냥! 🐾 어디 가볼까냥?
-- 해운대 (해변, 맛집)
-- 광안리 (야경, 카페)
-- 남포동 (쇼핑, 먹거리)
-
-마음에 드는 곳 **다 골라도** 된다냥! 😸"
-
-### 2-1단계: 세부 지역 1개 받은 경우 (중요!)
-**필수**: 사용자가 "해운대" 또는 "부산 해운대" 말하면:
-1. **해운대 선택 확인**
-2. **반드시 call_region_agent 재호출** (해운대 제외한 다른 지역 추천)
-3. "없다"고 말해도 괜찮다고 알려주기
-4. **예시 응답 (반드시 이 형식 따르기)**:
-   "부산 해운대를 가고 싶구나냥! 😸
-    
-    해운대 말고도 다른 곳도 추천해줄까냥?
-    - 광안리 (야경 맛집)
-    - 남포동 (쇼핑 천국)
-    - 기장 (자연 힐링)
-    
-    다른 데도 가보고 싶으면 골라냥!
-    해운대만 갈 거면 '없다'고 말해도 괜찮다냥! 😻"
-
-### 2-2단계: 세부 지역 여러 개 받은 경우
-사용자가 "광안리, 남포동" 또는 "광안리랑 남포동" 말하면:
-1. **선택 목록 보여주기**
-2. 확인 받기
-3. 예시 응답:
-   "광안리랑 남포동이냥! 😻
-    
-    지금까지 선택한 곳:
-    ✅ 해운대
-    ✅ 광안리
-    ✅ 남포동
-    
-    이대로 확정할까냥? 아니면 다른 곳도 더 볼까냥?"
-
-### 2-3단계: 확정 받은 경우
-사용자가 "확정", "좋아", "이대로", "없어" 등 말하면:
-1. 세부 지역 선택 완료
-2. 다음 단계(날짜)로 이동
-3. 예시 응답:
-   "좋다냥! 😸 그럼 언제 여행 가냥?"
-
-### 3단계: 날짜
-"언제 여행 가냥? 😸 
-시작일이랑 종료일 알려달라냥!
-(예: 2025/12/13 ~ 12/15)"
-
-### 4단계: 예산
-"예산은 얼마나 있냥? 💰
-(예: 50만원, 100만원, 200만원)"
-
-**중요:** 사용자가 숫자만 입력하면 (예: "50") → "50만원이냥?" 확인 필요
-
-### 5단계: 인원
-"몇 명이서 가냥? 🐾"
-
-### 6단계: 출발 시간
-"몇 시에 출발할 거냥? ⏰
-(예: 오전 9시, 아침 8시)"
-
-### 7단계: 출발 장소
-"어디서 출발할 거냥? 📍
-(예: 서울역, 집, 인천공항)"
-
----
-
-## 🍽️ 일차별 식사 계획 시작!
-
-**중요: FlowState 컨텍스트를 확인하세요!**
-- current_day: 현재 몇 일차인지
-- total_days: 전체 며칠인지
-- 상태: 첫날/중간/마지막 구분
-
-### 8단계: 맛집 선호도 (일차별!)
-
-**음식 종류 선택지 (모든 식사에 동일하게 표시):**
-- 한식 (전통, 현대식, 퓨전)
-- 일식 (초밥, 라멘, 이자카야)
-- 양식 (파스타, 스테이크)
-- 중식 (짜장, 마라탕)
-- 아시안 (태국, 베트남)
-- 특별한 거 (미슐랭, 오마카세)
-
-**1일차 (첫날):**
-1. "1일차 점심에 뭐 먹고 싶냥? 🍽️
-   [위 음식 종류 선택지 표시]"
-   
-   → 응답 받기 → **즉시 call_restaurant_agent 호출**
-   → 맛집 리스트 표시
-   → **"1개만 골라달라냥! 😸 (예: 1)"**
-   → 선택 받기
-   → "좋은 선택이다냥! 😸"
-
-2. "1일차 저녁에 뭐 먹고 싶냥? 🍽️
-   [위 음식 종류 선택지 표시]"
-   
-   → 응답 받기 → **즉시 call_restaurant_agent 호출**
-   → 맛집 리스트 표시
-   → **"1개만 골라달라냥! 😸 (예: 1)"**
-   → 선택 받기
-   → "좋은 선택이다냥! 😸"
-
-**중요: 반드시 선택을 받아야 다음 단계로 이동!**
-
-**2일차 이후 (중간 날):**
-1. "X일차 아침에 뭐 먹고 싶냥? 🍳 [음식 선택지]" → 에이전트 호출 → 선택 요청
-2. "X일차 점심에 뭐 먹고 싶냥? 🍽️ [음식 선택지]" → 에이전트 호출 → 선택 요청
-3. "X일차 저녁에 뭐 먹고 싶냥? 🍽️ [음식 선택지]" → 에이전트 호출 → 선택 요청
-
-**마지막 날:**
-1. "마지막 날 아침에 뭐 먹고 싶냥? 🍳 [음식 선택지]" → 에이전트 호출 → 선택 요청
-2. "마지막 날 점심에 뭐 먹고 싶냥? 🍽️ [음식 선택지]" (선택적) → 에이전트 호출 → 선택 요청
-
-### 9단계: 카페 선호도
-
-
-"2️⃣ 카페/디저트 ☕
-어떤 카페 가고 싶냥?
-- 루프탑 카페 (야경 감상, 분위기)
-- 오션뷰 카페 (바다 뷰, 힐링)
-- 감성 카페 (인테리어, 사진 맛집)
-- 베이커리 카페 (빵, 디저트 맛집)
-- 테마 카페 (북카페, 애견카페, 보드게임)
-- 디저트 전문점 (케이크, 마카롱, 빙수)"
-
-사용자 응답 → **즉시 call_dessert_agent 호출!**
-→ 결과 보여주고 → **일차별 선택 안내:**
-
-"이 중에서 골라달라냥! 😸
-📅 여행 일정에 맞춰서 일차별로 골라줘!
-
-**일차별로 골라줘:**
-예시)
-1일차: A카페
-2일차: B카페, C카페
-3일차: D카페
-
-이렇게 말해주면 된다냥! 🐾"
-
-→ 사용자 확인 후 다음 단계로
-
-### 8단계: 숙소 선호도
-"3️⃣ 숙소 🏨
-어떤 숙소 원하냥?
-- 호텔 (편안함, 서비스, 조식)
-- 모텔 (가성비, 편리함, 주차)
-- 게스트하우스 (저렴, 소통, 공용 공간)
-- 한옥스테이 (전통 한옥, 온돌 체험, 한국 문화)
-- 료칸 (일본식 온천, 다다미, 가이세키)
-- 글램핑 (캠핑 + 호텔, 자연 속, 바베큐)
-- 풀빌라 (개인 수영장, 프라이빗, 럭셔리)
-- 오션뷰 리조트 (바다 전망, 리조트 시설)
-- 펜션 (독채, 가족/친구, 취사 가능)
-- 캐핑카 (이동식 숙소, 자유로움)
-- 트리하우스 (나무 위 집, 특별한 경험)
-- 컨테이너 하우스 (감성 숙소, SNS 핫플)"
-
-사용자 응답 → **즉시 call_accommodation_agent 호출!**
-→ 결과 보여주고 → **일차별 선택 안내:**
-
-"이 중에서 골라달라냥! 😸
-📅 여행 일정에 맞춰서 일차별로 골라줘!
-
-**일차별로 골라줘:**
-예시)
-1일차: A숙소
-2일차: B숙소
-(마지막 날은 숙소 필요 없다냥!)
-
-이렇게 말해주면 된다냥! 🐾"
-
-→ 사용자 확인 후 다음 단계로
-
-### 9단계: 관광지 선호도
-"4️⃣ 관광지 🏛️
-어디 가보고 싶냥?
-- 랜드마크 (유명한 곳, 포토존, 대표 명소)
-- 자연 (해변, 산, 공원, 폭포, 계곡)
-- 문화 (박물관, 미술관, 전시관, 역사 유적)
-- 쇼핑 (시장, 거리, 아울렛, 면세점)
-- 액티비티 (체험, 놀이, 테마파크, 레저)"
-
-사용자 응답 → **즉시 call_landmark_agent 호출!**
-→ 결과 보여주고 → **일차별 선택 안내:**
-
-"이 중에서 골라달라냥! 😸
-📅 여행 일정에 맞춰서 일차별로 골라줘!
-
-**일차별로 골라줘:**
-예시)
-1일차: A관광지, B관광지
-2일차: C관광지
-3일차: D관광지, E관광지
+# Prompt는 단계별로 조립 (agents/coordinator_prompt.py)
+# - SHARED_PROMPT: 매 턴 동일한 공통 prefix
+# - step_prompt: 현재/다음 단계 섹션만
 
-이렇게 말해주면 된다냥! 🐾"
 
-→ 사용자 확인 후 다음 단계로
 
+# Coordinator Agent 초기화
+COORDINATOR_LLM_TAG = "coordinator_llm"  # 스트리밍 시 Coordinator 토큰 구분용
+# 한 스텝의 여러 Tool 호출 병렬 실행 ("on" 기본, "off"면 순차 실행)
+PARALLEL_TOOLS = os.getenv("COORDINATOR_PARALLEL_TOOLS", "on").lower() != "off"
+coordinator_agent = None
 
-### 10단계: 일정 생성
-모든 정보 수집 완료 → 일정 요약 및 제안
-
----
-
-## 🔀 예외 처리 (플로우 이탈)
-
-사용자가 플로우 순서를 안 지키면:
 
-### 일반 질문
-User: "부산 날씨 어때?"
-→ call_chat_agent("부산 날씨 어때?")
-→ 답변 후: "자, 다시 [중단된 단계]로 돌아가자냥!"
+# ==================== Session State ====================
+# 세션별 대화 기록/페르소나는 공용 세션 저장소에 보관 (agents/session_store.py)
 
-### 순서 무시하고 특정 요청
-User: "숙소부터 찾고 싶어"
-→ 지역 확인 후 call_accommodation_agent 호출
-→ 완료 후: "좋다냥! 그럼 다시 플로우로 돌아가자냥!"
+def _new_memory() -> TokenBudgetMemory:
+    # 최근 K턴 원문 + 누적 요약 (토큰 예산: COORDINATOR_MEMORY_* 환경 변수)
+    return TokenBudgetMemory()
 
----
 
-## 💡 중요 포인트
+register_codec(NS_MEMORY, TokenBudgetMemory.to_dict, TokenBudgetMemory.from_dict)
 
-1. **에이전트 호출은 필수**: 6~9단계에서 사용자가 선호도를 말하면 무조건 에이전트 호출
-2. **일반 대화 금지**: "일식 좋은 선택이냥!" 같은 일반 대화만 하지 말고, 반드시 에이전트 호출
-3. **지역 정보 포함**: 에이전트 호출 시 "[목적지] [세부지역] [선호도]" 형식 사용
-4. **플로우 복귀**: 예외 처리 후 반드시 원래 단계로 돌아가기
-5. **Tool 사용 우선**: 정보 검색이 필요하면 직접 답변하지 말고 Tool 사용
-6. **세부 지역 재추천**: 사용자가 1개 지역만 선택하면 다른 지역도 추천해주기
-"""
+# 에이전트 Tool → FlowState.agent_results 키
+AGENT_RESULT_KEYS = {
+    "call_region_agent": "region_recommendations",
+    "call_restaurant_agent": "restaurant_recommendations",
+    "call_dessert_agent": "cafe_recommendations",
+    "call_accommodation_agent": "accommodation_recommendations",
+    "call_landmark_agent": "landmark_recommendations",
+}
 
+# 페르소나 조회 결과가 없을 때 저장하는 값 (재조회 방지)
+_NO_PERSONA: Dict[str, Any] = {}
 
 
-# Coordinator Agent 초기화
-coordinator_agent = None
-conversation_memories = {}
-user_personas = {}
-
 try:
-    llm = get_llm()
+    llm = get_llm().with_config(tags=[COORDINATOR_LLM_TAG])
     
     # 기본 Agent Tools (항상 사용 가능)
     coordinator_tools = [
@@ -579,12 +383,14 @@ try:
             search_accommodations,
             summarize_reviews,
             compare_booking_prices,
+            compare_booking_prices_batch,
             get_recommended_accommodations
         )
         coordinator_tools.extend([
             search_accommodations,
             summarize_reviews,
             compare_booking_prices,
+            compare_booking_prices_batch,
             get_recommended_accommodations,
         ])
         print("✅ Accommodation Tools 로드 성공")
@@ -611,19 +417,23 @@ try:
         print(f"⚠️ Landmark Tools 로드 실패 (기본 agent만 사용): {e}")
     
     coordinator_prompt = ChatPromptTemplate.from_messages([
-        ("system", COORDINATOR_PROMPT),
+        ("system", SHARED_PROMPT),
+        ("system", "{step_prompt}"),
         MessagesPlaceholder(variable_name="chat_history"),
         ("human", "{input}"),
         MessagesPlaceholder(variable_name="agent_scratchpad"),
     ])
     
-    coordinator_executor = create_openai_functions_agent(llm, coordinator_tools, coordinator_prompt)
-    coordinator_agent = AgentExecutor(
+    # tools agent: 한 스텝에서 여러 Tool 호출 가능 (parallel tool calls)
+    coordinator_executor = create_openai_tools_agent(llm, coordinator_tools, coordinator_prompt)
+    executor_class = ParallelAgentExecutor if PARALLEL_TOOLS else AgentExecutor
+    coordinator_agent = executor_class(
         agent=coordinator_executor,
         tools=coordinator_tools,
         verbose=True,
         max_iterations=10,
-        handle_parsing_errors=True
+        handle_parsing_errors=True,
+        return_intermediate_steps=True  # 에이전트 결과를 FlowState에 기록
     )
     print("✅ Coordinator Agent 초기화 성공")
     print(f"   📍 총 {len(coordinator_tools)}개 Tools 로드됨")
@@ -632,111 +442,223 @@ except Exception as e:
     print("   ℹ️ 서버는 정상 시작되지만 Coordinator 기능은 사용 불가")
 
 
-def get_coordinator_response(message: str, session_id: str = "default", user_id: str = "default_user") -> str:
-    """Coordinator Agent 호출"""
-    if not coordinator_agent:
-        return "Coordinator Agent가 초기화되지 않았어냥... 😿"
+def _is_reset_message(message: str) -> bool:
+    """새로운 여행 계획 시작 요청인지 (agents/utils/keyword_engine.py의 "reset" 그룹)"""
+    return match_keywords(message).has("reset")
+
+
+def _try_fast_path(message: str, session_id: str) -> Optional[str]:
+    """선택/슬롯 답변이면 LLM 없이 템플릿으로 응답 (agents/fast_path.py)
+
+    Returns:
+        응답 문자열 (처리 불가 시 None → Coordinator Agent로 처리)
+    """
+    from agents.flow_state import get_flow_state, save_flow_state
     
-    try:
-        # FlowState 가져오기
-        from agents.flow_state import get_flow_state, reset_flow_state
-        
-        # 새로운 여행 계획 시작 키워드 감지
-        reset_keywords = ["여행 계획 시작", "새로운 여행", "처음부터", "다시 시작", "초기화"]
-        should_reset = any(keyword in message for keyword in reset_keywords)
-        
-        if should_reset:
-            # FlowState 초기화
-            reset_flow_state(session_id)
-            print(f"🔄 FlowState 초기화됨 (세션: {session_id})")
-            
-            # ConversationMemory도 초기화
-            if session_id in conversation_memories:
-                conversation_memories[session_id].clear()
-                print(f"🔄 대화 기록 초기화됨 (세션: {session_id})")
-        
-        flow_state = get_flow_state(session_id)
+    if _is_reset_message(message):
+        return None
+    
+    flow_state = get_flow_state(session_id)
+    response = fast_path.route(message, flow_state)
+    if response is None:
+        return None
+    
+    memory = session_store.get(NS_MEMORY, session_id)
+    if memory is None:
+        memory = _new_memory()
+    memory.save_turn(message, response)
+    session_store.set(NS_MEMORY, session_id, memory)
+    save_flow_state(session_id, flow_state)
+    
+    print(f"⚡ Fast path 응답 (세션: {session_id}, 단계: {flow_state.current_step})")
+    return response
 
+
+def _prepare_coordinator_turn(message: str, session_id: str, user_id: str):
+    """세션 상태(FlowState/Memory/페르소나)를 준비하고 Coordinator 입력을 구성
+
+    Returns:
+        (flow_state, memory, agent_input) 튜플
+        agent_input: coordinator_agent 입력 dict (input, chat_history, step_prompt)
+    """
+    # FlowState 가져오기
+    from agents.flow_state import get_flow_state, reset_flow_state
+    
+    # 새로운 여행 계획 시작 키워드 감지
+    should_reset = _is_reset_message(message)
+    
+    if should_reset:
+        # FlowState 초기화
+        reset_flow_state(session_id)
+        print(f"🔄 FlowState 초기화됨 (세션: {session_id})")
         
-        # Memory 초기화
-        if session_id not in conversation_memories:
-            conversation_memories[session_id] = ConversationBufferMemory(
-                memory_key="chat_history",
-                return_messages=True
-            )
-        
-        memory = conversation_memories[session_id]
-        
-        # 페르소나 로드
-        if session_id not in user_personas:
-            try:
-                from agents.persona_agent import agent as persona_agent
-                persona_result = persona_agent.get(user_id)
-                
-                if persona_result.get('success') and persona_result.get('data'):
-                    persona = persona_result['data'][0]
-                    user_personas[session_id] = persona
-                    print(f"✅ 페르소나 로드 성공: {user_id}")
-                else:
-                    print(f"⚠️ 페르소나 없음: {user_id}")
-                    user_personas[session_id] = None
-            except Exception as e:
-                print(f"❌ 페르소나 로드 실패: {e}")
-                user_personas[session_id] = None
-        
-        # 페르소나 컨텍스트
-        persona_context = ""
-        if user_personas.get(session_id):
-            persona = user_personas[session_id]
-            persona_context = f"""
+        # ConversationMemory도 초기화
+        session_store.delete(NS_MEMORY, session_id)
+        print(f"🔄 대화 기록 초기화됨 (세션: {session_id})")
+    
+    flow_state = get_flow_state(session_id)
+
+    
+    # Memory 초기화
+    memory = session_store.get(NS_MEMORY, session_id)
+    if memory is None:
+        memory = _new_memory()
+        session_store.set(NS_MEMORY, session_id, memory)
+    
+    # 페르소나 로드
+    persona = session_store.get(NS_PERSONA, session_id)
+    if persona is None:
+        persona = _NO_PERSONA
+        try:
+            from agents.persona_agent import agent as persona_agent
+            persona_result = persona_agent.get(user_id)
+            
+            if persona_result.get('success') and persona_result.get('data'):
+                persona = persona_result['data'][0]
+                print(f"✅ 페르소나 로드 성공: {user_id}")
+            else:
+                print(f"⚠️ 페르소나 없음: {user_id}")
+        except Exception as e:
+            print(f"❌ 페르소나 로드 실패: {e}")
+        session_store.set(NS_PERSONA, session_id, persona)
+    
+    # 페르소나 컨텍스트
+    persona_context = ""
+    if persona:
+        persona_context = f"""
 
 👤 사용자 페르소나 (참고용):
 - 연령대: {persona.get('age_group', '정보없음')}
 - 여행 스타일: {', '.join(persona.get('travel_style', []))}
 - 음식 선호: {', '.join(persona.get('food_preferences', []))}
 """
+    
+    # FlowState 컨텍스트 추가
+    flow_context = flow_state.get_context_for_prompt()
+    
+    # 박수/일수 계산
+    nights = 0
+    days = 0
+    trip_duration_text = ""
+    
+    if flow_state.collected_info.get('start_date') and flow_state.collected_info.get('end_date'):
+        try:
+            from datetime import datetime
+            start = datetime.strptime(flow_state.collected_info['start_date'], "%Y/%m/%d")
+            end = datetime.strptime(flow_state.collected_info['end_date'], "%Y/%m/%d")
+            days = (end - start).days + 1
+            nights = days - 1
+            trip_duration_text = f"\n\n📅 여행 기간: {nights}박 {days}일"
+        except:
+            pass
+    
+    # 전체 입력 구성
+    full_input = message + persona_context + flow_context + trip_duration_text
+    
+    print(f"\n=== FlowState 정보 ===")
+    print(f"현재 단계: {flow_state.current_step} ({flow_state.get_step_name()})")
+    print(f"플로우 내부: {flow_state.is_in_flow}")
+    print(f"수집된 정보: {flow_state.collected_info}")
+    if nights > 0:
+        print(f"여행 기간: {nights}박 {days}일")
+    
+    agent_input = {
+        "input": full_input,
+        "chat_history": memory.messages,
+        "step_prompt": compose_prompt_for_state(flow_state)
+    }
+    return flow_state, memory, agent_input
+
+
+def _record_agent_results(flow_state, intermediate_steps) -> list:
+    """call_*_agent Tool 결과를 FlowState.agent_results에 저장하고 저장한 키 목록 반환"""
+    refs = []
+    for action, observation in intermediate_steps or []:
+        key = AGENT_RESULT_KEYS.get(getattr(action, "tool", None))
+        if key:
+            flow_state.agent_results[key] = observation
+            if key not in refs:
+                refs.append(key)
+    return refs
+
+
+def _finish_coordinator_turn(session_id: str, message: str, response: str, flow_state, memory: TokenBudgetMemory, intermediate_steps=None) -> None:
+    """대화 기록 추가 후 세션 상태를 저장소에 다시 기록 (영속 저장소 반영)
+
+    토큰 예산을 넘으면 요약 LLM 호출이 일어날 수 있으므로 async 경로에서는 스레드에서 실행
+    """
+    from agents.flow_state import save_flow_state
+    
+    refs = _record_agent_results(flow_state, intermediate_steps)
+    track_turn(flow_state, message, intermediate_steps)
+    
+    # Memory 저장 (오래된 턴은 요약, 에이전트 결과는 참조로 치환)
+    memory.save_turn(message, response, result_refs=refs)
+    session_store.set(NS_MEMORY, session_id, memory)
+    save_flow_state(session_id, flow_state)
+
+
+def get_coordinator_response(message: str, session_id: str = "default", user_id: str = "default_user") -> str:
+    """Coordinator Agent 호출"""
+    if not coordinator_agent:
+        return "Coordinator Agent가 초기화되지 않았어냥... 😿"
+    
+    try:
+        fast_response = _try_fast_path(message, session_id)
+        if fast_response is not None:
+            return fast_response
         
-        # FlowState 컨텍스트 추가
-        flow_context = flow_state.get_context_for_prompt()
+        flow_state, memory, agent_input = _prepare_coordinator_turn(message, session_id, user_id)
         
-        # 박수/일수 계산
-        nights = 0
-        days = 0
-        trip_duration_text = ""
+        # Coordinator Agent 호출
+        result = coordinator_agent.invoke(agent_input)
         
-        if flow_state.collected_info.get('start_date') and flow_state.collected_info.get('end_date'):
-            try:
-                from datetime import datetime
-                start = datetime.strptime(flow_state.collected_info['start_date'], "%Y/%m/%d")
-                end = datetime.strptime(flow_state.collected_info['end_date'], "%Y/%m/%d")
-                days = (end - start).days + 1
-                nights = days - 1
-                trip_duration_text = f"\n\n📅 여행 기간: {nights}박 {days}일"
-            except:
-                pass
+        response = result.get("output", "응답 생성 실패냥...")
         
-        # 전체 입력 구성
-        full_input = message + persona_context + flow_context + trip_duration_text
+        # Memory 저장
+        _finish_coordinator_turn(
+            session_id, message, response, flow_state, memory,
+            result.get("intermediate_steps")
+        )
         
-        print(f"\n=== FlowState 정보 ===")
-        print(f"현재 단계: {flow_state.current_step} ({flow_state.get_step_name()})")
-        print(f"플로우 내부: {flow_state.is_in_flow}")
-        print(f"수집된 정보: {flow_state.collected_info}")
-        if nights > 0:
-            print(f"여행 기간: {nights}박 {days}일")
+        print(f"\n=== 응답 완료 ===")
+        print(f"응답: {response[:200]}...")
+        
+        return response
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return f"에러 발생냥... 😿 ({str(e)})"
+
+
+async def aget_coordinator_response(message: str, session_id: str = "default", user_id: str = "default_user") -> str:
+    """Coordinator Agent 비동기 호출
+
+    Coordinator/하위 에이전트 모두 ainvoke로 실행되어 이벤트 루프를 막지 않는다.
+    (페르소나 DB 조회 등 blocking 준비 단계는 스레드에서 실행)
+    """
+    if not coordinator_agent:
+        return "Coordinator Agent가 초기화되지 않았어냥... 😿"
+    
+    try:
+        fast_response = await asyncio.to_thread(_try_fast_path, message, session_id)
+        if fast_response is not None:
+            return fast_response
+        
+        flow_state, memory, agent_input = await asyncio.to_thread(
+            _prepare_coordinator_turn, message, session_id, user_id
+        )
         
         # Coordinator Agent 호출
-        result = coordinator_agent.invoke({
-            "input": full_input,
-            "chat_history": memory.chat_memory.messages
-        })
+        result = await coordinator_agent.ainvoke(agent_input)
         
         response = result.get("output", "응답 생성 실패냥...")
         
         # Memory 저장
-        memory.save_context(
-            {"input": message},
-            {"output": response}
+        await asyncio.to_thread(
+            _finish_coordinator_turn,
+            session_id, message, response, flow_state, memory,
+            result.get("intermediate_steps")
         )
         
         print(f"\n=== 응답 완료 ===")
@@ -747,3 +669,70 @@ def get_coordinator_response(message: str, session_id: str = "default", user_id:
         import traceback
         traceback.print_exc()
         return f"에러 발생냥... 😿 ({str(e)})"
+
+
+async def stream_coordinator_response(message: str, session_id: str = "default", user_id: str = "default_user"):
+    """Coordinator Agent 스트리밍 호출
+
+    astream_events로 Coordinator LLM 토큰과 call_*_agent Tool 시작/종료를
+    이벤트 단위로 흘려보낸다. 마지막에는 항상 "final" 이벤트가 나온다.
+
+    Yields:
+        dict: {"event": "token" | "tool_start" | "tool_end" | "final" | "error", ...}
+    """
+    if not coordinator_agent:
+        yield {"event": "final", "response": "Coordinator Agent가 초기화되지 않았어냥... 😿"}
+        return
+    
+    try:
+        fast_response = await asyncio.to_thread(_try_fast_path, message, session_id)
+        if fast_response is not None:
+            yield {"event": "final", "response": fast_response}
+            return
+        
+        flow_state, memory, agent_input = await asyncio.to_thread(
+            _prepare_coordinator_turn, message, session_id, user_id
+        )
+        
+        response = None
+        intermediate_steps = None
+        async for event in coordinator_agent.astream_events(agent_input, version="v1"):
+            kind = event["event"]
+            name = event.get("name", "")
+            
+            if kind == "on_chat_model_stream":
+                # Sub-agent LLM 토큰은 제외 (Coordinator LLM만)
+                if COORDINATOR_LLM_TAG not in event.get("tags", []):
+                    continue
+                content = event["data"]["chunk"].content
+                if content:
+                    yield {"event": "token", "content": content}
+            elif kind == "on_tool_start" and name.startswith("call_"):
+                yield {
+                    "event": "tool_start",
+                    "tool": name,
+                    "input": event["data"].get("input")
+                }
+            elif kind == "on_tool_end" and name.startswith("call_"):
+                yield {"event": "tool_end", "tool": name}
+            elif kind == "on_chain_end" and name == coordinator_agent.get_name():
+                output = event["data"].get("output") or {}
+                response = output.get("output")
+                intermediate_steps = output.get("intermediate_steps")
+        
+        response = response or "응답 생성 실패냥..."
+        
+        # Memory 저장
+        await asyncio.to_thread(
+            _finish_coordinator_turn,
+            session_id, message, response, flow_state, memory, intermediate_steps
+        )
+        
+        print(f"\n=== 스트리밍 응답 완료 ===")
+        print(f"응답: {response[:200]}...")
+        
+        yield {"event": "final", "response": response}
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        yield {"event": "error", "message": f"에러 발생냥... 😿 ({str(e)})"}
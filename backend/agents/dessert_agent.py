@@ -5,9 +5,11 @@ import logging
 from typing import Optional, List, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-import googlemaps
 from langchain_openai import ChatOpenAI
 from schemas.data_models import PlaceData, AgentResponse, UserPersona
+from agents.utils.places_gateway import get_places_gateway
+from agents.utils.ranking import CandidateBatch
+from agents.utils.entity_resolver import EntityResolver
 
 # 1. 환경 설정
 load_dotenv()
@@ -20,7 +22,7 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("openai").setLevel(logging.WARNING)
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = get_places_gateway()
 
 # --- [Helper] 페르소나 점수 계산 ---
 def calculate_persona_score(place: dict, persona: Optional[UserPersona]) -> float:
@@ -42,15 +44,7 @@ def calculate_persona_score(place: dict, persona: Optional[UserPersona]) -> floa
             if kw in place_name: score += 0.1
     return min(score, 1.0)
 
-# --- [Helper] 리뷰 품질 점수 계산 ---
-def calculate_review_quality_score(place_dict: dict) -> float:
-    import math
-    rating = place_dict.get('rating', 0)
-    review_count = place_dict.get('user_ratings_total', 0)
-    rating_score = rating * 10
-    review_score = min(30, math.log(review_count + 1) * 5)
-    persona_score = place_dict.get('persona_score', 0.5) * 20
-    return rating_score + review_score + persona_score
+# 리뷰 품질 점수(평점 + 리뷰 수 + 페르소나)는 CandidateBatch.quality_scores로 일괄 계산
 
 # --- [Step 1] 통합 검색 (초경량 모드) ---
 def search_desserts_integrated(region: str, keyword: str, num_results: int = 5, persona: Optional[UserPersona] = None) -> AgentResponse:
@@ -58,35 +52,32 @@ def search_desserts_integrated(region: str, keyword: str, num_results: int = 5,
         # 0. Serper 웹 검색 (2단계 전략)
         place_names_from_web = []
         try:
-            from agents.utils.serper_utils import search_with_serper, extract_place_names
+            from agents.utils.serper_utils import search_many, extract_place_names
             
-            # 1차: 메뉴 특화 검색 (사용자 입력 그대로)
             if keyword:
+                # 1차: 메뉴 특화 검색 (사용자 입력 그대로)
+                # 2차: 일반 검색 (메뉴에서 카테고리 추출, 예: "딸기 케이크" → "케이크")
+                # 두 쿼리를 배치 요청 1회로 함께 검색하고 2차 결과는 1차가 부족할 때만 사용
                 search_query_specific = f"{region} {keyword}"
-                logger.warning(f"🌐 Serper 1차 검색 (메뉴 특화): {search_query_specific}")
-                serper_results = search_with_serper(search_query_specific, num_results=10)
+                general_category = keyword.split()[-1] if ' ' in keyword else keyword
+                queries = [search_query_specific]
+                if general_category != keyword:  # 메뉴 특화와 다른 경우만
+                    queries.append(f"{region} {general_category}")
+                logger.warning(f"🌐 Serper 검색: {queries}")
+                serper_results, *rest = search_many(queries, num_results=10)
                 
                 if serper_results:
                     place_names_from_web = extract_place_names(serper_results, keyword)
                     logger.warning(f"📝 1차 검색 결과: {len(place_names_from_web)}개")
                 
                 # 2차: 일반 검색 (결과가 부족하면)
-                if len(place_names_from_web) < 5:
-                    # 메뉴에서 카테고리 추출 (예: "딸기 케이크" → "케이크")
-                    general_category = keyword.split()[-1] if ' ' in keyword else keyword
-                    
-                    if general_category != keyword:  # 메뉴 특화와 다른 경우만
-                        search_query_general = f"{region} {general_category}"
-                        logger.warning(f"🌐 Serper 2차 검색 (일반): {search_query_general}")
-                        serper_results_2 = search_with_serper(search_query_general, num_results=10)
-                        
-                        if serper_results_2:
-                            additional_names = extract_place_names(serper_results_2, general_category)
-                            # 중복 제거하고 추가
-                            for name in additional_names:
-                                if name not in place_names_from_web:
-                                    place_names_from_web.append(name)
-                            logger.warning(f"📝 2차 검색 추가: {len(additional_names)}개 (총 {len(place_names_from_web)}개)")
+                if len(place_names_from_web) < 5 and rest and rest[0]:
+                    additional_names = extract_place_names(rest[0], general_category)
+                    # 중복 제거하고 추가
+                    for name in additional_names:
+                        if name not in place_names_from_web:
+                            place_names_from_web.append(name)
+                    logger.warning(f"📝 2차 검색 추가: {len(additional_names)}개 (총 {len(place_names_from_web)}개)")
         except Exception as e:
             logger.warning(f"⚠️ Serper 검색 실패 (Google Places만 사용): {e}")
         
@@ -105,13 +96,21 @@ def search_desserts_integrated(region: str, keyword: str, num_results: int = 5,
         # 페이지네이션 로직 완전 제거 (첫 페이지 20개로 승부)
         raw_results = first_page.get('results', [])
         
-        filtered = [r for r in raw_results if r.get('user_ratings_total', 0) >= 10]
+        # 리뷰 10개 이상 + 품질 점수 순 상위 15개 (열 배열로 한 번에 계산)
+        batch = CandidateBatch(raw_results)
+        persona_scores = [calculate_persona_score(p, persona) for p in batch.places]
+        quality_scores = batch.quality_scores(persona_scores)
+        for p, persona_score, quality_score in zip(batch.places, persona_scores, quality_scores.tolist()):
+            p['persona_score'] = persona_score
+            p['quality_score'] = quality_score
         
-        for p in filtered:
-            p['persona_score'] = calculate_persona_score(p, persona)
-            p['quality_score'] = calculate_review_quality_score(p)
-        
-        sorted_results = sorted(filtered, key=lambda x: x.get('quality_score', 0), reverse=True)
+        # 웹 검색에 언급된 가게 우선 (추가 API 호출 없이 로컬 이름 매칭)
+        if place_names_from_web:
+            web_hits = EntityResolver(batch.places).hits(place_names_from_web)
+            logger.warning(f"🌐 웹 언급 가게 매칭: {int(sum(web_hits))}개")
+            sorted_results = batch.top_k([web_hits, quality_scores], k=15, where=batch.reviews >= 10)
+        else:
+            sorted_results = batch.top_k([quality_scores], k=15, where=batch.reviews >= 10)
         
         # 다양성을 위한 랜덤 셔플 (상위 15개 중에서)
         import random
@@ -0,0 +1,123 @@
+"""
+Direct Search
+지역과 카테고리가 이미 정해진 요청은 하위 ReAct 에이전트 없이 검색 함수를 바로 호출
+
+기존: Coordinator → call_*_agent → ReAct Agent(LLM) → search_*_tool → (설명 생성 LLM)
+Direct: Coordinator → call_*_agent → search_restaurants / search_desserts_integrated /
+        search_accommodations / search_landmarks → 번호 목록 포맷
+
+검색 실패/결과 없음이면 None을 반환하고 호출 측은 기존 ReAct 에이전트로 처리한다.
+
+환경 변수:
+- DIRECT_SEARCH_AGENTS: direct 모드로 실행할 에이전트 (쉼표 구분,
+  기본 "restaurant,dessert,accommodation,landmark", 빈 값이면 모두 ReAct)
+"""
+
+import os
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DIRECT_SEARCH_AGENTS = {
+    name.strip()
+    for name in os.getenv("DIRECT_SEARCH_AGENTS", "restaurant,dessert,accommodation,landmark").split(",")
+    if name.strip()
+}
+
+# 결과 개수 (기존 에이전트 출력과 동일하게 5개)
+NUM_RESULTS = 5
+
+
+def is_direct(agent: str) -> bool:
+    """에이전트가 direct 모드인지"""
+    return agent in DIRECT_SEARCH_AGENTS
+
+
+# ==================== 검색 함수 ====================
+# 각 함수는 PlaceData dict 리스트 반환
+
+def _search_restaurants(region: str, category: str) -> List[Dict[str, Any]]:
+    from agents.restaurant_agent import search_restaurants
+    result = search_restaurants(region, preference=category, num_results=NUM_RESULTS)
+    return result.data if result.success else []
+
+
+def _search_desserts(region: str, category: str) -> List[Dict[str, Any]]:
+    from agents.dessert_agent import search_desserts_integrated
+    result = search_desserts_integrated(region, category, num_results=NUM_RESULTS)
+    return result.data if result.success else []
+
+
+def _search_accommodations(region: str, category: str) -> List[Dict[str, Any]]:
+    # search_accommodations는 @tool이므로 원본 함수 호출
+    from agents.tool.accommodation_tools import search_accommodations
+    result = search_accommodations.func(region, preference=category, num_results=NUM_RESULTS)
+    return (result.get('data') or []) if result.get('success') else []
+
+
+def _search_landmarks(region: str, category: str) -> List[Dict[str, Any]]:
+    from agents.landmark_agent import search_landmarks, TOURIST_CATEGORIES
+    target_category = category if category in TOURIST_CATEGORIES else None
+    result = search_landmarks(region, preference=category, category=target_category)
+    return result.data[:NUM_RESULTS] if result.success else []
+
+
+# agent → (검색 함수, 제목 이모지, 제목)
+SEARCHERS: Dict[str, tuple] = {
+    "restaurant": (_search_restaurants, "🍽️", "맛집"),
+    "dessert": (_search_desserts, "☕", "카페"),
+    "accommodation": (_search_accommodations, "🏨", "숙소"),
+    "landmark": (_search_landmarks, "🏛️", "관광지"),
+}
+
+
+def format_places(places: List[Dict[str, Any]], emoji: str, title: str, region: str, category: str) -> str:
+    """검색 결과 → 번호 목록 (fast_path 선택 파싱과 호환되는 "**1. 이름**" 형식)"""
+    output = [f"{emoji} **{region} {category} {title}** 추천이다냥!\n"]
+    for i, place in enumerate(places, 1):
+        output.append(f"**{i}. {place['name']}**")
+        output.append(f"⭐ **{place.get('rating') or 0}점** · 리뷰 {place.get('review_count') or 0:,}개")
+        if place.get('open_now') is not None:
+            output.append("🟢 영업중" if place['open_now'] else "🔴 영업종료")
+        if place.get('address'):
+            output.append(f"📍 {place['address']}")
+        if place.get('phone'):
+            output.append(f"📞 {place['phone']}")
+        output.append(f"[🗺️ 지도보기]({place['google_maps_url']})\n")
+    return "\n".join(output)
+
+
+def direct_search(agent: str, region: str, category: str) -> Optional[str]:
+    """검색 함수 직접 호출 (결과가 없거나 실패하면 None → ReAct 에이전트로 처리)"""
+    searcher, emoji, title = SEARCHERS[agent]
+    try:
+        places = searcher(region, category)
+        if not places:
+            return None
+        response = format_places(places, emoji, title, region, category)
+    except Exception as e:
+        logger.warning(f"⚠️ Direct 검색 실패 ({agent}): {e}")
+        return None
+
+    logger.info(f"⚡ Direct 검색: {agent} - {region} {category} ({len(places)}개)")
+    return response
+
+
+def try_direct_search(agent: str, region: Optional[str], category: Optional[str]) -> Optional[str]:
+    """direct 모드 조건(에이전트 설정 + 지역/카테고리 지정)이 맞으면 직접 검색
+
+    Returns:
+        포맷된 결과 (None이면 호출 측에서 ReAct 에이전트 실행)
+    """
+    if not (region and category and is_direct(agent)):
+        return None
+    return direct_search(agent, region, category)
+
+
+async def atry_direct_search(agent: str, region: Optional[str], category: Optional[str]) -> Optional[str]:
+    """try_direct_search의 비동기 버전 (Google Maps 클라이언트가 sync이므로 스레드에서 실행)"""
+    if not (region and category and is_direct(agent)):
+        return None
+    return await asyncio.to_thread(direct_search, agent, region, category)
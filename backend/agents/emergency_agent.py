@@ -7,8 +7,10 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-import googlemaps
 from schemas.data_models import PlaceData, AgentResponse
+from agents.utils.places_gateway import get_places_gateway
+from agents.utils.cache import cached
+from agents.utils.request_governor import request_json
 
 load_dotenv()
 
@@ -28,7 +30,10 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 DATA_GO_API_KEY = os.getenv("DATA_GO_KR_API_KEY")
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHERMAP_API_KEY")
 
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = get_places_gateway()
+
+# 날씨 캐시: OpenWeather 예보는 3시간 단위라 10분 보관 + 30분 동안은 이전 값 반환하며 백그라운드 갱신
+WEATHER_CACHE_TTL = int(os.getenv("WEATHER_CACHE_TTL", 600))
 
 # --- 1. 재난문자 조회 ---
 def fetch_disaster_alerts(region: str) -> List[Dict[str, Any]]:
@@ -46,12 +51,8 @@ def fetch_disaster_alerts(region: str) -> List[Dict[str, Any]]:
             "rgnNm": region
         }
         # 타임아웃을 짧게 설정하여 전체 프로세스 지연 방지
-        response = requests.get(url, params=params, timeout=3)
-        
-        if response.status_code != 200: return []
-        
         try:
-            data = response.json()
+            data = request_json("safetydata", "GET", url, params=params, timeout=3)
         except:
             return []
             
@@ -81,6 +82,8 @@ def fetch_disaster_alerts(region: str) -> List[Dict[str, Any]]:
         return []
 
 # --- 2. 날씨 및 옷차림 추천 ---
+@cached("weather", ttl=WEATHER_CACHE_TTL, stale_ttl=1800, max_entries=200,
+        key=lambda region: region.strip(), cache_if=lambda result: result.get("api_available", False))
 def fetch_weather_and_outfit(region: str) -> Dict[str, Any]:
     if not OPENWEATHER_API_KEY or not gmaps:
         return {"api_available": False, "condition": "설정 오류", "warnings": [], "risk_level": 0}
@@ -95,18 +98,17 @@ def fetch_weather_and_outfit(region: str) -> Dict[str, Any]:
         coords = geocode[0]['geometry']['location']
         
         url = "https://api.openweathermap.org/data/2.5/forecast"
-        res = requests.get(url, params={
-            'lat': coords['lat'],
-            'lon': coords['lng'],
-            'appid': OPENWEATHER_API_KEY,
-            'units': 'metric',
-            'lang': 'kr'
-        }, timeout=3)
-        
-        if res.status_code != 200:
+        try:
+            data = request_json("openweather", "GET", url, params={
+                'lat': coords['lat'],
+                'lon': coords['lng'],
+                'appid': OPENWEATHER_API_KEY,
+                'units': 'metric',
+                'lang': 'kr'
+            }, timeout=3)
+        except requests.HTTPError:
             return {"api_available": False, "condition": "API 오류", "warnings": [], "risk_level": 0}
         
-        data = res.json()
         current = data['list'][0]
         
         # 데이터 추출 (기존 로직 동일)
@@ -0,0 +1,311 @@
+"""
+Coordinator Fast Path
+LLM 호출 없이 처리 가능한 턴을 로컬에서 바로 응답하는 pre-router
+
+처리 대상 (규칙 2-1: 선택/슬롯 답변은 에이전트 호출 불필요):
+- 선택: "1", "1,2", "1번 2번", "첫번째" → 직전 에이전트 결과에서 이름을 찾아 daily_selections 기록
+- 확정: "확정", "없어" (2단계 세부 지역)
+- 날짜/예산/인원/출발 시간/출발 장소 (3~5단계)
+
+처리할 수 없거나 애매하면 None 반환 → 기존 Coordinator Agent로 처리.
+None을 반환하는 경우 FlowState를 변경하지 않는다.
+
+환경 변수:
+- COORDINATOR_FAST_PATH: "on" (기본) | "off"
+"""
+
+import os
+import re
+import logging
+from typing import List, Optional
+
+from agents.flow_state import TravelFlowState
+from agents.flow_tracker import (
+    is_confirmation,
+    parse_budget,
+    parse_date_range,
+    parse_departure_time,
+    parse_people_count,
+    parse_selection,
+    set_trip_dates,
+    strip_slot_values,
+)
+from agents.utils.gazetteer import lookup_region
+
+logger = logging.getLogger(__name__)
+
+FAST_PATH_ENABLED = os.getenv("COORDINATOR_FAST_PATH", "on").lower() != "off"
+
+# ==================== 패턴 ====================
+
+# 번호 목록 항목: "1. 이름", "1) 이름", "**1. 이름**", "### 1. 이름", "1️⃣ 이름"
+_NUMBERED_ITEM_RE = re.compile(
+    r"^[\s#>*-]*(?:\*\*)?\s*(\d{1,2})(?:[.)]|️?⃣|번\.?)\s*(?:\*\*)?\s*(.+?)\s*$",
+    re.MULTILINE
+)
+# 이름 뒤에 붙는 설명 구분자
+_NAME_CUT_RE = re.compile(r"\s*(?:\*\*|\s[-–—|]\s|[(:📍⭐★🔗]).*$")
+
+# 슬롯 답변에 붙는 조사/어미 (제거 후 남는 글자가 없어야 슬롯 답변으로 인정)
+_FILLER_RE = re.compile(
+    r"(?:부터|까지|에서|이요|입니다|이에요|예요|이야|정도|쯤|출발|할게요?|갈게요?|가요|이서|서|요|야|에|~|-|!|\.|,|\s)+"
+)
+
+# 자유 텍스트 출발 장소 최대 길이 / 장소가 아닌 요청 표현
+MAX_LOCATION_LENGTH = 20
+_NOT_LOCATION_RE = re.compile(r"추천|알려|어때|뭐|어디|언제|얼마|해줘|싶|할까|하자|바꿔|다시")
+# 출발 장소 끝 어미/문장부호 ("서울역이요!" → "서울역")
+_LOCATION_TAIL_RE = re.compile(r"(?:이에요|예요|이요|요|[!.~\s])+$")
+# 지명 사전에 없어도 장소로 인정하는 접미사 (교통 거점/건물)
+_PLACE_SUFFIX_RE = re.compile(r".+(?:역|터미널|공항|항|정류장|정류소|대학교|호텔|백화점|아파트)$")
+
+# agent_results 키 → daily_selections 카테고리
+SELECTION_CATEGORIES = {
+    'restaurant_recommendations': "restaurant",
+    'cafe_recommendations': "cafe",
+    'accommodation_recommendations': "accommodation",
+    'landmark_recommendations': "landmark",
+}
+# 1개만 고르는 카테고리
+SINGLE_SELECT_CATEGORIES = {"restaurant", "cafe", "accommodation"}
+
+# ==================== 응답 템플릿 ====================
+# coordinator_prompt의 단계별 질문과 같은 문구
+
+DATES_QUESTION = """언제 여행 가냥? 😸
+시작일이랑 종료일 알려달라냥!
+(예: 2025/12/13 ~ 12/15)"""
+
+BUDGET_QUESTION = """예산은 얼마나 있냥? 💰
+(예: 50만원, 100만원, 200만원)"""
+
+PEOPLE_QUESTION = "몇 명이서 가냥? 🐾"
+
+DEPARTURE_TIME_QUESTION = """몇 시에 출발할 거냥? ⏰
+(예: 오전 9시, 아침 8시)"""
+
+DEPARTURE_LOCATION_QUESTION = """어디서 출발할 거냥? 📍
+(예: 서울역, 집, 인천공항)"""
+
+FOOD_MENU = """- 한식 (전통, 현대식, 퓨전)
+- 일식 (초밥, 라멘, 이자카야)
+- 양식 (파스타, 스테이크)
+- 중식 (짜장, 마라탕)
+- 아시안 (태국, 베트남)
+- 특별한 거 (미슐랭, 오마카세)"""
+
+CAFE_QUESTION = """2️⃣ 카페/디저트 ☕
+어떤 카페 가고 싶냥?
+- 루프탑 카페 (야경 감상, 분위기)
+- 오션뷰 카페 (바다 뷰, 힐링)
+- 감성 카페 (인테리어, 사진 맛집)
+- 베이커리 카페 (빵, 디저트 맛집)
+- 테마 카페 (북카페, 애견카페, 보드게임)
+- 디저트 전문점 (케이크, 마카롱, 빙수)"""
+
+ACCOMMODATION_QUESTION = """3️⃣ 숙소 🏨
+어떤 숙소 원하냥?
+- 호텔 (편안함, 서비스, 조식)
+- 모텔 (가성비, 편리함, 주차)
+- 게스트하우스 (저렴, 소통, 공용 공간)
+- 한옥스테이 (전통 한옥, 온돌 체험, 한국 문화)
+- 료칸 (일본식 온천, 다다미, 가이세키)
+- 글램핑 (캠핑 + 호텔, 자연 속, 바베큐)
+- 풀빌라 (개인 수영장, 프라이빗, 럭셔리)
+- 오션뷰 리조트 (바다 전망, 리조트 시설)
+- 펜션 (독채, 가족/친구, 취사 가능)
+- 캐핑카 (이동식 숙소, 자유로움)
+- 트리하우스 (나무 위 집, 특별한 경험)
+- 컨테이너 하우스 (감성 숙소, SNS 핫플)"""
+
+LANDMARK_QUESTION = """4️⃣ 관광지 🏛️
+어디 가보고 싶냥?
+- 랜드마크 (유명한 곳, 포토존, 대표 명소)
+- 자연 (해변, 산, 공원, 폭포, 계곡)
+- 문화 (박물관, 미술관, 전시관, 역사 유적)
+- 쇼핑 (시장, 거리, 아울렛, 면세점)
+- 액티비티 (체험, 놀이, 테마파크, 레저)"""
+
+
+# ==================== 파싱 ====================
+
+def extract_numbered_items(text: str) -> List[str]:
+    """에이전트 결과 텍스트에서 번호 목록 항목 이름 추출 (번호 순서대로, 1부터 연속된 것만)"""
+    items: List[str] = []
+    for number, rest in _NUMBERED_ITEM_RE.findall(text or ""):
+        if int(number) != len(items) + 1:
+            continue
+        name = _NAME_CUT_RE.sub("", rest).strip(" *")
+        if name:
+            items.append(name)
+    return items
+
+
+def _is_slot_only(message: str) -> bool:
+    """날짜/예산/인원/시간 값(또는 숫자 하나)과 조사 외에 다른 내용이 없는 메시지인지"""
+    if message.strip().isdigit():
+        return True
+    return not _FILLER_RE.sub("", strip_slot_values(message))
+
+
+def _meal_names(flow_state: TravelFlowState) -> List[str]:
+    """현재 일차의 식사 순서 (coordinator_prompt 6단계와 동일)"""
+    day, total_days = flow_state.current_day, flow_state.total_days
+    if day <= 1:
+        return ["점심", "저녁"]
+    if total_days and day >= total_days:
+        return ["아침", "점심"]
+    return ["아침", "점심", "저녁"]
+
+
+def _meal_question(flow_state: TravelFlowState, meal: str) -> str:
+    if flow_state.total_days > 1 and flow_state.current_day == flow_state.total_days:
+        day_label = "마지막 날"
+    else:
+        day_label = f"{flow_state.current_day}일차"
+    emoji = "🍳" if meal == "아침" else "🍽️"
+    return f"{day_label} {meal}에 뭐 먹고 싶냥? {emoji}\n{FOOD_MENU}"
+
+
+def _is_last_day(flow_state: TravelFlowState) -> bool:
+    return flow_state.total_days > 1 and flow_state.current_day >= flow_state.total_days
+
+
+# ==================== 라우팅 ====================
+
+def _prefetch_details(names: List[str]) -> None:
+    """선택한 장소의 상세 정보를 백그라운드에서 미리 로드 (목록은 검색 결과만으로 구성되므로)"""
+    try:
+        from agents.utils.places_gateway import get_places_gateway, SUMMARY_DETAIL_FIELDS
+        gateway = get_places_gateway()
+        if gateway is None:
+            return
+        place_ids = [gateway.find_place_id(name) for name in names]
+        gateway.prefetch([pid for pid in place_ids if pid], fields=SUMMARY_DETAIL_FIELDS, language="ko")
+    except Exception as e:
+        logger.warning(f"⚠️ 상세 정보 prefetch 실패: {e}")
+
+
+def _route_selection(message: str, flow_state: TravelFlowState) -> Optional[str]:
+    indices = parse_selection(message)
+    category = SELECTION_CATEGORIES.get(flow_state.pending_selection)
+    if not indices or not category:
+        return None
+
+    # 관광지 선택 후에는 일정표 생성(call_itinerary_generator)이 필요하므로 Agent에 맡김
+    if category == "landmark":
+        return None
+    if category in SINGLE_SELECT_CATEGORIES and len(indices) != 1:
+        return None
+
+    items = extract_numbered_items(flow_state.agent_results.get(flow_state.pending_selection))
+    if not items or any(index > len(items) for index in indices):
+        return None
+    names = [items[index - 1] for index in indices]
+
+    flow_state.add_selection(category, names)
+    flow_state.pending_selection = None
+    _prefetch_details(names)
+    picked = f"{', '.join(names)} 선택했구나냥! 😸 좋은 선택이다냥!\n\n"
+
+    if category == "restaurant":
+        meals = _meal_names(flow_state)
+        chosen = len(flow_state.get_selections("restaurant"))
+        if chosen < len(meals):
+            return picked + _meal_question(flow_state, meals[chosen])
+        flow_state.current_step = TravelFlowState.STEP_CAFE
+        return picked + CAFE_QUESTION
+
+    if category == "cafe" and not _is_last_day(flow_state):
+        flow_state.current_step = TravelFlowState.STEP_ACCOMMODATION
+        return picked + ACCOMMODATION_QUESTION
+
+    # 숙소 선택 후 / 마지막 날 카페 선택 후 (마지막 날은 숙소 없음)
+    flow_state.current_step = TravelFlowState.STEP_LANDMARK
+    return picked + LANDMARK_QUESTION
+
+
+def _route_slot(message: str, flow_state: TravelFlowState) -> Optional[str]:
+    info = flow_state.collected_info
+    step = flow_state.current_step
+
+    if step == TravelFlowState.STEP_REGIONS:
+        if info['regions'] and len(message.strip()) <= 10 and is_confirmation(message):
+            flow_state.current_step = TravelFlowState.STEP_DATES
+            return f"좋다냥! 😸 {', '.join(info['regions'])}(으)로 확정이다냥!\n\n{DATES_QUESTION}"
+        return None
+
+    if not _is_slot_only(message):
+        return None
+
+    if step == TravelFlowState.STEP_DATES:
+        date_range = parse_date_range(message)
+        if not date_range:
+            return None
+        set_trip_dates(flow_state, *date_range)
+        flow_state.current_step = TravelFlowState.STEP_BUDGET
+        duration = f"{flow_state.nights}박 {flow_state.total_days}일" if flow_state.nights else "당일치기"
+        return f"{date_range[0]} ~ {date_range[1]}, {duration}이구나냥! 😸\n\n{BUDGET_QUESTION}"
+
+    if step == TravelFlowState.STEP_BUDGET:
+        budget = parse_budget(message, allow_bare_number=True)
+        if not budget:
+            return None
+        info['budget'] = budget
+        flow_state.current_step = TravelFlowState.STEP_PEOPLE
+        return f"예산 {budget}이냥! 💰 알겠다냥!\n\n{PEOPLE_QUESTION}"
+
+    if step == TravelFlowState.STEP_PEOPLE:
+        if info['people_count'] is None:
+            people = parse_people_count(message)
+            if not people:
+                return None
+            info['people_count'] = people
+            return f"{people}명이서 가는구나냥! 🐾\n\n{DEPARTURE_TIME_QUESTION}"
+        if flow_state.departure_time is None:
+            departure_time = parse_departure_time(message)
+            if not departure_time:
+                return None
+            flow_state.departure_time = departure_time
+            return f"{departure_time} 출발이냥! ⏰\n\n{DEPARTURE_LOCATION_QUESTION}"
+
+    return None
+
+
+def _route_departure_location(message: str, flow_state: TravelFlowState) -> Optional[str]:
+    """5-2단계 출발 장소 (자유 텍스트라 짧은 단답만 처리)
+
+    지명 사전에 있는 지역이거나 장소 접미사(역/터미널/공항...)로 끝나는 답만 장소로 인정
+    ("몰라", "아무데나" 같은 답은 Coordinator가 처리)
+    """
+    if flow_state.current_step != TravelFlowState.STEP_PEOPLE:
+        return None
+    if flow_state.collected_info['people_count'] is None or flow_state.departure_time is None:
+        return None
+    location = _LOCATION_TAIL_RE.sub("", message.strip())
+    if not location or len(location) > MAX_LOCATION_LENGTH or "?" in location:
+        return None
+    if re.search(r"\d", location) or _NOT_LOCATION_RE.search(location):
+        return None
+    location = location.removesuffix("에서")
+    if not (lookup_region(location) or _PLACE_SUFFIX_RE.fullmatch(location)):
+        return None
+
+    flow_state.departure_location = location
+    flow_state.current_step = TravelFlowState.STEP_RESTAURANT
+    meal = _meal_names(flow_state)[0]
+    return (
+        f"{location}에서 {flow_state.departure_time} 출발이냥! 📍 기본 정보는 다 모였다냥! 🎉\n\n"
+        f"이제 일차별로 계획하자냥!\n{_meal_question(flow_state, meal)}"
+    )
+
+
+def route(message: str, flow_state: TravelFlowState) -> Optional[str]:
+    """Fast path 응답 (처리 불가 시 None → Coordinator Agent)"""
+    if not FAST_PATH_ENABLED or not flow_state.is_in_flow or not message.strip():
+        return None
+
+    if flow_state.pending_selection:
+        return _route_selection(message, flow_state)
+
+    return _route_slot(message, flow_state) or _route_departure_location(message, flow_state)
@@ -6,6 +6,8 @@ Travel Flow State Management
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from agents.session_store import session_store, register_codec, NS_FLOW_STATE
+
 
 class TravelFlowState:
     """여행 계획 플로우 상태 관리"""
@@ -53,6 +55,12 @@ class TravelFlowState:
             'landmark_preference': []      # 관광지 선호도 (예: ["랜드마크", "자연"])
         }
         
+        # 일차별 선택 항목 {day: {category: [장소 이름]}}
+        self.daily_selections: Dict[int, Dict[str, List[str]]] = {}
+        
+        # 사용자 선택을 기다리는 에이전트 결과 키 (예: 'restaurant_recommendations')
+        self.pending_selection: Optional[str] = None
+        
         # 에이전트 호출 결과 저장
         self.agent_results: Dict[str, Any] = {
             'region_recommendations': None,
@@ -79,6 +87,16 @@ class TravelFlowState:
         if self.current_step < self.STEP_ITINERARY:
             self.current_step += 1
     
+    def add_selection(self, category: str, names: List[str]) -> None:
+        """현재 일차에 선택 항목 추가"""
+        day_selections = self.daily_selections.setdefault(self.current_day, {})
+        day_selections.setdefault(category, []).extend(names)
+    
+    def get_selections(self, category: str, day: Optional[int] = None) -> List[str]:
+        """일차별 선택 항목 조회 (기본: 현재 일차)"""
+        day = self.current_day if day is None else day
+        return self.daily_selections.get(day, {}).get(category, [])
+    
     def is_step_complete(self, step: int) -> bool:
         """특정 단계가 완료되었는지 확인"""
         if step == self.STEP_DESTINATION:
@@ -148,6 +166,12 @@ class TravelFlowState:
             if value:
                 context += f"- {key}: {value}\n"
         
+        if self.daily_selections:
+            context += f"\n## 일차별 선택 항목\n"
+            for day, selections in self.daily_selections.items():
+                if selections:
+                    context += f"- {day}일차: {selections}\n"
+        
         return context
     
     def should_call_agent(self, step: int) -> bool:
@@ -180,20 +204,39 @@ class TravelFlowState:
             return f"{location} {preferences}".strip()
         
         return None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """세션 저장소 직렬화용 dict 변환"""
+        return dict(self.__dict__)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TravelFlowState":
+        """to_dict() 결과로 FlowState 복원 (새로 추가된 필드는 기본값 유지)"""
+        state = cls()
+        state.__dict__.update(data)
+        # JSON 직렬화로 문자열이 된 일차 키 복원
+        state.daily_selections = {int(day): value for day, value in state.daily_selections.items()}
+        return state
 
 
-# 세션별 FlowState 저장소
-flow_states: Dict[str, TravelFlowState] = {}
+# 세션별 FlowState 저장소 (agents/session_store.py)
+register_codec(NS_FLOW_STATE, TravelFlowState.to_dict, TravelFlowState.from_dict)
 
 
 def get_flow_state(session_id: str) -> TravelFlowState:
     """세션 ID로 FlowState 가져오기 (없으면 생성)"""
-    if session_id not in flow_states:
-        flow_states[session_id] = TravelFlowState()
-    return flow_states[session_id]
+    flow_state = session_store.get(NS_FLOW_STATE, session_id)
+    if flow_state is None:
+        flow_state = TravelFlowState()
+        session_store.set(NS_FLOW_STATE, session_id, flow_state)
+    return flow_state
+
+
+def save_flow_state(session_id: str, flow_state: TravelFlowState) -> None:
+    """변경된 FlowState 저장 (영속 저장소에서는 매 턴 종료 시 호출 필요)"""
+    session_store.set(NS_FLOW_STATE, session_id, flow_state)
 
 
 def reset_flow_state(session_id: str) -> None:
     """FlowState 초기화"""
-    if session_id in flow_states:
-        del flow_states[session_id]
+    session_store.delete(NS_FLOW_STATE, session_id)
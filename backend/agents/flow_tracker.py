@@ -0,0 +1,277 @@
+"""
+Flow Tracker
+매 턴 종료 후 사용자 메시지와 Tool 호출 기록으로 TravelFlowState를 진행시킴
+
+- 사용자 메시지: 날짜/예산/인원/출발 시간 등 정형 값 추출 → collected_info 채움
+- Tool 호출: call_*_agent 호출 → 해당 단계로 이동 + 선호도 기록
+- call_itinerary_generator 호출 → 다음 일차(6단계)로 이동, 마지막 날이면 10단계
+
+단계는 앞으로만 이동 (일차 전환 제외). 추적이 한 턴 늦더라도
+coordinator_prompt가 현재+다음 단계 섹션을 함께 넣으므로 플로우는 끊기지 않는다.
+"""
+
+import re
+import logging
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from agents.flow_state import TravelFlowState
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMAT = "%Y/%m/%d"
+
+# 확정/완료 표현 (2-3단계)
+CONFIRM_KEYWORDS = ["확정", "좋아", "이대로", "없어", "없다", "됐어", "그걸로", "ㅇㅇ"]
+
+# 에이전트 Tool → (단계, collected_info 선호도 키, agent_results 키)
+AGENT_TOOL_STEPS = {
+    "call_restaurant_agent": (TravelFlowState.STEP_RESTAURANT, "restaurant_preference", "restaurant_recommendations"),
+    "call_dessert_agent": (TravelFlowState.STEP_CAFE, "cafe_preference", "cafe_recommendations"),
+    "call_accommodation_agent": (TravelFlowState.STEP_ACCOMMODATION, "accommodation_preference", "accommodation_recommendations"),
+    "call_landmark_agent": (TravelFlowState.STEP_LANDMARK, "landmark_preference", "landmark_recommendations"),
+}
+
+_FULL_DATE_RE = re.compile(r"(\d{4})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})")
+_KOREAN_DATE_RE = re.compile(r"(?:(\d{4})\s*년\s*)?(?:(\d{1,2})\s*월\s*)?(\d{1,2})\s*일")
+_SHORT_DATE_RE = re.compile(r"(?<![\d./-])(\d{1,2})\s*/\s*(\d{1,2})(?![\d./-])")
+_BUDGET_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(만\s*원|만|천\s*원|원)")
+_NUMBER_ONLY_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*$")
+_PEOPLE_RE = re.compile(r"(\d+)\s*(?:명|인)")
+_PEOPLE_WORDS = {"혼자": 1, "둘이": 2, "셋이": 3, "넷이": 4, "다섯이": 5}
+_TIME_RE = re.compile(r"(오전|오후|아침|점심|저녁|밤|새벽)?\s*(\d{1,2})\s*시(?:\s*(반|\d{1,2}\s*분))?")
+
+# 선택 번호: "1", "1,2", "1번 2번", "첫번째", "2번으로 할게"
+_ORDINALS = {"첫": 1, "두": 2, "세": 3, "네": 4, "다섯": 5, "여섯": 6, "일곱": 7, "여덟": 8, "아홉": 9, "열": 10}
+_INDEX = r"(?:\d{1,2}\s*번?(?:\s*째)?|(?:첫|두|세|네|다섯|여섯|일곱|여덟|아홉|열)\s*번\s*째)"
+_SEPARATOR = r"(?:\s*(?:,|/|&|\+|이랑|랑|하고|와|과|그리고)\s*|\s+)"
+_INDEX_RE = re.compile(r"(\d{1,2})|(첫|두|세|네|다섯|여섯|일곱|여덟|아홉|열)\s*번\s*째")
+_SELECTION_RE = re.compile(
+    rf"^\s*{_INDEX}(?:{_SEPARATOR}{_INDEX})*"
+    r"\s*(?:(?:으로|로|을|를)?\s*(?:할게요?|할래요?|선택할게요?|선택|골라요?|고를게요?|주세요|줘))?"
+    r"\s*(?:요)?\s*[.!~😸]*\s*$"
+)
+
+_SLOT_PATTERNS = [_FULL_DATE_RE, _KOREAN_DATE_RE, _SHORT_DATE_RE, _BUDGET_RE, _PEOPLE_RE, _TIME_RE]
+
+
+def _resolve_year(month: int, day: int, year: Optional[int], today: date) -> Optional[date]:
+    """연도 생략 시 오늘 이후 가장 가까운 날짜로 해석"""
+    try:
+        if year:
+            return date(year, month, day)
+        candidate = date(today.year, month, day)
+        if candidate < today:
+            candidate = date(today.year + 1, month, day)
+        return candidate
+    except ValueError:
+        return None
+
+
+def parse_date_range(text: str, today: Optional[date] = None) -> Optional[Tuple[str, str]]:
+    """여행 기간 추출 → ("YYYY/MM/DD", "YYYY/MM/DD")
+
+    지원 형식: "2025/12/13 ~ 12/15", "2025-12-13~2025-12-15", "12월 15일부터 17일까지", "12/13~12/15"
+    종료일의 연/월이 생략되면 시작일 값을 이어받는다.
+    """
+    today = today or date.today()
+    # (year, month, day) - 생략된 값은 None
+    parts: List[Tuple[Optional[int], Optional[int], int]] = []
+
+    for match in _FULL_DATE_RE.finditer(text):
+        parts.append((int(match.group(1)), int(match.group(2)), int(match.group(3))))
+    stripped = _FULL_DATE_RE.sub(" ", text)
+    for match in _SHORT_DATE_RE.finditer(stripped):
+        parts.append((None, int(match.group(1)), int(match.group(2))))
+    for match in _KOREAN_DATE_RE.finditer(stripped):
+        year = int(match.group(1)) if match.group(1) else None
+        month = int(match.group(2)) if match.group(2) else None
+        parts.append((year, month, int(match.group(3))))
+
+    if not parts or parts[0][1] is None:
+        return None
+
+    year, month, day = parts[0]
+    start = _resolve_year(month, day, year, today)
+    if start is None:
+        return None
+
+    end = start
+    if len(parts) > 1:
+        end_year, end_month, end_day = parts[1]
+        end_month = end_month or start.month
+        try:
+            end = date(end_year or start.year, end_month, end_day)
+        except ValueError:
+            return None
+        if end < start and end_year is None:
+            end = _resolve_year(end_month, end_day, start.year + 1, today)
+        if end is None or end < start:
+            return None
+
+    return start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)
+
+
+def parse_budget(text: str, allow_bare_number: bool = False) -> Optional[str]:
+    """예산 추출 → "50만원" 형태 (숫자만 있으면 allow_bare_number일 때 만원 단위로 해석)"""
+    match = _BUDGET_RE.search(text)
+    if match:
+        amount, unit = match.group(1), match.group(2).replace(" ", "")
+        return f"{amount}{'만원' if unit == '만' else unit}"
+    if allow_bare_number:
+        match = _NUMBER_ONLY_RE.match(text)
+        if match:
+            return f"{match.group(1)}만원"
+    return None
+
+
+def parse_people_count(text: str) -> Optional[int]:
+    match = _PEOPLE_RE.search(text)
+    if match:
+        return int(match.group(1))
+    for word, count in _PEOPLE_WORDS.items():
+        if word in text:
+            return count
+    return None
+
+
+def parse_departure_time(text: str) -> Optional[str]:
+    """출발 시간 추출 → 원문 표현 그대로 (예: "오전 9시", "아침 8시 반")"""
+    match = _TIME_RE.search(text)
+    if not match:
+        return None
+    return re.sub(r"\s+", " ", match.group(0)).strip()
+
+
+def parse_selection(message: str) -> Optional[List[int]]:
+    """선택 번호 추출 ("1,2" → [1, 2], "첫번째" → [1]). 선택 답변이 아니면 None"""
+    if not _SELECTION_RE.match(message):
+        return None
+    indices = []
+    for number, ordinal in _INDEX_RE.findall(message):
+        index = int(number) if number else _ORDINALS[ordinal]
+        if index not in indices:
+            indices.append(index)
+    return indices or None
+
+
+def is_confirmation(text: str) -> bool:
+    return any(keyword in text for keyword in CONFIRM_KEYWORDS)
+
+
+def strip_slot_values(text: str) -> str:
+    """날짜/예산/인원/시간 표현을 제거한 나머지 텍스트 (슬롯 답변만 있는 메시지 판별용)"""
+    for pattern in _SLOT_PATTERNS:
+        text = pattern.sub(" ", text)
+    for word in _PEOPLE_WORDS:
+        text = text.replace(word, " ")
+    return text
+
+
+def set_trip_dates(flow_state: TravelFlowState, start: str, end: str) -> None:
+    flow_state.collected_info['start_date'] = start
+    flow_state.collected_info['end_date'] = end
+    days = (datetime.strptime(end, DATE_FORMAT) - datetime.strptime(start, DATE_FORMAT)).days + 1
+    flow_state.total_days = days
+    flow_state.nights = days - 1
+
+
+def _advance_to(flow_state: TravelFlowState, step: int) -> None:
+    if step > flow_state.current_step:
+        logger.info(f"➡️ 플로우 진행: {flow_state.current_step}단계 → {step}단계")
+        flow_state.current_step = step
+
+
+def _absorb_message(flow_state: TravelFlowState, message: str) -> None:
+    """사용자 메시지에서 정형 값 추출 (이미 채워진 값은 덮어쓰지 않음)"""
+    info = flow_state.collected_info
+    step = flow_state.current_step
+
+    if info.get('start_date') is None:
+        date_range = parse_date_range(message)
+        if date_range:
+            set_trip_dates(flow_state, *date_range)
+
+    if info.get('budget') is None:
+        budget = parse_budget(message, allow_bare_number=step == TravelFlowState.STEP_BUDGET)
+        if budget:
+            info['budget'] = budget
+
+    if info.get('people_count') is None and step >= TravelFlowState.STEP_BUDGET:
+        people = parse_people_count(message)
+        if people:
+            info['people_count'] = people
+            return
+
+    if step == TravelFlowState.STEP_PEOPLE and info.get('people_count') is not None:
+        if flow_state.departure_time is None:
+            flow_state.departure_time = parse_departure_time(message)
+        elif flow_state.departure_location is None:
+            # 5-2단계: 출발 시간 다음 답변은 출발 장소
+            flow_state.departure_location = message.strip()
+
+
+def _absorb_regions(flow_state: TravelFlowState, message: str) -> None:
+    """2단계: 추천된 지역 중 사용자가 언급한 지역 기록"""
+    recommendations = flow_state.agent_results.get('region_recommendations') or ""
+    regions = flow_state.collected_info['regions']
+    for token in re.split(r"[,\s/]+|(?:이랑|랑|하고|와|과)(?=\s|$)", message):
+        token = token.strip()
+        if len(token) >= 2 and token in str(recommendations) and token not in regions:
+            regions.append(token)
+
+
+def _absorb_tool_calls(flow_state: TravelFlowState, intermediate_steps) -> None:
+    for action, _ in intermediate_steps or []:
+        tool = getattr(action, "tool", None)
+        tool_input = getattr(action, "tool_input", None)
+        query = tool_input.get("query") if isinstance(tool_input, dict) else tool_input
+
+        if tool == "call_region_agent":
+            if flow_state.collected_info['destination'] is None and query:
+                flow_state.collected_info['destination'] = str(query).split()[0]
+            _advance_to(flow_state, TravelFlowState.STEP_REGIONS)
+        elif tool in AGENT_TOOL_STEPS:
+            step, preference_key, result_key = AGENT_TOOL_STEPS[tool]
+            _advance_to(flow_state, step)
+            flow_state.pending_selection = result_key
+            if query:
+                flow_state.collected_info[preference_key].append(str(query))
+        elif tool == "call_itinerary_generator":
+            day_number = tool_input.get("day_number") if isinstance(tool_input, dict) else None
+            finished_day = day_number or flow_state.current_day
+            if flow_state.total_days and finished_day < flow_state.total_days:
+                # 다음 일차 식사 계획부터 다시 시작
+                flow_state.current_day = finished_day + 1
+                flow_state.current_step = TravelFlowState.STEP_RESTAURANT
+                logger.info(f"📅 {finished_day}일차 완료 → {flow_state.current_day}일차")
+            else:
+                _advance_to(flow_state, TravelFlowState.STEP_ITINERARY)
+
+
+def track_turn(flow_state: TravelFlowState, message: str, intermediate_steps=None) -> None:
+    """턴 결과를 FlowState에 반영 (단계/일차/수집 정보)"""
+    # Agent가 처리한 선택 답변 → 대기 중인 선택 해제 (이번 턴 Tool 호출 시 아래에서 다시 설정)
+    if flow_state.pending_selection and parse_selection(message):
+        flow_state.pending_selection = None
+    if flow_state.current_step == TravelFlowState.STEP_REGIONS:
+        _absorb_regions(flow_state, message)
+
+    _absorb_message(flow_state, message)
+    _absorb_tool_calls(flow_state, intermediate_steps)
+
+    info = flow_state.collected_info
+    step = flow_state.current_step
+
+    # 2단계는 확정 또는 날짜 입력 시 완료 (2-1 재추천 단계 보존)
+    if step == TravelFlowState.STEP_REGIONS and (is_confirmation(message) or info.get('start_date')):
+        _advance_to(flow_state, TravelFlowState.STEP_DATES)
+
+    # 3~5단계: 값이 채워진 단계는 건너뜀
+    while TravelFlowState.STEP_DATES <= flow_state.current_step < TravelFlowState.STEP_PEOPLE \
+            and flow_state.is_step_complete(flow_state.current_step):
+        flow_state.next_step()
+
+    if flow_state.current_step == TravelFlowState.STEP_PEOPLE and info.get('people_count') is not None \
+            and flow_state.departure_time and flow_state.departure_location:
+        _advance_to(flow_state, TravelFlowState.STEP_RESTAURANT)
@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 import os
 
 from agents.state import TravelPlannerState
+from agents.cat_speech import CAT_SPEECH_MODE, to_cat_speech
 
 # 환경 변수 로드 (상위 디렉토리의 env 파일)
 env_path = os.path.join(os.path.dirname(__file__), '..', '..', 'env')
@@ -289,14 +290,18 @@ def chat_agent_node(state: TravelPlannerState) -> TravelPlannerState:
 # ============================================================================
 
 def cat_speech_node(state: TravelPlannerState) -> TravelPlannerState:
-    """모든 응답을 고양이 말투로 변환"""
-    llm = get_llm()
+    """모든 응답을 고양이 말투로 변환 (기본: 규칙 기반, CAT_SPEECH_MODE=llm이면 LLM)"""
     original = state["final_response"]
     
     # 이미 고양이 말투면 그대로 반환
     if "냥" in original:
         return state
     
+    if CAT_SPEECH_MODE != "llm":
+        state["final_response"] = to_cat_speech(original)
+        return state
+    
+    llm = get_llm()
     prompt = f"""
     다음 텍스트를 귀여운 고양이 말투로 변환하세요.
     
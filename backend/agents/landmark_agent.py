@@ -13,8 +13,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import logging
 from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
-import googlemaps
 from schemas.data_models import TravelState, AgentResponse, PlaceData
+from agents.utils.places_gateway import get_places_gateway, LAZY_DETAILS
+from agents.utils.ranking import CandidateBatch
+from agents.utils.entity_resolver import EntityResolver
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
@@ -49,7 +51,7 @@ TOURIST_CATEGORIES = {
 }
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = get_places_gateway()
 
 # --- 랜드마크 에이전트 기능 (통합됨) ---
 
@@ -133,16 +135,15 @@ def search_landmarks(
 
         unique_results = list(all_results.values())
         
-        # 3. 필터링 (리뷰 50개 이상)
-        filtered = [r for r in unique_results
-                   if r.get('user_ratings_total', 0) >= 50]
-        
-        # 4. 정렬 (리뷰수, 평점 순)
-        sorted_results = sorted(
-            filtered,
-            key=lambda x: (x.get('user_ratings_total', 0), x.get('rating', 0)),
-            reverse=True
-        )
+        # 3~4. 필터링 (리뷰 50개 이상) + 정렬 (리뷰수, 평점 순 상위 15개)
+        # 웹 검색에 언급된 관광지는 우선 (추가 API 호출 없이 로컬 이름 매칭)
+        batch = CandidateBatch(unique_results)
+        sort_keys = [batch.reviews, batch.rating]
+        if place_names_from_web:
+            web_hits = EntityResolver(batch.places).hits(place_names_from_web)
+            logger.info(f"🌐 웹 언급 관광지 매칭: {int(sum(web_hits))}개")
+            sort_keys.insert(0, web_hits)
+        sorted_results = batch.top_k(sort_keys, k=15, where=batch.reviews >= 50)
         
         # 랜덤 선택 (상위 15개 중에서)
         import random
@@ -151,19 +152,24 @@ def search_landmarks(
         final_candidates = top_candidates[:10]
         
         # 5. 상세 정보 로드 및 변환
-        places = []
-        for place in final_candidates:
-            place_id = place['place_id']
-            # 상세 정보 요청 (필요한 필드만)
-            try:
-                details_result = gmaps.place(place_id, fields=[
+        # - lazy(기본): 목록은 검색 결과만으로 구성 (상세는 get_landmark_detail에서 조회)
+        # - eager: 필요한 필드만 동시 요청
+        if LAZY_DETAILS:
+            details_list = [{} for _ in final_candidates]
+        else:
+            details_list = gmaps.place_many(
+                [place['place_id'] for place in final_candidates],
+                fields=[
                     'formatted_phone_number', 'website', 
                     'opening_hours', 'formatted_address', 'photo'
-                ], language="ko")
-                details = details_result.get('result', {})
-            except Exception as detail_error:
-                logger.warning(f"상세 정보 로드 실패 ({place.get('name')}): {detail_error}")
-                details = {}
+                ],
+                language="ko"
+            )
+        
+        places = []
+        for place, details in zip(final_candidates, details_list):
+            place_id = place['place_id']
+            opening_hours = details.get('opening_hours') or place.get('opening_hours') or {}
             
             # 카테고리 상세 분류
             place_types = place.get('types', [])
@@ -187,13 +193,15 @@ def search_landmarks(
                 rating=place.get('rating', 0.0),
                 review_count=place.get('user_ratings_total', 0),
                 price_level=place.get('price_level', 0),
-                opening_hours=details.get('opening_hours', {}).get('weekday_text', []),
-                open_now=details.get('opening_hours', {}).get('open_now'),
+                opening_hours=opening_hours.get('weekday_text', []),
+                open_now=opening_hours.get('open_now'),
                 phone=details.get('formatted_phone_number'),
                 website=details.get('website'),
                 google_maps_url=f"https://www.google.com/maps/place/?q=place_id:{place_id}"
             ))
         
+        gmaps.register_places(final_candidates)
+        
         return AgentResponse(
             success=True,
             agent_name="landmark",
@@ -471,50 +479,29 @@ def find_nearby_landmarks(
             language="ko"
         )
         
-        # 기준 장소 제외 및 필터링
-        filtered_results = [
-            r for r in nearby_results.get('results', [])
-            if r['place_id'] != place_id and r.get('user_ratings_total', 0) >= 50
-        ]
-        
-        # 거리 계산 및 정렬
-        import math
-        def calculate_distance(lat1, lon1, lat2, lon2):
-            """두 좌표 간 거리 계산 (미터)"""
-            R = 6371000  # 지구 반경 (미터)
-            phi1 = math.radians(lat1)
-            phi2 = math.radians(lat2)
-            delta_phi = math.radians(lat2 - lat1)
-            delta_lambda = math.radians(lon2 - lon1)
-            
-            a = math.sin(delta_phi/2)**2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda/2)**2
-            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-            return R * c
-        
-        for result in filtered_results:
-            loc = result['geometry']['location']
-            distance = calculate_distance(
-                base_location['lat'], base_location['lng'],
-                loc['lat'], loc['lng']
-            )
-            result['distance_meters'] = distance
-        
-        # 거리순 정렬 및 제한
-        sorted_results = sorted(filtered_results, key=lambda x: x['distance_meters'])[:limit]
+        # 기준 장소 제외 및 필터링 + 거리 계산/정렬 (열 배열로 한 번에)
+        batch = CandidateBatch(nearby_results.get('results', []))
+        distances = batch.distances(base_location['lat'], base_location['lng'])
+        keep = batch.mask(min_reviews=50, exclude_ids=[place_id])
+        sorted_results = batch.top_k([distances], k=limit, descending=False, where=keep)
+        
+        distance_by_id = dict(zip((p['place_id'] for p in batch.places), distances.tolist()))
+        for result in sorted_results:
+            result['distance_meters'] = distance_by_id[result['place_id']]
+        
+        # 상세 정보 가져오기 (동시 요청)
+        details_list = gmaps.place_many(
+            [place['place_id'] for place in sorted_results],
+            fields=[
+                'formatted_phone_number', 'website', 
+                'opening_hours', 'formatted_address'
+            ],
+            language="ko"
+        )
         
         # PlaceData 형식으로 변환
         places = []
-        for place in sorted_results:
-            # 상세 정보 가져오기
-            try:
-                details_result = gmaps.place(place['place_id'], fields=[
-                    'formatted_phone_number', 'website', 
-                    'opening_hours', 'formatted_address'
-                ], language="ko")
-                details = details_result.get('result', {})
-            except:
-                details = {}
-            
+        for place, details in zip(sorted_results, details_list):
             distance_km = place['distance_meters'] / 1000
             distance_text = f"{distance_km:.1f}km" if distance_km >= 1 else f"{int(place['distance_meters'])}m"
             
@@ -2,14 +2,26 @@
 
 from langchain_openai import ChatOpenAI
 from .state import TravelAgentState
+from agents.utils.keyword_engine import match_keywords
 
 
 # GPT-4 모델 설정
 llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
 
 
+def _classify_by_keywords(user_input: str) -> str | None:
+    """키워드로 의도 판별 (restaurant/itinerary 중 하나만 걸리면 그 의도, 아니면 None)"""
+    intents = match_keywords(user_input).labels("intent")
+    return intents[0] if len(intents) == 1 else None
+
+
 def classify_intent(user_input: str) -> str:
-    """GPT-4로 사용자 의도를 분류합니다"""
+    """사용자 의도 분류 (키워드로 확실하면 LLM 호출 없이, 애매하면 GPT-4)"""
+    
+    # 키워드가 한 가지 의도만 가리키면 로컬에서 바로 결정
+    intent = _classify_by_keywords(user_input)
+    if intent:
+        return intent
     
     prompt = f"""사용자 입력을 다음 의도 중 하나로 분류하세요:
 
@@ -22,30 +34,22 @@ def classify_intent(user_input: str) -> str:
 
 **한 단어로만 답하세요** (restaurant, itinerary, chat 중 하나만)"""
     
+    # 폴백: 키워드 기반 (두 의도가 모두 걸리면 restaurant 우선)
+    fallback = match_keywords(user_input).first("intent") or "chat"
+    
     try:
         response = llm.invoke(prompt)
         intent = response.content.strip().lower()
         
         # 검증
         if intent not in ["restaurant", "itinerary", "chat"]:
-            # 폴백: 키워드 기반
-            if any(word in user_input.lower() for word in ['맛집', '음식', '식당', '먹을', '레스토랑']):
-                return "restaurant"
-            elif any(word in user_input.lower() for word in ['일정', '계획', '여행', '스케줄']):
-                return "itinerary"
-            else:
-                return "chat"
+            return fallback
         
         return intent
         
     except Exception as e:
         print(f"GPT-4 의도 분류 실패: {e}")
-        # 폴백
-        if any(word in user_input.lower() for word in ['맛집', '음식', '식당']):
-            return "restaurant"
-        elif any(word in user_input.lower() for word in ['일정', '계획']):
-            return "itinerary"
-        return "chat"
+        return fallback
 
 
 def orchestrator_node(state: TravelAgentState) -> TravelAgentState:
@@ -0,0 +1,95 @@
+"""
+Parallel Agent Executor
+한 번의 LLM 스텝에서 나온 여러 Tool 호출을 동시에 실행하는 AgentExecutor
+
+- 예: "파스타랑 닭갈비" → call_restaurant_agent 2회, 다중 지역 → call_region_agent 여러 회
+- sync: 공용 스레드 풀(크기 제한)에서 실행, 결과는 요청 순서대로 반환
+- async: AgentExecutor 기본 asyncio.gather 실행에 Semaphore로 동시 실행 수 제한
+- Tool 호출이 1개면 기존과 동일하게 현재 스레드에서 실행
+
+턴 지연 시간 = 하위 에이전트 지연 시간의 합 → 가장 느린 하위 에이전트 지연 시간
+
+환경 변수:
+- COORDINATOR_MAX_PARALLEL_TOOLS: 동시에 실행할 Tool 수 (기본 4)
+"""
+
+import os
+import asyncio
+import logging
+import weakref
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable
+
+from langchain.agents import AgentExecutor
+from langchain_core.agents import AgentStep
+
+logger = logging.getLogger(__name__)
+
+MAX_PARALLEL_TOOLS = int(os.getenv("COORDINATOR_MAX_PARALLEL_TOOLS", 4))
+
+# sync 경로용 공용 스레드 풀
+_tool_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOLS, thread_name_prefix="coordinator-tool")
+
+# async 경로용 이벤트 루프별 Semaphore
+# (대기한 적 있는 Semaphore는 루프를 참조하므로 닫힌 루프의 항목은 새로 만들 때 정리)
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        for closed in [other for other in list(_semaphores) if other.is_closed()]:
+            _semaphores.pop(closed, None)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOLS)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+class _DeferredStep:
+    """실행을 미룬 Tool 호출 (_iter_next_step에서 모아서 한 번에 실행)"""
+
+    def __init__(self, run: Callable[[], AgentStep]):
+        self.run = run
+
+
+class ParallelAgentExecutor(AgentExecutor):
+    """같은 스텝의 Tool 호출을 병렬 실행하는 AgentExecutor"""
+
+    def _perform_agent_action(self, name_to_tool_map, color_mapping, agent_action, run_manager=None):
+        # 바로 실행하지 않고 _iter_next_step에서 모아서 실행
+        perform = super()._perform_agent_action
+        return _DeferredStep(partial(perform, name_to_tool_map, color_mapping, agent_action, run_manager))
+
+    def _iter_next_step(self, name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager=None):
+        deferred = []
+        for item in super()._iter_next_step(
+            name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+        ):
+            if isinstance(item, _DeferredStep):
+                deferred.append(item)
+            else:
+                yield item
+
+        if len(deferred) == 1:
+            yield deferred[0].run()
+            return
+
+        if deferred:
+            logger.info(f"⚡ Tool {len(deferred)}개 병렬 실행")
+            # 스레드마다 현재 context(콜백/설정) 복사본에서 실행
+            futures = [
+                _tool_pool.submit(contextvars.copy_context().run, step.run)
+                for step in deferred
+            ]
+            # 요청 순서대로 결과 병합
+            for future in futures:
+                yield future.result()
+
+    async def _aperform_agent_action(self, name_to_tool_map, color_mapping, agent_action, run_manager=None):
+        async with _get_semaphore():
+            return await super()._aperform_agent_action(
+                name_to_tool_map, color_mapping, agent_action, run_manager
+            )
@@ -5,8 +5,8 @@ import os
 from typing import List, Optional
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
-import googlemaps
 from schemas.data_models import RegionInfo, AgentResponse
+from agents.utils.places_gateway import get_places_gateway
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +22,7 @@ llm = ChatOpenAI(
     api_key=OPENAI_API_KEY
 ) if OPENAI_API_KEY else None
 
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = get_places_gateway()
 
 
 # 인기 도시 하드코딩 데이터 (즉시 응답)
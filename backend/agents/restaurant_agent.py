@@ -4,9 +4,14 @@ import logging
 import json
 from typing import List, Optional
 from dotenv import load_dotenv
-import googlemaps
 from langchain_openai import ChatOpenAI
 from schemas.data_models import PlaceData, AgentResponse
+from agents.utils.places_gateway import get_places_gateway, LAZY_DETAILS, SUMMARY_DETAIL_FIELDS
+from agents.utils.gazetteer import lookup_region
+from agents.utils.cache import get_cache
+from agents.utils.ranking import CandidateBatch
+from agents.utils.entity_resolver import EntityResolver
+from agents.utils.photo_store import photo_url, LIST_WIDTH
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
@@ -16,23 +21,22 @@ logger = logging.getLogger(__name__)
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = get_places_gateway()
 llm = ChatOpenAI(
     model="gpt-4o-mini",
     temperature=0.7,
     api_key=OPENAI_API_KEY
 ) if OPENAI_API_KEY else None
 
-# API 호출 캐시 (성능 최적화)
-_place_cache = {}
-
 # LLM 결과 캐시 (성능 최적화 - 3-5초 → 0.1초)
-_llm_cache = {}
+# 리뷰가 바뀌는 주기에 맞춰 6시간 보관, 메모리에서 밀려나면 디스크에 보관
+LLM_CACHE_TTL = int(os.getenv("RESTAURANT_LLM_CACHE_TTL", 6 * 60 * 60))
+_llm_cache = get_cache("restaurant_llm", max_entries=500, ttl=LLM_CACHE_TTL, spill=True)
 
 
 def get_place_details(place_id: str, fields: list) -> dict:
     """
-    Google Places API 호출 with 캐싱
+    Google Places API 호출 (캐싱은 PlacesGateway가 필드 단위로 처리)
     
     Args:
         place_id: Place ID
@@ -41,18 +45,8 @@ def get_place_details(place_id: str, fields: list) -> dict:
     Returns:
         dict: Place details
     """
-    # 캐시 키 생성
-    cache_key = f"{place_id}:{','.join(sorted(fields))}"
-    
-    # 캐시에 있으면 반환
-    if cache_key in _place_cache:
-        return _place_cache[cache_key]
-    
-    # API 호출
     try:
-        result = gmaps.place(place_id, fields=fields, language='ko')['result']
-        _place_cache[cache_key] = result
-        return result
+        return gmaps.place(place_id, fields=fields, language='ko')['result']
     except Exception as e:
         logger.warning(f"API 호출 실패: {e}")
         return {}
@@ -68,6 +62,11 @@ def detect_region_type(region: str) -> tuple[str, int]:
     Returns:
         (타입, 반경) 튜플
     """
+    # 지명 사전에 있으면 지역별 권장 반경 사용
+    entry = lookup_region(region)
+    if entry is not None:
+        return ("city" if entry["kind"] == "city" else "district", entry["radius"])
+    
     if ' ' in region.strip():
         return ("district", 10000)
     else:
@@ -125,35 +124,32 @@ def search_restaurants(
         # 0. Serper로 먼저 웹 검색 (유명한 가게 이름 추출)
         place_names_from_web = []
         try:
-            from agents.utils.serper_utils import search_with_serper, extract_place_names
+            from agents.utils.serper_utils import search_many, extract_place_names
             
-            # 1차: 메뉴 특화 검색 (사용자 입력 그대로)
             if preference:
+                # 1차: 메뉴 특화 검색 (사용자 입력 그대로)
+                # 2차: 일반 검색 (메뉴에서 카테고리 추출, 예: "토마토 파스타" → "파스타")
+                # 두 쿼리를 배치 요청 1회로 함께 검색하고 2차 결과는 1차가 부족할 때만 사용
                 search_query_specific = f"{region} {preference} 맛집"
-                logger.info(f"🌐 Serper 1차 검색 (메뉴 특화): {search_query_specific}")
-                serper_results = search_with_serper(search_query_specific, num_results=10)
+                general_category = preference.split()[-1] if ' ' in preference else preference
+                queries = [search_query_specific]
+                if general_category != preference:  # 메뉴 특화와 다른 경우만
+                    queries.append(f"{region} {general_category} 맛집")
+                logger.info(f"🌐 Serper 검색: {queries}")
+                serper_results, *rest = search_many(queries, num_results=10)
                 
                 if serper_results:
                     place_names_from_web = extract_place_names(serper_results, preference)
                     logger.info(f"📝 1차 검색 결과: {len(place_names_from_web)}개")
                 
                 # 2차: 일반 검색 (결과가 부족하면)
-                if len(place_names_from_web) < 5:
-                    # 메뉴에서 카테고리 추출 (예: "토마토 파스타" → "파스타")
-                    general_category = preference.split()[-1] if ' ' in preference else preference
-                    
-                    if general_category != preference:  # 메뉴 특화와 다른 경우만
-                        search_query_general = f"{region} {general_category} 맛집"
-                        logger.info(f"🌐 Serper 2차 검색 (일반): {search_query_general}")
-                        serper_results_2 = search_with_serper(search_query_general, num_results=10)
-                        
-                        if serper_results_2:
-                            additional_names = extract_place_names(serper_results_2, general_category)
-                            # 중복 제거하고 추가
-                            for name in additional_names:
-                                if name not in place_names_from_web:
-                                    place_names_from_web.append(name)
-                            logger.info(f"📝 2차 검색 추가: {len(additional_names)}개 (총 {len(place_names_from_web)}개)")
+                if len(place_names_from_web) < 5 and rest and rest[0]:
+                    additional_names = extract_place_names(rest[0], general_category)
+                    # 중복 제거하고 추가
+                    for name in additional_names:
+                        if name not in place_names_from_web:
+                            place_names_from_web.append(name)
+                    logger.info(f"📝 2차 검색 추가: {len(additional_names)}개 (총 {len(place_names_from_web)}개)")
         except Exception as e:
             logger.warning(f"⚠️ Serper 검색 실패 (Google Places만 사용): {e}")
         
@@ -208,49 +204,36 @@ def search_restaurants(
                 message=f"{region}에서 맛집을 찾지 못했습니다. 검색 조건을 변경해보세요."
             )
         
-        # 3. 호텔/숙박시설 제외
-        filtered_restaurants = [
-            r for r in all_results
-            if not any(t in r.get('types', []) for t in ['lodging', 'hotel', 'motel', 'hostel', 'resort'])
-        ]
+        # 3~5. 필터링/정렬 (열 배열로 한 번에 계산)
+        batch = CandidateBatch(all_results)
         
-        logger.info(f"📊 호텔 제외: {len(all_results)}개 → {len(filtered_restaurants)}개")
+        # 호텔/숙박시설 제외
+        not_lodging = batch.mask(exclude_types=['lodging', 'hotel', 'motel', 'hostel', 'resort'])
+        logger.info(f"📊 호텔 제외: {len(all_results)}개 → {int(not_lodging.sum())}개")
         
-        # 4. 리뷰 필터링 (리뷰 50개 이상)
-        filtered = [
-            r for r in filtered_restaurants
-            if r.get('user_ratings_total', 0) >= 50
-        ]
-        
-        logger.info(f"📊 필터링: {len(filtered_restaurants)}개 → {len(filtered)}개 (리뷰 50개 이상)")
+        # 리뷰 필터링 (리뷰 50개 이상)
+        keep = not_lodging & (batch.reviews >= 50)
+        logger.info(f"📊 필터링: {int(not_lodging.sum())}개 → {int(keep.sum())}개 (리뷰 50개 이상)")
         
         # 필터링 결과가 없으면 리뷰 10개 이상으로 완화
-        if not filtered:
-            filtered = [
-                r for r in filtered_restaurants
-                if r.get('user_ratings_total', 0) >= 10
-            ]
-            logger.info(f"📊 필터 완화: {len(filtered)}개 (리뷰 10개 이상)")
-        
-        # 5. 정렬
+        if not keep.any():
+            keep = not_lodging & (batch.reviews >= 10)
+            logger.info(f"📊 필터 완화: {int(keep.sum())}개 (리뷰 10개 이상)")
+        
+        # 웹 검색에 언급된 가게를 후보에서 찾아 표시 (추가 API 호출 없이 로컬 이름 매칭)
+        web_hits = EntityResolver(batch.places).hits(place_names_from_web) if place_names_from_web else None
+        if web_hits:
+            logger.info(f"🌐 웹 언급 가게 매칭: {int(sum(web_hits))}개")
+        
+        # 정렬 (셔플 대상 상위 15개까지만)
         if sort_by == "rating":
-            sorted_results = sorted(
-                filtered,
-                key=lambda x: (x.get('rating', 0), x.get('user_ratings_total', 0)),
-                reverse=True
-            )[:num_results]
+            sorted_results = batch.top_k([batch.rating, batch.reviews], k=min(num_results, 15), where=keep)
         elif sort_by == "popularity":
-            sorted_results = sorted(
-                filtered,
-                key=lambda x: (x.get('user_ratings_total', 0) * x.get('rating', 0)),
-                reverse=True
-            )[:num_results]
+            sorted_results = batch.top_k([batch.reviews * batch.rating], k=min(num_results, 15), where=keep)
+        elif web_hits:  # review_count (기본) + 웹 언급 가게 우선
+            sorted_results = batch.top_k([web_hits, batch.reviews, batch.rating], k=15, where=keep)
         else:  # review_count (기본)
-            sorted_results = sorted(
-            filtered,
-            key=lambda x: (x.get('user_ratings_total', 0), x.get('rating', 0)),
-            reverse=True
-        )
+            sorted_results = batch.top_k([batch.reviews, batch.rating], k=15, where=keep)
         
         # 다양성을 위한 랜덤 셔플 (상위 15개 중에서)
         import random
@@ -261,36 +244,26 @@ def search_restaurants(
         logger.info(f"🎯 랜덤 선택: {len(final_results)}개")
         
         # 6. 상세 정보 로드
+        # - lazy(기본): 목록은 검색 결과만으로 구성, 1순위만 백그라운드 prefetch
+        # - eager: 모든 결과의 상세 정보를 동시 요청
+        place_ids = [place['place_id'] for place in final_results]
+        if LAZY_DETAILS:
+            details_list = [{} for _ in final_results]
+        else:
+            details_list = gmaps.place_many(place_ids, fields=SUMMARY_DETAIL_FIELDS, language='ko')
+        
         places = []
-        for place in final_results:
+        for place, details in zip(final_results, details_list):
             place_id = place['place_id']
+            opening_hours = details.get('opening_hours') or place.get('opening_hours') or {}
             
-            # 상세 정보 가져오기
-            try:
-                details = gmaps.place(
-                    place_id,
-                    fields=[
-                        'formatted_phone_number',
-                        'website',
-                        'opening_hours',
-                        'formatted_address',
-                        'photo',
-                        'price_level'
-                    ],
-                    language='ko'
-                )['result']
-            except Exception as e:
-                logger.warning(f"⚠️ 상세 정보 로드 실패 ({place['name']}): {e}")
-                details = {}
-            
-            # 사진 URL 생성
+            # 사진 URL 생성 (검색 결과에도 사진 참조가 포함됨)
+            # API 키가 노출되지 않도록 백엔드 사진 프록시(/api/photos) 썸네일 URL 사용
             photo_urls = []
-            if details.get('photos'):
-                for photo in details['photos'][:3]:
-                    photo_ref = photo.get('photo_reference')
-                    if photo_ref:
-                        photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_ref}&key={GOOGLE_API_KEY}"
-                        photo_urls.append(photo_url)
+            for photo in (details.get('photos') or place.get('photos') or [])[:3]:
+                photo_ref = photo.get('photo_reference')
+                if photo_ref:
+                    photo_urls.append(photo_url(photo_ref, width=LIST_WIDTH))
             
             place_data = PlaceData(
                 place_id=place_id,
@@ -302,9 +275,9 @@ def search_restaurants(
                 region=region,
                 rating=place.get('rating', 0),
                 review_count=place.get('user_ratings_total', 0),
-                price_level=details.get('price_level', 0),
-                opening_hours=details.get('opening_hours', {}).get('weekday_text', []),
-                open_now=details.get('opening_hours', {}).get('open_now'),
+                price_level=details.get('price_level', place.get('price_level', 0)),
+                opening_hours=opening_hours.get('weekday_text', []),
+                open_now=opening_hours.get('open_now'),
                 phone=details.get('formatted_phone_number'),
                 website=details.get('website'),
                 images=photo_urls,
@@ -314,6 +287,10 @@ def search_restaurants(
             
             places.append(place_data)
         
+        gmaps.register_places(final_results)
+        if LAZY_DETAILS:
+            gmaps.prefetch(place_ids[:1], fields=SUMMARY_DETAIL_FIELDS, language='ko')
+        
         logger.info(f"✅ 맛집 {len(places)}개 찾음!")
         
         return AgentResponse(
@@ -349,9 +326,10 @@ def get_restaurant_reviews(place_id: str, num_reviews: int = 10) -> AgentRespons
     """
     # LLM 캐시 확인
     cache_key = f"reviews:{place_id}:{num_reviews}"
-    if cache_key in _llm_cache:
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
         logger.info(f"⚡ 캐시 hit! 리뷰 요약 즉시 반환")
-        return _llm_cache[cache_key]
+        return cached
     
     try:
         if not gmaps:
@@ -438,7 +416,7 @@ JSON만 출력하고 다른 설명은 추가하지 마세요."""
             )
             
             # 캐시에 저장
-            _llm_cache[cache_key] = result
+            _llm_cache.set(cache_key, result)
             
             return result
             
@@ -478,9 +456,10 @@ def extract_menu(place_id: str, num_reviews: int = 20) -> AgentResponse:
     """
     # LLM 캐시 확인
     cache_key = f"menu:{place_id}:{num_reviews}"
-    if cache_key in _llm_cache:
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
         logger.info(f"⚡ 캐시 hit! 메뉴 추출 즉시 반환")
-        return _llm_cache[cache_key]
+        return cached
     
     try:
         if not gmaps:
@@ -565,7 +544,7 @@ JSON만 출력하고 다른 설명은 추가하지 마세요."""
             )
             
             # 캐시에 저장
-            _llm_cache[cache_key] = result
+            _llm_cache.set(cache_key, result)
             
             return result
             
@@ -759,12 +738,13 @@ def get_all_restaurant_info(place_id: str) -> dict:
             'reservation': {...},
             'price': {...},
             'parking': {...},
-            'pet': {...}
+            'pet': {...},
+            'contact': {...}
         }
     """
-    # 한 번의 API 호출로 모든 필드 가져오기
+    # 한 번의 API 호출로 모든 필드 가져오기 (목록에서 생략한 연락처/영업시간 포함)
     details = get_place_details(place_id, [
-        'reservable', 'reviews', 'price_level'
+        'reservable', 'reviews', *SUMMARY_DETAIL_FIELDS
     ])
     
     reviews = details.get('reviews', [])
@@ -819,9 +799,18 @@ def get_all_restaurant_info(place_id: str) -> dict:
             "evidence": f"{pet_allowed}/{pet_mentions}개 리뷰에서 동반 가능 언급"
         }
     
+    # 연락처/영업시간
+    contact_info = {
+        "address": details.get('formatted_address'),
+        "phone": details.get('formatted_phone_number'),
+        "website": details.get('website'),
+        "opening_hours": details.get('opening_hours', {}).get('weekday_text', [])
+    }
+    
     return {
         'reservation': reservation_info,
         'price': price_info,
         'parking': parking_info,
-        'pet': pet_info
+        'pet': pet_info,
+        'contact': contact_info
     }
@@ -0,0 +1,51 @@
+"""
+Session Locks
+세션별 asyncio.Lock 테이블 - 같은 세션의 턴은 순서대로, 다른 세션은 병렬로 실행
+
+- 전역 Lock 없이 세션 단위로만 직렬화
+- 참조 카운트 기반 eviction: 대기/실행 중인 요청이 없는 세션의 Lock은 즉시 제거
+  (테이블 크기 = 동시에 활성인 세션 수)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, List
+
+
+class SessionLockTable:
+    """세션 ID → asyncio.Lock 매핑 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self):
+        # session_id -> [lock, refcount]
+        self._locks: Dict[str, List] = {}
+        self._stats = {"acquired": 0, "contended": 0, "evicted": 0}
+
+    @asynccontextmanager
+    async def hold(self, session_id: str):
+        """세션 Lock 획득 (async with session_locks.hold(session_id): ...)"""
+        entry = self._locks.get(session_id)
+        if entry is None:
+            entry = [asyncio.Lock(), 0]
+            self._locks[session_id] = entry
+        entry[1] += 1
+
+        lock = entry[0]
+        if lock.locked():
+            self._stats["contended"] += 1
+
+        try:
+            async with lock:
+                self._stats["acquired"] += 1
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and self._locks.get(session_id) is entry:
+                del self._locks[session_id]
+                self._stats["evicted"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "active_sessions": len(self._locks)}
+
+
+# 전역 세션 Lock 테이블
+session_locks = SessionLockTable()
@@ -0,0 +1,294 @@
+"""
+Session Store
+세션별 상태(FlowState, 대화 기록, 페르소나)를 저장하는 교체 가능한 저장소
+
+Backends:
+1. InMemorySessionStore: LRU + TTL (프로세스 메모리, 가장 빠름)
+2. SQLiteSessionStore: SQLite 영속 저장 (재시작 유지, 여러 워커가 같은 파일 공유)
+
+환경 변수:
+- SESSION_STORE_BACKEND: "memory" (기본) | "sqlite"
+- SESSION_STORE_PATH: SQLite 파일 경로 (기본: backend/data/sessions.db)
+- SESSION_TTL_SECONDS: 유휴 세션 만료 시간 (기본 6시간)
+- SESSION_MAX_SESSIONS: 최대 세션 수 (기본 1000)
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 네임스페이스 (세션 하나에 저장되는 상태 종류)
+NS_FLOW_STATE = "flow_state"
+NS_MEMORY = "memory"
+NS_PERSONA = "persona"
+
+DEFAULT_TTL_SECONDS = 6 * 60 * 60  # 6시간
+DEFAULT_MAX_SESSIONS = 1000
+
+
+# 네임스페이스별 직렬화 함수 (영속 backend에서만 사용)
+# namespace -> (dumps: obj -> JSON 호환 값, loads: JSON 호환 값 -> obj)
+_codecs: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {}
+
+
+def register_codec(namespace: str, dumps: Callable[[Any], Any], loads: Callable[[Any], Any]) -> None:
+    """네임스페이스 직렬화 함수 등록 (미등록 시 값 그대로 JSON 직렬화)"""
+    _codecs[namespace] = (dumps, loads)
+
+
+def _encode(namespace: str, value: Any) -> bytes:
+    """값 → 압축된 JSON bytes"""
+    codec = _codecs.get(namespace)
+    if codec:
+        value = codec[0](value)
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+    return zlib.compress(raw.encode("utf-8"))
+
+
+def _decode(namespace: str, payload: bytes) -> Any:
+    """압축된 JSON bytes → 값"""
+    value = json.loads(zlib.decompress(payload).decode("utf-8"))
+    codec = _codecs.get(namespace)
+    if codec:
+        value = codec[1](value)
+    return value
+
+
+class SessionStore(ABC):
+    """세션 저장소 인터페이스"""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    @abstractmethod
+    def get(self, namespace: str, session_id: str, default: Any = None) -> Any:
+        """세션 값 조회 (없거나 만료되면 default)"""
+
+    @abstractmethod
+    def set(self, namespace: str, session_id: str, value: Any) -> None:
+        """세션 값 저장"""
+
+    @abstractmethod
+    def delete(self, namespace: str, session_id: str) -> None:
+        """세션의 특정 네임스페이스 값 삭제"""
+
+    @abstractmethod
+    def clear_session(self, session_id: str) -> None:
+        """세션의 모든 값 삭제"""
+
+    @abstractmethod
+    def session_count(self) -> int:
+        """저장된 세션 수"""
+
+    def stats(self) -> Dict[str, Any]:
+        """hit/miss/eviction 카운터 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["sessions"] = self.session_count()
+        stats["backend"] = type(self).__name__
+        return stats
+
+
+class InMemorySessionStore(SessionStore):
+    """LRU + TTL 메모리 저장소 (객체를 그대로 보관하므로 직렬화 비용 없음)"""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        super().__init__(ttl_seconds, max_sessions)
+        # session_id -> (last_access, {namespace: value})
+        self._sessions: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _live_entry(self, session_id: str, now: float) -> Optional[Dict[str, Any]]:
+        """만료되지 않은 세션 데이터 반환 + LRU 갱신 (lock 보유 상태에서 호출)"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        last_access, data = entry
+        if now - last_access > self.ttl_seconds:
+            del self._sessions[session_id]
+            self._stats["expirations"] += 1
+            return None
+        self._sessions[session_id] = (now, data)
+        self._sessions.move_to_end(session_id)
+        return data
+
+    def get(self, namespace: str, session_id: str, default: Any = None) -> Any:
+        with self._lock:
+            data = self._live_entry(session_id, time.time())
+            if data is None or namespace not in data:
+                self._stats["misses"] += 1
+                return default
+            self._stats["hits"] += 1
+            return data[namespace]
+
+    def set(self, namespace: str, session_id: str, value: Any) -> None:
+        with self._lock:
+            now = time.time()
+            data = self._live_entry(session_id, now)
+            if data is None:
+                data = {}
+                self._sessions[session_id] = (now, data)
+            data[namespace] = value
+            self._evict_overflow()
+
+    def _evict_overflow(self) -> None:
+        while len(self._sessions) > self.max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            self._stats["evictions"] += 1
+            logger.info(f"🧹 세션 evict (LRU): {evicted_id}")
+
+    def delete(self, namespace: str, session_id: str) -> None:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry:
+                entry[1].pop(namespace, None)
+
+    def clear_session(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def session_count(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite 영속 저장소 (zlib 압축 JSON, WAL 모드로 여러 워커 공유)"""
+
+    # 이 횟수마다 만료/초과 세션 정리
+    SWEEP_EVERY_WRITES = 100
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_sessions: int = DEFAULT_MAX_SESSIONS
+    ):
+        super().__init__(ttl_seconds, max_sessions)
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT NOT NULL,
+                namespace TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (session_id, namespace)
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_access ON sessions(last_access)")
+        self._conn.commit()
+        self._writes = 0
+
+    def get(self, namespace: str, session_id: str, default: Any = None) -> Any:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, last_access FROM sessions WHERE session_id=? AND namespace=?",
+                (session_id, namespace)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return default
+            payload, last_access = row
+            if now - last_access > self.ttl_seconds:
+                self._conn.execute("DELETE FROM sessions WHERE session_id=?", (session_id,))
+                self._conn.commit()
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return default
+            self._conn.execute(
+                "UPDATE sessions SET last_access=? WHERE session_id=?",
+                (now, session_id)
+            )
+            self._conn.commit()
+            self._stats["hits"] += 1
+        return _decode(namespace, payload)
+
+    def set(self, namespace: str, session_id: str, value: Any) -> None:
+        payload = _encode(namespace, value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, namespace, payload, last_access) VALUES (?, ?, ?, ?)",
+                (session_id, namespace, payload, time.time())
+            )
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % self.SWEEP_EVERY_WRITES == 0:
+                self._sweep()
+
+    def _sweep(self) -> None:
+        """만료 세션 삭제 + max_sessions 초과 시 오래된 세션부터 삭제 (lock 보유 상태에서 호출)"""
+        cutoff = time.time() - self.ttl_seconds
+        expired = self._conn.execute(
+            "DELETE FROM sessions WHERE session_id IN "
+            "(SELECT session_id FROM sessions GROUP BY session_id HAVING MAX(last_access) < ?)",
+            (cutoff,)
+        ).rowcount
+        self._stats["expirations"] += max(expired, 0)
+
+        overflow = self._count_sessions() - self.max_sessions
+        if overflow > 0:
+            victims = self._conn.execute(
+                "SELECT session_id FROM sessions GROUP BY session_id ORDER BY MAX(last_access) LIMIT ?",
+                (overflow,)
+            ).fetchall()
+            self._conn.executemany("DELETE FROM sessions WHERE session_id=?", victims)
+            self._stats["evictions"] += len(victims)
+            logger.info(f"🧹 세션 evict (LRU): {len(victims)}개")
+        self._conn.commit()
+
+    def _count_sessions(self) -> int:
+        return self._conn.execute("SELECT COUNT(DISTINCT session_id) FROM sessions").fetchone()[0]
+
+    def delete(self, namespace: str, session_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM sessions WHERE session_id=? AND namespace=?",
+                (session_id, namespace)
+            )
+            self._conn.commit()
+
+    def clear_session(self, session_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE session_id=?", (session_id,))
+            self._conn.commit()
+
+    def session_count(self) -> int:
+        with self._lock:
+            return self._count_sessions()
+
+
+def create_session_store() -> SessionStore:
+    """환경 변수 설정에 따라 세션 저장소 생성"""
+    backend = os.getenv("SESSION_STORE_BACKEND", "memory").lower()
+    ttl = float(os.getenv("SESSION_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+    max_sessions = int(os.getenv("SESSION_MAX_SESSIONS", DEFAULT_MAX_SESSIONS))
+
+    if backend == "sqlite":
+        default_path = os.path.join(os.path.dirname(__file__), "..", "data", "sessions.db")
+        path = os.getenv("SESSION_STORE_PATH", default_path)
+        logger.info(f"💾 SQLite 세션 저장소: {path}")
+        return SQLiteSessionStore(path, ttl_seconds=ttl, max_sessions=max_sessions)
+
+    return InMemorySessionStore(ttl_seconds=ttl, max_sessions=max_sessions)
+
+
+# 전역 세션 저장소
+session_store = create_session_store()
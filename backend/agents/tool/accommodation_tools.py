@@ -1,27 +1,38 @@
-"""숙소 검색 툴 모음 - 4개 툴 + 병렬 처리 최적화
+"""숙소 검색 툴 모음 - 5개 툴 + 병렬 처리 최적화
 
 Tools:
 1. search_accommodations: 숙소 검색 (고급 필터링)
 2. summarize_reviews: AI 리뷰 요약
 3. compare_booking_prices: 실시간 가격 비교 (병렬 처리!)
+   compare_booking_prices_batch: 검색 결과 전체 숙소 × 플랫폼 가격 매트릭스
 4. get_recommended_accommodations: AI 맞춤 추천
 
 ✨ 최적화:
 - 가격 비교 3개 플랫폼 병렬 처리 (3배 빠름!)
+  - 공용 AsyncClient(커넥션 풀) 사용, 429/5xx는 jitter 백오프 후 재시도
+  - async 호출(ainvoke/acompare_booking_prices)은 실행 중인 이벤트 루프에서 그대로 실행
+  - Booking.com dest_id는 플랫폼 ID 저장소(SQLite)에 보관 → 검색 API는 숙소당 한 번만
+  - Agoda/Airbnb 숙소 ID도 보관 → 다음 검색에서 ID로 고르고, 찾지 못한 숙소는 호출 생략
 - 5분 캐싱으로 중복 요청 즉시 응답
 """
 import os
 import logging
 import asyncio
-import requests
 import httpx
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, Union
 from dotenv import load_dotenv
-import googlemaps
 from openai import OpenAI
 from langchain.tools import tool
+from langchain_core.tools import StructuredTool
 from schemas.data_models import PlaceData, AgentResponse
+from agents.utils.places_gateway import get_places_gateway
+from agents.utils.cache import get_cache
+from agents.utils.ranking import CandidateBatch
+from agents.utils.entity_resolver import EntityResolver
+from agents.utils.keyword_engine import normalize_text
+from agents.utils.request_governor import get_upstream, backoff_delay
+from agents.utils.http_client import get_async_client, run_sync
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -33,15 +44,27 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = get_places_gateway()
 openai_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 
+# RapidAPI(Booking.com/Agoda/Airbnb) 플랫폼별 호출량 제한 (API마다 구독 플랜이 따로 있음)
+PRICE_PLATFORMS = ("Booking.com", "Agoda", "Airbnb")
+_rapidapi_upstreams = {
+    "Booking.com": get_upstream("rapidapi_booking"),
+    "Agoda": get_upstream("rapidapi_agoda"),
+    "Airbnb": get_upstream("rapidapi_airbnb"),
+}
+
 # 캐시 & 타임아웃 설정
-_price_cache = {}
 CACHE_TTL = 300  # 5분
+_price_cache = get_cache("accommodation_price", max_entries=1000, ttl=CACHE_TTL)
 QUICK_TIMEOUT = 10
 NORMAL_TIMEOUT = 20
 MAX_TIMEOUT = 30
+RAPIDAPI_MAX_RETRIES = 2
+RAPIDAPI_BACKOFF_SECONDS = 1.0
+# 일괄 가격 비교 최대 숙소 수
+PRICE_BATCH_MAX = int(os.getenv("PRICE_BATCH_MAX", 10))
 
 
 # ============================================================================
@@ -53,16 +76,8 @@ def get_reviews_enhanced(place_id: str) -> list:
     # 1차 시도: New Places API
     try:
         logger.info("  🔍 New API로 리뷰 수집 시도...")
-        url = f"https://places.googleapis.com/v1/places/{place_id}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-Goog-Api-Key": GOOGLE_API_KEY,
-            "X-Goog-FieldMask": "reviews"
-        }
-        response = requests.get(url, headers=headers, timeout=15)
-        
-        if response.status_code == 200:
-            data = response.json()
+        if gmaps:
+            data = gmaps.place_new(place_id, "reviews")
             new_api_reviews = data.get('reviews', [])
             
             if new_api_reviews:
@@ -99,82 +114,139 @@ def get_reviews_enhanced(place_id: str) -> list:
 # ASYNC HELPERS FOR PARALLEL PRICE COMPARISON
 # ============================================================================
 
+async def _rapidapi_get(url: str, headers: Dict[str, str], params: Dict[str, Any], timeout: float, platform: str) -> httpx.Response:
+    """RapidAPI GET (공용 AsyncClient 사용)
+
+    429 / 5xx / 연결 오류는 backoff_delay(지수 증가 + jitter)만큼 쉬고 최대 RAPIDAPI_MAX_RETRIES번 재시도.
+    3개 플랫폼이 동시에 제한을 받아도 재시도 시각이 흩어진다. 마지막 시도의 응답은 상태 코드와 관계없이 반환.
+    """
+    client = get_async_client()
+    upstream = _rapidapi_upstreams[platform]
+    for attempt in range(RAPIDAPI_MAX_RETRIES + 1):
+        try:
+            response = await upstream.acall(client.get, url, headers=headers, params=params, timeout=timeout)
+        except httpx.TransportError as e:
+            if attempt == RAPIDAPI_MAX_RETRIES:
+                raise
+            logger.warning(f"    ⚠️ {platform} 연결 오류 ({type(e).__name__}), 재시도 {attempt + 1}/{RAPIDAPI_MAX_RETRIES}...")
+        else:
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            if attempt == RAPIDAPI_MAX_RETRIES:
+                return response
+            logger.warning(f"    ⚠️ {platform} {response.status_code}, 재시도 {attempt + 1}/{RAPIDAPI_MAX_RETRIES}...")
+        await asyncio.sleep(backoff_delay(attempt, base=RAPIDAPI_BACKOFF_SECONDS))
+
+
+async def _lookup_platform_id(platform: str, place_name: str) -> Tuple[bool, Optional[str]]:
+    """장소 카탈로그의 플랫폼 ID 조회 (SQLite 조회는 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+    catalog = gmaps.catalog if gmaps else None
+    if not catalog:
+        return False, None
+    return await asyncio.to_thread(catalog.lookup_platform_id, platform, place_name)
+
+
+async def _save_platform_id(platform: str, place_name: str, platform_id: Optional[Any]) -> None:
+    """플랫폼 ID 저장 (None이면 '찾지 못함')"""
+    catalog = gmaps.catalog if gmaps else None
+    if catalog:
+        await asyncio.to_thread(catalog.save_platform_id, platform, place_name, platform_id)
+
+
+async def _match_listing(platform: str, place_name: str, listings: List[Dict], known_id: Optional[str]) -> Optional[Dict]:
+    """이름으로 검색한 숙소 목록에서 place_name에 해당하는 숙소 고르기
+
+    listings는 {'id', 'name', 'listing'} 목록. 저장된 ID가 있으면 ID로 고르고,
+    없으면 이름이 가장 비슷한 숙소(MATCH_THRESHOLD 미만이면 다른 숙소 → 찾지 못함)를 골라 ID를 저장한다.
+    """
+    if known_id:
+        for item in listings:
+            if item['id'] is not None and str(item['id']) == known_id:
+                return item
+    
+    match = EntityResolver(listings).match(place_name)
+    item = match.place if match else None
+    if item is None:
+        await _save_platform_id(platform, place_name, None)
+    elif item['id'] is not None:
+        await _save_platform_id(platform, place_name, item['id'])
+    return item
+
+
+async def _resolve_booking_dest_id(place_name: str, headers: Dict[str, str]) -> Optional[str]:
+    """숙소 이름 → Booking.com dest_id (장소 카탈로그에 있으면 검색 API 생략)"""
+    found, dest_id = await _lookup_platform_id("booking", place_name)
+    if found:
+        return dest_id
+    
+    search_url = "https://booking-com15.p.rapidapi.com/api/v1/hotels/searchDestination"
+    response = await _rapidapi_get(search_url, headers, {"query": place_name}, MAX_TIMEOUT, "Booking.com")
+    
+    if response.status_code != 200:
+        # 오류는 저장하지 않음 (다음 요청에서 다시 검색)
+        logger.warning(f"    ⚠️ Booking.com search failed: {response.status_code}")
+        return None
+    
+    # 호텔 결과 중 이름이 가장 비슷한 것 (동점이면 검색 순위 우선)
+    hotels = [
+        {'id': item.get('dest_id'), 'name': item.get('name', ''), 'listing': item}
+        for item in response.json().get('data') or [] if item.get('dest_type') == 'hotel'
+    ]
+    match = await _match_listing("booking", place_name, hotels, None)
+    return str(match['id']) if match and match['id'] is not None else None
+
+
 async def _fetch_booking_price_async(place_name: str, check_in: str, check_out: str, num_guests: int, nights: int) -> Optional[Dict]:
     """Booking.com 가격 조회 (비동기)"""
     try:
         logger.info("  📊 Booking.com 조회 중...")
         
-        async with httpx.AsyncClient(timeout=MAX_TIMEOUT) as client:
-            # Step 1: 호텔 검색
-            search_url = "https://booking-com15.p.rapidapi.com/api/v1/hotels/searchDestination"
-            headers = {
-                "X-RapidAPI-Key": RAPIDAPI_KEY,
-                "X-RapidAPI-Host": "booking-com15.p.rapidapi.com"
-            }
-            
-            # Rate limit 대응 재시도
-            max_retries = 2
-            response = None
-            for attempt in range(max_retries):
-                response = await client.get(search_url, headers=headers, params={"query": place_name})
-                
-                if response.status_code == 429 and attempt < max_retries - 1:
-                    logger.warning(f"    ⚠️ Booking.com Rate Limit, 재시도 {attempt + 1}/{max_retries}...")
-                    await asyncio.sleep(2)
-                    continue
-                break
-            
-            if not response or response.status_code != 200:
-                logger.warning(f"    ⚠️ Booking.com search failed: {response.status_code if response else 'No response'}")
-                return None
-            
-            data = response.json()
-            hotel_dest_id = None
-            
-            if data.get('data'):
-                for item in data['data']:
-                    if item.get('dest_type') == 'hotel':
-                        hotel_dest_id = item.get('dest_id')
-                        break
-            
-            if not hotel_dest_id:
-                logger.warning("    ⚠️ Booking.com: Hotel not found")
-                return None
-            
-            # Step 2: 가격 조회
-            price_url = "https://booking-com15.p.rapidapi.com/api/v1/hotels/searchHotels"
-            price_params = {
-                "dest_id": hotel_dest_id,
-                "search_type": "hotel",
-                "arrival_date": check_in,
-                "departure_date": check_out,
-                "adults": str(num_guests),
-                "room_qty": "1",
-                "languagecode": "ko-kr",
-                "currency_code": "KRW"
-            }
-            
-            price_response = await client.get(price_url, headers=headers, params=price_params)
+        headers = {
+            "X-RapidAPI-Key": RAPIDAPI_KEY,
+            "X-RapidAPI-Host": "booking-com15.p.rapidapi.com"
+        }
+        
+        # Step 1: 호텔 ID (저장소 → 검색 API)
+        hotel_dest_id = await _resolve_booking_dest_id(place_name, headers)
+        
+        if not hotel_dest_id:
+            logger.warning("    ⚠️ Booking.com: Hotel not found")
+            return None
+        
+        # Step 2: 가격 조회
+        price_url = "https://booking-com15.p.rapidapi.com/api/v1/hotels/searchHotels"
+        price_params = {
+            "dest_id": hotel_dest_id,
+            "search_type": "hotel",
+            "arrival_date": check_in,
+            "departure_date": check_out,
+            "adults": str(num_guests),
+            "room_qty": "1",
+            "languagecode": "ko-kr",
+            "currency_code": "KRW"
+        }
+        
+        price_response = await _rapidapi_get(price_url, headers, price_params, MAX_TIMEOUT, "Booking.com")
+        
+        if price_response.status_code == 200:
+            price_data = price_response.json()
+            hotels = price_data.get('data', {}).get('hotels', [])
             
-            if price_response.status_code == 200:
-                price_data = price_response.json()
-                hotels = price_data.get('data', {}).get('hotels', [])
+            if hotels:
+                hotel = hotels[0]
+                price = hotel.get('price', {}).get('grossPrice', {}).get('amount', 0)
                 
-                if hotels:
-                    hotel = hotels[0]
-                    price = hotel.get('price', {}).get('grossPrice', {}).get('amount', 0)
-                    
-                    if price > 0:
-                        per_night_price = price / nights if nights > 0 else price
-                        logger.info(f"    ✅ Booking.com: {int(per_night_price):,}원")
-                        return {
-                            'platform': 'Booking.com',
-                            'price': int(per_night_price),
-                            'currency': 'KRW',
-                            'hotel_name': hotel.get('name', place_name),
-                            'room_type': '스탠다드',
-                            'rating': hotel.get('rating', 0)
-                        }
+                if price > 0:
+                    per_night_price = price / nights if nights > 0 else price
+                    logger.info(f"    ✅ Booking.com: {int(per_night_price):,}원")
+                    return {
+                        'platform': 'Booking.com',
+                        'price': int(per_night_price),
+                        'currency': 'KRW',
+                        'hotel_name': hotel.get('name', place_name),
+                        'room_type': '스탠다드',
+                        'rating': hotel.get('rating', 0)
+                    }
         
         return None
     except Exception as e:
@@ -183,94 +255,94 @@ async def _fetch_booking_price_async(place_name: str, check_in: str, check_out:
 
 
 async def _fetch_agoda_price_async(place_name: str, check_in: str, check_out: str, nights: int) -> Optional[Dict]:
-    """Agoda 가격 조회 (비동기)"""
+    """Agoda 가격 조회 (비동기)
+
+    검색 API가 이름 검색과 가격을 한 번에 주므로 호출은 매번 필요하다.
+    장소 카탈로그에는 매칭된 propertyId를 저장해 다음 검색에서 ID로 고르고, 찾지 못한 숙소는 호출을 생략한다.
+    """
     try:
         logger.info("  📊 Agoda 조회 중...")
         
-        async with httpx.AsyncClient(timeout=NORMAL_TIMEOUT) as client:
-            url = "https://agoda-travel.p.rapidapi.com/agoda-app/hotels/search-overnight"
-            headers = {
-                "X-RapidAPI-Key": RAPIDAPI_KEY,
-                "X-RapidAPI-Host": "agoda-travel.p.rapidapi.com"
-            }
-            params = {
-                "query": place_name,
-                "checkin": check_in,
-                "checkout": check_out
-            }
+        found, property_id = await _lookup_platform_id("agoda", place_name)
+        if found and not property_id:
+            logger.info(f"    ⏭️ Agoda: '{place_name}' 이전 검색에서 찾지 못한 숙소")
+            return None
+        
+        url = "https://agoda-travel.p.rapidapi.com/agoda-app/hotels/search-overnight"
+        headers = {
+            "X-RapidAPI-Key": RAPIDAPI_KEY,
+            "X-RapidAPI-Host": "agoda-travel.p.rapidapi.com"
+        }
+        params = {
+            "query": place_name,
+            "checkin": check_in,
+            "checkout": check_out
+        }
+        
+        response = await _rapidapi_get(url, headers, params, NORMAL_TIMEOUT, "Agoda")
+        
+        if response.status_code == 200:
+            data = response.json()
             
-            response = await client.get(url, headers=headers, params=params)
+            # 응답 구조 파싱
+            hotels = []
+            if data.get('data'):
+                data_content = data['data']
+                if isinstance(data_content, list):
+                    hotels = data_content
+                elif isinstance(data_content, dict):
+                    hotels = data_content.get('properties', []) or data_content.get('hotels', [])
+            elif isinstance(data, list):
+                hotels = data
+            
+            listings = []
+            for hotel in hotels[:20]:
+                content = hotel.get('content', {})
+                hotel_name = ''
+                if content.get('informationSummary'):
+                    info = content['informationSummary']
+                    hotel_name = info.get('defaultName', '') or info.get('localeName', '')
+                if not hotel_name:
+                    hotel_name = content.get('name', '') or hotel.get('name', '')
+                listings.append({'id': hotel.get('propertyId'), 'name': hotel_name, 'listing': hotel})
             
-            if response.status_code == 200:
-                data = response.json()
+            match = await _match_listing("agoda", place_name, listings, property_id)
+            if match:
+                hotel = match['listing']
+                
+                # 가격 추출
+                price = 0
+                currency = 'KRW'
+                pricing = hotel.get('pricing', {})
+                if pricing.get('offers') and isinstance(pricing['offers'], list) and pricing['offers']:
+                    offer = pricing['offers'][0]
+                    if offer.get('roomOffers') and isinstance(offer['roomOffers'], list) and offer['roomOffers']:
+                        room_offer = offer['roomOffers'][0]
+                        if room_offer.get('room'):
+                            room = room_offer['room']
+                            if isinstance(room.get('pricing'), list) and room['pricing']:
+                                room_pricing = room['pricing'][0]
+                                currency = room_pricing.get('currency', 'KRW')
+                                if room_pricing.get('price'):
+                                    price_obj = room_pricing['price']
+                                    if isinstance(price_obj, dict):
+                                        price = (price_obj.get('perRoomPerNight', {}).get('exclusive', {}).get('display') or
+                                                price_obj.get('perNight', {}).get('exclusive', {}).get('display') or 0)
                 
-                # 응답 구조 파싱
-                hotels = []
-                if data.get('data'):
-                    data_content = data['data']
-                    if isinstance(data_content, list):
-                        hotels = data_content
-                    elif isinstance(data_content, dict):
-                        hotels = data_content.get('properties', []) or data_content.get('hotels', [])
-                elif isinstance(data, list):
-                    hotels = data
+                # USD → KRW 변환
+                if currency == 'USD' and price > 0:
+                    price = price * 1300
                 
-                if hotels:
-                    # 호텔 이름 매칭
-                    for hotel in hotels[:20]:
-                        content = hotel.get('content', {})
-                        hotel_name = ''
-                        if content.get('informationSummary'):
-                            info = content['informationSummary']
-                            hotel_name = info.get('defaultName', '') or info.get('localeName', '')
-                        if not hotel_name:
-                            hotel_name = content.get('name', '') or hotel.get('name', '')
-                        
-                        # 한글/영문 매칭
-                        place_clean = place_name.replace(" ", "").replace("-", "").lower()
-                        hotel_clean = hotel_name.replace(" ", "").replace("-", "").lower()
-                        
-                        korean_to_english = {'롯데': 'lotte', '호텔': 'hotel', '서울': 'seoul'}
-                        place_english = place_clean
-                        for kr, en in korean_to_english.items():
-                            place_english = place_english.replace(kr, en)
-                        
-                        if (place_clean in hotel_clean or hotel_clean in place_clean or
-                            place_english in hotel_clean or hotel_clean in place_english):
-                            
-                            # 가격 추출
-                            price = 0
-                            currency = 'KRW'
-                            pricing = hotel.get('pricing', {})
-                            if pricing.get('offers') and isinstance(pricing['offers'], list) and pricing['offers']:
-                                offer = pricing['offers'][0]
-                                if offer.get('roomOffers') and isinstance(offer['roomOffers'], list) and offer['roomOffers']:
-                                    room_offer = offer['roomOffers'][0]
-                                    if room_offer.get('room'):
-                                        room = room_offer['room']
-                                        if isinstance(room.get('pricing'), list) and room['pricing']:
-                                            room_pricing = room['pricing'][0]
-                                            currency = room_pricing.get('currency', 'KRW')
-                                            if room_pricing.get('price'):
-                                                price_obj = room_pricing['price']
-                                                if isinstance(price_obj, dict):
-                                                    price = (price_obj.get('perRoomPerNight', {}).get('exclusive', {}).get('display') or
-                                                            price_obj.get('perNight', {}).get('exclusive', {}).get('display') or 0)
-                            
-                            # USD → KRW 변환
-                            if currency == 'USD' and price > 0:
-                                price = price * 1300
-                            
-                            if price > 0:
-                                logger.info(f"    ✅ Agoda: {int(price):,}원")
-                                return {
-                                    'platform': 'Agoda',
-                                    'price': int(price),
-                                    'currency': 'KRW',
-                                    'hotel_name': hotel_name,
-                                    'room_type': '스탠다드',
-                                    'rating': round(hotel.get('rating', 0) or hotel.get('starRating', 0), 1)
-                                }
+                if price > 0:
+                    logger.info(f"    ✅ Agoda: {int(price):,}원")
+                    return {
+                        'platform': 'Agoda',
+                        'price': int(price),
+                        'currency': 'KRW',
+                        'hotel_name': match['name'],
+                        'room_type': '스탠다드',
+                        'rating': round(hotel.get('rating', 0) or hotel.get('starRating', 0), 1)
+                    }
         
         logger.warning(f"    ⚠️ Agoda: '{place_name}' 호텔을 찾을 수 없음")
         return None
@@ -280,82 +352,82 @@ async def _fetch_agoda_price_async(place_name: str, check_in: str, check_out: st
 
 
 async def _fetch_airbnb_price_async(place_name: str, check_in: str, check_out: str, num_guests: int, nights: int) -> Optional[Dict]:
-    """Airbnb 가격 조회 (비동기)"""
+    """Airbnb 가격 조회 (비동기)
+
+    Agoda와 같이 검색 결과에서 고른 숙소 ID를 장소 카탈로그에 저장한다.
+    """
     try:
         logger.info("  📊 Airbnb 조회 중...")
         
-        async with httpx.AsyncClient(timeout=NORMAL_TIMEOUT) as client:
-            url = "https://airbnb13.p.rapidapi.com/search-location"
-            headers = {
-                "X-RapidAPI-Key": RAPIDAPI_KEY,
-                "X-RapidAPI-Host": "airbnb13.p.rapidapi.com"
-            }
-            params = {
-                "location": place_name,
-                "checkin": check_in,
-                "checkout": check_out,
-                "adults": str(num_guests),
-                "children": "0"
-            }
+        found, listing_id = await _lookup_platform_id("airbnb", place_name)
+        if found and not listing_id:
+            logger.info(f"    ⏭️ Airbnb: '{place_name}' 이전 검색에서 찾지 못한 숙소")
+            return None
+        
+        url = "https://airbnb13.p.rapidapi.com/search-location"
+        headers = {
+            "X-RapidAPI-Key": RAPIDAPI_KEY,
+            "X-RapidAPI-Host": "airbnb13.p.rapidapi.com"
+        }
+        params = {
+            "location": place_name,
+            "checkin": check_in,
+            "checkout": check_out,
+            "adults": str(num_guests),
+            "children": "0"
+        }
+        
+        response = await _rapidapi_get(url, headers, params, NORMAL_TIMEOUT, "Airbnb")
+        
+        if response.status_code == 200:
+            data = response.json()
+            
+            # 응답 구조 파싱
+            listings = []
+            if data.get('results'):
+                listings = data['results']
+            elif data.get('data'):
+                if isinstance(data['data'], list):
+                    listings = data['data']
+                elif isinstance(data['data'], dict) and data['data'].get('results'):
+                    listings = data['data']['results']
             
-            response = await client.get(url, headers=headers, params=params)
+            candidates = [
+                {'id': listing.get('id'), 'name': listing.get('name', '') or listing.get('title', ''), 'listing': listing}
+                for listing in listings[:20]
+            ]
             
-            if response.status_code == 200:
-                data = response.json()
+            match = await _match_listing("airbnb", place_name, candidates, listing_id)
+            if match:
+                listing = match['listing']
                 
-                # 응답 구조 파싱
-                listings = []
-                if data.get('results'):
-                    listings = data['results']
-                elif data.get('data'):
-                    if isinstance(data['data'], list):
-                        listings = data['data']
-                    elif isinstance(data['data'], dict) and data['data'].get('results'):
-                        listings = data['data']['results']
+                # 가격 추출
+                price = 0
+                if listing.get('price'):
+                    price_data = listing['price']
+                    if isinstance(price_data, dict):
+                        price = price_data.get('rate', 0) or price_data.get('total', 0)
+                    elif isinstance(price_data, (int, float)):
+                        price = price_data
                 
-                if listings:
-                    # 숙소 이름 매칭
-                    for listing in listings[:20]:
-                        listing_name = listing.get('name', '') or listing.get('title', '')
-                        
-                        place_clean = place_name.replace(" ", "").replace("-", "").lower()
-                        listing_clean = listing_name.replace(" ", "").replace("-", "").lower()
-                        
-                        korean_to_english = {'롯데': 'lotte', '호텔': 'hotel', '서울': 'seoul'}
-                        place_english = place_clean
-                        for kr, en in korean_to_english.items():
-                            place_english = place_english.replace(kr, en)
-                        
-                        if (place_clean in listing_clean or listing_clean in place_clean or
-                            place_english in listing_clean or listing_clean in place_english):
-                            
-                            # 가격 추출
-                            price = 0
-                            if listing.get('price'):
-                                price_data = listing['price']
-                                if isinstance(price_data, dict):
-                                    price = price_data.get('rate', 0) or price_data.get('total', 0)
-                                elif isinstance(price_data, (int, float)):
-                                    price = price_data
-                            
-                            if not price and listing.get('pricing'):
-                                pricing = listing['pricing']
-                                if isinstance(pricing, dict):
-                                    price = (pricing.get('rate', {}).get('amount', 0) or
-                                            pricing.get('total', {}).get('amount', 0))
-                            
-                            # 1박 기준으로 변환
-                            if price > 0 and nights > 0:
-                                per_night = price / nights
-                                logger.info(f"    ✅ Airbnb: {int(per_night):,}원")
-                                return {
-                                    'platform': 'Airbnb',
-                                    'price': int(per_night),
-                                    'currency': 'KRW',
-                                    'hotel_name': listing_name,
-                                    'room_type': '전체 숙소',
-                                    'rating': round(listing.get('rating', 0) or listing.get('avgRating', 0), 1)
-                                }
+                if not price and listing.get('pricing'):
+                    pricing = listing['pricing']
+                    if isinstance(pricing, dict):
+                        price = (pricing.get('rate', {}).get('amount', 0) or
+                                pricing.get('total', {}).get('amount', 0))
+                
+                # 1박 기준으로 변환
+                if price > 0 and nights > 0:
+                    per_night = price / nights
+                    logger.info(f"    ✅ Airbnb: {int(per_night):,}원")
+                    return {
+                        'platform': 'Airbnb',
+                        'price': int(per_night),
+                        'currency': 'KRW',
+                        'hotel_name': match['name'],
+                        'room_type': '전체 숙소',
+                        'rating': round(listing.get('rating', 0) or listing.get('avgRating', 0), 1)
+                    }
         
         logger.warning(f"    ⚠️ Airbnb: '{place_name}' 숙소를 찾을 수 없음")
         return None
@@ -365,7 +437,15 @@ async def _fetch_airbnb_price_async(place_name: str, check_in: str, check_out: s
 
 
 async def _compare_prices_parallel(place_name: str, check_in: str, check_out: str, num_guests: int, nights: int) -> List[Dict]:
-    """3개 플랫폼 병렬 가격 조회 (3배 빠름!)"""
+    """3개 플랫폼 병렬 가격 조회 (3배 빠름!)
+
+    숙소별 결과를 캐시하므로 단건/일괄 비교가 같은 조회 결과를 공유한다.
+    """
+    cache_key = f"prices:{place_name}_{check_in}_{check_out}_{num_guests}"
+    cached_prices = _price_cache.get(cache_key)
+    if cached_prices is not None:
+        return cached_prices
+    
     tasks = [
         _fetch_booking_price_async(place_name, check_in, check_out, num_guests, nights),
         _fetch_agoda_price_async(place_name, check_in, check_out, nights),
@@ -380,6 +460,8 @@ async def _compare_prices_parallel(place_name: str, check_in: str, check_out: st
         if result and isinstance(result, dict):
             prices.append(result)
     
+    if prices:
+        _price_cache.set(cache_key, prices)
     return prices
 
 
@@ -457,75 +539,62 @@ def search_accommodations(
         
         coords = geocode_result[0]['geometry']['location']
         
-        # 2. 웹 검색 결과로 Google Places 검색
-        places = []
-        if web_place_names:
-            logger.info(f"  🔍 웹 검색 결과로 Google Places 검색...")
-            for place_name in web_place_names:
-                try:
-                    # Text Search로 정확한 장소 찾기
-                    text_search_result = gmaps.places(
-                        query=f"{place_name} {region}",
-                        language="ko"
-                    )
-                    
-                    if text_search_result.get('results'):
-                        place = text_search_result['results'][0]
-                        if place.get('user_ratings_total', 0) >= 10:  # 최소 리뷰 수
-                            places.append(place)
-                            logger.info(f"    ✅ {place['name']} - ⭐{place.get('rating', 0)}")
-                except Exception as e:
-                    logger.warning(f"    ⚠️ {place_name} 검색 실패: {e}")
-        
-        # 3. 웹 검색 결과가 없으면 기본 Google Places 검색
-        if not places:
-            logger.info(f"  🔍 Google Places 기본 검색...")
-            # 테마 키워드 매핑
-            search_keyword = preference
-            if preference:
-                for theme, keywords in THEME_KEYWORDS.items():
-                    if theme in preference:
-                        search_keyword = keywords
-                        break
-            
+        # 2. Google Places 후보 검색 (nearby 1회)
+        # 테마 키워드 매핑
+        search_keyword = preference
+        if preference:
+            for theme, keywords in THEME_KEYWORDS.items():
+                if theme in preference:
+                    search_keyword = keywords
+                    break
+        
+        results = gmaps.places_nearby(
+            location=(coords['lat'], coords['lng']),
+            radius=5000,
+            type="lodging",
+            keyword=search_keyword,
+            language="ko"
+        )
+        
+        if not results.get('results') and preference:
             results = gmaps.places_nearby(
                 location=(coords['lat'], coords['lng']),
                 radius=5000,
                 type="lodging",
-                keyword=search_keyword,
+                keyword=None,
                 language="ko"
             )
-            
-            if not results.get('results') and preference:
-                results = gmaps.places_nearby(
-                    location=(coords['lat'], coords['lng']),
-                    radius=5000,
-                    type="lodging",
-                    keyword=None,
-                    language="ko"
-                )
-            
-            if not results.get('results'):
-                return AgentResponse(
-                    success=True,
-                    agent_name="accommodation",
-                    data=[],
-                    count=0,
-                    message=f"{region}에서 숙소를 찾을 수 없습니다"
-                ).model_dump()
-            
-            places = results['results']
         
-        # 4. 필터링 (기본 필터만 - 예약 사이트는 이미 검증됨)
-        filtered = [r for r in places if r.get('user_ratings_total', 0) >= 50]
+        if not results.get('results'):
+            return AgentResponse(
+                success=True,
+                agent_name="accommodation",
+                data=[],
+                count=0,
+                message=f"{region}에서 숙소를 찾을 수 없습니다"
+            ).model_dump()
         
+        candidates = results['results']
         
-        if min_rating:
-            filtered = [r for r in filtered if r.get('rating', 0) >= min_rating]
-        if price_level is not None:
-            filtered = [r for r in filtered if r.get('price_level', 0) == price_level]
+        # 3. 웹 검색 결과를 후보와 로컬 이름 매칭 (숙소별 Text Search 대신)
+        # 매칭된 숙소가 있으면 그 숙소만, 없으면 후보 전체 사용
+        places = []
+        if web_place_names:
+            logger.info(f"  🔍 웹 검색 결과를 후보 {len(candidates)}개와 매칭...")
+            for match in EntityResolver(candidates).resolve(web_place_names):
+                place = match.place
+                if place.get('user_ratings_total', 0) >= 10:  # 최소 리뷰 수
+                    places.append(place)
+                    logger.info(f"    ✅ {match.name} → {place['name']} ({match.score}) - ⭐{place.get('rating', 0)}")
+        
+        if not places:
+            places = candidates
         
-        if not filtered:
+        # 4. 필터링 (기본 필터만 - 예약 사이트는 이미 검증됨)
+        batch = CandidateBatch(places)
+        keep = batch.mask(min_reviews=50, min_rating=min_rating, price_level=price_level)
+        
+        if not keep.any():
             return AgentResponse(
                 success=True,
                 agent_name="accommodation",
@@ -536,28 +605,26 @@ def search_accommodations(
 
         
         # 4. 정렬
-        if sort_by == "rating":
-            sorted_results = sorted(filtered, key=lambda x: (x.get('rating', 0), x.get('user_ratings_total', 0)), reverse=True)
-        elif sort_by == "reviews":
-            sorted_results = sorted(filtered, key=lambda x: x.get('user_ratings_total', 0), reverse=True)
+        if sort_by == "reviews":
+            sorted_results = batch.top_k([batch.reviews], k=num_results, where=keep)
         elif sort_by == "price":
-            sorted_results = sorted(filtered, key=lambda x: x.get('price_level', 0))
-        else:
-            sorted_results = sorted(filtered, key=lambda x: (x.get('rating', 0), x.get('user_ratings_total', 0)), reverse=True)
+            sorted_results = batch.top_k([batch.price_level], k=num_results, descending=False, where=keep)
+        else:  # rating (기본)
+            sorted_results = batch.top_k([batch.rating, batch.reviews], k=num_results, where=keep)
         
-        sorted_results = sorted_results[:num_results]
+        # 5. 데이터 수집 (price_level 없는 숙소만 상세 정보 동시 요청)
+        missing_price = [place['place_id'] for place in sorted_results if place.get('price_level') is None]
+        fetched_price = dict(zip(
+            missing_price,
+            gmaps.place_many(missing_price, fields=['price_level'], language='ko')
+        ))
         
-        # 5. 데이터 수집
         places = []
         for place in sorted_results:
             place_id = place['place_id']
             place_price_level = place.get('price_level')
             if place_price_level is None:
-                try:
-                    details = gmaps.place(place_id, fields=['price_level'], language='ko')
-                    place_price_level = details.get('result', {}).get('price_level', 0)
-                except:
-                    place_price_level = 0
+                place_price_level = fetched_price[place_id].get('price_level', 0)
             
             place_data = PlaceData(
                 place_id=place_id,
@@ -713,15 +780,14 @@ def summarize_reviews(place_id: str, user_id: Optional[str] = None) -> dict:
 # TOOL 3: 가격 비교 (병렬 처리!)
 # ============================================================================
 
-@tool
-def compare_booking_prices(
+async def acompare_booking_prices(
     place_name: str,
     check_in: str,
     check_out: str,
     num_guests: int = 2,
     location: str = "서울"
 ) -> dict:
-    """예약 사이트 실시간 최저가 비교 - 병렬 처리로 3배 빠름!"""
+    """예약 사이트 실시간 최저가 비교 (비동기 - 실행 중인 이벤트 루프에서 그대로 await)"""
     try:
         if not RAPIDAPI_KEY:
             return AgentResponse(
@@ -740,14 +806,13 @@ def compare_booking_prices(
         
         # 캐시 확인
         cache_key = f"{place_name}_{check_in}_{check_out}_{num_guests}"
-        if cache_key in _price_cache:
-            cached_data, timestamp = _price_cache[cache_key]
-            if datetime.now() - timestamp < timedelta(seconds=CACHE_TTL):
-                logger.info("✅ 캐시에서 반환 (즉시 응답)")
-                return cached_data
+        cached_data = _price_cache.get(cache_key)
+        if cached_data is not None:
+            logger.info("✅ 캐시에서 반환 (즉시 응답)")
+            return cached_data
         
         # 병렬 조회! (3배 빠름!)
-        prices = asyncio.run(_compare_prices_parallel(place_name, check_in, check_out, num_guests, nights))
+        prices = await _compare_prices_parallel(place_name, check_in, check_out, num_guests, nights)
         
         if not prices:
             return AgentResponse(
@@ -782,7 +847,7 @@ def compare_booking_prices(
         )
         
         # 캐싱
-        _price_cache[cache_key] = (response.model_dump(), datetime.now())
+        _price_cache.set(cache_key, response.model_dump())
         
         return response.model_dump()
         
@@ -796,6 +861,139 @@ def compare_booking_prices(
         ).model_dump()
 
 
+def compare_booking_prices(
+    place_name: str,
+    check_in: str,
+    check_out: str,
+    num_guests: int = 2,
+    location: str = "서울"
+) -> dict:
+    """예약 사이트 실시간 최저가 비교 - 병렬 처리로 3배 빠름!"""
+    # 동기 호출은 공용 백그라운드 루프에서 실행 (호출 스레드에 실행 중인 루프가 있어도 동작, 커넥션 풀 재사용)
+    return run_sync(acompare_booking_prices(place_name, check_in, check_out, num_guests, location))
+
+
+# invoke()는 sync 함수를, ainvoke()는 acompare_booking_prices를 사용
+compare_booking_prices = StructuredTool.from_function(
+    func=compare_booking_prices,
+    coroutine=acompare_booking_prices
+)
+
+
+def _price_targets(places: List[Union[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """일괄 비교 대상 [{place_id, place_name}] (이름 중복 제거, 최대 PRICE_BATCH_MAX개)"""
+    targets = []
+    seen = set()
+    for place in places:
+        if isinstance(place, str):
+            place_id, name = None, place
+        else:
+            place_id, name = place.get('place_id'), place.get('name') or place.get('place_name')
+        if not name or normalize_text(name) in seen:
+            continue
+        seen.add(normalize_text(name))
+        targets.append({'place_id': place_id, 'place_name': name})
+    return targets[:PRICE_BATCH_MAX]
+
+
+async def acompare_booking_prices_batch(
+    places: List[Union[str, Dict[str, Any]]],
+    check_in: str,
+    check_out: str,
+    num_guests: int = 2
+) -> dict:
+    """숙소 목록 전체 최저가 비교 (비동기) - 숙소 × 플랫폼을 한 번에 동시 조회해 가격 매트릭스 반환
+
+    Args:
+        places: search_accommodations 결과의 data 목록 (또는 숙소 이름 목록)
+    """
+    try:
+        if not RAPIDAPI_KEY:
+            return AgentResponse(
+                success=False,
+                agent_name="accommodation",
+                message="RapidAPI 키가 설정되지 않았습니다",
+                error="RAPIDAPI_KEY not found"
+            ).model_dump()
+        
+        targets = _price_targets(places)
+        if not targets:
+            return AgentResponse(
+                success=False,
+                agent_name="accommodation",
+                message="가격을 비교할 숙소가 없습니다",
+                error="No places"
+            ).model_dump()
+        
+        logger.info(f"💰 일괄 가격 비교: 숙소 {len(targets)}곳 ({check_in} ~ {check_out})")
+        
+        checkin_date = datetime.strptime(check_in, "%Y-%m-%d")
+        checkout_date = datetime.strptime(check_out, "%Y-%m-%d")
+        nights = (checkout_date - checkin_date).days
+        
+        # 전체 동시 조회 (플랫폼별 호출량은 request_governor 버킷이 조절)
+        results = await asyncio.gather(*[
+            _compare_prices_parallel(target['place_name'], check_in, check_out, num_guests, nights)
+            for target in targets
+        ])
+        
+        # 가격 매트릭스: 숙소별 {플랫폼: 가격 정보 or None}
+        rows = []
+        for target, prices in zip(targets, results):
+            by_platform = {platform: None for platform in PRICE_PLATFORMS}
+            for price in prices:
+                by_platform[price['platform']] = price
+            rows.append({
+                **target,
+                'prices': by_platform,
+                'lowest_price': min(prices, key=lambda x: x['price']) if prices else None
+            })
+        
+        found = sum(1 for row in rows if row['lowest_price'])
+        logger.info(f"✅ 일괄 가격 비교 완료: {found}/{len(rows)}곳 가격 확인")
+        
+        return AgentResponse(
+            success=True,
+            agent_name="accommodation",
+            data=[{
+                'check_in': check_in,
+                'check_out': check_out,
+                'nights': nights,
+                'num_guests': num_guests,
+                'platforms': list(PRICE_PLATFORMS),
+                'hotels': rows,
+                'per_night': True
+            }],
+            count=found,
+            message=f"숙소 {len(rows)}곳 중 {found}곳 최저가 확인"
+        ).model_dump()
+        
+    except Exception as e:
+        logger.error(f"❌ 일괄 가격 비교 실패: {e}")
+        return AgentResponse(
+            success=False,
+            agent_name="accommodation",
+            message="일괄 가격 비교 중 오류 발생",
+            error=str(e)
+        ).model_dump()
+
+
+def compare_booking_prices_batch(
+    places: List[Union[str, Dict[str, Any]]],
+    check_in: str,
+    check_out: str,
+    num_guests: int = 2
+) -> dict:
+    """숙소 목록 전체 최저가 비교 - search_accommodations 결과(data)를 그대로 넘기면 숙소별 플랫폼 가격표 반환"""
+    return run_sync(acompare_booking_prices_batch(places, check_in, check_out, num_guests))
+
+
+compare_booking_prices_batch = StructuredTool.from_function(
+    func=compare_booking_prices_batch,
+    coroutine=acompare_booking_prices_batch
+)
+
+
 # ============================================================================
 # TOOL 4: AI 맞춤 추천
 # ============================================================================
@@ -925,5 +1123,6 @@ accommodation_tools = [
     search_accommodations,
     summarize_reviews,
     compare_booking_prices,
+    compare_booking_prices_batch,
     get_recommended_accommodations
 ]
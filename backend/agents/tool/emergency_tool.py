@@ -1,15 +1,14 @@
 """긴급정보 멀티 툴 - Agent 연동형 (병렬 처리 최적화)"""
 from langchain.tools import tool
-import googlemaps
-import os
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Agent 함수 직접 임포트
 from agents.emergency_agent import get_emergency_info
+from agents.utils.places_gateway import get_places_gateway
 
 load_dotenv()
-gmaps = googlemaps.Client(key=os.getenv("GOOGLE_PLACES_API_KEY"))
+gmaps = get_places_gateway()
 
 # ========================================
 # 툴 1: 통합 긴급정보 (메인)
@@ -1,8 +1,8 @@
 """ODsay API 통신 담당 모듈"""
 import os
-import requests
 import logging
 from typing import Dict, List, Any, Optional
+from agents.utils.request_governor import request_json, arequest_json
 
 logger = logging.getLogger(__name__)
 
@@ -23,23 +23,43 @@ class ODsayApiTool:
                 'mapObject': '0:0@' + map_obj_id,
                 'lang': 0
             }
-            res = requests.get(url, params=params)
-            data = res.json()
+            return self._parse_lane_info(request_json("odsay", "GET", url, params=params))
+        except Exception as e:
+            logger.error(f"loadLane 에러: {e}")
+            return []
+
+    async def afetch_lane_info(self, map_obj_id: str) -> List[List[List[float]]]:
+        """fetch_lane_info의 비동기 버전"""
+        if not self.api_key or not map_obj_id:
+            return []
             
-            lane_sections = []
-            if 'result' in data and 'lane' in data['result']:
-                for lane in data['result']['lane']:
-                    section_coords = []
-                    for section in lane.get('section', []):
-                        for graph in section.get('graphPos', []):
-                            section_coords.append([graph['x'], graph['y']])
-                    if section_coords:
-                        lane_sections.append(section_coords)
-            return lane_sections
+        try:
+            data = await arequest_json(
+                "odsay", "GET", f"{self.base_url}/loadLane",
+                params={
+                    'apiKey': self.api_key,
+                    'mapObject': '0:0@' + map_obj_id,
+                    'lang': 0
+                }
+            )
+            return self._parse_lane_info(data)
         except Exception as e:
             logger.error(f"loadLane 에러: {e}")
             return []
 
+    @staticmethod
+    def _parse_lane_info(data: Dict[str, Any]) -> List[List[List[float]]]:
+        lane_sections = []
+        if 'result' in data and 'lane' in data['result']:
+            for lane in data['result']['lane']:
+                section_coords = []
+                for section in lane.get('section', []):
+                    for graph in section.get('graphPos', []):
+                        section_coords.append([graph['x'], graph['y']])
+                if section_coords:
+                    lane_sections.append(section_coords)
+        return lane_sections
+
     def fetch_pub_trans_path(self, origin: Dict[str, float], dest: Dict[str, float]) -> Optional[Dict[str, Any]]:
         """ODsay 'searchPubTransPath' API를 호출하여 대중교통 경로를 검색합니다"""
         if not self.api_key:
@@ -53,11 +73,31 @@ class ODsayApiTool:
                 'EX': dest['lng'], 'EY': dest['lat']
             }
             
-            response = requests.get(url, params=params)
-            if response.status_code != 200:
+            # 2xx가 아니면 HTTPError → None
+            data = request_json("odsay", "GET", url, params=params)
+            if 'error' in data:
                 return None
                 
-            data = response.json()
+            return data.get('result')
+            
+        except Exception as e:
+            logger.error(f"searchPubTransPath 에러: {e}")
+            return None
+
+    async def afetch_pub_trans_path(self, origin: Dict[str, float], dest: Dict[str, float]) -> Optional[Dict[str, Any]]:
+        """fetch_pub_trans_path의 비동기 버전"""
+        if not self.api_key:
+            return None
+            
+        try:
+            data = await arequest_json(
+                "odsay", "GET", f"{self.base_url}/searchPubTransPath",
+                params={
+                    'apiKey': self.api_key,
+                    'SX': origin['lng'], 'SY': origin['lat'],
+                    'EX': dest['lng'], 'EY': dest['lat']
+                }
+            )
             if 'error' in data:
                 return None
                 
@@ -65,4 +105,4 @@ class ODsayApiTool:
             
         except Exception as e:
             logger.error(f"searchPubTransPath 에러: {e}")
-            return None
\ No newline at end of file
+            return None
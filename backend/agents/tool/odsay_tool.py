@@ -1,8 +1,9 @@
 """ODsay 대중교통 경로 검색 툴 (모듈화 버전)"""
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Any
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 from dotenv import load_dotenv
 
 from schemas.data_models import AgentResponse
@@ -12,6 +13,31 @@ from tools.odsay_parser_tool import ODsayParserTool
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+def _inter_city_options(result: Dict) -> List[Dict]:
+    """시외 경로(기차/고속버스) 후보 중 소요 시간순 상위 5개"""
+    inter_city_options = []
+    if 'trainRequest' in result: inter_city_options.extend(result['trainRequest'].get('OBJ', []))
+    if 'exBusRequest' in result: inter_city_options.extend(result['exBusRequest'].get('OBJ', []))
+    if 'outBusRequest' in result: inter_city_options.extend(result['outBusRequest'].get('OBJ', []))
+    
+    now = datetime.now()
+    is_night = now.hour < 5 or now.hour >= 23 
+
+    # 옵션 필터링 (요청되지 않은 심야 버스 등 제외)
+    valid_options = []
+    for opt in inter_city_options:
+        bus_class = opt.get('busClass', '')
+        if not is_night and '심야' in bus_class:
+            continue
+        valid_options.append(opt)
+        
+    if not valid_options:
+        valid_options = inter_city_options
+
+    # 소요 시간순 정렬 후 상위 5개 선택
+    sorted_options = sorted(valid_options, key=lambda x: x.get('time', 9999))[:5]
+    return sorted_options
+
 def _search_odsay_recursive(origin_coords: Dict, dest_coords: Dict) -> List[Dict]:
     """출발지와 도착지 간의 경로를 재귀적으로 검색하여 조정합니다."""
     api_tool = ODsayApiTool()
@@ -41,29 +67,7 @@ def _search_odsay_recursive(origin_coords: Dict, dest_coords: Dict) -> List[Dict
         return routes
 
     # 3. 시외 경로 처리 (기차/고속버스)
-    inter_city_options = []
-    if 'trainRequest' in result: inter_city_options.extend(result['trainRequest'].get('OBJ', []))
-    if 'exBusRequest' in result: inter_city_options.extend(result['exBusRequest'].get('OBJ', []))
-    if 'outBusRequest' in result: inter_city_options.extend(result['outBusRequest'].get('OBJ', []))
-    
-    now = datetime.now()
-    is_night = now.hour < 5 or now.hour >= 23 
-
-    # 옵션 필터링 (요청되지 않은 심야 버스 등 제외)
-    valid_options = []
-    for opt in inter_city_options:
-        bus_class = opt.get('busClass', '')
-        if not is_night and '심야' in bus_class:
-            continue
-        valid_options.append(opt)
-        
-    if not valid_options:
-        valid_options = inter_city_options
-
-    # 소요 시간순 정렬 후 상위 5개 선택
-    sorted_options = sorted(valid_options, key=lambda x: x.get('time', 9999))[:5]
-    
-    for best in sorted_options:
+    for best in _inter_city_options(result):
         start_node = {'lat': best['SY'], 'lng': best['SX'], 'formatted_address': best['startSTN']}
         end_node = {'lat': best['EY'], 'lng': best['EX'], 'formatted_address': best['endSTN']}
         
@@ -82,7 +86,42 @@ def _search_odsay_recursive(origin_coords: Dict, dest_coords: Dict) -> List[Dict
         
     return routes
 
-@tool
+async def _asearch_odsay_recursive(origin_coords: Dict, dest_coords: Dict) -> List[Dict]:
+    """_search_odsay_recursive의 비동기 버전 (Lane 좌표/연계 구간을 동시 조회)"""
+    api_tool = ODsayApiTool()
+    
+    result = await api_tool.afetch_pub_trans_path(origin_coords, dest_coords)
+    if not result:
+        return []
+
+    # 시내 경로 (지하철/버스) - 경로별 Lane 좌표 동시 로딩
+    paths = result.get('path', [])[:5]
+    if paths:
+        lane_lists = await asyncio.gather(*[
+            api_tool.afetch_lane_info(path_info['info'].get('mapObj'))
+            for path_info in paths
+        ])
+        return [
+            ODsayParserTool.parse_intra_city_route(path_info, origin_coords, dest_coords, lane_list)
+            for path_info, lane_list in zip(paths, lane_lists)
+        ]
+
+    # 시외 경로 (기차/고속버스) - 옵션별 연계 구간(출발지->터미널, 터미널->도착지) 동시 탐색
+    options = _inter_city_options(result)
+    segments = await asyncio.gather(*[
+        asyncio.gather(
+            _asearch_odsay_recursive(origin_coords, {'lat': best['SY'], 'lng': best['SX'], 'formatted_address': best['startSTN']}),
+            _asearch_odsay_recursive({'lat': best['EY'], 'lng': best['EX'], 'formatted_address': best['endSTN']}, dest_coords)
+        )
+        for best in options
+    ])
+    return [
+        ODsayParserTool.parse_inter_city_segment(
+            best, r1[0] if r1 else None, r2[0] if r2 else None, origin_coords, dest_coords
+        )
+        for best, (r1, r2) in zip(options, segments)
+    ]
+
 def search_public_transport_tool(origin_search: str, destination_search: str) -> Dict[str, Any]:
     """
     ODsay API를 사용하여 출발지와 도착지 간의 '대중교통(Transit)' 경로를 검색합니다.
@@ -101,7 +140,24 @@ def search_public_transport_tool(origin_search: str, destination_search: str) ->
         return AgentResponse(success=False, agent_name="odsay", message="출발지 또는 도착지의 좌표를 찾을 수 없습니다.").dict()
     
     routes = _search_odsay_recursive(org_coords, dst_coords)
+    return _transport_response(routes, origin_search, destination_search)
+
+async def _asearch_public_transport_tool(origin_search: str, destination_search: str) -> Dict[str, Any]:
+    """search_public_transport_tool의 비동기 버전 (출발지/도착지 좌표 동시 조회)"""
+    from tools.gps_tool import aget_place_point
+    
+    org_coords, dst_coords = await asyncio.gather(
+        aget_place_point(origin_search),
+        aget_place_point(destination_search)
+    )
     
+    if not org_coords or not dst_coords:
+        return AgentResponse(success=False, agent_name="odsay", message="출발지 또는 도착지의 좌표를 찾을 수 없습니다.").dict()
+    
+    routes = await _asearch_odsay_recursive(org_coords, dst_coords)
+    return _transport_response(routes, origin_search, destination_search)
+
+def _transport_response(routes: List[Dict], origin_search: str, destination_search: str) -> Dict[str, Any]:
     if routes:
         # 결과에 원본 검색어 주입
         for r in routes:
@@ -110,4 +166,10 @@ def search_public_transport_tool(origin_search: str, destination_search: str) ->
             
         return AgentResponse(success=True, agent_name="odsay", data=routes, count=len(routes), message=f"경로 {len(routes)}개 검색 완료").dict()
     else:
-        return AgentResponse(success=False, agent_name="odsay", message="대중교통 경로를 찾을 수 없습니다.").dict()
\ No newline at end of file
+        return AgentResponse(success=False, agent_name="odsay", message="대중교통 경로를 찾을 수 없습니다.").dict()
+
+# invoke()는 sync 함수를, ainvoke()는 비동기 버전을 사용
+search_public_transport_tool = StructuredTool.from_function(
+    func=search_public_transport_tool,
+    coroutine=_asearch_public_transport_tool
+)
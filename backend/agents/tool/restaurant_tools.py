@@ -256,7 +256,7 @@ def verify_restaurant_tool(place_id: str, user_location: Optional[tuple] = None)
 @tool
 def get_restaurant_details_tool(place_id: str) -> str:
     """
-    맛집 상세 정보 (예약/가격/주차/애완견)
+    맛집 상세 정보 (예약/가격/주차/애완견/연락처/영업시간)
     
     Args:
         place_id: Google Place ID
@@ -299,4 +299,19 @@ def get_restaurant_details_tool(place_id: str) -> str:
     else:
         output.append("🐕 **반려견** 정보 없음")
     
+    # 연락처/영업시간 (검색 목록에는 포함되지 않음)
+    contact = details.get('contact', {})
+    if contact.get('address'):
+        output.append(f"📍 {contact['address']}")
+    if contact.get('phone'):
+        output.append(f"📞 {contact['phone']}")
+    if contact.get('opening_hours'):
+        import datetime
+        today_idx = datetime.datetime.now().weekday()
+        hours = contact['opening_hours']
+        if len(hours) > today_idx:
+            output.append(f"🕐 오늘 {hours[today_idx].split(': ', 1)[-1]}")
+    if contact.get('website'):
+        output.append(f"🌐 {contact['website']}")
+    
     return "\n".join(output)
@@ -1,8 +1,8 @@
 """Serper 웹 검색 헬퍼 함수 (예약 사이트 통합)"""
 import os
-import requests
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
+from agents.utils.serper_utils import search_many, search_with_serper
 import re
 
 load_dotenv()
@@ -35,93 +35,58 @@ def search_web_for_theme_accommodations(region: str, theme: str, num_results: in
         "yanolja.com",      # 야놀자
     ]
     
-    for site in booking_sites:
-        try:
-            query = f"{region} {theme} site:{site}"
-            print(f"🔍 예약 사이트 검색: {query}")
-            
-            url = "https://google.serper.dev/search"
-            headers = {
-                "X-API-KEY": SERPER_API_KEY,
-                "Content-Type": "application/json"
-            }
-            payload = {
-                "q": query,
-                "gl": "kr",
-                "hl": "ko",
-                "num": 5
-            }
+    # 2단계: 웹 검색 보완
+    fallback_query = f"{region} {theme} 추천"
+    
+    # 예약 사이트 3개는 배치 요청 1회로 함께 검색 (캐시된 쿼리는 제외)
+    site_queries = [(f"{region} {theme} site:{site}", 5) for site in booking_sites]
+    print(f"🔍 예약 사이트 검색: {[query for query, _ in site_queries]}")
+    site_results = search_many(site_queries)
+    
+    for site, results in zip(booking_sites, site_results):
+        for result in results:
+            title = result.get("title", "")
             
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            cleaned = re.sub(r'^\d+\.?\s*', '', title)
+            cleaned = cleaned.replace('베스트', '').replace('추천', '')
+            cleaned = cleaned.replace(f' - {site}', '').strip()
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                for result in data.get("organic", []):
-                    title = result.get("title", "")
-                    
-                    cleaned = re.sub(r'^\d+\.?\s*', '', title)
-                    cleaned = cleaned.replace('베스트', '').replace('추천', '')
-                    cleaned = cleaned.replace(f' - {site}', '').strip()
-                    
-                    if cleaned and len(cleaned) > 2 and cleaned not in place_names:
-                        place_names.append(cleaned)
-                        print(f"   ✅ {cleaned} ({site})")
-                
-                if len(place_names) >= num_results:
-                    break
-        except Exception as e:
-            print(f"   ⚠️ {site} 검색 실패: {e}")
+            if cleaned and len(cleaned) > 2 and cleaned not in place_names:
+                place_names.append(cleaned)
+                print(f"   ✅ {cleaned} ({site})")
+        
+        if len(place_names) >= num_results:
+            break
     
-    # 2단계: 웹 검색 보완
+    # 예약 사이트 결과가 부족하면 웹 검색 결과로 보완
     if len(place_names) < num_results:
-        try:
-            query = f"{region} {theme} 추천"
-            print(f"🔍 웹 검색 보완: {query}")
-            
-            url = "https://google.serper.dev/search"
-            headers = {
-                "X-API-KEY": SERPER_API_KEY,
-                "Content-Type": "application/json"
-            }
-            payload = {
-                "q": query,
-                "gl": "kr",
-                "hl": "ko",
-                "num": num_results * 2
-            }
+        print(f"🔍 웹 검색 보완: {fallback_query}")
+        fallback_results = search_with_serper(fallback_query, num_results * 2)
+        
+        theme_keywords = {
+            "료칸": ["료칸", "ryokan", "온천"],
+            "한옥스테이": ["한옥", "전통", "hanok"],
+            "글램핑": ["글램핑", "glamping"],
+            "풀빌라": ["풀빌라", "pool"],
+            "펜션": ["펜션", "pension"],
+        }
+        
+        required_keywords = theme_keywords.get(theme, [theme.lower()])
+        
+        for result in fallback_results:
+            title = result.get("title", "")
+            snippet = result.get("snippet", "")
+            combined_text = (title + " " + snippet).lower()
             
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            has_theme = any(keyword in combined_text for keyword in required_keywords)
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                theme_keywords = {
-                    "료칸": ["료칸", "ryokan", "온천"],
-                    "한옥스테이": ["한옥", "전통", "hanok"],
-                    "글램핑": ["글램핑", "glamping"],
-                    "풀빌라": ["풀빌라", "pool"],
-                    "펜션": ["펜션", "pension"],
-                }
-                
-                required_keywords = theme_keywords.get(theme, [theme.lower()])
+            if has_theme:
+                cleaned = re.sub(r'^\d+\.?\s*', '', title)
+                cleaned = cleaned.replace('베스트', '').replace('추천', '').strip()
                 
-                for result in data.get("organic", []):
-                    title = result.get("title", "")
-                    snippet = result.get("snippet", "")
-                    combined_text = (title + " " + snippet).lower()
-                    
-                    has_theme = any(keyword in combined_text for keyword in required_keywords)
-                    
-                    if has_theme:
-                        cleaned = re.sub(r'^\d+\.?\s*', '', title)
-                        cleaned = cleaned.replace('베스트', '').replace('추천', '').strip()
-                        
-                        if cleaned and len(cleaned) > 2 and cleaned not in place_names:
-                            place_names.append(cleaned)
-                            print(f"   ✅ {cleaned} (웹 검색)")
-        except Exception as e:
-            print(f"❌ 웹 검색 실패: {e}")
+                if cleaned and len(cleaned) > 2 and cleaned not in place_names:
+                    place_names.append(cleaned)
+                    print(f"   ✅ {cleaned} (웹 검색)")
     
     print(f"✅ 총 검색 결과: {len(place_names)}개")
     
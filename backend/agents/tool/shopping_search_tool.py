@@ -4,25 +4,24 @@ import os
 from typing import List, Dict, Any
 
 from dotenv import load_dotenv
-import googlemaps
 from langchain_core.tools import tool
+from agents.utils.places_gateway import get_places_gateway
+from agents.utils.keyword_engine import KEYWORD_TABLE, keyword_matcher, match_keywords
 
 load_dotenv()
 
 # Google Maps API 키
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = get_places_gateway()
+
+# 카테고리/브랜드/체인 키워드는 agents/utils/keyword_engine.py의 KEYWORD_TABLE에서 관리
+# (입력 한 번 훑기로 모든 그룹 매칭, 같은 입력은 캐시)
 
 # 대형마트 제외 키워드 (편의점 필터링용)
-LARGE_MART_KEYWORDS = [
-    "이마트", "홈플러스", "롯데마트", "메가마트", "빅마켓",
-    "하나로마트", "농협", "코스트코", "emart", "homeplus",
-]
+LARGE_MART_KEYWORDS = KEYWORD_TABLE["store_chain"]["대형마트"]
 
 # 실제 편의점 체인
-CONVENIENCE_STORE_CHAINS = [
-    "GS25", "CU", "세븐일레븐", "7-ELEVEN", "이마트24", "씨유", "미니스톱",
-]
+CONVENIENCE_STORE_CHAINS = KEYWORD_TABLE["store_chain"]["편의점"]
 
 
 # --------------------
@@ -31,41 +30,25 @@ CONVENIENCE_STORE_CHAINS = [
 
 def is_convenience_store_search(user_input: str) -> bool:
     """편의점 검색인지 확인"""
-    convenience_keywords = ["편의점", "cvs", "씨유", "GS25", "세븐일레븐", "cu"]
-    return any(keyword in user_input for keyword in convenience_keywords)
+    return match_keywords(user_input).has("shopping_search", "편의점")
 
 
 def is_pharmacy_search(user_input: str) -> bool:
     """약국 검색인지 확인"""
-    pharmacy_keywords = ["약국", "pharmacy", "약방", "드럭스토어"]
-    return any(keyword in user_input for keyword in pharmacy_keywords)
+    return match_keywords(user_input).has("shopping_search", "약국")
 
 
 def is_large_mart_search(user_input: str) -> bool:
     """대형마트 검색인지 확인"""
-    large_mart_keywords = ["대형마트", "마트", "슈퍼마켓", "supermarket"]
-    return any(keyword in user_input for keyword in large_mart_keywords)
+    return match_keywords(user_input).has("shopping_search", "대형마트")
 
 
 def get_category_from_input(user_input: str) -> str:
     """
     사용자 입력에서 카테고리 추출
+    (편의점 > 대형마트 > 팝업스토어 > 다이소 > 약국 > 재래시장 순 우선)
     """
-    categories = {
-        "편의점": ["편의점", "cvs", "씨유", "GS25", "세븐일레븐", "cu"],
-        "대형마트": ["대형마트", "마트", "이마트", "홈플러스", "롯데마트"],
-        "팝업스토어": ["팝업", "팝업스토어", "popup"],
-        "다이소": ["다이소", "daiso"],
-        "약국": ["약국", "pharmacy"],
-        "재래시장": ["재래시장", "시장", "전통시장"],
-    }
-
-    text = user_input.lower()
-    for category, keywords in categories.items():
-        for keyword in keywords:
-            if keyword in text:
-                return category
-    return ""
+    return match_keywords(user_input).first("shopping_store") or ""
 
 def get_implied_category_from_product(user_input: str) -> str | None:
     """
@@ -75,46 +58,15 @@ def get_implied_category_from_product(user_input: str) -> str | None:
     - '고기 사러 갈 곳' -> '대형마트'
     - '와인오프너 파는 곳' -> '다이소'
     - '콘돔 파는 곳' -> '편의점'
+
+    우선순위: 대형마트(고기/장보기) > 다이소(생활용품) > 약국(감기약 등) > 편의점
     """
-    text = user_input.lower()
-
-    # 1) 대형마트로 보내야 하는 키워드들 (고기, 장보기 계열)
-    large_mart_keywords = [
-        "고기", "삼겹살", "목살", "소고기", "돼지고기",
-        "장보기", "장 보러", "장 보러 갈", "정육", "정육점",
-    ]
-    for kw in large_mart_keywords:
-        if kw in text:
-            return "대형마트"
-
-    # 2) 다이소/생활용품점 계열
-    daiso_keywords = [
-        "와인오프너", "와인 오프너", "병따개", "병 따개",
-        "와인 따개", "오프너", "주방용품", "생활용품",
-    ]
-    for kw in daiso_keywords:
-        if kw in text:
-            return "다이소"
-
-    # 3) 약국 계열 (감기약, 두통약 등)
-    pharmacy_keywords = [
-        "감기약", "두통약", "해열제", "종합감기약", "기침약",
-        "감기 약", "두통 약", "약 필요", "약 사러", "약 파는",
-    ]
-    for kw in pharmacy_keywords:
-        if kw in text:
-            return "약국"
-
-    # 4) 편의점/약국 계열 (일단 편의점 우선)
-    convenience_keywords = [
-        "콘돔", "피임도구", "피임 도구", "피임기구", "피임 기구",
-        "야간 간식", "야식 사러", "컵라면 사러",
-    ]
-    for kw in convenience_keywords:
-        if kw in text:
-            return "편의점"
-
-    return None
+    return match_keywords(user_input).first("shopping_product")
+
+
+def get_brand_from_input(user_input: str) -> str | None:
+    """브랜드 검색용 키워드 (다이소, 이마트, 홈플러스, 롯데마트, 코스트코)"""
+    return match_keywords(user_input).first("shopping_brand")
 
 def has_category_keyword(user_input: str) -> bool:
     """
@@ -171,7 +123,7 @@ def filter_convenience_stores(places: List[Dict[str, Any]]) -> List[Dict[str, An
     for place in places:
         name = place["name"]
         # 대형마트 키워드 제외
-        if not any(keyword in name for keyword in LARGE_MART_KEYWORDS):
+        if not keyword_matcher.scan(name).has("store_chain", "대형마트"):
             filtered.append(place)
     return filtered
 
@@ -182,7 +134,7 @@ def filter_large_marts(places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     for place in places:
         name = place["name"]
         # 편의점 체인 제외
-        if not any(keyword in name for keyword in CONVENIENCE_STORE_CHAINS):
+        if not keyword_matcher.scan(name).has("store_chain", "편의점"):
             filtered.append(place)
     return filtered
 
@@ -456,12 +408,8 @@ def search_shopping_tool(region: str, user_input: str) -> List[Dict[str, Any]]:
     if category == "약국" and not is_pharmacy:
         is_pharmacy = True
 
-    keyword = None
-
     # 브랜드 검색용 (다이소, 이마트, 홈플 등)
-    brand_like_categories = ["다이소", "이마트", "홈플러스", "롯데마트", "코스트코"]
-    if category in brand_like_categories:
-        keyword = category
+    keyword = get_brand_from_input(user_input)
 
 
     if is_convenience:
@@ -518,10 +466,7 @@ def search_shopping_by_coords(
     if category == "약국" and not is_pharmacy:
         is_pharmacy = True
 
-    keyword = None
-    brand_like_categories = ["다이소", "이마트", "홈플러스", "롯데마트", "코스트코"]
-    if category in brand_like_categories:
-        keyword = category
+    keyword = get_brand_from_input(user_input)
 
     if is_convenience:
         print("  → (현재 위치) 편의점 검색 모드")
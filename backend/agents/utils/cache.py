@@ -0,0 +1,524 @@
+"""
+공용 캐시 라이브러리
+모듈마다 따로 만들던 dict 캐시를 대체하는 크기 제한 LRU + TTL 캐시
+
+- max_entries / max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- 항목마다 TTL (set 시 ttl 인자로 개별 지정 가능)
+- stale-while-revalidate: TTL이 지나도 stale_ttl 동안은 이전 값을 바로 반환하고
+  백그라운드에서 한 번만 새로 로드 (같은 키의 중복 갱신 없음)
+- 디스크 스필(spill=True): LRU로 밀려난 항목을 SQLite에 내려 두었다가 메모리 miss 시 복원
+- 캐시별 통계 (hit/miss/stale hit/eviction/bytes) → all_cache_stats(), /api/admin/cache-stats
+
+사용법:
+    # 명시적 API
+    _llm_cache = get_cache("restaurant_llm", max_entries=500, ttl=6 * 3600)
+    value = _llm_cache.get(key)
+    _llm_cache.set(key, value)
+    value = _llm_cache.get_or_load(key, lambda: load(key))
+
+    # 데코레이터 (sync/async 함수 모두 지원, 기본적으로 None 결과는 캐시하지 않음)
+    @cached("weather", ttl=600, stale_ttl=1800)
+    def fetch_weather(region): ...
+
+환경 변수:
+- CACHE_SPILL: "on"(기본) / "off" (off면 spill=True 캐시도 메모리만 사용)
+- CACHE_SPILL_PATH: 스필 SQLite 파일 경로 (기본: backend/data/cache_spill.db)
+- CACHE_SPILL_MAX_ENTRIES: 스필 파일 최대 항목 수 (기본 50000)
+- CACHE_REFRESH_WORKERS: stale 항목 백그라운드 갱신 스레드 수 (기본 4)
+"""
+
+import os
+import sys
+import time
+import pickle
+import sqlite3
+import asyncio
+import logging
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SPILL_ENABLED = os.getenv("CACHE_SPILL", "on").lower() != "off"
+DEFAULT_SPILL_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "cache_spill.db")
+SPILL_MAX_ENTRIES = int(os.getenv("CACHE_SPILL_MAX_ENTRIES", 50000))
+REFRESH_WORKERS = int(os.getenv("CACHE_REFRESH_WORKERS", 4))
+
+_MISSING = object()
+
+
+def _not_none(value: Any) -> bool:
+    return value is not None
+
+
+def _sizeof(value: Any) -> int:
+    """항목 크기 추정 (pickle 길이, pickle 불가 객체는 sys.getsizeof)"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "fresh_until", "stale_until", "size")
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float, size: int):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.size = size
+
+
+class _SpillStore:
+    """LRU에서 밀려난 항목을 보관하는 SQLite 저장소 (모든 캐시가 파일 하나를 공유)"""
+
+    # 이 횟수마다 만료 항목 / max_entries 초과분 정리
+    SWEEP_EVERY_WRITES = 200
+
+    def __init__(self, path: str, max_entries: int = SPILL_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS cache_spill (
+                cache TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                fresh_until REAL NOT NULL,
+                stale_until REAL NOT NULL,
+                PRIMARY KEY (cache, key)
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_spill_stale ON cache_spill(stale_until)")
+        self._conn.commit()
+        self._writes = 0
+
+    def put_many(self, cache: str, entries: List[Tuple[str, _Entry]]) -> int:
+        """항목 저장 (pickle 불가 항목은 건너뜀), 저장한 개수 반환"""
+        rows = []
+        for key, entry in entries:
+            try:
+                blob = pickle.dumps(entry.value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                continue
+            rows.append((cache, key, blob, entry.fresh_until, entry.stale_until))
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache_spill (cache, key, value, fresh_until, stale_until) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % self.SWEEP_EVERY_WRITES == 0:
+                self._sweep()
+        return len(rows)
+
+    def pop(self, cache: str, key: str) -> Optional[Tuple[Any, float, float]]:
+        """항목을 꺼내고 삭제 (메모리로 복원할 때 사용, 만료됐으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, fresh_until, stale_until FROM cache_spill WHERE cache=? AND key=?",
+                (cache, key)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("DELETE FROM cache_spill WHERE cache=? AND key=?", (cache, key))
+            self._conn.commit()
+
+        blob, fresh_until, stale_until = row
+        if stale_until < time.time():
+            return None
+        try:
+            return pickle.loads(blob), fresh_until, stale_until
+        except Exception:
+            return None
+
+    def clear(self, cache: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_spill WHERE cache=?", (cache,))
+            self._conn.commit()
+
+    def _sweep(self) -> None:
+        """만료 항목 삭제 + max_entries 초과 시 곧 만료될 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        self._conn.execute("DELETE FROM cache_spill WHERE stale_until < ?", (time.time(),))
+        overflow = self._conn.execute("SELECT COUNT(*) FROM cache_spill").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM cache_spill WHERE rowid IN "
+                "(SELECT rowid FROM cache_spill ORDER BY stale_until LIMIT ?)",
+                (overflow,)
+            )
+        self._conn.commit()
+
+    def count(self, cache: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM cache_spill WHERE cache=?", (cache,)
+            ).fetchone()[0]
+
+
+_spill_store: Optional[_SpillStore] = None
+_spill_lock = threading.Lock()
+_spill_failed = False
+
+
+def _get_spill_store() -> Optional[_SpillStore]:
+    """공용 스필 저장소 (비활성화/생성 실패 시 None)"""
+    global _spill_store, _spill_failed
+    if not SPILL_ENABLED or _spill_failed:
+        return None
+    if _spill_store is None:
+        with _spill_lock:
+            if _spill_store is None and not _spill_failed:
+                path = os.getenv("CACHE_SPILL_PATH", DEFAULT_SPILL_PATH)
+                try:
+                    _spill_store = _SpillStore(path)
+                    logger.info(f"💾 캐시 스필 저장소: {path}")
+                except Exception as e:
+                    _spill_failed = True
+                    logger.warning(f"⚠️ 캐시 스필 저장소 생성 실패 (메모리만 사용): {e}")
+    return _spill_store
+
+
+_refresh_pool: Optional[ThreadPoolExecutor] = None
+_refresh_tasks: set = set()
+_pool_lock = threading.Lock()
+
+
+def _get_refresh_pool() -> ThreadPoolExecutor:
+    global _refresh_pool
+    if _refresh_pool is None:
+        with _pool_lock:
+            if _refresh_pool is None:
+                _refresh_pool = ThreadPoolExecutor(
+                    max_workers=REFRESH_WORKERS, thread_name_prefix="cache-refresh"
+                )
+    return _refresh_pool
+
+
+class TTLCache:
+    """스레드 안전 LRU + TTL 캐시 (stale-while-revalidate, 디스크 스필 지원)
+
+    Args:
+        name: 캐시 이름 (통계/스필 구분용)
+        max_entries: 최대 항목 수
+        ttl: 기본 TTL 초
+        stale_ttl: TTL이 지난 뒤에도 이전 값을 반환하며 백그라운드 갱신하는 시간 (0이면 사용 안 함)
+        max_bytes: 최대 바이트 수 (0이면 제한 없음, pickle 길이 기준 추정)
+        spill: LRU로 밀려난 항목을 디스크에 보관 (키는 문자열로 저장됨)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 1000,
+        ttl: float = 300,
+        stale_ttl: float = 0,
+        max_bytes: int = 0,
+        spill: bool = False,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0, "misses": 0, "stale_hits": 0, "evictions": 0, "expirations": 0,
+            "spills": 0, "disk_hits": 0, "refreshes": 0, "refresh_errors": 0,
+        }
+
+    # ==================== 내부 ====================
+
+    def _lookup(self, key: Hashable) -> Tuple[Any, str]:
+        """(값, 상태) 반환 - 상태: "fresh" / "stale" / "miss" (통계는 호출 측에서 기록)"""
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if now < entry.fresh_until:
+                    self._data.move_to_end(key)
+                    return entry.value, "fresh"
+                if now < entry.stale_until:
+                    self._data.move_to_end(key)
+                    return entry.value, "stale"
+                self._remove(key)
+                self._stats["expirations"] += 1
+                return _MISSING, "miss"
+
+        store = _get_spill_store() if self.spill else None
+        if store is None:
+            return _MISSING, "miss"
+        restored = store.pop(self.name, str(key))
+        if restored is None:
+            return _MISSING, "miss"
+
+        value, fresh_until, stale_until = restored
+        self._store(key, _Entry(value, fresh_until, stale_until, _sizeof(value)))
+        with self._lock:
+            self._stats["disk_hits"] += 1
+        return value, "fresh" if now < fresh_until else "stale"
+
+    def _remove(self, key: Hashable) -> None:
+        """lock 보유 상태에서 호출"""
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        evicted = []
+        with self._lock:
+            self._remove(key)
+            self._data[key] = entry
+            self._bytes += entry.size
+            while len(self._data) > 1 and (
+                len(self._data) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes)
+            ):
+                old_key, old_entry = self._data.popitem(last=False)
+                self._bytes -= old_entry.size
+                self._stats["evictions"] += 1
+                evicted.append((old_key, old_entry))
+
+        if evicted and self.spill:
+            self._spill(evicted)
+
+    def _spill(self, evicted: List[Tuple[Hashable, _Entry]]) -> None:
+        store = _get_spill_store()
+        if store is None:
+            return
+        now = time.time()
+        live = [(str(key), entry) for key, entry in evicted if entry.stale_until > now]
+        try:
+            saved = store.put_many(self.name, live)
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 스필 실패 ({self.name}): {e}")
+            return
+        with self._lock:
+            self._stats["spills"] += saved
+
+    def _record(self, state: str) -> None:
+        with self._lock:
+            self._stats[{"fresh": "hits", "stale": "stale_hits", "miss": "misses"}[state]] += 1
+
+    def _claim_refresh(self, key: Hashable) -> bool:
+        """같은 키의 백그라운드 갱신이 이미 진행 중이면 False"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _finish_refresh(self, key: Hashable, value: Any, ttl: Optional[float], cache_if, error) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+            self._stats["refresh_errors" if error else "refreshes"] += 1
+        if error:
+            logger.warning(f"⚠️ 캐시 갱신 실패 ({self.name}): {error}")
+        elif cache_if(value):
+            self.set(key, value, ttl)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float], cache_if) -> None:
+        value, error = None, None
+        try:
+            value = loader()
+        except Exception as e:
+            error = e
+        self._finish_refresh(key, value, ttl, cache_if, error)
+
+    async def _arefresh(self, key: Hashable, loader, ttl: Optional[float], cache_if) -> None:
+        value, error = None, None
+        try:
+            value = await loader()
+        except Exception as e:
+            error = e
+        self._finish_refresh(key, value, ttl, cache_if, error)
+
+    # ==================== 명시적 API ====================
+
+    def get(self, key: Hashable, default: Any = None, allow_stale: bool = False) -> Any:
+        """TTL 안의 값 반환 (없으면 default, allow_stale이면 stale 값도 반환)"""
+        value, state = self._lookup(key)
+        if state == "stale" and not allow_stale:
+            state = "miss"
+        self._record(state)
+        return default if state == "miss" else value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl이 없으면 기본 TTL)"""
+        now = time.time()
+        fresh_until = now + (self.ttl if ttl is None else ttl)
+        self._store(key, _Entry(value, fresh_until, fresh_until + self.stale_ttl, _sizeof(value)))
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+        store = _get_spill_store() if self.spill else None
+        if store is not None:
+            store.clear(self.name)
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        cache_if: Callable[[Any], bool] = _not_none,
+    ) -> Any:
+        """캐시 조회, 없으면 loader()로 로드 후 저장
+
+        stale 항목이면 이전 값을 바로 반환하고 백그라운드 스레드에서 loader()로 갱신
+        cache_if(결과)가 False면 저장하지 않음 (기본: None은 저장 안 함)
+        """
+        value, state = self._lookup(key)
+        self._record(state)
+        if state == "fresh":
+            return value
+        if state == "stale":
+            if self._claim_refresh(key):
+                _get_refresh_pool().submit(self._refresh, key, loader, ttl, cache_if)
+            return value
+
+        value = loader()
+        if cache_if(value):
+            self.set(key, value, ttl)
+        return value
+
+    async def aget_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        cache_if: Callable[[Any], bool] = _not_none,
+    ) -> Any:
+        """get_or_load의 비동기 버전 (loader는 코루틴을 반환하는 함수, 갱신은 같은 이벤트 루프의 task)"""
+        value, state = self._lookup(key)
+        self._record(state)
+        if state == "fresh":
+            return value
+        if state == "stale":
+            if self._claim_refresh(key):
+                task = asyncio.get_running_loop().create_task(self._arefresh(key, loader, ttl, cache_if))
+                _refresh_tasks.add(task)
+                task.add_done_callback(_refresh_tasks.discard)
+            return value
+
+        value = await loader()
+        if cache_if(value):
+            self.set(key, value, ttl)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key)[1] != "miss"
+
+    # ==================== 통계 ====================
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._data)
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["max_bytes"] = self.max_bytes
+        stats["ttl"] = self.ttl
+        stats["stale_ttl"] = self.stale_ttl
+        store = _get_spill_store() if self.spill else None
+        if store is not None:
+            stats["disk_entries"] = store.count(self.name)
+        return stats
+
+
+# ==================== 레지스트리 ====================
+
+_registry: Dict[str, TTLCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(name: str, **options) -> TTLCache:
+    """이름으로 공용 캐시 반환 (없으면 options로 생성, 이미 있으면 options 무시)"""
+    cache = _registry.get(name)
+    if cache is None:
+        with _registry_lock:
+            cache = _registry.get(name)
+            if cache is None:
+                cache = TTLCache(name, **options)
+                _registry[name] = cache
+    return cache
+
+
+def all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """등록된 모든 캐시의 통계"""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {cache.name: cache.stats() for cache in caches}
+
+
+def _default_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    return repr((func.__module__, func.__qualname__, args, sorted(kwargs.items())))
+
+
+def cached(
+    name: str,
+    ttl: float = 300,
+    key: Optional[Callable[..., Hashable]] = None,
+    cache_if: Callable[[Any], bool] = _not_none,
+    **options,
+) -> Callable:
+    """함수 결과 캐시 데코레이터 (sync/async 함수 모두 지원)
+
+    Args:
+        name: 캐시 이름 (같은 이름이면 캐시 공유 → sync/async 버전이 같은 항목 사용 가능)
+        ttl: 기본 TTL 초
+        key: 인자 → 캐시 키 함수 (기본: 함수 이름 + 인자 repr)
+        cache_if: 결과를 저장할지 판단 (기본: None이 아니면 저장)
+        **options: TTLCache 옵션 (max_entries, stale_ttl, max_bytes, spill)
+
+    데코레이트된 함수의 .cache 속성으로 캐시에 접근할 수 있다.
+    """
+    cache = get_cache(name, ttl=ttl, **options)
+
+    def decorator(func: Callable) -> Callable:
+        def make_key(args, kwargs):
+            return key(*args, **kwargs) if key else _default_key(func, args, kwargs)
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await cache.aget_or_load(
+                    make_key(args, kwargs), lambda: func(*args, **kwargs), cache_if=cache_if
+                )
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cache.get_or_load(
+                make_key(args, kwargs), lambda: func(*args, **kwargs), cache_if=cache_if
+            )
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,170 @@
+"""
+Entity Resolver
+웹 검색(Serper)에서 뽑은 가게 이름을 places_nearby 후보 장소와 로컬에서 맞춰 보는 모듈 (API 호출 없음)
+
+- normalize_name: 이름 정규화
+  - 유니코드 NFKC, 소문자, 공백/구두점 제거
+  - 둥근 괄호 안 내용은 별칭으로 분리 ("스타벅스(Starbucks)" → "스타벅스", "starbucks")
+  - 대괄호 등 말머리 태그는 제거 ("[부산맛집] 개미집" → "개미집")
+  - 지점 접미사 제거 ("스타벅스 광안점" / "스타벅스 광안리본점" → "스타벅스")
+  - 블로그 제목 꼬리 제거 ("OO식당 - 네이버 블로그", "OO식당 | 메뉴")
+- name_similarity: 포함 관계 + 글자 bigram Dice 계수 (한글은 음절 단위라 bigram이 잘 맞음)
+- EntityResolver.resolve: 웹 이름 → 후보 장소 1:1 매칭 (점수 높은 쌍부터, MATCH_THRESHOLD 이상)
+
+라틴/한글 표기는 한쪽이라도 괄호/슬래시로 두 표기를 함께 적은 경우 별칭으로 매칭된다.
+(음역 사전은 두지 않음)
+
+사용법:
+    resolver = EntityResolver(candidates)
+    web_hits = resolver.hits(place_names_from_web)   # 후보 순서대로 1.0(웹 언급) / 0.0
+    top = batch.top_k([web_hits, batch.reviews], k=15)
+"""
+
+import os
+import re
+import unicodedata
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence
+
+MATCH_THRESHOLD = float(os.getenv("ENTITY_MATCH_THRESHOLD", 0.6))
+
+# 둥근 괄호 (안의 내용은 별칭, 예: "온더(On the)")
+_ALIAS_BRACKETS = re.compile(r"[\(（]([^\)）]*)[\)）]")
+# 그 외 괄호 (블로그 말머리 태그라 내용째 제거, 예: "[부산맛집]")
+_TAG_BRACKETS = re.compile(r"[\[\{<［「『【][^\]\}>］」』】]*[\]\}>］」』】]")
+# 제목 꼬리 구분자 ("이름 - 네이버 블로그", "이름 | 메뉴", "이름 : 후기")
+_TITLE_SEPARATORS = re.compile(r"\s+[-|:·]\s+|\s*[|｜]\s*")
+# 별칭 구분자 ("스타벅스/Starbucks")
+_ALIAS_SEPARATORS = re.compile(r"\s*/\s*")
+# 지점 접미사 ("스타벅스 광안점", "스타벅스광안리본점", "해운대 2호점", "본점")
+# 띄어쓰기가 없으면 "점" 앞 최대 4글자까지만 지점명으로 봄
+_BRANCH_SUFFIX = re.compile(r"(?:\s+\S+|[가-힣0-9]{1,4})점$")
+# 검색 제목에 섞이는 일반 단어
+_NOISE_WORDS = ("맛집", "추천", "후기", "베스트", "best", "top", "리뷰", "메뉴", "내돈내산")
+_LEADING_NUMBER = re.compile(r"^\d+\s*[\.\)]\s*")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def _compact(text: str) -> str:
+    """소문자 + 한글/영문/숫자만 남김"""
+    return _NON_WORD.sub("", text.lower())
+
+
+def _strip_branch(name: str) -> str:
+    """지점 접미사 제거 (이름 전체가 지점명이면 그대로)"""
+    stripped = _BRANCH_SUFFIX.sub("", name).strip()
+    return stripped if len(_compact(stripped)) >= 2 else name
+
+
+def normalize_name(name: str) -> FrozenSet[str]:
+    """이름 → 비교용 정규화 형태들 (본 이름, 지점 제거 이름, 괄호/슬래시 별칭)"""
+    text = unicodedata.normalize("NFKC", name or "").strip()
+    text = _LEADING_NUMBER.sub("", text)
+    # 블로그/검색 제목 꼬리 제거 (첫 구간이 이름)
+    text = _TITLE_SEPARATORS.split(text)[0]
+
+    text = _TAG_BRACKETS.sub(" ", text)
+    aliases = [inner for inner in _ALIAS_BRACKETS.findall(text) if inner.strip()]
+    base = _ALIAS_BRACKETS.sub(" ", text)
+    parts = _ALIAS_SEPARATORS.split(base) + aliases
+
+    forms = set()
+    for part in parts:
+        lowered = part.lower()
+        for word in _NOISE_WORDS:
+            lowered = lowered.replace(word, " ")
+        lowered = " ".join(lowered.split())
+        for form in (lowered, _strip_branch(lowered)):
+            compact = _compact(form)
+            if len(compact) >= 2:
+                forms.add(compact)
+    return frozenset(forms)
+
+
+def _bigrams(text: str) -> Dict[str, int]:
+    grams: Dict[str, int] = {}
+    for i in range(len(text) - 1):
+        gram = text[i:i + 2]
+        grams[gram] = grams.get(gram, 0) + 1
+    return grams
+
+
+def _form_similarity(a: str, b: str) -> float:
+    if a == b:
+        return 1.0
+    short, long = (a, b) if len(a) <= len(b) else (b, a)
+    # 한쪽이 다른 쪽에 포함 ("해운대암소갈비" ⊂ "해운대암소갈비집", 2글자는 우연히 겹치기 쉬워 제외)
+    if len(short) >= 3 and short in long:
+        return 0.8 + 0.2 * len(short) / len(long)
+    grams_a, grams_b = _bigrams(a), _bigrams(b)
+    total = sum(grams_a.values()) + sum(grams_b.values())
+    if not total:
+        return 0.0
+    common = sum(min(count, grams_b.get(gram, 0)) for gram, count in grams_a.items())
+    return 2 * common / total
+
+
+def name_similarity(a: str, b: str) -> float:
+    """두 이름의 유사도 0~1 (정규화 형태 쌍 중 최대값)"""
+    return _best_similarity(normalize_name(a), normalize_name(b))
+
+
+def _best_similarity(forms_a: FrozenSet[str], forms_b: FrozenSet[str]) -> float:
+    return max((_form_similarity(a, b) for a in forms_a for b in forms_b), default=0.0)
+
+
+class Match(NamedTuple):
+    """웹 이름 ↔ 후보 장소 매칭 결과"""
+    name: str
+    name_index: int
+    candidate_index: int
+    place: Dict[str, Any]
+    score: float
+
+
+class EntityResolver:
+    """후보 장소 목록(places_nearby results)에 대한 이름 매칭기 (후보 이름 정규화는 한 번만)"""
+
+    def __init__(self, candidates: Sequence[Dict[str, Any]], threshold: float = MATCH_THRESHOLD):
+        self.candidates = list(candidates)
+        self.threshold = threshold
+        self._forms = [normalize_name(place.get("name", "")) for place in self.candidates]
+
+    def match(self, name: str) -> Optional[Match]:
+        """이름 하나에 가장 잘 맞는 후보 (threshold 미만이면 None)"""
+        matches = self.resolve([name])
+        return matches[0] if matches else None
+
+    def resolve(self, names: Sequence[str]) -> List[Match]:
+        """웹 이름 목록 → 1:1 매칭 목록 (웹 이름 순서대로)
+
+        점수가 높은 (이름, 후보) 쌍부터 배정하므로 한 후보가 여러 이름에 중복 배정되지 않는다.
+        """
+        pairs = []
+        for i, name in enumerate(names):
+            forms = normalize_name(name)
+            if not forms:
+                continue
+            for j, candidate_forms in enumerate(self._forms):
+                score = _best_similarity(forms, candidate_forms)
+                if score >= self.threshold:
+                    pairs.append((score, i, j))
+
+        # 동점이면 웹 순위가 높은 이름, 앞쪽 후보 우선
+        pairs.sort(key=lambda pair: (-pair[0], pair[1], pair[2]))
+        used_names, used_candidates = set(), set()
+        matches = []
+        for score, i, j in pairs:
+            if i in used_names or j in used_candidates:
+                continue
+            used_names.add(i)
+            used_candidates.add(j)
+            matches.append(Match(names[i], i, j, self.candidates[j], round(score, 3)))
+        matches.sort(key=lambda match: match.name_index)
+        return matches
+
+    def hits(self, names: Sequence[str]) -> List[float]:
+        """후보 순서대로 웹 이름과 매칭되면 1.0, 아니면 0.0 (CandidateBatch.top_k 정렬 키용)"""
+        flags = [0.0] * len(self.candidates)
+        for match in self.resolve(names):
+            flags[match.candidate_index] = 1.0
+        return flags
@@ -0,0 +1,326 @@
+"""
+Korean Region Gazetteer
+자주 검색되는 국내 지역(시/군/구/동, 인기 세부 지역)의 중심 좌표와 권장 검색 반경
+
+- 검색마다 반복되던 gmaps.geocode("부산 해운대, 대한민국") 네트워크 호출을 로컬 조회로 대체
+- 정규화된 이름 → 항목 dict 조회 (O(1))
+  - "부산광역시 해운대구", "부산 해운대", "해운대" → 같은 항목
+  - 행정 접미사(시/군/구/동/읍/면, 광역시 등), "대한민국", "주변/근처" 같은 말은 제거
+  - 여러 도시에 같은 이름이 있는 세부 지역(예: 부산 송도 / 인천 송도)은 도시명과 함께일 때만 조회
+- 번들 데이터에 없는 지역은 네트워크 geocode 결과를 오버레이 파일에 저장해서 다음부터 로컬 조회
+  - 결과 types가 행정구역(locality/administrative_area/sublocality)인 경우만 저장 (주소/장소명은 저장 안 함)
+  - 최대 GAZETTEER_OVERLAY_MAX_ENTRIES개 (넘으면 먼저 저장된 것부터 삭제)
+- region_agent.POPULAR_CITIES의 도시/세부 지역은 모두 번들 데이터에 포함되어 있다
+
+환경 변수:
+- GAZETTEER_OVERLAY_PATH: 오버레이 JSON 경로 (기본: backend/data/gazetteer_overlay.json)
+- GAZETTEER_OVERLAY_MAX_ENTRIES: 오버레이 최대 항목 수 (기본 2000)
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OVERLAY_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "gazetteer_overlay.json")
+OVERLAY_PATH = os.getenv("GAZETTEER_OVERLAY_PATH", DEFAULT_OVERLAY_PATH)
+OVERLAY_MAX_ENTRIES = int(os.getenv("GAZETTEER_OVERLAY_MAX_ENTRIES", 2000))
+
+# 오버레이에 저장하는 geocode 결과 types → 지역 종류 (앞쪽이 우선)
+REGION_TYPES = (
+    ("administrative_area_level_1", "city"),
+    ("locality", "city"),
+    ("administrative_area_level_2", "district"),
+    ("sublocality_level_1", "district"),
+    ("sublocality", "area"),
+)
+
+# 지역 종류별 권장 검색 반경 (m)
+KIND_RADIUS = {
+    "city": 15000,      # 시/군
+    "district": 7000,   # 구
+    "area": 3000,       # 동/읍/면, 번화가·해변 등 세부 지역
+}
+
+# (이름, 상위 도시, 위도, 경도, 종류, 별칭)
+_BUNDLED: List[Tuple[str, Optional[str], float, float, str, Tuple[str, ...]]] = [
+    # ----- 광역/특별시 -----
+    ("서울", None, 37.5665, 126.9780, "city", ("서울특별시",)),
+    ("부산", None, 35.1796, 129.0756, "city", ("부산광역시",)),
+    ("대구", None, 35.8714, 128.6014, "city", ("대구광역시",)),
+    ("인천", None, 37.4563, 126.7052, "city", ("인천광역시",)),
+    ("광주", None, 35.1595, 126.8526, "city", ("광주광역시",)),
+    ("대전", None, 36.3504, 127.3845, "city", ("대전광역시",)),
+    ("울산", None, 35.5384, 129.3114, "city", ("울산광역시",)),
+    ("세종", None, 36.4800, 127.2890, "city", ("세종특별자치시",)),
+    # ----- 제주 -----
+    ("제주", None, 33.4996, 126.5312, "city", ("제주시", "제주도", "제주특별자치도")),
+    ("서귀포", "제주", 33.2541, 126.5600, "city", ()),
+    ("성산", "제주", 33.4586, 126.9424, "area", ("성산일출봉",)),
+    ("중문", "제주", 33.2486, 126.4120, "area", ("중문관광단지",)),
+    ("애월", "제주", 33.4628, 126.3310, "area", ()),
+    ("협재", "제주", 33.3940, 126.2397, "area", ("협재해수욕장",)),
+    ("한림", "제주", 33.4106, 126.2692, "area", ()),
+    ("함덕", "제주", 33.5433, 126.6695, "area", ("함덕해수욕장",)),
+    ("월정리", "제주", 33.5563, 126.7958, "area", ()),
+    ("우도", "제주", 33.5064, 126.9530, "area", ()),
+    ("표선", "제주", 33.3257, 126.8310, "area", ()),
+    # ----- 서울 -----
+    ("명동", "서울", 37.5636, 126.9834, "area", ()),
+    ("강남", "서울", 37.4979, 127.0276, "area", ("강남역",)),
+    ("홍대", "서울", 37.5563, 126.9236, "area", ("홍대입구", "홍익대")),
+    ("북촌", "서울", 37.5826, 126.9836, "area", ("북촌한옥마을",)),
+    ("이태원", "서울", 37.5345, 126.9946, "area", ()),
+    ("종로", "서울", 37.5704, 126.9921, "district", ()),
+    ("인사동", "서울", 37.5740, 126.9850, "area", ()),
+    ("성수", "서울", 37.5445, 127.0560, "area", ("성수동",)),
+    ("잠실", "서울", 37.5133, 127.1001, "area", ()),
+    ("여의도", "서울", 37.5219, 126.9245, "area", ()),
+    ("신촌", "서울", 37.5551, 126.9368, "area", ()),
+    ("을지로", "서울", 37.5660, 126.9910, "area", ()),
+    ("동대문", "서울", 37.5712, 127.0095, "area", ()),
+    ("압구정", "서울", 37.5270, 127.0286, "area", ()),
+    ("가로수길", "서울", 37.5209, 127.0230, "area", ("신사동",)),
+    ("연남동", "서울", 37.5660, 126.9250, "area", ("연남",)),
+    ("용산", "서울", 37.5326, 126.9905, "district", ()),
+    ("마포", "서울", 37.5663, 126.9019, "district", ()),
+    # ----- 부산 -----
+    ("해운대", "부산", 35.1587, 129.1604, "area", ("해운대해수욕장", "해운대해변")),
+    ("광안리", "부산", 35.1532, 129.1186, "area", ("광안리해수욕장", "광안리해변", "광안")),
+    ("남포동", "부산", 35.0980, 129.0306, "area", ("남포", "자갈치")),
+    ("서면", "부산", 35.1578, 129.0600, "area", ()),
+    ("송도", "부산", 35.0760, 129.0170, "area", ("송도해수욕장",)),
+    ("기장", "부산", 35.2445, 129.2222, "city", ()),
+    ("부산역", "부산", 35.1151, 129.0414, "area", ()),
+    ("센텀시티", "부산", 35.1690, 129.1317, "area", ("센텀",)),
+    ("태종대", "부산", 35.0530, 129.0870, "area", ()),
+    ("감천문화마을", "부산", 35.0975, 129.0106, "area", ("감천",)),
+    ("영도", "부산", 35.0911, 129.0679, "district", ()),
+    ("전포", "부산", 35.1554, 129.0650, "area", ("전포카페거리",)),
+    # ----- 강원 -----
+    ("강릉", None, 37.7519, 128.8761, "city", ()),
+    ("경포대", "강릉", 37.7954, 128.9080, "area", ("경포", "경포해변", "경포해수욕장")),
+    ("안목해변", "강릉", 37.7720, 128.9470, "area", ("안목", "강릉커피거리")),
+    ("주문진", "강릉", 37.8920, 128.8240, "area", ()),
+    ("강릉역 주변", "강릉", 37.7640, 128.8995, "area", ("강릉역",)),
+    ("정동진", "강릉", 37.6898, 129.0344, "area", ()),
+    ("속초", None, 38.2070, 128.5918, "city", ()),
+    ("양양", None, 38.0754, 128.6190, "city", ()),
+    ("춘천", None, 37.8813, 127.7298, "city", ()),
+    ("평창", None, 37.3705, 128.3903, "city", ()),
+    ("삼척", None, 37.4500, 129.1652, "city", ()),
+    ("동해", None, 37.5247, 129.1143, "city", ()),
+    ("가평", None, 37.8315, 127.5105, "city", ()),
+    # ----- 인천 -----
+    ("차이나타운", "인천", 37.4756, 126.6173, "area", ("인천차이나타운",)),
+    ("송도", "인천", 37.3925, 126.6390, "area", ("송도국제도시", "송도센트럴파크")),
+    ("월미도", "인천", 37.4752, 126.5970, "area", ()),
+    ("영종도", "인천", 37.4920, 126.4930, "area", ("영종",)),
+    ("을왕리", "인천", 37.4470, 126.3730, "area", ("을왕리해수욕장",)),
+    # ----- 전라 -----
+    ("전주", None, 35.8242, 127.1480, "city", ()),
+    ("전주 한옥마을", "전주", 35.8151, 127.1530, "area", ("한옥마을",)),
+    ("객사길", "전주", 35.8185, 127.1440, "area", ("객리단길",)),
+    ("덕진공원", "전주", 35.8466, 127.1213, "area", ()),
+    ("여수", None, 34.7604, 127.6622, "city", ()),
+    ("순천", None, 34.9507, 127.4872, "city", ()),
+    ("목포", None, 34.8118, 126.3922, "city", ()),
+    ("담양", None, 35.3211, 126.9882, "city", ()),
+    ("남원", None, 35.4164, 127.3905, "city", ()),
+    # ----- 경상 -----
+    ("경주", None, 35.8562, 129.2247, "city", ()),
+    ("황리단길", "경주", 35.8380, 129.2096, "area", ()),
+    ("보문단지", "경주", 35.8420, 129.2850, "area", ("보문관광단지", "보문호")),
+    ("포항", None, 36.0190, 129.3435, "city", ()),
+    ("안동", None, 36.5684, 128.7294, "city", ("안동하회마을",)),
+    ("통영", None, 34.8544, 128.4331, "city", ()),
+    ("거제", None, 34.8806, 128.6211, "city", ("거제도",)),
+    ("창원", None, 35.2280, 128.6811, "city", ()),
+    ("김해", None, 35.2285, 128.8894, "city", ()),
+    # ----- 경기/충청 -----
+    ("수원", None, 37.2636, 127.0286, "city", ()),
+    ("용인", None, 37.2411, 127.1776, "city", ()),
+    ("고양", None, 37.6584, 126.8320, "city", ("일산",)),
+    ("성남", None, 37.4201, 127.1265, "city", ("분당",)),
+    ("파주", None, 37.7599, 126.7800, "city", ()),
+    ("천안", None, 36.8151, 127.1139, "city", ()),
+    ("청주", None, 36.6424, 127.4890, "city", ()),
+    ("단양", None, 36.9846, 128.3655, "city", ()),
+    ("공주", None, 36.4465, 127.1190, "city", ()),
+    ("부여", None, 36.2756, 126.9098, "city", ()),
+    ("보령", None, 36.3333, 126.6127, "city", ("대천", "대천해수욕장")),
+    ("태안", None, 36.7456, 126.2980, "city", ()),
+]
+
+# 정규화 시 버리는 토큰
+_STOP_TOKENS = {"대한민국", "한국", "주변", "근처", "일대", "인근", "쪽", "부근"}
+
+# 뒤에서부터 제거하는 행정 접미사 (긴 것 우선)
+_ADMIN_SUFFIXES = ("특별자치시", "특별자치도", "특별시", "광역시", "시", "군", "구", "동", "읍", "면", "도")
+
+_SPLIT_RE = re.compile(r"[\s,·/]+")
+
+
+def _normalize_token(token: str) -> str:
+    for suffix in _ADMIN_SUFFIXES:
+        # "중구", "명동"처럼 접미사를 빼면 한 글자가 되는 이름은 그대로 둔다
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            return token[:-len(suffix)]
+    return token
+
+
+def _tokens(name: str) -> List[str]:
+    return [_normalize_token(t) for t in _SPLIT_RE.split(name.strip()) if t and t not in _STOP_TOKENS]
+
+
+def normalize_region(name: str) -> str:
+    """지역명 → 조회 키 ("부산광역시 해운대구, 대한민국" → "부산해운대")"""
+    return "".join(_tokens(name))
+
+
+def _make_entry(name: str, parent: Optional[str], lat: float, lng: float, kind: str,
+                source: str = "bundled") -> Dict[str, Any]:
+    display = f"{parent} {name}" if parent and not name.startswith(parent) else name
+    return {
+        "name": display,
+        "city": parent or name,
+        "lat": lat,
+        "lng": lng,
+        "kind": kind,
+        "radius": KIND_RADIUS.get(kind, KIND_RADIUS["area"]),
+        "source": source,
+    }
+
+
+def _build_index() -> Dict[str, Dict[str, Any]]:
+    """번들 데이터 → 조회 인덱스 (도시명 포함 키 + 모호하지 않은 단독 키)"""
+    qualified: Dict[str, Dict[str, Any]] = {}
+    bare: Dict[str, List[Dict[str, Any]]] = {}
+
+    for name, parent, lat, lng, kind, aliases in _BUNDLED:
+        entry = _make_entry(name, parent, lat, lng, kind)
+        for label in (name, *aliases):
+            key = normalize_region(label)
+            bare.setdefault(key, [])
+            if entry not in bare[key]:
+                bare[key].append(entry)
+            if parent:
+                qualified[normalize_region(f"{parent} {label}")] = entry
+
+    index = dict(qualified)
+    for key, entries in bare.items():
+        if len(entries) == 1:
+            index.setdefault(key, entries[0])
+        else:
+            # 같은 이름이 여러 도시에 있으면 도시 단위 항목이 있을 때만 단독 키로 사용
+            cities = [e for e in entries if e["kind"] == "city"]
+            if len(cities) == 1:
+                index.setdefault(key, cities[0])
+    return index
+
+
+_INDEX = _build_index()
+
+# 네트워크 geocode 결과 오버레이 (정규화 키 → 항목)
+_overlay: Dict[str, Dict[str, Any]] = {}
+_overlay_lock = threading.Lock()
+
+
+def _load_overlay() -> None:
+    if not os.path.exists(OVERLAY_PATH):
+        return
+    try:
+        with open(OVERLAY_PATH, encoding="utf-8") as f:
+            loaded = json.load(f)
+        # 예전 파일의 행정구역이 아닌 항목은 버리고 최대 개수 유지
+        _overlay.update({
+            key: entry for key, entry in loaded.items()
+            if entry.get("kind") in KIND_RADIUS and entry.get("source") == "geocode"
+        })
+        _trim_overlay()
+        logger.info(f"🗺️ 지역 오버레이 {len(_overlay)}개 로드")
+    except Exception as e:
+        logger.warning(f"⚠️ 지역 오버레이 로드 실패: {e}")
+
+
+def _trim_overlay() -> None:
+    """최대 개수를 넘으면 먼저 저장된 항목부터 삭제 (dict 삽입 순서)"""
+    for key in list(_overlay)[:max(0, len(_overlay) - OVERLAY_MAX_ENTRIES)]:
+        del _overlay[key]
+
+
+def _save_overlay() -> None:
+    """오버레이를 임시 파일에 쓰고 교체 (_overlay_lock 보유 상태에서 호출)"""
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(OVERLAY_PATH)), exist_ok=True)
+        tmp_path = f"{OVERLAY_PATH}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_overlay, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, OVERLAY_PATH)
+    except Exception as e:
+        logger.warning(f"⚠️ 지역 오버레이 저장 실패: {e}")
+
+
+_load_overlay()
+
+
+def lookup_region(name: str) -> Optional[Dict[str, Any]]:
+    """지역명 → {"name", "lat", "lng", "kind", "radius", "source"} (없으면 None)"""
+    if not name:
+        return None
+    tokens = _tokens(name)
+    key = "".join(tokens)
+    entry = _INDEX.get(key) or _overlay.get(key)
+    if entry or len(tokens) < 2:
+        return entry
+
+    # "서귀포 중문"처럼 앞 지역과 뒤 세부 지역이 같은 도시에 속하면 세부 지역으로 조회
+    head = _INDEX.get(tokens[0])
+    tail = _INDEX.get("".join(tokens[1:]))
+    if head and tail and head["city"] == tail["city"]:
+        return tail
+    return None
+
+
+def _region_kind(types: List[str]) -> Optional[str]:
+    """geocode 결과 types → 지역 종류 (행정구역이 아니면 None)"""
+    for region_type, kind in REGION_TYPES:
+        if region_type in types:
+            return kind
+    return None
+
+
+def remember_region(name: str, geocode_result: List[Dict[str, Any]]) -> None:
+    """네트워크 geocode 결과를 오버레이에 저장
+
+    번들에 있는 지역, 행정구역이 아닌 결과(도로명 주소, 장소명, 현재 위치 문자열 등)는 저장하지 않는다.
+    """
+    key = normalize_region(name)
+    if not key or key in _INDEX or not geocode_result:
+        return
+    kind = _region_kind(geocode_result[0].get("types", []))
+    if kind is None:
+        return
+    location = geocode_result[0]["geometry"]["location"]
+    entry = _make_entry(name.split(",")[0].strip(), None, location["lat"], location["lng"], kind, source="geocode")
+    with _overlay_lock:
+        if _overlay.get(key) == entry:
+            return
+        _overlay.pop(key, None)
+        _overlay[key] = entry
+        _trim_overlay()
+        _save_overlay()
+
+
+def to_geocode_result(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """조회 결과 → googlemaps.Client.geocode 응답 형태"""
+    return [{
+        "formatted_address": f"대한민국 {entry['name']}",
+        "geometry": {"location": {"lat": entry["lat"], "lng": entry["lng"]}},
+        "types": ["locality" if entry["kind"] == "city" else "sublocality"],
+        "source": entry["source"],
+    }]
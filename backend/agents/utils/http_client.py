@@ -0,0 +1,126 @@
+"""
+공용 비동기 HTTP 클라이언트
+Serper/Naver/ODsay 등 외부 API 비동기 호출에서 커넥션 풀을 공유하기 위한 모듈
+
+- get_async_client: 이벤트 루프별 공용 httpx.AsyncClient (keep-alive 커넥션 재사용)
+- run_sync: 동기 코드(LangChain 동기 Tool 등)에서 코루틴 실행
+  - 백그라운드 스레드의 전용 이벤트 루프 하나에서 실행 → 그 루프의 공용 클라이언트가 계속 재사용됨
+  - 호출한 스레드에 이미 실행 중인 루프가 있어도 동작 (asyncio.run과 달리 RuntimeError 없음)
+
+환경 변수:
+- HTTP_CLIENT_HTTP2: "on" / "off"(기본) - HTTP/2 사용 (h2 패키지 필요, 없으면 HTTP/1.1로 동작)
+"""
+
+import os
+import asyncio
+import logging
+import concurrent.futures
+import threading
+import weakref
+from typing import Any, Awaitable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 타임아웃 & 커넥션 풀 설정
+DEFAULT_TIMEOUT = 10
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30
+
+
+def _http2_available() -> bool:
+    if os.getenv("HTTP_CLIENT_HTTP2", "off").lower() != "on":
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("⚠️ HTTP_CLIENT_HTTP2=on 이지만 h2 패키지가 없어 HTTP/1.1로 동작합니다")
+        return False
+    return True
+
+
+HTTP2_ENABLED = _http2_available()
+
+# 이벤트 루프별 클라이언트 (httpx.AsyncClient는 생성된 루프에 묶임)
+# 루프가 사라지거나 닫힌 항목은 정리 (asyncio.run을 반복하는 스크립트, 워커마다 새로 만드는 루프)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+# run_sync 전용 백그라운드 이벤트 루프
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프에서 사용할 공용 httpx.AsyncClient 반환 (없으면 생성)"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+
+    if client is None or client.is_closed:
+        _drop_closed_loops()
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            )
+        )
+        _clients[loop] = client
+        logger.info(f"🌐 공용 AsyncClient 생성 (HTTP/{'2' if HTTP2_ENABLED else '1.1'})")
+
+    return client
+
+
+def _drop_closed_loops() -> None:
+    """닫힌 루프의 클라이언트 제거 (닫힌 루프에서는 aclose할 수 없으므로 참조만 끊고 소켓은 GC에 맡김)
+
+    클라이언트의 커넥션이 루프를 참조하므로 WeakKeyDictionary만으로는 항목이 사라지지 않는다.
+    """
+    for loop in [loop for loop in list(_clients) if loop.is_closed()]:
+        _clients.pop(loop, None)
+
+
+async def close_async_client() -> None:
+    """현재 이벤트 루프의 공용 클라이언트 종료 (서버 shutdown 시 호출)"""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """run_sync 전용 이벤트 루프 (처음 호출 시 데몬 스레드로 시작)"""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="http-client-loop", daemon=True)
+            thread.start()
+            _background_loop = loop
+            logger.info("🔁 run_sync 백그라운드 이벤트 루프 시작")
+        return _background_loop
+
+
+def run_sync(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """동기 코드에서 코루틴을 실행하고 결과 반환 (백그라운드 루프에서 실행)
+
+    백그라운드 루프 스레드 안에서 호출하면 교착되므로, 그 루프에서 도는 코루틴은 직접 await 해야 한다.
+    """
+    loop = _get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync는 백그라운드 루프 안에서 호출할 수 없습니다 (await 사용)")
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
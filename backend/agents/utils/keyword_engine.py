@@ -0,0 +1,264 @@
+"""
+Keyword Engine
+선언형 키워드 표(KEYWORD_TABLE)로 import 시 한 번 만든 Aho–Corasick 오토마톤으로
+텍스트 한 번 훑기(O(len(text)))에 모든 그룹/라벨 키워드를 찾는 모듈
+
+- 그룹: 용도별 키워드 묶음 (쇼핑 카테고리, 브랜드, 의도, 음식 종류, 제외어 등)
+- 라벨: 그룹 안의 분류 이름 (표에 적은 순서가 우선순위)
+- normalize_text: 비교 전 정규화 (텍스트와 키워드에 똑같이 적용)
+  - 유니코드 NFKC → 자모가 분리된(NFD) 한글도 음절로 합쳐짐, 전각 영문/숫자 → 반각
+  - 호환 자모(ㅇㅇ, ㅋㅋ)는 그대로 유지 (NFKC가 조합용 자모로 바꾼 것을 되돌림)
+  - 소문자, 연속 공백은 한 칸
+- 영문/숫자로 시작(끝)나는 키워드는 앞(뒤) 글자가 영문/숫자가 아닐 때만 매칭
+  ("cu"는 "CU 편의점"/"cu에서"에는 걸리지만 "cucumber"에는 안 걸림, 한글 키워드는 붙여 써도 매칭)
+- match_keywords: 같은 텍스트는 LRU로 한 번만 훑음 (여러 판별 함수가 같은 입력을 반복 조회)
+
+사용법:
+    hits = match_keywords(user_input)
+    hits.first("shopping_store")      # "편의점" (표 순서상 첫 라벨) / None
+    hits.has("intent", "restaurant")  # True / False
+    hits.labels("food_exclude")       # 제외어가 걸린 라벨 목록
+"""
+
+import unicodedata
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# ==================== 키워드 표 ====================
+# {그룹: {라벨: [키워드, ...]}} - 라벨 순서 = 우선순위
+
+KEYWORD_TABLE: Dict[str, Dict[str, List[str]]] = {
+    # 쇼핑: 매장 종류 검색 여부 (is_*_search)
+    "shopping_search": {
+        "편의점": ["편의점", "cvs", "씨유", "GS25", "세븐일레븐", "cu"],
+        "약국": ["약국", "pharmacy", "약방", "드럭스토어"],
+        "대형마트": ["대형마트", "마트", "슈퍼마켓", "supermarket"],
+    },
+    # 쇼핑: 명시적 매장 카테고리 (get_category_from_input)
+    "shopping_store": {
+        "편의점": ["편의점", "cvs", "씨유", "GS25", "세븐일레븐", "cu"],
+        "대형마트": ["대형마트", "마트", "이마트", "홈플러스", "롯데마트"],
+        "팝업스토어": ["팝업", "팝업스토어", "popup"],
+        "다이소": ["다이소", "daiso"],
+        "약국": ["약국", "pharmacy"],
+        "재래시장": ["재래시장", "시장", "전통시장"],
+    },
+    # 쇼핑: 상품/목적 → 매장 카테고리 유추 (get_implied_category_from_product)
+    "shopping_product": {
+        "대형마트": [
+            "고기", "삼겹살", "목살", "소고기", "돼지고기",
+            "장보기", "장 보러", "장 보러 갈", "정육", "정육점",
+        ],
+        "다이소": [
+            "와인오프너", "와인 오프너", "병따개", "병 따개",
+            "와인 따개", "오프너", "주방용품", "생활용품",
+        ],
+        "약국": [
+            "감기약", "두통약", "해열제", "종합감기약", "기침약",
+            "감기 약", "두통 약", "약 필요", "약 사러", "약 파는",
+        ],
+        "편의점": [
+            "콘돔", "피임도구", "피임 도구", "피임기구", "피임 기구",
+            "야간 간식", "야식 사러", "컵라면 사러",
+        ],
+    },
+    # 쇼핑: 브랜드 (Places keyword + 이름 필터로 사용)
+    "shopping_brand": {
+        "다이소": ["다이소", "daiso"],
+        "이마트": ["이마트", "emart"],
+        "홈플러스": ["홈플러스", "homeplus"],
+        "롯데마트": ["롯데마트"],
+        "코스트코": ["코스트코", "costco"],
+    },
+    # 장소 이름 → 매장 체인 종류 (편의점/대형마트 결과 필터)
+    "store_chain": {
+        "대형마트": [
+            "이마트", "홈플러스", "롯데마트", "메가마트", "빅마켓",
+            "하나로마트", "농협", "코스트코", "emart", "homeplus",
+        ],
+        "편의점": ["GS25", "CU", "세븐일레븐", "7-ELEVEN", "이마트24", "씨유", "미니스톱"],
+    },
+    # 사용자 의도 (orchestrator.classify_intent)
+    "intent": {
+        "restaurant": ["맛집", "음식", "식당", "먹을", "레스토랑"],
+        "itinerary": ["일정", "계획", "여행", "스케줄"],
+    },
+    # 대화 흐름 초기화 (coordinator)
+    "reset": {
+        "reset": ["여행 계획 시작", "새로운 여행", "처음부터", "다시 시작", "초기화"],
+    },
+    # 웹 검색 결과 음식 종류 (serper_utils.extract_place_names)
+    "food": {
+        "스테이크": ["스테이크", "안심", "등심", "채끝", "립아이", "tomahawk"],
+        "파스타": ["파스타", "스파게티", "알리오", "까르보나라", "크림", "토마토"],
+        "피자": ["피자", "마르게리타", "페퍼로니", "치즈"],
+        "초밥": ["초밥", "스시", "사시미", "회"],
+        "라멘": ["라멘", "돈코츠", "미소", "쇼유"],
+        "이자카야": ["이자카야", "사케", "안주", "꽃치"],
+        "한식": ["한식", "된장", "김치", "불고기", "갈비"],
+        "중식": ["중식", "짜장", "짬뽕", "탕수육", "마라"],
+        "케이크": ["케이크", "디저트", "베이커리", "빵"],
+        "커피": ["커피", "카페", "라떼", "아메리카노"],
+    },
+    # 음식 종류별 제외어 (라벨 = 이 제외어를 쓰는 음식 종류)
+    "food_exclude": {
+        "스테이크": ["카페", "디저트", "베이커리", "버거", "파스타"],
+        "파스타": ["카페", "디저트", "베이커리", "버거", "스테이크"],
+        "초밥": ["카페", "디저트", "파스타", "버거"],
+        "케이크": ["파스타", "스테이크", "버거", "라멘"],
+        "커피": ["파스타", "스테이크", "버거", "라멘"],
+    },
+    # 메뉴/후기 정보가 있는 글인지
+    "menu_info": {
+        "menu": ["메뉴", "맛집", "유명", "인기", "추천", "리뷰", "후기"],
+    },
+}
+
+
+# ==================== 정규화 ====================
+
+# NFKC는 호환 자모(ㄱ U+3131)를 조합용 자모(U+1100)로 바꾸므로, 단독 자모는 호환 자모로 되돌림
+_CONJOINING_TO_COMPAT = {}
+for _compat in range(0x3131, 0x318F):
+    _conjoining = unicodedata.normalize("NFKC", chr(_compat))
+    if len(_conjoining) == 1 and _conjoining != chr(_compat):
+        _CONJOINING_TO_COMPAT.setdefault(_conjoining, chr(_compat))
+_JAMO_TABLE = str.maketrans(_CONJOINING_TO_COMPAT)
+
+
+def normalize_text(text: str) -> str:
+    """비교용 정규화 (NFKC + 단독 자모 복원 + 소문자 + 공백 정리)"""
+    text = unicodedata.normalize("NFKC", text or "").translate(_JAMO_TABLE)
+    return " ".join(text.lower().split())
+
+
+# ==================== Aho–Corasick ====================
+
+def _is_word_char(char: str) -> bool:
+    """영문/숫자 (라틴 키워드의 단어 경계 판단용)"""
+    return char.isascii() and char.isalnum()
+
+
+class Hit(NamedTuple):
+    """키워드 하나가 텍스트에서 발견된 위치"""
+    group: str
+    label: str
+    keyword: str
+    start: int
+    end: int
+
+
+class KeywordHits:
+    """한 텍스트의 전체 매칭 결과 (그룹/라벨별 조회)"""
+
+    def __init__(self, hits: Sequence[Hit], label_order: Mapping[str, Mapping[str, int]]):
+        self.hits = tuple(hits)
+        self._by_group: Dict[str, Dict[str, List[Hit]]] = {}
+        for hit in self.hits:
+            self._by_group.setdefault(hit.group, {}).setdefault(hit.label, []).append(hit)
+        self._label_order = label_order
+
+    def labels(self, group: str) -> List[str]:
+        """매칭된 라벨 (표 순서 = 우선순위 순)"""
+        found = self._by_group.get(group, {})
+        order = self._label_order.get(group, {})
+        return sorted(found, key=lambda label: order.get(label, len(order)))
+
+    def first(self, group: str) -> Optional[str]:
+        """우선순위가 가장 높은 매칭 라벨 (없으면 None)"""
+        labels = self.labels(group)
+        return labels[0] if labels else None
+
+    def has(self, group: str, label: Optional[str] = None) -> bool:
+        found = self._by_group.get(group, {})
+        return bool(found) if label is None else label in found
+
+    def keywords(self, group: str, label: Optional[str] = None) -> List[str]:
+        """매칭된 키워드 (텍스트 등장 순)"""
+        found = self._by_group.get(group, {})
+        hits = found.get(label, []) if label is not None else [hit for hits in found.values() for hit in hits]
+        return [hit.keyword for hit in sorted(hits, key=lambda hit: hit.start)]
+
+    def __bool__(self) -> bool:
+        return bool(self.hits)
+
+
+class KeywordMatcher:
+    """Aho–Corasick 다중 패턴 매칭기 (생성 후 읽기 전용 → 스레드 안전)"""
+
+    def __init__(self, table: Mapping[str, Mapping[str, Iterable[str]]]):
+        # 노드별 전이 / 실패 링크 / 출력 (출력은 실패 링크 출력까지 합쳐 둠)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, str, str, int, bool, bool]]] = [[]]
+        self._label_order: Dict[str, Dict[str, int]] = {}
+
+        for group, labels in table.items():
+            self._label_order[group] = {label: i for i, label in enumerate(labels)}
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    self._add(group, label, keyword)
+        self._build()
+
+    def _add(self, group: str, label: str, keyword: str) -> None:
+        pattern = normalize_text(keyword)
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = next_node
+        # 영문/숫자로 시작/끝나는 키워드는 단어 경계 확인 (start_bound, end_bound)
+        self._out[node].append(
+            (group, label, keyword, len(pattern), _is_word_char(pattern[0]), _is_word_char(pattern[-1]))
+        )
+
+    def _build(self) -> None:
+        """BFS로 실패 링크 계산"""
+        # 깊이 1 노드의 실패 링크는 루트
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def scan(self, text: str) -> KeywordHits:
+        """정규화된 text 한 번 훑기로 모든 키워드 위치 찾기"""
+        text = normalize_text(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = []
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for group, label, keyword, length, start_bound, end_bound in out[node]:
+                start = end - length
+                if start_bound and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end_bound and end < len(text) and _is_word_char(text[end]):
+                    continue
+                hits.append(Hit(group, label, keyword, start, end))
+        return KeywordHits(hits, self._label_order)
+
+
+# 공용 매칭기 (import 시 한 번 생성)
+keyword_matcher = KeywordMatcher(KEYWORD_TABLE)
+
+
+@lru_cache(maxsize=512)
+def match_keywords(text: str) -> KeywordHits:
+    """공용 매칭기로 text 매칭 (같은 텍스트는 캐시)"""
+    return keyword_matcher.scan(text)
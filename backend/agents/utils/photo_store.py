@@ -0,0 +1,317 @@
+"""
+Photo Store
+Google Places 사진을 한 번만 받아 디스크에 보관하고 썸네일을 만들어 주는 저장소 (/api/photos 프록시용)
+
+- 원본은 SOURCE_WIDTH(기본 800px)로 한 번만 다운로드 (같은 사진 동시 요청은 governor가 합침)
+- 요청 너비는 THUMBNAIL_WIDTHS 중 가장 가까운 큰 값으로 맞춰 썸네일 생성 (Pillow, JPEG)
+  - Pillow가 없거나 원본보다 큰 너비면 원본 그대로
+- 파일은 내용 SHA-256 이름으로 저장 (content-addressed) → 같은 이미지는 한 번만 저장, ETag로 그대로 사용
+- (photo_reference, 너비) → 파일 매핑은 SQLite 인덱스에 저장 (재시작/여러 워커 간 공유)
+- 전체 용량이 MAX_BYTES를 넘으면 오래 조회되지 않은 사진부터 삭제 (LRU)
+
+클라이언트에는 API 키가 들어간 Google URL 대신 photo_url()이 만든 프록시 URL을 내려준다.
+
+환경 변수:
+- PHOTO_PROXY: "on"(기본) / "off" (off면 photo_url이 Google URL 반환)
+- PHOTO_CACHE_DIR: 저장 디렉터리 (기본: backend/data/photos)
+- PHOTO_CACHE_MAX_BYTES: 최대 저장 용량 (기본 512MB)
+- PHOTO_PUBLIC_BASE_URL: 프록시 URL 앞에 붙일 백엔드 주소 (기본 http://localhost:8000)
+- PHOTO_LIST_WIDTH: 목록 카드용 썸네일 너비 (기본 480)
+- PHOTO_MISS_TTL: Google이 찾지 못한 photo_reference를 다시 요청하지 않는 시간 초 (기본 600, /api/photos)
+"""
+
+import io
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+from agents.utils.request_governor import request_bytes
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
+PHOTO_API_URL = "https://maps.googleapis.com/maps/api/place/photo"
+
+PHOTO_PROXY_ENABLED = os.getenv("PHOTO_PROXY", "on").lower() != "off"
+DEFAULT_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data", "photos")
+MAX_BYTES = int(os.getenv("PHOTO_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+PUBLIC_BASE_URL = os.getenv("PHOTO_PUBLIC_BASE_URL", "http://localhost:8000").rstrip("/")
+LIST_WIDTH = int(os.getenv("PHOTO_LIST_WIDTH", 480))
+MISS_TTL = int(os.getenv("PHOTO_MISS_TTL", 600))
+
+# 원본 다운로드 너비 (기존 클라이언트가 받던 크기)
+SOURCE_WIDTH = 800
+# 제공하는 썸네일 너비 (요청 너비는 이 중 하나로 맞춤)
+THUMBNAIL_WIDTHS = (160, 320, 480, SOURCE_WIDTH)
+JPEG_QUALITY = 80
+
+# photo_reference 형식 (영문/숫자/-/_)
+_REFERENCE_PATTERN = re.compile(r"^[A-Za-z0-9_-]{16,2048}$")
+
+
+class PhotoFile(NamedTuple):
+    """디스크에 저장된 사진 (etag는 내용 해시)"""
+    path: str
+    etag: str
+    content_type: str
+    size: int
+
+
+def is_valid_reference(photo_reference: str) -> bool:
+    return bool(_REFERENCE_PATTERN.match(photo_reference or ""))
+
+
+def snap_width(width: Optional[int]) -> int:
+    """요청 너비 → 제공 너비 (THUMBNAIL_WIDTHS 중 width 이상인 가장 작은 값)"""
+    if not width:
+        return SOURCE_WIDTH
+    for candidate in THUMBNAIL_WIDTHS:
+        if width <= candidate:
+            return candidate
+    return SOURCE_WIDTH
+
+
+def photo_url(photo_reference: str, width: int = SOURCE_WIDTH) -> str:
+    """클라이언트에 내려줄 사진 URL (프록시 비활성화 시 Google URL)"""
+    if not PHOTO_PROXY_ENABLED:
+        return f"{PHOTO_API_URL}?maxwidth={width}&photo_reference={photo_reference}&key={GOOGLE_API_KEY}"
+    return f"{PUBLIC_BASE_URL}/api/photos/{photo_reference}?w={snap_width(width)}"
+
+
+def _resize(content: bytes, width: int) -> Optional[bytes]:
+    """width 너비 JPEG 썸네일 (Pillow 없음/원본이 더 작음/디코딩 실패 시 None)"""
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            if image.width <= width:
+                return None
+            height = max(1, round(image.height * width / image.width))
+            thumbnail = image.convert("RGB").resize((width, height), Image.LANCZOS)
+            output = io.BytesIO()
+            thumbnail.save(output, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+            return output.getvalue()
+    except Exception as e:
+        logger.warning(f"⚠️ 썸네일 생성 실패 (원본 사용): {e}")
+        return None
+
+
+class PhotoStore:
+    """content-addressed 사진 저장소 (SQLite 인덱스 + 파일, WAL 모드로 여러 워커 공유)"""
+
+    # 이 횟수마다 max_bytes 초과분 정리
+    SWEEP_EVERY_WRITES = 50
+
+    def __init__(self, root: str, max_bytes: int = MAX_BYTES):
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(self.root, "index.db"), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS variants (
+                photo_reference TEXT NOT NULL,
+                width INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (photo_reference, width)
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                content_type TEXT NOT NULL,
+                size INTEGER NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_variants_access ON variants(last_access)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_variants_digest ON variants(digest)")
+        self._conn.commit()
+        self._writes = 0
+        self._stats = {"hits": 0, "misses": 0, "downloads": 0, "resized": 0, "evictions": 0}
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    # ==================== 조회 ====================
+
+    def _lookup(self, photo_reference: str, width: int) -> Optional[PhotoFile]:
+        """인덱스에서 사진 조회 + last_access 갱신 (파일이 사라졌으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT v.digest, b.content_type, b.size FROM variants v JOIN blobs b ON b.digest = v.digest "
+                "WHERE v.photo_reference=? AND v.width=?",
+                (photo_reference, width)
+            ).fetchone()
+            if row is None:
+                return None
+            digest, content_type, size = row
+            path = self._blob_path(digest)
+            if not os.path.exists(path):
+                self._conn.execute(
+                    "DELETE FROM variants WHERE photo_reference=? AND width=?", (photo_reference, width)
+                )
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE variants SET last_access=? WHERE photo_reference=? AND width=?",
+                (time.time(), photo_reference, width)
+            )
+            self._conn.commit()
+        return PhotoFile(path, digest, content_type, size)
+
+    def get(self, photo_reference: str, width: Optional[int] = None) -> PhotoFile:
+        """사진 파일 반환 (없으면 원본 다운로드 → 썸네일 생성 → 저장)
+
+        Raises:
+            requests.HTTPError: Google 응답 오류 (잘못된/만료된 photo_reference 등)
+            RateLimitExceeded: google_places 호출량 제한 대기 초과
+        """
+        width = snap_width(width)
+        photo = self._lookup(photo_reference, width)
+        if photo is not None:
+            with self._lock:
+                self._stats["hits"] += 1
+            return photo
+
+        with self._lock:
+            self._stats["misses"] += 1
+        source = self._lookup(photo_reference, SOURCE_WIDTH)
+        if source is None:
+            source = self._download(photo_reference)
+        if width == SOURCE_WIDTH:
+            return source
+
+        with open(source.path, "rb") as f:
+            thumbnail = _resize(f.read(), width)
+        if thumbnail is None:
+            # 썸네일을 만들 수 없으면 원본 파일을 이 너비로도 사용
+            self._register(photo_reference, width, source.etag, source.content_type, source.size)
+            return source
+        with self._lock:
+            self._stats["resized"] += 1
+        return self._store(photo_reference, width, thumbnail, "image/jpeg")
+
+    def _download(self, photo_reference: str) -> PhotoFile:
+        """Google Places Photo API에서 원본 다운로드 후 저장"""
+        content, content_type = request_bytes(
+            "google_places",
+            PHOTO_API_URL,
+            params={"maxwidth": SOURCE_WIDTH, "photo_reference": photo_reference, "key": GOOGLE_API_KEY},
+            timeout=15,
+            key=("photo", photo_reference),
+        )
+        with self._lock:
+            self._stats["downloads"] += 1
+        logger.info(f"📷 사진 다운로드: {len(content) // 1024}KB")
+        return self._store(photo_reference, SOURCE_WIDTH, content, content_type.split(";")[0])
+
+    # ==================== 저장 ====================
+
+    def _store(self, photo_reference: str, width: int, content: bytes, content_type: str) -> PhotoFile:
+        """내용 해시 이름으로 파일 저장 (같은 내용이면 기존 파일 재사용)"""
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        self._register(photo_reference, width, digest, content_type, len(content))
+        return PhotoFile(path, digest, content_type, len(content))
+
+    def _register(self, photo_reference: str, width: int, digest: str, content_type: str, size: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs (digest, content_type, size) VALUES (?, ?, ?)",
+                (digest, content_type, size)
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO variants (photo_reference, width, digest, last_access) VALUES (?, ?, ?, ?)",
+                (photo_reference, width, digest, time.time())
+            )
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % self.SWEEP_EVERY_WRITES == 0:
+                self._sweep()
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _sweep(self) -> None:
+        """max_bytes 초과 시 오래 조회되지 않은 사진부터 삭제 (lock 보유 상태에서 호출)"""
+        overflow = self._total_bytes() - self.max_bytes
+        if overflow <= 0:
+            return
+
+        # 한 파일을 여러 (photo_reference, 너비)가 가리킬 수 있으므로 마지막 참조가 빠질 때만 용량 확보
+        refs = dict(self._conn.execute("SELECT digest, COUNT(*) FROM variants GROUP BY digest").fetchall())
+        victims = []
+        freed = 0
+        rows = self._conn.execute(
+            "SELECT v.photo_reference, v.width, v.digest, b.size FROM variants v "
+            "JOIN blobs b ON b.digest = v.digest ORDER BY v.last_access"
+        ).fetchall()
+        for photo_reference, width, digest, size in rows:
+            victims.append((photo_reference, width))
+            refs[digest] -= 1
+            if refs[digest] == 0:
+                freed += size
+                if freed >= overflow:
+                    break
+        self._conn.executemany("DELETE FROM variants WHERE photo_reference=? AND width=?", victims)
+
+        # 더 이상 참조되지 않는 파일 삭제
+        orphans = self._conn.execute(
+            "SELECT digest FROM blobs WHERE digest NOT IN (SELECT digest FROM variants)"
+        ).fetchall()
+        for (digest,) in orphans:
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+        self._conn.executemany("DELETE FROM blobs WHERE digest=?", orphans)
+        self._conn.commit()
+        self._stats["evictions"] += len(victims)
+        logger.info(f"🧹 사진 저장소 evict (LRU): {len(victims)}개, 파일 {len(orphans)}개")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            files, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+            return {**self._stats, "files": files, "bytes": total, "max_bytes": self.max_bytes}
+
+
+_store: Optional[PhotoStore] = None
+_store_lock = threading.Lock()
+
+
+def get_photo_store() -> PhotoStore:
+    """공용 PhotoStore 반환 (최초 호출 시 생성)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                root = os.getenv("PHOTO_CACHE_DIR", DEFAULT_DIR)
+                _store = PhotoStore(root)
+                logger.info(f"📷 사진 저장소: {os.path.abspath(root)} (썸네일: {'Pillow' if Image else '원본 사용'})")
+    return _store
+
+
+def get_photo_store_stats() -> Optional[Dict[str, Any]]:
+    """공용 PhotoStore 통계 (아직 생성되지 않았으면 None - 통계 조회로 디렉터리/DB를 만들지 않음)"""
+    if _store is None:
+        return None
+    return _store.stats()
@@ -0,0 +1,355 @@
+"""
+Place Catalog
+place_id 단위로 장소 정보를 필드별로 저장하는 SQLite 카탈로그 (재시작/여러 워커 간 공유)
+
+- 필드마다 변동성에 따라 TTL이 다름
+  - 이름/주소/좌표/전화번호 등 정적 정보: 2주
+  - 영업시간(opening_hours): 1일
+  - 평점/리뷰 수/리뷰 원문: 6시간
+  - open_now: 저장하지 않음 (영업시간 periods로 조회 시점에 다시 계산)
+- 요청 필드 중 TTL 안의 필드만 반환 → 호출 측은 모자란 필드만 네트워크로 요청
+- upsert_many로 검색 결과를 한 트랜잭션에 일괄 저장
+- 최대 장소 수를 넘으면 오래 조회되지 않은 장소부터 삭제 (LRU)
+- 숙소 이름 → 예약 플랫폼 ID(Booking.com dest_id 등) 매핑도 같은 파일에 보관
+  - 키: (플랫폼, normalize_text로 정규화한 숙소 이름)
+  - 찾은 ID는 30일, 찾지 못한 결과(None)는 1일 동안 재검색하지 않음 (API 오류는 저장하지 않음)
+  - 장소와 같은 최대 개수 / LRU 정리
+
+PlacesGateway.place가 메모리 캐시 다음 단계로 사용한다 (read-through).
+가격 비교 도구는 게이트웨이의 카탈로그(gmaps.catalog)로 플랫폼 ID를 조회/저장한다.
+
+환경 변수:
+- PLACE_CATALOG: "on"(기본) / "off"
+- PLACE_CATALOG_PATH: SQLite 파일 경로 (기본: backend/data/places.db)
+- PLACE_CATALOG_MAX_PLACES: 최대 장소 수 (기본 20000)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from agents.utils.keyword_engine import normalize_text
+
+logger = logging.getLogger(__name__)
+
+CATALOG_ENABLED = os.getenv("PLACE_CATALOG", "on").lower() != "off"
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "places.db")
+MAX_PLACES = int(os.getenv("PLACE_CATALOG_MAX_PLACES", 20000))
+
+WEEKS = 14 * 24 * 60 * 60
+DAY = 24 * 60 * 60
+HOURS = 6 * 60 * 60
+
+# 필드(Places API 필드 마스크 이름)별 TTL (초)
+FIELD_TTL = {
+    # 정적 정보
+    "name": WEEKS,
+    "formatted_address": WEEKS,
+    "vicinity": WEEKS,
+    "geometry": WEEKS,
+    "place_id": WEEKS,
+    "type": WEEKS,
+    "formatted_phone_number": WEEKS,
+    "international_phone_number": WEEKS,
+    "website": WEEKS,
+    "url": WEEKS,
+    "photo": WEEKS,
+    "price_level": WEEKS,
+    "reservable": WEEKS,
+    "wheelchair_accessible_entrance": WEEKS,
+    "editorial_summary": WEEKS,
+    "business_status": DAY,
+    # 영업시간
+    "opening_hours": DAY,
+    "current_opening_hours": DAY,
+    # 평점/리뷰
+    "rating": HOURS,
+    "user_ratings_total": HOURS,
+    "reviews": HOURS,
+}
+DEFAULT_FIELD_TTL = DAY
+
+# 예약 플랫폼 ID: 찾은 ID / 찾지 못함(None)
+PLATFORM_ID_TTL = 30 * DAY
+PLATFORM_ID_MISS_TTL = DAY
+
+# 필드 마스크 이름 → 응답 result 키 (이름이 다른 것만)
+RESULT_KEYS = {
+    "photo": "photos",
+    "type": "types",
+    "address_component": "address_components",
+}
+_MASK_FIELDS = {key: field for field, key in RESULT_KEYS.items()}
+
+# 한국 표준시 (open_now 계산용)
+KST = timezone(timedelta(hours=9))
+_WEEK_MINUTES = 7 * 24 * 60
+
+
+def result_key(field: str) -> str:
+    """필드 마스크 이름 → result 키 ("photo" → "photos", "geometry/location" → "geometry")"""
+    field = field.split("/")[0]
+    return RESULT_KEYS.get(field, field)
+
+
+def mask_field(key: str) -> str:
+    """result 키 → 필드 마스크 이름"""
+    return _MASK_FIELDS.get(key, key)
+
+
+def _strip_volatile(field: str, value: Any) -> Any:
+    """저장 전에 open_now 제거"""
+    if field in ("opening_hours", "current_opening_hours") and isinstance(value, dict):
+        return {k: v for k, v in value.items() if k != "open_now"}
+    return value
+
+
+def compute_open_now(opening_hours: Dict[str, Any], now: Optional[datetime] = None) -> Optional[bool]:
+    """영업시간 periods로 현재 영업 여부 계산 (periods가 없으면 None)
+
+    periods: [{"open": {"day": 0, "time": "1100"}, "close": {"day": 0, "time": "2200"}}, ...]
+    day는 일요일=0, close가 없으면 24시간 영업
+    """
+    periods = opening_hours.get("periods")
+    if not periods:
+        return None
+
+    now = now or datetime.now(KST)
+    current = ((now.weekday() + 1) % 7) * 1440 + now.hour * 60 + now.minute
+
+    for period in periods:
+        open_ = period.get("open")
+        close = period.get("close")
+        if not open_:
+            continue
+        if not close:
+            return True
+        start = open_["day"] * 1440 + int(open_["time"][:2]) * 60 + int(open_["time"][2:])
+        end = close["day"] * 1440 + int(close["time"][:2]) * 60 + int(close["time"][2:])
+        if end <= start:
+            end += _WEEK_MINUTES
+        if start <= current < end or start <= current + _WEEK_MINUTES < end:
+            return True
+    return False
+
+
+class PlaceCatalog:
+    """SQLite 장소 카탈로그 (필드 단위 저장, WAL 모드로 여러 워커 공유)"""
+
+    # 이 횟수마다 max_places 초과분 정리
+    SWEEP_EVERY_WRITES = 200
+
+    def __init__(self, path: str, max_places: int = MAX_PLACES):
+        self.path = path
+        self.max_places = max_places
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS place_fields (
+                place_id TEXT NOT NULL,
+                language TEXT NOT NULL,
+                field TEXT NOT NULL,
+                value TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (place_id, language, field)
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS places (
+                place_id TEXT NOT NULL,
+                language TEXT NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (place_id, language)
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_places_access ON places(last_access)")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS platform_ids (
+                platform TEXT NOT NULL,
+                name_key TEXT NOT NULL,
+                platform_id TEXT,
+                resolved_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (platform, name_key)
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_platform_ids_access ON platform_ids(last_access)")
+        self._conn.commit()
+        self._writes = 0
+        self._stats = {
+            "hits": 0, "misses": 0, "evictions": 0,
+            "platform_id_hits": 0, "platform_id_negative_hits": 0, "platform_id_misses": 0,
+        }
+
+    def get_fields(self, place_id: str, language: Optional[str], fields: Iterable[str]) -> Dict[str, Any]:
+        """요청 필드 중 TTL 안의 필드만 반환
+
+        Returns:
+            {필드 마스크 이름: 값} (값이 None이면 "조회했지만 해당 장소에 없는 필드")
+        """
+        fields = list(fields)
+        if not fields:
+            return {}
+        now = time.time()
+        lang = language or ""
+        placeholders = ",".join("?" * len(fields))
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT field, value, fetched_at FROM place_fields "
+                f"WHERE place_id=? AND language=? AND field IN ({placeholders})",
+                (place_id, lang, *fields)
+            ).fetchall()
+
+            found = {
+                field: json.loads(value)
+                for field, value, fetched_at in rows
+                if now - fetched_at <= FIELD_TTL.get(field, DEFAULT_FIELD_TTL)
+            }
+            if found:
+                self._conn.execute(
+                    "UPDATE places SET last_access=? WHERE place_id=? AND language=?",
+                    (now, place_id, lang)
+                )
+                self._conn.commit()
+            self._stats["hits" if len(found) == len(fields) else "misses"] += 1
+        return found
+
+    def upsert(self, place_id: str, language: Optional[str], values: Dict[str, Any]) -> None:
+        """필드 값 저장 (values 키는 필드 마스크 이름)"""
+        self.upsert_many([(place_id, language, values)])
+
+    def upsert_many(self, records: Iterable[Tuple[str, Optional[str], Dict[str, Any]]]) -> None:
+        """여러 장소의 필드 값을 한 트랜잭션에 저장"""
+        now = time.time()
+        field_rows = []
+        place_rows = []
+        for place_id, language, values in records:
+            lang = language or ""
+            place_rows.append((place_id, lang, now))
+            for field, value in values.items():
+                if field == "open_now":
+                    continue
+                value = _strip_volatile(field, value)
+                field_rows.append((place_id, lang, field, json.dumps(value, ensure_ascii=False), now))
+        if not place_rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO place_fields (place_id, language, field, value, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                field_rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO places (place_id, language, last_access) VALUES (?, ?, ?)",
+                place_rows
+            )
+            self._conn.commit()
+            self._after_write()
+
+    # ==================== 예약 플랫폼 ID ====================
+
+    def lookup_platform_id(self, platform: str, name: str) -> Tuple[bool, Optional[str]]:
+        """(저장된 결과가 있는지, 플랫폼 ID - 찾지 못한 숙소면 None)"""
+        name_key = normalize_text(name)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT platform_id, resolved_at FROM platform_ids WHERE platform=? AND name_key=?",
+                (platform, name_key)
+            ).fetchone()
+            if row is None:
+                self._stats["platform_id_misses"] += 1
+                return False, None
+
+            platform_id, resolved_at = row
+            ttl = PLATFORM_ID_TTL if platform_id is not None else PLATFORM_ID_MISS_TTL
+            if now - resolved_at > ttl:
+                self._stats["platform_id_misses"] += 1
+                return False, None
+
+            self._conn.execute(
+                "UPDATE platform_ids SET last_access=? WHERE platform=? AND name_key=?",
+                (now, platform, name_key)
+            )
+            self._conn.commit()
+            self._stats["platform_id_hits" if platform_id is not None else "platform_id_negative_hits"] += 1
+        return True, platform_id
+
+    def save_platform_id(self, platform: str, name: str, platform_id: Optional[Any]) -> None:
+        """검색 결과 저장 (platform_id가 None이면 '찾지 못함'으로 저장)"""
+        now = time.time()
+        value = str(platform_id) if platform_id is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO platform_ids (platform, name_key, platform_id, resolved_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (platform, normalize_text(name), value, now, now)
+            )
+            self._conn.commit()
+            self._after_write()
+
+    # ==================== 정리 ====================
+
+    def _after_write(self) -> None:
+        """SWEEP_EVERY_WRITES번 쓸 때마다 정리 (lock 보유 상태에서 호출)"""
+        self._writes += 1
+        if self._writes % self.SWEEP_EVERY_WRITES == 0:
+            self._sweep()
+
+    def _sweep(self) -> None:
+        """max_places 초과 시 오래 조회되지 않은 장소/플랫폼 ID부터 삭제 (lock 보유 상태에서 호출)"""
+        overflow = self._count_places() - self.max_places
+        if overflow > 0:
+            victims = self._conn.execute(
+                "SELECT place_id, language FROM places ORDER BY last_access LIMIT ?",
+                (overflow,)
+            ).fetchall()
+            self._conn.executemany("DELETE FROM place_fields WHERE place_id=? AND language=?", victims)
+            self._conn.executemany("DELETE FROM places WHERE place_id=? AND language=?", victims)
+            self._stats["evictions"] += len(victims)
+            logger.info(f"🧹 장소 카탈로그 evict (LRU): {len(victims)}개")
+
+        id_overflow = self._count_platform_ids() - self.max_places
+        if id_overflow > 0:
+            self._conn.execute(
+                "DELETE FROM platform_ids WHERE rowid IN "
+                "(SELECT rowid FROM platform_ids ORDER BY last_access LIMIT ?)",
+                (id_overflow,)
+            )
+            self._stats["evictions"] += id_overflow
+            logger.info(f"🧹 플랫폼 ID evict (LRU): {id_overflow}개")
+        self._conn.commit()
+
+    def _count_places(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+
+    def _count_platform_ids(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM platform_ids").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "places": self._count_places(), "platform_ids": self._count_platform_ids()}
+
+
+def create_place_catalog() -> Optional[PlaceCatalog]:
+    """환경 변수 설정에 따라 카탈로그 생성 (비활성화/생성 실패 시 None)"""
+    if not CATALOG_ENABLED:
+        return None
+    path = os.getenv("PLACE_CATALOG_PATH", DEFAULT_PATH)
+    try:
+        catalog = PlaceCatalog(path)
+        logger.info(f"💾 장소 카탈로그: {path}")
+        return catalog
+    except Exception as e:
+        logger.warning(f"⚠️ 장소 카탈로그 생성 실패 (메모리 캐시만 사용): {e}")
+        return None
@@ -0,0 +1,489 @@
+"""
+Google Places Gateway
+모든 에이전트가 공유하는 Google Maps/Places 호출 창구
+
+- 커넥션 풀을 가진 requests.Session 하나를 googlemaps.Client와 New Places API 호출에서 공유
+- 엔드포인트별 캐시 (LRU + TTL, agents/utils/cache.py)
+  - place(details): (place_id, language) 단위로 필드를 모아서 저장
+    → 이미 받아 둔 필드의 상위 집합이면 하위 필드 요청은 API 호출 없이 반환
+    → 모자란 필드만 추가로 요청해서 기존 항목에 병합
+  - geocode / places_nearby / places(text search): 요청 파라미터 단위
+  - directions: 실시간 정보라 캐시하지 않음
+- place_many: 여러 장소의 상세 정보를 동시에 요청 (순서 유지, 개별 실패는 빈 dict)
+- prefetch: 상세 정보를 백그라운드에서 미리 캐시에 적재 (목록 1순위/사용자가 선택한 장소)
+- place: 메모리 캐시 → 장소 카탈로그(SQLite, agents/utils/place_catalog.py) → 네트워크
+- geocode(지역명)는 로컬 지명 사전(gazetteer)을 먼저 조회, 없으면 네트워크 호출 후 오버레이에 저장
+- places_nearby(위치 + 반경 + type)는 공간 인덱스(agents/utils/spatial_index.py)가 커버한 영역이면 로컬 응답
+- 모든 호출은 요청 governor(agents/utils/request_governor.py)의 google_places 토큰 버킷을 거치고,
+  같은 요청이 동시에 들어오면 한 번만 호출해서 결과를 공유
+- 엔드포인트별 호출 수 / 캐시 적중 / 에러 / 지연 시간 메트릭
+
+googlemaps.Client와 같은 메서드 시그니처/반환 형태라 기존 코드의 gmaps 변수만 바꾸면 된다.
+
+환경 변수:
+- GOOGLE_MAPS_TIMEOUT: 요청 타임아웃 초 (기본 10)
+- GOOGLE_MAPS_RETRY_TIMEOUT: 재시도 포함 최대 대기 초 (기본 30)
+- PLACES_POOL_SIZE: 커넥션 풀 크기 (기본 20)
+- PLACES_CACHE_SIZE: 엔드포인트별 최대 캐시 항목 수 (기본 2000)
+- PLACES_DETAILS_CONCURRENCY: place_many 동시 요청 수 (기본 8)
+- PLACES_LAZY_DETAILS: "on"(기본) 목록은 검색 결과만으로 구성하고 상세 정보는 선택/상세 조회 시 로드,
+  "off"면 목록의 모든 장소 상세 정보를 검색 시점에 로드
+- PLACES_DETAILS_TTL / PLACES_SEARCH_TTL / PLACES_GEOCODE_TTL: 캐시 TTL 초
+  (기본 3600 / 600 / 604800, 상세 정보는 장소 카탈로그가 필드별 TTL로 더 오래 보관)
+"""
+
+import os
+import copy
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from agents.utils.cache import TTLCache
+from agents.utils.gazetteer import lookup_region, remember_region, to_geocode_result
+from agents.utils.request_governor import get_upstream
+from agents.utils.place_catalog import compute_open_now, create_place_catalog, mask_field, result_key
+from agents.utils.spatial_index import create_spatial_index, parse_location
+
+logger = logging.getLogger(__name__)
+
+TIMEOUT = float(os.getenv("GOOGLE_MAPS_TIMEOUT", 10))
+RETRY_TIMEOUT = float(os.getenv("GOOGLE_MAPS_RETRY_TIMEOUT", 30))
+POOL_SIZE = int(os.getenv("PLACES_POOL_SIZE", 20))
+CACHE_SIZE = int(os.getenv("PLACES_CACHE_SIZE", 2000))
+DETAILS_TTL = int(os.getenv("PLACES_DETAILS_TTL", 3600))
+SEARCH_TTL = int(os.getenv("PLACES_SEARCH_TTL", 600))
+GEOCODE_TTL = int(os.getenv("PLACES_GEOCODE_TTL", 604800))
+DETAILS_CONCURRENCY = int(os.getenv("PLACES_DETAILS_CONCURRENCY", 8))
+LAZY_DETAILS = os.getenv("PLACES_LAZY_DETAILS", "on").lower() != "off"
+
+# 검색 결과(places_nearby)에 상세 정보와 같은 값으로 들어 있어 카탈로그에 저장하는 키
+# (사진은 1장만, 영업시간은 open_now만 있어서 제외)
+NEARBY_CATALOG_KEYS = (
+    'name', 'vicinity', 'geometry', 'rating', 'user_ratings_total',
+    'price_level', 'types', 'business_status'
+)
+
+# 목록에서 선택한 장소의 상세 정보 필드 (전화/웹사이트/영업시간/주소/사진/가격대)
+SUMMARY_DETAIL_FIELDS = [
+    'formatted_phone_number',
+    'website',
+    'opening_hours',
+    'formatted_address',
+    'photo',
+    'price_level'
+]
+
+NEW_PLACES_URL = "https://places.googleapis.com/v1/places/{place_id}"
+
+
+class _EndpointMetrics:
+    """엔드포인트 하나의 호출 통계"""
+
+    __slots__ = ("calls", "cache_hits", "errors", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        requests_total = self.calls + self.cache_hits
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors,
+            "hit_rate": round(self.cache_hits / requests_total, 3) if requests_total else 0.0,
+            "avg_ms": round(self.total_ms / self.calls, 1) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+def _make_key(*parts: Any) -> str:
+    """요청 파라미터 → 캐시 키 (tuple/dict 위치 인자 포함)"""
+    return json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _normalize_fields(fields: Optional[Iterable[str]]) -> Optional[frozenset]:
+    """필드 마스크 정규화 (None = 전체 필드)"""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return frozenset(f.strip() for f in fields if f and f.strip())
+
+
+class PlacesGateway:
+    """googlemaps.Client 호환 캐시/메트릭 게이트웨이"""
+
+    def __init__(self, api_key: str):
+        import googlemaps
+
+        self.api_key = api_key
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+
+        self.client = googlemaps.Client(
+            key=api_key,
+            timeout=TIMEOUT,
+            retry_timeout=RETRY_TIMEOUT,
+            requests_session=self.session,
+        )
+
+        # 게이트웨이 인스턴스마다 따로 두는 캐시 (통계는 get_metrics로 노출)
+        self._details_cache = TTLCache("places.place", CACHE_SIZE, DETAILS_TTL)
+        self._new_details_cache = TTLCache("places.place_new", CACHE_SIZE, DETAILS_TTL)
+        self._search_cache = TTLCache("places.search", CACHE_SIZE, SEARCH_TTL)
+        self._geocode_cache = TTLCache("places.geocode", CACHE_SIZE, GEOCODE_TTL)
+        self._place_ids = TTLCache("places.place_ids", CACHE_SIZE, DETAILS_TTL)
+        self.catalog = create_place_catalog()
+        self._upstream = get_upstream("google_places")
+        self.spatial = create_spatial_index()
+
+        self._metrics: Dict[str, _EndpointMetrics] = {}
+        self._metrics_lock = threading.Lock()
+
+        # place_many 전용 스레드 풀 (동시 요청 수 제한)
+        self._details_pool = ThreadPoolExecutor(
+            max_workers=DETAILS_CONCURRENCY, thread_name_prefix="places-details"
+        )
+
+    # ==================== 메트릭 ====================
+
+    def _metric(self, endpoint: str) -> _EndpointMetrics:
+        metric = self._metrics.get(endpoint)
+        if metric is None:
+            with self._metrics_lock:
+                metric = self._metrics.setdefault(endpoint, _EndpointMetrics())
+        return metric
+
+    def _record_hit(self, endpoint: str) -> None:
+        metric = self._metric(endpoint)
+        with self._metrics_lock:
+            metric.cache_hits += 1
+
+    def _call(self, endpoint: str, func, *args, **kwargs):
+        """API 호출 + 지연 시간/에러 기록
+
+        요청 governor(google_places)의 호출량 제한을 거치고,
+        같은 파라미터로 진행 중인 호출이 있으면 그 결과를 공유한다.
+        """
+        metric = self._metric(endpoint)
+        start = time.perf_counter()
+        try:
+            return self._upstream.call(func, *args, key=_make_key(endpoint, args, kwargs), **kwargs)
+        except Exception:
+            with self._metrics_lock:
+                metric.errors += 1
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._metrics_lock:
+                metric.calls += 1
+                metric.total_ms += elapsed_ms
+                metric.max_ms = max(metric.max_ms, elapsed_ms)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """엔드포인트별 호출 통계 + 캐시 통계"""
+        with self._metrics_lock:
+            endpoints = {name: metric.to_dict() for name, metric in self._metrics.items()}
+        caches = (
+            self._details_cache, self._new_details_cache,
+            self._search_cache, self._geocode_cache, self._place_ids,
+        )
+        return {
+            "endpoints": endpoints,
+            "caches": {cache.name: cache.stats() for cache in caches},
+            "catalog": self.catalog.stats() if self.catalog else None,
+            "spatial": self.spatial.stats() if self.spatial else None,
+        }
+
+    # ==================== 검색 (파라미터 단위 캐시) ====================
+
+    def _cached(self, endpoint: str, cache: TTLCache, func, *args, **kwargs):
+        key = _make_key(endpoint, args, kwargs)
+        cached = cache.get(key)
+        if cached is not None:
+            self._record_hit(endpoint)
+            # 호출 측에서 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return copy.deepcopy(cached)
+
+        result = self._call(endpoint, func, *args, **kwargs)
+        cache.set(key, copy.deepcopy(result))
+        return result
+
+    def geocode(self, address=None, **kwargs):
+        # 지역명 geocode는 로컬 지명 사전을 먼저 조회하고, 없을 때만 네트워크 호출
+        use_gazetteer = address and not any(kwargs.get(k) for k in ("place_id", "components", "bounds"))
+        if use_gazetteer:
+            entry = lookup_region(address)
+            if entry is not None:
+                self._record_hit("gazetteer")
+                return to_geocode_result(entry)
+
+        result = self._cached("geocode", self._geocode_cache, self.client.geocode, address, **kwargs)
+        if use_gazetteer and result:
+            remember_region(address, result)
+        return result
+
+    def places_nearby(self, *args, **kwargs):
+        """Nearby Search: 검색 캐시(같은 파라미터) → 공간 인덱스(커버된 타일) → 네트워크"""
+        # 다음 페이지 토큰 요청은 재사용되지 않으므로 캐시하지 않음
+        if kwargs.get("page_token"):
+            return self._call("places_nearby", self.client.places_nearby, *args, **kwargs)
+
+        key = _make_key("places_nearby", args, kwargs)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._record_hit("places_nearby")
+            return copy.deepcopy(cached)
+
+        circle = self._spatial_circle(args, kwargs)
+        if circle:
+            results = self.spatial.query_radius(*circle, kwargs["type"], kwargs.get("language"))
+            if results is not None:
+                self._record_hit("places_nearby_local")
+                return {"html_attributions": [], "results": results, "status": "OK" if results else "ZERO_RESULTS"}
+
+        result = self._call("places_nearby", self.client.places_nearby, *args, **kwargs)
+        self._search_cache.set(key, copy.deepcopy(result))
+        if self.spatial:
+            # 다음 페이지가 없는 응답만 영역 안의 장소를 모두 담고 있으므로 커버 표시
+            # (결과가 0개여도 "이 영역에 해당 type이 없음"을 알게 되므로 커버)
+            complete = result.get("status") in ("OK", "ZERO_RESULTS") and not result.get("next_page_token")
+            self.spatial.add(
+                result.get("results", []), kwargs.get("type"), kwargs.get("language"),
+                covered=circle if complete else None,
+            )
+        return result
+
+    def _spatial_circle(self, args, kwargs) -> Optional[tuple]:
+        """공간 인덱스로 답할 수 있는 요청이면 (lat, lng, radius)
+
+        location + radius + type (+ language)만 있는 요청만 해당
+        (keyword/name/가격/영업 중 필터/rank_by는 인덱스로 재현할 수 없음)
+        """
+        if not self.spatial or args or not kwargs.get("type") or not kwargs.get("radius"):
+            return None
+        if set(kwargs) - {"location", "radius", "type", "language"}:
+            return None
+        point = parse_location(kwargs.get("location"))
+        if point is None:
+            return None
+        return point[0], point[1], float(kwargs["radius"])
+
+    def places(self, *args, **kwargs):
+        if kwargs.get("page_token"):
+            return self._call("places", self.client.places, *args, **kwargs)
+        return self._cached("places", self._search_cache, self.client.places, *args, **kwargs)
+
+    def directions(self, *args, **kwargs):
+        # 실시간 교통 정보라 캐시하지 않음
+        return self._call("directions", self.client.directions, *args, **kwargs)
+
+    # ==================== 상세 정보 (필드 단위 캐시) ====================
+
+    def _fetch_fields(self, cache: TTLCache, key: str, fields: Optional[frozenset], fetch):
+        """필드 마스크를 고려한 캐시 조회
+
+        캐시 항목: {"fields": 받아 둔 필드 집합(None = 전체), "result": 결과 dict}
+        요청 필드가 받아 둔 필드의 부분 집합이면 캐시 반환,
+        아니면 모자란 필드만 fetch(missing_fields)로 받아서 병합한다.
+
+        Returns:
+            (결과 dict 복사본, 캐시 적중 여부)
+        """
+        entry = cache.get(key)
+        if entry is not None:
+            cached_fields = entry["fields"]
+            if cached_fields is None or (fields is not None and fields <= cached_fields):
+                return copy.deepcopy(entry["result"]), True
+
+        if entry is None or fields is None or entry["fields"] is None:
+            missing = fields
+        else:
+            missing = fields - entry["fields"]
+
+        fetched = fetch(missing)
+
+        if entry is None or missing is None:
+            merged = {"fields": missing, "result": fetched}
+        else:
+            merged = {
+                "fields": entry["fields"] | missing,
+                "result": {**entry["result"], **fetched},
+            }
+        cache.set(key, copy.deepcopy(merged))
+        return merged["result"], False
+
+    def place(self, place_id: str, fields=None, language=None, **kwargs) -> Dict[str, Any]:
+        """Place Details (googlemaps.Client.place 호환)
+
+        메모리 캐시 → 장소 카탈로그(SQLite, 필드별 TTL) → 네트워크 순으로 조회
+        """
+        requested = _normalize_fields(fields)
+        key = _make_key("place", place_id, language, kwargs)
+        meta = {}
+        # 추가 파라미터(reviews_sort 등)가 있으면 응답이 달라지므로 카탈로그 미사용
+        catalog = self.catalog if not kwargs else None
+
+        def fetch(missing):
+            stored = catalog.get_fields(place_id, language, missing) if catalog and missing else {}
+            need = None if missing is None else missing - stored.keys()
+
+            result = {}
+            if need is None or need:
+                response = self._call(
+                    "place", self.client.place, place_id,
+                    fields=sorted(need) if need is not None else None,
+                    language=language, **kwargs
+                )
+                meta["html_attributions"] = response.get("html_attributions", [])
+                result = response.get("result", {})
+                if catalog:
+                    if need is None:
+                        values = {mask_field(k): v for k, v in result.items()}
+                    else:
+                        values = {field: result.get(result_key(field)) for field in need}
+                    catalog.upsert(place_id, language, values)
+            else:
+                self._record_hit("place_catalog")
+
+            for field, value in stored.items():
+                if value is not None:
+                    result[result_key(field)] = value
+            return result
+
+        result, hit = self._fetch_fields(self._details_cache, key, requested, fetch)
+        if hit:
+            self._record_hit("place")
+
+        # open_now는 캐시하지 않으므로 영업시간 periods로 다시 계산
+        opening_hours = result.get("opening_hours")
+        if isinstance(opening_hours, dict) and opening_hours.get("periods"):
+            opening_hours["open_now"] = compute_open_now(opening_hours)
+
+        return {"html_attributions": meta.get("html_attributions", []), "result": result, "status": "OK"}
+
+    def _fetch_result(self, place_id: str, fields, language, kwargs) -> Dict[str, Any]:
+        """place() 결과의 result dict (실패 시 빈 dict)"""
+        try:
+            return self.place(place_id, fields=fields, language=language, **kwargs).get("result", {})
+        except Exception as e:
+            logger.warning(f"⚠️ 상세 정보 로드 실패 ({place_id}): {e}")
+            return {}
+
+    def place_many(self, place_ids: List[str], fields=None, language=None, **kwargs) -> List[Dict[str, Any]]:
+        """여러 장소의 Place Details를 동시에 요청
+
+        Returns:
+            place_ids 순서와 같은 result dict 리스트 (실패한 항목은 빈 dict)
+        """
+        if len(place_ids) <= 1:
+            return [self._fetch_result(place_id, fields, language, kwargs) for place_id in place_ids]
+        return list(self._details_pool.map(
+            lambda place_id: self._fetch_result(place_id, fields, language, kwargs), place_ids
+        ))
+
+    def prefetch(self, place_ids: List[str], fields=None, language=None, **kwargs) -> None:
+        """상세 정보를 백그라운드에서 미리 받아 캐시에 적재 (결과를 기다리지 않음)"""
+        for place_id in place_ids:
+            if place_id:
+                self._details_pool.submit(self._fetch_result, place_id, fields, language, kwargs)
+
+    # ==================== 이름 → place_id ====================
+
+    def register_places(self, places: List[Dict[str, Any]], language: Optional[str] = "ko") -> None:
+        """목록(검색 결과)의 장소 기록
+
+        - 이름 → place_id (선택 시 상세 정보 prefetch용)
+        - 검색 결과에도 들어 있는 필드는 카탈로그에 일괄 저장
+        """
+        records = []
+        for place in places:
+            if place.get("name") and place.get("place_id"):
+                self._place_ids.set(place["name"], place["place_id"])
+            if place.get("place_id"):
+                values = {mask_field(k): place[k] for k in NEARBY_CATALOG_KEYS if k in place}
+                records.append((place["place_id"], language, values))
+
+        if self.catalog and records:
+            try:
+                self.catalog.upsert_many(records)
+            except Exception as e:
+                logger.warning(f"⚠️ 장소 카탈로그 저장 실패: {e}")
+
+    def find_place_id(self, name: str) -> Optional[str]:
+        return self._place_ids.get(name)
+
+    def place_new(self, place_id: str, field_mask: str, language: Optional[str] = None) -> Dict[str, Any]:
+        """New Places API (v1) Place Details
+
+        Args:
+            place_id: Place ID
+            field_mask: X-Goog-FieldMask (쉼표 구분, 예: "reviews,rating")
+            language: languageCode (None이면 API 기본값)
+
+        Returns:
+            응답 JSON dict (HTTP 에러면 requests.HTTPError)
+        """
+        requested = _normalize_fields(field_mask)
+        key = _make_key("place_new", place_id, language)
+
+        def fetch(missing):
+            return self._call("place_new", self._request_new_place, place_id, ",".join(sorted(missing)), language)
+
+        result, hit = self._fetch_fields(self._new_details_cache, key, requested, fetch)
+        if hit:
+            self._record_hit("place_new")
+        return result
+
+
+    def _request_new_place(self, place_id: str, field_mask: str, language: Optional[str]) -> Dict[str, Any]:
+        response = self.session.get(
+            NEW_PLACES_URL.format(place_id=place_id),
+            headers={
+                "Content-Type": "application/json",
+                "X-Goog-Api-Key": self.api_key,
+                "X-Goog-FieldMask": field_mask,
+            },
+            params={"languageCode": language} if language else None,
+            timeout=TIMEOUT,
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+# ==================== 싱글톤 ====================
+
+_gateway: Optional[PlacesGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_places_gateway() -> Optional[PlacesGateway]:
+    """공용 PlacesGateway 반환 (GOOGLE_PLACES_API_KEY가 없으면 None)"""
+    global _gateway
+    if _gateway is None:
+        api_key = os.getenv("GOOGLE_PLACES_API_KEY")
+        if not api_key:
+            return None
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = PlacesGateway(api_key)
+                logger.info("🗺️ PlacesGateway 생성")
+    return _gateway
+
+
+def get_places_metrics() -> Dict[str, Any]:
+    """공용 게이트웨이 메트릭 (게이트웨이가 없으면 빈 통계)"""
+    if _gateway is None:
+        return {"endpoints": {}, "caches": {}}
+    return _gateway.get_metrics()
@@ -0,0 +1,141 @@
+"""
+후보 장소 랭킹 커널
+장소 dict 리스트를 열(column) 배열로 바꿔 거리/점수/필터/상위 k개를 NumPy로 한 번에 계산
+
+- CandidateBatch: lat, lng, rating, reviews(user_ratings_total), price_level, types
+- distances: 기준 좌표에서 모든 후보까지 haversine 거리 (미터)
+- quality_scores: 평점 + 리뷰 수(log) + 페르소나 점수 합산 점수
+- mask: 리뷰 수/평점/가격대/제외 타입 필터를 bool 배열로
+- top_k: 여러 정렬 키(1차, 2차 ...)로 상위 k개 선택 (argpartition + lexsort)
+
+Python sorted(key=lambda ...) 여러 번 대신 모든 에이전트가 공유한다.
+
+사용법:
+    batch = CandidateBatch(results)
+    keep = batch.mask(min_reviews=50, exclude_types=LODGING_TYPES)
+    top = batch.top_k([batch.reviews, batch.rating], k=15, where=keep)
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def haversine_many(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """기준 좌표에서 여러 좌표까지 거리 (미터)"""
+    phi1 = np.radians(lat)
+    phi2 = np.radians(lats)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(lngs - lng)
+    a = np.sin(d_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _column(places: List[Dict[str, Any]], key: str, default: float) -> np.ndarray:
+    return np.fromiter(
+        (default if place.get(key) is None else place[key] for place in places),
+        dtype=np.float64, count=len(places)
+    )
+
+
+class CandidateBatch:
+    """후보 장소 목록의 열 배열 표현 (원본 dict는 places로 그대로 보관)"""
+
+    def __init__(self, places: List[Dict[str, Any]], default_price_level: float = 0):
+        self.places = list(places)
+        n = len(self.places)
+        self.rating = _column(self.places, "rating", 0.0)
+        self.reviews = _column(self.places, "user_ratings_total", 0.0)
+        self.price_level = _column(self.places, "price_level", default_price_level)
+
+        lats = np.full(n, np.nan)
+        lngs = np.full(n, np.nan)
+        for i, place in enumerate(self.places):
+            location = place.get("geometry", {}).get("location")
+            if location:
+                lats[i], lngs[i] = location["lat"], location["lng"]
+        self.lat = lats
+        self.lng = lngs
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def has_type(self, types: Iterable[str]) -> np.ndarray:
+        """types 중 하나라도 가진 후보 (bool 배열)"""
+        wanted = set(types)
+        return np.fromiter(
+            (not wanted.isdisjoint(place.get("types", ())) for place in self.places),
+            dtype=bool, count=len(self.places)
+        )
+
+    def distances(self, lat: float, lng: float) -> np.ndarray:
+        """기준 좌표에서 각 후보까지 거리 (미터, 좌표 없는 후보는 inf)"""
+        distances = haversine_many(lat, lng, self.lat, self.lng)
+        return np.where(np.isnan(distances), np.inf, distances)
+
+    def quality_scores(self, persona_scores: Optional[Sequence[float]] = None) -> np.ndarray:
+        """평점*10 + min(30, log(리뷰 수+1)*5) + 페르소나 점수*20"""
+        persona = np.full(len(self), 0.5) if persona_scores is None else np.asarray(persona_scores, dtype=np.float64)
+        return self.rating * 10 + np.minimum(30, np.log1p(self.reviews) * 5) + persona * 20
+
+    def mask(
+        self,
+        min_reviews: float = 0,
+        min_rating: Optional[float] = None,
+        price_level: Optional[int] = None,
+        exclude_types: Iterable[str] = (),
+        exclude_ids: Iterable[str] = (),
+    ) -> np.ndarray:
+        """필터 조건을 모두 만족하는 후보 (bool 배열)"""
+        keep = self.reviews >= min_reviews
+        if min_rating:
+            keep &= self.rating >= min_rating
+        if price_level is not None:
+            keep &= self.price_level == price_level
+        exclude_types = tuple(exclude_types)
+        if exclude_types:
+            keep &= ~self.has_type(exclude_types)
+        exclude_ids = set(exclude_ids)
+        if exclude_ids:
+            keep &= np.fromiter(
+                (place.get("place_id") not in exclude_ids for place in self.places),
+                dtype=bool, count=len(self.places)
+            )
+        return keep
+
+    def top_k(
+        self,
+        keys: Sequence[np.ndarray],
+        k: Optional[int] = None,
+        descending: bool = True,
+        where: Optional[np.ndarray] = None,
+    ) -> List[Dict[str, Any]]:
+        """정렬 키(1차 키가 먼저) 기준 상위 k개 장소 (동점은 원래 순서 유지)
+
+        Args:
+            keys: 후보 수와 길이가 같은 배열들
+            k: 반환 개수 (None이면 전부)
+            descending: 큰 값 우선
+            where: 포함할 후보 (bool 배열)
+        """
+        index = np.arange(len(self)) if where is None else np.flatnonzero(where)
+        if index.size == 0 or (k is not None and k <= 0):
+            return []
+        columns = [np.asarray(key, dtype=np.float64)[index] for key in keys]
+        if descending:
+            columns = [-column for column in columns]
+
+        # k가 작으면 1차 키로 후보를 먼저 줄인 뒤 정렬 (1차 키 동점은 모두 포함)
+        if k is not None and k < index.size:
+            threshold = np.partition(columns[0], k - 1)[k - 1]
+            near = np.flatnonzero(columns[0] <= threshold)
+            index = index[near]
+            columns = [column[near] for column in columns]
+
+        # lexsort는 마지막 키가 1차 키, 안정 정렬이라 동점은 원래 순서 유지
+        order = np.lexsort(columns[::-1])
+        if k is not None:
+            order = order[:k]
+        return [self.places[i] for i in index[order]]
@@ -0,0 +1,450 @@
+"""
+Request Governor
+외부 API(업스트림)별 호출량 제한 + 같은 요청 합치기(single-flight)
+
+- 업스트림마다 토큰 버킷 (초당 rate개 충전, 최대 burst개)
+  - 토큰이 없으면 순서대로 예약 후 대기 (max_wait를 넘으면 RateLimitExceeded)
+  - 429 / OVER_QUERY_LIMIT 응답을 받으면 Retry-After 동안 버킷 정지
+    (헤더가 없으면 연속 제한 횟수에 따라 지수 증가 + jitter: backoff_delay)
+- key가 같은 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 공유
+  (결과는 호출자마다 deepcopy로 전달 → dict/list 같은 데이터를 반환하는 함수에만 key 사용)
+- 업스트림별 대기열 길이 / 대기 시간 / 합쳐진 요청 / 제한 횟수 통계 → /api/admin/governor-stats
+
+업스트림: google_places, serper, naver, odsay, rapidapi_booking, rapidapi_agoda, rapidapi_airbnb, openweather, safetydata
+
+사용법:
+    data = request_json("serper", "POST", SERPER_URL, json=payload, headers=headers)
+    data = await arequest_json("naver", "GET", url, params=params, headers=headers)
+    result = get_upstream("google_places").call(func, *args, key=cache_key, **kwargs)
+    content, content_type = request_bytes("google_places", photo_url, params=params, key=photo_key)
+
+환경 변수:
+- RATE_LIMIT_<업스트림 이름 대문자>: "초당 요청 수,버스트" (예: RATE_LIMIT_SERPER="5,10")
+- GOVERNOR_MAX_WAIT: 토큰 대기 최대 초 (기본 10)
+"""
+
+import os
+import copy
+import json
+import time
+import random
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# 업스트림별 기본 (초당 요청 수, 버스트)
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "google_places": (50, 50),
+    "serper": (5, 10),
+    "naver": (10, 10),
+    "odsay": (5, 10),
+    # RapidAPI는 API(플랫폼)마다 구독 플랜/호출 제한이 따로 있음
+    "rapidapi_booking": (5, 5),
+    "rapidapi_agoda": (5, 5),
+    "rapidapi_airbnb": (5, 5),
+    "openweather": (1, 10),
+    "safetydata": (5, 10),
+}
+MAX_WAIT = float(os.getenv("GOVERNOR_MAX_WAIT", 10))
+BACKOFF_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 30.0
+POOL_SIZE = 20
+
+
+class RateLimitExceeded(Exception):
+    """토큰 대기 시간이 max_wait를 넘음"""
+
+
+def _limits_for(name: str) -> Tuple[float, float]:
+    value = os.getenv(f"RATE_LIMIT_{name.upper()}")
+    if value:
+        try:
+            rate, burst = value.split(",")
+            return float(rate), float(burst)
+        except ValueError:
+            logger.warning(f"⚠️ RATE_LIMIT_{name.upper()} 형식 오류 (\"rate,burst\"): {value}")
+    return DEFAULT_LIMITS.get(name, (10, 10))
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_SECONDS, cap: float = BACKOFF_MAX_SECONDS) -> float:
+    """attempt번째(0부터) 재시도 전 대기 초 - 지수 증가 + jitter (절반은 고정, 절반은 랜덤)
+
+    여러 요청이 같은 시각에 다시 몰리지 않도록 대기 시간을 흩뜨린다.
+    """
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _rate_limit(error: BaseException) -> Tuple[bool, Optional[float]]:
+    """(호출 제한 응답 여부, Retry-After 초 - 헤더가 없으면 None)"""
+    if "OverQueryLimit" in type(error).__name__:
+        return True, None
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) != 429:
+        return False, None
+    try:
+        return True, float(response.headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return True, None
+
+
+class _Flight:
+    """진행 중인 요청 하나 (sync)"""
+
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class Upstream:
+    """업스트림 하나의 토큰 버킷 + single-flight (스레드/이벤트 루프 안전)"""
+
+    def __init__(self, name: str, rate: float, burst: float, max_wait: float = MAX_WAIT):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # 연속으로 받은 호출 제한 응답 수 (backoff_delay attempt)
+        self._limited_streak = 0
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        # (이벤트 루프, key) -> (Future, 대기자 수)
+        self._async_flights: Dict[Tuple[int, Hashable], list] = {}
+        self._stats = {
+            "calls": 0, "coalesced": 0, "throttled": 0, "rejected": 0, "rate_limited": 0,
+            "errors": 0, "queue_depth": 0, "max_queue_depth": 0, "wait_ms": 0.0,
+        }
+
+    # ==================== 토큰 버킷 ====================
+
+    def _reserve(self) -> float:
+        """토큰 하나 예약, 대기해야 할 초 반환 (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        wait = max(0.0, (1 - self._tokens) / self.rate, self._paused_until - now)
+        if wait > self.max_wait:
+            self._stats["rejected"] += 1
+            raise RateLimitExceeded(f"{self.name}: 대기 {wait:.1f}초 (최대 {self.max_wait}초)")
+        # 음수까지 내려가며 예약 → 뒤에 온 요청은 앞 요청 다음 순서로 대기
+        self._tokens -= 1
+        if wait > 0:
+            self._stats["throttled"] += 1
+            self._stats["queue_depth"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._stats["queue_depth"])
+            self._stats["wait_ms"] += wait * 1000
+        return wait
+
+    def _dequeue(self) -> None:
+        with self._lock:
+            self._stats["queue_depth"] -= 1
+
+    def acquire(self) -> None:
+        """토큰을 얻을 때까지 대기 (sync)"""
+        with self._lock:
+            wait = self._reserve()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._dequeue()
+
+    async def aacquire(self) -> None:
+        """토큰을 얻을 때까지 대기 (async)"""
+        with self._lock:
+            wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._dequeue()
+
+    def backoff(self, seconds: Optional[float] = None) -> None:
+        """호출 제한 응답을 받았을 때 seconds(없으면 backoff_delay) 동안 새 토큰 발급 중지"""
+        with self._lock:
+            if seconds is None:
+                seconds = backoff_delay(self._limited_streak)
+            self._limited_streak += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0)
+            self._stats["rate_limited"] += 1
+        logger.warning(f"⏳ {self.name} 호출 제한 응답 → {seconds:.1f}초 대기")
+
+    def _record_result(self, error: Optional[BaseException]) -> None:
+        if error is None:
+            self._limited_streak = 0
+            return
+        limited, retry_after = _rate_limit(error)
+        if limited:
+            self.backoff(retry_after)
+        with self._lock:
+            self._stats["errors"] += 1
+
+    def _record_response(self, result: Any) -> None:
+        """httpx/requests 응답 객체를 그대로 반환하는 경우 429 감지"""
+        if getattr(result, "status_code", None) == 429:
+            self.backoff(_rate_limit(_ResponseError(result))[1])
+        else:
+            self._limited_streak = 0
+
+    # ==================== 호출 ====================
+
+    def _invoke(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        self.acquire()
+        with self._lock:
+            self._stats["calls"] += 1
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._record_result(e)
+            raise
+        self._record_response(result)
+        return result
+
+    async def _ainvoke(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        await self.aacquire()
+        with self._lock:
+            self._stats["calls"] += 1
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self._record_result(e)
+            raise
+        self._record_response(result)
+        return result
+
+    def call(self, func: Callable, *args, key: Optional[Hashable] = None, **kwargs) -> Any:
+        """토큰을 얻은 뒤 func(*args, **kwargs) 호출
+
+        key가 있으면 같은 key로 진행 중인 호출의 결과(복사본)를 공유
+        """
+        if key is None:
+            return self._invoke(func, args, kwargs)
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.waiters += 1
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            result = self._invoke(func, args, kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+                waiters = flight.waiters
+            if flight.error is None and waiters:
+                # 리더가 결과를 수정하기 전에 대기자용 스냅샷 저장
+                flight.result = copy.deepcopy(result)
+            flight.event.set()
+        return result
+
+    async def acall(self, func: Callable, *args, key: Optional[Hashable] = None, **kwargs) -> Any:
+        """call의 비동기 버전 (func는 코루틴 함수, 같은 이벤트 루프 안에서만 합침)"""
+        if key is None:
+            return await self._ainvoke(func, args, kwargs)
+
+        flight_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            flight = self._async_flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._async_flights[flight_key] = [asyncio.get_running_loop().create_future(), 0]
+            else:
+                flight[1] += 1
+                self._stats["coalesced"] += 1
+
+        future = flight[0]
+        if not leader:
+            return copy.deepcopy(await asyncio.shield(future))
+
+        try:
+            result = await self._ainvoke(func, args, kwargs)
+        except BaseException as e:
+            with self._lock:
+                self._async_flights.pop(flight_key, None)
+            if flight[1]:
+                future.set_exception(e)
+            else:
+                future.cancel()
+            raise
+        with self._lock:
+            self._async_flights.pop(flight_key, None)
+        future.set_result(copy.deepcopy(result) if flight[1] else None)
+        return result
+
+    # ==================== 통계 ====================
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._flights) + len(self._async_flights)
+            stats["tokens"] = round(max(self._tokens, 0), 2)
+        throttled = stats["throttled"]
+        stats["avg_wait_ms"] = round(stats.pop("wait_ms") / throttled, 1) if throttled else 0.0
+        stats["rate"] = self.rate
+        stats["burst"] = self.burst
+        return stats
+
+
+class _ResponseError(Exception):
+    """응답 객체를 _rate_limit에 넘기기 위한 래퍼"""
+
+    def __init__(self, response):
+        super().__init__(getattr(response, "status_code", None))
+        self.response = response
+
+
+# ==================== 레지스트리 ====================
+
+_upstreams: Dict[str, Upstream] = {}
+_registry_lock = threading.Lock()
+
+
+def get_upstream(name: str) -> Upstream:
+    """업스트림 이름으로 공용 Upstream 반환 (없으면 생성)"""
+    upstream = _upstreams.get(name)
+    if upstream is None:
+        with _registry_lock:
+            upstream = _upstreams.get(name)
+            if upstream is None:
+                upstream = _upstreams[name] = Upstream(name, *_limits_for(name))
+    return upstream
+
+
+def governor_stats() -> Dict[str, Dict[str, Any]]:
+    """업스트림별 통계"""
+    with _registry_lock:
+        upstreams = list(_upstreams.values())
+    return {upstream.name: upstream.stats() for upstream in upstreams}
+
+
+# ==================== JSON API 호출 헬퍼 ====================
+
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """동기 호출용 공용 Session (커넥션 풀 재사용)"""
+    global _session
+    if _session is None:
+        with _registry_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _request_key(method: str, url: str, params: Optional[dict], body: Any) -> str:
+    """합치기용 요청 key (헤더는 API 키라 제외)"""
+    return json.dumps(
+        [method.upper(), url, sorted((params or {}).items()), body],
+        ensure_ascii=False, sort_keys=True, default=str
+    )
+
+
+def _fetch_json(method: str, url: str, timeout: float, kwargs: dict) -> Any:
+    response = _get_session().request(method, url, timeout=timeout, **kwargs)
+    response.raise_for_status()
+    return response.json()
+
+
+def _fetch_bytes(method: str, url: str, timeout: float, kwargs: dict) -> Tuple[bytes, str]:
+    response = _get_session().request(method, url, timeout=timeout, **kwargs)
+    response.raise_for_status()
+    return response.content, response.headers.get("Content-Type", "application/octet-stream")
+
+
+async def _afetch_json(method: str, url: str, timeout: float, kwargs: dict) -> Any:
+    from agents.utils.http_client import get_async_client
+
+    response = await get_async_client().request(method, url, timeout=timeout, **kwargs)
+    response.raise_for_status()
+    return response.json()
+
+
+def request_json(
+    upstream: str,
+    method: str,
+    url: str,
+    *,
+    params: Optional[dict] = None,
+    json: Any = None,
+    headers: Optional[dict] = None,
+    timeout: float = 10,
+    coalesce: bool = True,
+) -> Any:
+    """업스트림 제한/합치기를 거쳐 JSON API 호출 (sync)
+
+    Returns:
+        응답 JSON (2xx가 아니면 requests.HTTPError)
+    """
+    kwargs = {"params": params, "json": json, "headers": headers}
+    key = _request_key(method, url, params, json) if coalesce else None
+    return get_upstream(upstream).call(_fetch_json, method, url, timeout, kwargs, key=key)
+
+
+async def arequest_json(
+    upstream: str,
+    method: str,
+    url: str,
+    *,
+    params: Optional[dict] = None,
+    json: Any = None,
+    headers: Optional[dict] = None,
+    timeout: float = 10,
+    coalesce: bool = True,
+) -> Any:
+    """request_json의 비동기 버전 (공용 AsyncClient 사용, 2xx가 아니면 httpx.HTTPStatusError)"""
+    kwargs = {"params": params, "json": json, "headers": headers}
+    key = _request_key(method, url, params, json) if coalesce else None
+    return await get_upstream(upstream).acall(_afetch_json, method, url, timeout, kwargs, key=key)
+
+
+def request_bytes(
+    upstream: str,
+    url: str,
+    *,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: float = 10,
+    key: Optional[Hashable] = None,
+) -> Tuple[bytes, str]:
+    """업스트림 제한을 거쳐 바이너리(이미지 등) GET (sync)
+
+    key를 주면 같은 key로 진행 중인 다운로드를 공유 (URL에 API 키가 들어가는 경우 직접 지정)
+
+    Returns:
+        (본문 bytes, Content-Type) (2xx가 아니면 requests.HTTPError)
+    """
+    kwargs = {"params": params, "headers": headers}
+    return get_upstream(upstream).call(_fetch_bytes, "GET", url, timeout, kwargs, key=key)
@@ -1,20 +1,44 @@
 """
 Serper API 통합 유틸리티
 웹 검색을 통해 유명한 가게 이름을 먼저 찾고, Google Places로 상세 정보 가져오기
+
+- search_with_serper: 쿼리 1개 검색 (정규화된 쿼리 기준 캐시)
+- search_many: 여러 쿼리를 한 번에 검색 → 캐시에 없는 쿼리만 Serper 배치 요청 1회
 """
 
 import os
-import requests
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 from dotenv import load_dotenv
+from agents.utils.cache import cached
+from agents.utils.keyword_engine import KEYWORD_TABLE, keyword_matcher, normalize_text
+from agents.utils.request_governor import request_json
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 SERPER_API_KEY = os.getenv("SERPER_API_KEY")
+SERPER_URL = "https://google.serper.dev/search"
+
+# 웹 검색 결과 캐시 (단건/배치 검색이 같은 캐시 공유, 실패/빈 결과는 저장 안 함)
+# 맛집/숙소 웹 검색 결과는 하루 단위로도 거의 바뀌지 않음
+SERPER_CACHE_TTL = int(os.getenv("SERPER_CACHE_TTL", 24 * 60 * 60))
+
+# search_many 쿼리: 문자열 또는 (쿼리, 결과 개수)
+SerperQuery = Union[str, Tuple[str, int]]
+
+
+def _normalize_query(query: str) -> str:
+    """공백 정리 + 소문자 ("  부산  해운대 " → "부산 해운대")"""
+    return " ".join(query.split()).lower()
+
 
+def _serper_cache_key(query: str, num_results: int = 10) -> str:
+    return f"{_normalize_query(query)}:{num_results}"
 
+
+@cached("serper", ttl=SERPER_CACHE_TTL, stale_ttl=SERPER_CACHE_TTL, max_entries=1000,
+        key=_serper_cache_key, cache_if=bool)
 def search_with_serper(query: str, num_results: int = 10) -> List[Dict]:
     """
     Serper API로 웹 검색
@@ -31,45 +55,14 @@ def search_with_serper(query: str, num_results: int = 10) -> List[Dict]:
         return []
     
     try:
-        url = "https://google.serper.dev/search"
-        
-        payload = {
-            "q": query,
-            "num": num_results,
-            "gl": "kr",  # 한국
-            "hl": "ko"   # 한국어
-        }
-        
-        headers = {
-            "X-API-KEY": SERPER_API_KEY,
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # 검색 결과에서 가게 이름 추출
-        results = []
+        data = request_json(
+            "serper", "POST", SERPER_URL,
+            json=_build_serper_payload(query, num_results),
+            headers=_serper_headers(),
+            timeout=10
+        )
         
-        # organic 검색 결과
-        for item in data.get("organic", []):
-            results.append({
-                "title": item.get("title", ""),
-                "snippet": item.get("snippet", ""),
-                "link": item.get("link", "")
-            })
-        
-        # local 검색 결과 (지역 비즈니스)
-        for item in data.get("places", []):
-            results.append({
-                "title": item.get("title", ""),
-                "snippet": item.get("address", ""),
-                "link": item.get("link", ""),
-                "rating": item.get("rating"),
-                "reviews": item.get("reviews")
-            })
+        results = _parse_serper_response(data)
         
         logger.info(f"✅ Serper 검색 완료: {len(results)}개 결과")
         return results
@@ -79,6 +72,115 @@ def search_with_serper(query: str, num_results: int = 10) -> List[Dict]:
         return []
 
 
+def _split_queries(queries: Sequence[SerperQuery], num_results: int) -> List[Tuple[str, int]]:
+    return [(query, num_results) if isinstance(query, str) else tuple(query) for query in queries]
+
+
+def _cached_results(
+    pending: List[Tuple[str, int]]
+) -> Tuple[Dict[str, List[Dict]], List[Tuple[str, str, int]]]:
+    """캐시에 있는 결과와 요청이 필요한 (캐시 key, 쿼리, 개수) 목록 (같은 쿼리는 한 번만)"""
+    cache = search_with_serper.cache
+    found = {}
+    missing = []
+    seen = set()
+    for query, num in pending:
+        key = _serper_cache_key(query, num)
+        if key in seen:
+            continue
+        seen.add(key)
+        results = cache.get(key)
+        if results is None:
+            missing.append((key, query, num))
+        else:
+            found[key] = results
+    return found, missing
+
+
+def _store_batch(found: Dict[str, List[Dict]], missing: List[Tuple[str, str, int]], data: List[Dict]) -> None:
+    cache = search_with_serper.cache
+    if isinstance(data, dict):
+        data = [data]
+    for (key, _, _), item in zip(missing, data):
+        results = _parse_serper_response(item or {})
+        found[key] = results
+        if results:
+            cache.set(key, results)
+
+
+def search_many(queries: Sequence[SerperQuery], num_results: int = 10) -> List[List[Dict]]:
+    """
+    여러 쿼리를 한 번에 검색 (캐시에 없는 쿼리만 Serper 배치 요청 1회)
+    
+    Args:
+        queries: 쿼리 목록 (문자열 또는 (쿼리, 결과 개수))
+        num_results: 결과 개수를 지정하지 않은 쿼리의 결과 개수
+    
+    Returns:
+        List[List[Dict]]: 쿼리 순서대로 검색 결과 (실패한 쿼리는 빈 리스트)
+    """
+    pending = _split_queries(queries, num_results)
+    found, missing = _cached_results(pending)
+    
+    if missing and SERPER_API_KEY:
+        try:
+            data = request_json(
+                "serper", "POST", SERPER_URL,
+                json=[_build_serper_payload(query, num) for _, query, num in missing],
+                headers=_serper_headers(),
+                timeout=10
+            )
+            _store_batch(found, missing, data)
+            logger.info(f"✅ Serper 배치 검색 완료: {len(missing)}개 쿼리 (캐시 {len(pending) - len(missing)}개)")
+        except Exception as e:
+            logger.error(f"❌ Serper 배치 검색 실패: {e}")
+    elif missing:
+        logger.warning("SERPER_API_KEY not found")
+    
+    return [found.get(_serper_cache_key(query, num), []) for query, num in pending]
+
+
+def _build_serper_payload(query: str, num_results: int) -> Dict:
+    return {
+        "q": query,
+        "num": num_results,
+        "gl": "kr",  # 한국
+        "hl": "ko"   # 한국어
+    }
+
+
+def _serper_headers() -> Dict:
+    return {
+        "X-API-KEY": SERPER_API_KEY,
+        "Content-Type": "application/json"
+    }
+
+
+def _parse_serper_response(data: Dict) -> List[Dict]:
+    """Serper 응답에서 organic/places 결과 추출"""
+    results = []
+    
+    # organic 검색 결과
+    for item in data.get("organic", []):
+        results.append({
+            "title": item.get("title", ""),
+            "snippet": item.get("snippet", ""),
+            "link": item.get("link", "")
+        })
+    
+    # local 검색 결과 (지역 비즈니스)
+    for item in data.get("places", []):
+        results.append({
+            "title": item.get("title", ""),
+            "snippet": item.get("address", ""),
+            "link": item.get("link", ""),
+            "rating": item.get("rating"),
+            "reviews": item.get("reviews")
+        })
+    
+    return results
+
+
 def extract_place_names(serper_results: List[Dict], preference: Optional[str] = None) -> List[str]:
     """
     Serper 검색 결과에서 가게 이름 추출 (개선된 필터링)
@@ -90,48 +192,29 @@ def extract_place_names(serper_results: List[Dict], preference: Optional[str] =
     Returns:
         List[str]: 가게 이름 리스트
     """
-    # 음식 카테고리별 키워드 정의
-    food_keywords = {
-        "스테이크": ["스테이크", "안심", "등심", "채끝", "립아이", "tomahawk"],
-        "파스타": ["파스타", "스파게티", "알리오", "까르보나라", "크림", "토마토"],
-        "피자": ["피자", "마르게리타", "페퍼로니", "치즈"],
-        "초밥": ["초밥", "스시", "사시미", "회"],
-        "라멘": ["라멘", "돈코츠", "미소", "쇼유"],
-        "이자카야": ["이자카야", "사케", "안주", "꽃치"],
-        "한식": ["한식", "된장", "김치", "불고기", "갈비"],
-        "중식": ["중식", "짜장", "짬뽕", "탕수육", "마라"],
-        "케이크": ["케이크", "디저트", "베이커리", "빵"],
-        "커피": ["커피", "카페", "라떼", "아메리카노"],
-    }
-    
-    # 제외 키워드 (카테고리별)
-    exclude_map = {
-        "스테이크": ["카페", "디저트", "베이커리", "버거", "파스타"],
-        "파스타": ["카페", "디저트", "베이커리", "버거", "스테이크"],
-        "초밥": ["카페", "디저트", "파스타", "버거"],
-        "케이크": ["파스타", "스테이크", "버거", "라멘"],
-        "커피": ["파스타", "스테이크", "버거", "라멘"],
-    }
-    
-    # 선호도에 맞는 키워드 가져오기
-    required_keywords = food_keywords.get(preference, [preference.lower()]) if preference else []
-    exclude_keywords = exclude_map.get(preference, []) if preference else []
+    # 음식 카테고리별 키워드/제외 키워드/메뉴 정보 표시어는 keyword_engine의 KEYWORD_TABLE에서 관리
+    # (food / food_exclude / menu_info 그룹, 결과마다 한 번 훑기로 모두 매칭)
+    # 표에 없는 선호도는 선호도 문자열 자체를 키워드로 사용
+    known_preference = bool(preference) and preference in KEYWORD_TABLE["food"]
     
     place_names = []
     
     for result in serper_results:
         title = result.get("title", "")
         snippet = result.get("snippet", "")
-        combined_text = (title + " " + snippet).lower()
+        combined_text = title + " " + snippet
         
         # 선호도 키워드 체크
         if preference:
-            has_preference = any(keyword.lower() in combined_text for keyword in required_keywords)
-            has_exclude = any(keyword.lower() in combined_text for keyword in exclude_keywords)
+            hits = keyword_matcher.scan(combined_text)
+            if known_preference:
+                has_preference = hits.has("food", preference)
+            else:
+                has_preference = normalize_text(preference) in normalize_text(combined_text)
+            has_exclude = hits.has("food_exclude", preference)
             
             # 메뉴 정보 확인 (중요!)
-            menu_indicators = ["메뉴", "맛집", "유명", "인기", "추천", "리뷰", "후기"]
-            has_menu_info = any(indicator in combined_text for indicator in menu_indicators)
+            has_menu_info = hits.has("menu_info")
             
             # 선호도 키워드가 없거나 제외 키워드가 있으면 스킵
             if not has_preference:
@@ -0,0 +1,239 @@
+"""
+Spatial Index
+API로 받아 본 장소를 격자 타일(위경도 TILE_DEG 간격)에 보관하는 메모리 공간 인덱스
+
+- places_nearby 응답의 장소를 타일별로 저장 (장소 type 태그 포함)
+- 응답이 완전하면(다음 페이지 없음, 20개 미만) 응답을 받은 원(중심 + 반경) 안에 완전히 들어가는 타일을
+  (type, language) 단위로 "커버됨" 표시 → 커버된 타일에는 해당 type의 장소가 모두 들어 있음
+- 이후 같은 type의 반경 검색이 커버된 타일(TTL 안)만 걸치면 네트워크 없이 로컬에서 응답
+  - 결과는 리뷰 수(인기도) 순 최대 20개 → Nearby Search 기본 정렬(prominence)과 비슷하게
+  - 오래된 항목의 open_now는 믿을 수 없으므로 opening_hours를 빼고 반환
+- nearest: k-최근접 검색 (커버된 반경 안에서만)
+- 최대 장소 수를 넘으면 오래 사용하지 않은 타일부터 삭제 (LRU)
+
+꽉 찬 페이지(20개)나 다음 페이지가 있는 응답은 덜 유명한 장소가 빠져 있으므로 커버 표시하지 않는다.
+(그대로 커버하면 더 좁은 반경 재검색이 상위 20개 중 일부만 받게 됨, 정확히 같은 파라미터 재요청은 검색 캐시가 우선)
+
+환경 변수:
+- SPATIAL_INDEX: "on"(기본) / "off"
+- SPATIAL_TILE_TTL: 타일 커버 유효 시간 초 (기본 21600 = 6시간)
+- SPATIAL_OPEN_NOW_TTL: 이 시간(초)보다 오래된 항목은 opening_hours 제외 (기본 900)
+- SPATIAL_MAX_PLACES: 최대 장소 수 (기본 50000)
+"""
+
+import os
+import copy
+import math
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SPATIAL_INDEX_ENABLED = os.getenv("SPATIAL_INDEX", "on").lower() != "off"
+TILE_TTL = int(os.getenv("SPATIAL_TILE_TTL", 6 * 60 * 60))
+OPEN_NOW_TTL = int(os.getenv("SPATIAL_OPEN_NOW_TTL", 15 * 60))
+MAX_PLACES = int(os.getenv("SPATIAL_MAX_PLACES", 50000))
+
+# 타일 크기 (위도 0.01도 ≈ 1.1km, 경도 0.01도 ≈ 0.9km @ 위도 37도)
+TILE_DEG = 0.01
+# Nearby Search 한 페이지 최대 결과 수
+PAGE_SIZE = 20
+
+EARTH_RADIUS_M = 6371000
+_M_PER_DEG = math.pi * EARTH_RADIUS_M / 180
+
+
+def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 간 거리 (미터)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def parse_location(location: Any) -> Optional[Tuple[float, float]]:
+    """places_nearby location 인자 → (lat, lng) (tuple/list/dict/"lat,lng" 문자열)"""
+    try:
+        if isinstance(location, dict):
+            return float(location["lat"]), float(location["lng"])
+        if isinstance(location, str):
+            lat, lng = location.split(",")
+            return float(lat), float(lng)
+        lat, lng = location
+        return float(lat), float(lng)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _tile_of(lat: float, lng: float) -> Tuple[int, int]:
+    return math.floor(lat / TILE_DEG), math.floor(lng / TILE_DEG)
+
+
+def _tile_range(lat: float, lng: float, radius: float) -> Iterable[Tuple[int, int]]:
+    """원의 경계 상자에 걸치는 타일"""
+    d_lat = radius / _M_PER_DEG
+    d_lng = radius / (_M_PER_DEG * max(math.cos(math.radians(lat)), 0.01))
+    i0, j0 = _tile_of(lat - d_lat, lng - d_lng)
+    i1, j1 = _tile_of(lat + d_lat, lng + d_lng)
+    for i in range(i0, i1 + 1):
+        for j in range(j0, j1 + 1):
+            yield i, j
+
+
+def _tile_distance(lat: float, lng: float, tile: Tuple[int, int]) -> Tuple[float, float]:
+    """중심에서 타일까지의 (가장 가까운 거리, 가장 먼 거리) 근사 (미터)"""
+    south, west = tile[0] * TILE_DEG, tile[1] * TILE_DEG
+    north, east = south + TILE_DEG, west + TILE_DEG
+    near_lat = min(max(lat, south), north)
+    near_lng = min(max(lng, west), east)
+    far_lat = south if abs(lat - south) > abs(lat - north) else north
+    far_lng = west if abs(lng - west) > abs(lng - east) else east
+    return haversine(lat, lng, near_lat, near_lng), haversine(lat, lng, far_lat, far_lng)
+
+
+class _Tile:
+    __slots__ = ("places", "covered")
+
+    def __init__(self):
+        # (place_id, language) -> (lat, lng, types, payload, seen_at)
+        self.places: Dict[Tuple[str, str], tuple] = {}
+        # (type, language) -> covered_at
+        self.covered: Dict[Tuple[str, str], float] = {}
+
+
+class SpatialIndex:
+    """격자 타일 기반 장소 인덱스 (스레드 안전)"""
+
+    def __init__(self, ttl: int = TILE_TTL, max_places: int = MAX_PLACES):
+        self.ttl = ttl
+        self.max_places = max_places
+        self._tiles: "OrderedDict[Tuple[int, int], _Tile]" = OrderedDict()
+        self._place_count = 0
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "misses": 0, "evictions": 0}
+
+    def _tile(self, key: Tuple[int, int]) -> _Tile:
+        """타일 조회/생성 + LRU 갱신 (lock 보유 상태에서 호출)"""
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = self._tiles[key] = _Tile()
+        self._tiles.move_to_end(key)
+        return tile
+
+    def add(
+        self,
+        places: List[Dict[str, Any]],
+        place_type: Optional[str] = None,
+        language: Optional[str] = None,
+        covered: Optional[Tuple[float, float, float]] = None,
+    ) -> None:
+        """Nearby Search 결과 저장
+
+        Args:
+            places: 응답 results
+            place_type: 요청 type (장소 types에 추가)
+            language: 요청 language
+            covered: (lat, lng, radius) - 이 원 안에 완전히 들어가는 타일을 커버됨으로 표시
+                (다음 페이지가 없는 응답일 때만 넘길 것, 결과가 PAGE_SIZE개면 잘렸을 수 있어 무시)
+        """
+        now = time.time()
+        lang = language or ""
+        with self._lock:
+            for place in places:
+                location = place.get("geometry", {}).get("location")
+                if not place.get("place_id") or not location:
+                    continue
+                types = frozenset(place.get("types", ())) | ({place_type} if place_type else frozenset())
+                lat, lng = location["lat"], location["lng"]
+                tile = self._tile(_tile_of(lat, lng))
+                key = (place["place_id"], lang)
+                if key not in tile.places:
+                    self._place_count += 1
+                tile.places[key] = (lat, lng, types, copy.deepcopy(place), now)
+
+            if covered and place_type and len(places) < PAGE_SIZE:
+                lat, lng, radius = covered
+                for key in _tile_range(lat, lng, radius):
+                    if _tile_distance(lat, lng, key)[1] <= radius:
+                        self._tile(key).covered[(place_type, lang)] = now
+
+            self._evict_overflow()
+
+    def _evict_overflow(self) -> None:
+        while (self._place_count > self.max_places or len(self._tiles) > self.max_places) and len(self._tiles) > 1:
+            _, tile = self._tiles.popitem(last=False)
+            self._place_count -= len(tile.places)
+            self._stats["evictions"] += 1
+
+    def _collect(
+        self, lat: float, lng: float, radius: float, place_type: str, lang: str
+    ) -> Optional[List[Tuple[float, tuple]]]:
+        """원 안의 (거리, 항목) 목록 (걸치는 타일이 하나라도 커버 안 됐으면 None, lock 보유 상태에서 호출)"""
+        now = time.time()
+        tiles = []
+        for key in _tile_range(lat, lng, radius):
+            if _tile_distance(lat, lng, key)[0] > radius:
+                continue
+            tile = self._tiles.get(key)
+            covered_at = tile.covered.get((place_type, lang)) if tile else None
+            if covered_at is None or now - covered_at > self.ttl:
+                return None
+            tiles.append(key)
+
+        found = []
+        for key in tiles:
+            self._tiles.move_to_end(key)
+            for (place_id, place_lang), item in self._tiles[key].places.items():
+                if place_lang != lang or place_type not in item[2]:
+                    continue
+                distance = haversine(lat, lng, item[0], item[1])
+                if distance <= radius:
+                    found.append((distance, item))
+        return found
+
+    @staticmethod
+    def _payload(item: tuple) -> Dict[str, Any]:
+        """저장된 장소 payload 복사본 (오래된 항목은 opening_hours 제외)"""
+        place = copy.deepcopy(item[3])
+        if time.time() - item[4] > OPEN_NOW_TTL:
+            place.pop("opening_hours", None)
+        return place
+
+    def query_radius(
+        self, lat: float, lng: float, radius: float, place_type: str, language: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """반경 검색 (리뷰 수 순 최대 PAGE_SIZE개, 커버되지 않은 영역이면 None)"""
+        with self._lock:
+            found = self._collect(lat, lng, radius, place_type, language or "")
+            self._stats["misses" if found is None else "local_hits"] += 1
+        if found is None:
+            return None
+        found.sort(key=lambda pair: pair[1][3].get("user_ratings_total", 0), reverse=True)
+        return [self._payload(item) for _, item in found[:PAGE_SIZE]]
+
+    def nearest(
+        self, lat: float, lng: float, k: int, place_type: str,
+        language: Optional[str] = None, max_radius: float = 5000
+    ) -> Optional[List[Tuple[float, Dict[str, Any]]]]:
+        """k-최근접 검색 (max_radius 안, 커버되지 않은 영역이면 None)
+
+        Returns:
+            [(거리 미터, 장소 payload), ...] 가까운 순
+        """
+        with self._lock:
+            found = self._collect(lat, lng, max_radius, place_type, language or "")
+            self._stats["misses" if found is None else "local_hits"] += 1
+        if found is None:
+            return None
+        found.sort(key=lambda pair: pair[0])
+        return [(distance, self._payload(item)) for distance, item in found[:k]]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "tiles": len(self._tiles), "places": self._place_count}
+
+
+def create_spatial_index() -> Optional[SpatialIndex]:
+    """환경 변수 설정에 따라 인덱스 생성 (비활성화 시 None)"""
+    return SpatialIndex() if SPATIAL_INDEX_ENABLED else None
@@ -0,0 +1,43 @@
+"""
+로컬 토큰 카운터
+API 호출 없이 프롬프트 토큰 수를 계산 (tiktoken 사용, 없으면 근사치)
+"""
+
+import logging
+from functools import lru_cache
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+# gpt-4o / gpt-4o-mini 토크나이저
+DEFAULT_ENCODING = "o200k_base"
+
+# 메시지 1개당 role/구분자 오버헤드 (OpenAI chat 포맷 기준 근사)
+TOKENS_PER_MESSAGE = 4
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"⚠️ tiktoken 사용 불가, 근사치로 계산: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """텍스트 토큰 수"""
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    # 근사치: 한글은 글자당 ~1토큰, ASCII는 4글자당 ~1토큰
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+def count_message_tokens(contents: Iterable[str]) -> int:
+    """채팅 메시지 내용 리스트의 토큰 수 (메시지 오버헤드 포함)"""
+    return sum(count_tokens(content) + TOKENS_PER_MESSAGE for content in contents)
@@ -6,7 +6,7 @@ import os
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
-from routers import auth, langgraph_chat  # LangGraph 라우터 추가
+from routers import auth, langgraph_chat, admin, photos  # LangGraph 라우터 추가
 from core.database import engine, Base  # 1. engine과 Base 가져오기
 
 # 2. 서버 시작 때 테이블 생성 (없으면 만들고, 있으면 넘어감)
@@ -62,9 +62,17 @@ def read_root():
 def health_check():
     return {"status": "ok", "version": "1.1"}
 
+# 공용 비동기 HTTP 클라이언트 정리
+@app.on_event("shutdown")
+async def close_http_clients():
+    from agents.utils.http_client import close_async_client
+    await close_async_client()
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(langgraph_chat.router)  # LangGraph 멀티에이전트 라우터 등록
+app.include_router(admin.router)  # 캐시 통계 등 관리용
+app.include_router(photos.router)  # 장소 사진 프록시 (썸네일 + 디스크 캐시)
 
 
 
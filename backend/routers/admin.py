@@ -0,0 +1,58 @@
+import os
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["admin"],
+    responses={404: {"description": "Not found"}},
+)
+
+# X-Admin-Token 헤더가 일치해야 조회 가능 (설정되지 않았으면 관리자 API 비활성화 → 404)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+
+def _check_token(token: Optional[str]) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not token or not secrets.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 필요합니다")
+
+
+@router.get("/cache-stats")
+async def cache_stats(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    캐시 통계 (hit/miss/eviction/bytes)
+    - caches: agents/utils/cache.py 공용 캐시
+    - places: PlacesGateway 엔드포인트/캐시/장소 카탈로그 (숙소 이름 → 예약 플랫폼 ID 포함)
+    - session_store: 세션 저장소
+    - photos: 사진 프록시 디스크 저장소 (아직 사진 요청이 없었으면 null)
+    """
+    _check_token(x_admin_token)
+
+    from agents.utils.cache import all_cache_stats
+    from agents.utils.places_gateway import get_places_metrics
+    from agents.session_store import session_store
+    from agents.utils.photo_store import get_photo_store_stats
+
+    return {
+        "caches": all_cache_stats(),
+        "places": get_places_metrics(),
+        "session_store": session_store.stats(),
+        "photos": get_photo_store_stats(),
+    }
+
+
+@router.get("/governor-stats")
+async def governor_stats(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    외부 API 업스트림별 호출량 제한 통계
+    (호출/합쳐진 요청/대기/거절/429 횟수, 현재 대기열 길이)
+    """
+    _check_token(x_admin_token)
+
+    from agents.utils.request_governor import governor_stats as get_governor_stats
+
+    return {"upstreams": get_governor_stats()}
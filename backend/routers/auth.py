@@ -35,6 +35,14 @@ def create_access_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+# 토큰 검증 함수 (유효하면 user_id, 아니면 None)
+def decode_access_token(token: str):
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        return payload.get("sub")
+    except JWTError:
+        return None
+
 
 # 이메일 인증번호 임시 저장소 (실제로는 Redis 또는 DB 사용 권장)
 verification_codes = {}
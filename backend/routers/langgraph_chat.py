@@ -1,8 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import json
 
-from agents.coordinator import get_coordinator_response
+from agents.coordinator import aget_coordinator_response, stream_coordinator_response
+from agents.session_locks import session_locks
+from routers.auth import decode_access_token
 
 router = APIRouter(
     prefix="/api/langgraph",
@@ -14,6 +19,42 @@ router = APIRouter(
 class ChatRequest(BaseModel):
     message: str
     conversation_history: Optional[List[dict]] = []
+    session_id: Optional[str] = None  # 같은 사용자의 여러 여행 계획 구분용 (선택)
+    user_id: Optional[str] = None  # 로그인 토큰이 없을 때 익명 세션 구분용 (선택, anon: 네임스페이스)
+
+
+# Authorization 헤더가 없어도 동작하도록 auto_error=False
+_bearer = HTTPBearer(auto_error=False)
+
+
+def resolve_session(
+    request: ChatRequest,
+    credentials: Optional[HTTPAuthorizationCredentials] = None
+) -> Tuple[str, str]:
+    """
+    요청의 (session_id, user_id) 결정
+    - 로그인(JWT) 사용자: session_id = "user:{sub}" 또는 "user:{sub}:{session_id}", user_id = sub
+    - 토큰 없음: body의 user_id/session_id는 검증되지 않은 값이므로 "anon:" 네임스페이스로 분리
+      ("anon:{user_id}", "anon:{user_id}:{session_id}", "anon:{session_id}", 모두 없으면 "default")
+      → 다른 사용자의 "user:" 세션(대화 기록)에 접근할 수 없고, 페르소나는 "default_user"로 조회
+    """
+    if credentials:
+        user_id = decode_access_token(credentials.credentials)
+        if user_id is None:
+            raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
+        if request.session_id:
+            # 로그인 사용자의 세션은 다른 사용자와 섞이지 않도록 user_id로 구분
+            return f"user:{user_id}:{request.session_id}", user_id
+        return f"user:{user_id}", user_id
+    
+    if request.user_id and request.session_id:
+        session_id = f"anon:{request.user_id}:{request.session_id}"
+    elif request.user_id or request.session_id:
+        session_id = f"anon:{request.user_id or request.session_id}"
+    else:
+        session_id = "default"
+    
+    return session_id, "default_user"
 
 
 class ChatResponse(BaseModel):
@@ -23,21 +64,29 @@ class ChatResponse(BaseModel):
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def langgraph_chat(request: ChatRequest):
+async def langgraph_chat(
+    request: ChatRequest,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)
+):
     """
     LangGraph Coordinator Agent 챗봇 엔드포인트
     - LLM이 자동으로 Agent 선택
     - Memory 기반 대화
+    - 세션별 Lock: 같은 세션의 요청은 순서대로, 다른 세션은 병렬 처리
     """
+    session_id, user_id = resolve_session(request, credentials)
+    
     try:
-        print(f"\n=== Coordinator Agent 실행 ===")
+        print(f"\n=== Coordinator Agent 실행 (세션: {session_id}) ===")
         print(f"입력: {request.message}")
         
-        # Coordinator Agent 호출
-        response = get_coordinator_response(
-            message=request.message,
-            session_id="default"
-        )
+        # Coordinator Agent 호출 (비동기 - 이벤트 루프를 막지 않음)
+        async with session_locks.hold(session_id):
+            response = await aget_coordinator_response(
+                message=request.message,
+                session_id=session_id,
+                user_id=user_id
+            )
         
         print(f"응답: {response[:100]}...")
         
@@ -59,14 +108,67 @@ async def langgraph_chat(request: ChatRequest):
         )
 
 
+def _format_sse(event: Dict[str, Any]) -> str:
+    """이벤트 dict → SSE 프레임 문자열"""
+    payload = {k: v for k, v in event.items() if k != "event"}
+    return f"event: {event['event']}\ndata: {json.dumps(payload, ensure_ascii=False, default=str)}\n\n"
+
+
+@router.post("/chat/stream")
+async def langgraph_chat_stream(
+    request: ChatRequest,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)
+):
+    """
+    LangGraph Coordinator Agent 스트리밍 엔드포인트 (Server-Sent Events)
+    - token: Coordinator LLM 토큰
+    - tool_start / tool_end: call_*_agent Tool 진행 상황
+    - final: 최종 응답 (ChatResponse와 같은 필드)
+    - error: 실행 실패
+    """
+    session_id, user_id = resolve_session(request, credentials)
+    
+    print(f"\n=== Coordinator Agent 스트리밍 실행 (세션: {session_id}) ===")
+    print(f"입력: {request.message}")
+    
+    async def event_generator():
+        # 스트림이 끝날 때까지 세션 Lock 유지
+        async with session_locks.hold(session_id):
+            async for event in stream_coordinator_response(
+                message=request.message,
+                session_id=session_id,
+                user_id=user_id
+            ):
+                if event["event"] == "final":
+                    event = {
+                        **event,
+                        "phase": "chat",
+                        "required_info_complete": True
+                    }
+                yield _format_sse(event)
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 버퍼링 방지
+        }
+    )
+
+
 @router.get("/health")
 async def langgraph_health():
     """
     Coordinator Agent 시스템 헬스 체크
     """
+    from agents.session_store import session_store
+    
     return {
         "status": "ok",
         "system": "coordinator_agent_pattern",
         "agents": ["restaurant", "dessert", "accommodation", "landmark", "region", "chat"],
-        "architecture": "LangChain Coordinator + LangGraph Agents"
+        "architecture": "LangChain Coordinator + LangGraph Agents",
+        "session_store": session_store.stats(),
+        "session_locks": session_locks.stats()
     }
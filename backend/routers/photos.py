@@ -0,0 +1,82 @@
+from typing import Optional
+
+import requests
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from starlette.concurrency import run_in_threadpool
+
+from agents.utils.cache import get_cache
+from agents.utils.photo_store import get_photo_store, is_valid_reference, GOOGLE_API_KEY, MISS_TTL
+from agents.utils.request_governor import RateLimitExceeded
+
+router = APIRouter(
+    prefix="/api/photos",
+    tags=["photos"],
+    responses={404: {"description": "Not found"}},
+)
+
+# 파일 이름이 내용 해시라 같은 URL의 내용은 바뀌지 않음 → 브라우저/CDN에서 30일 보관
+CACHE_CONTROL = "public, max-age=2592000, immutable"
+
+# Google이 찾지 못한 photo_reference (잘못된/만료된 참조로 API 할당량과 호출 토큰을 반복해서 쓰지 않도록)
+_missing = get_cache("photos.missing", max_entries=5000, ttl=MISS_TTL)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip() == etag for tag in if_none_match.split(","))
+
+
+@router.get("/{photo_reference}")
+async def get_photo(
+    photo_reference: str,
+    w: Optional[int] = Query(default=None, ge=1, le=1600, description="썸네일 너비 (160/320/480/800 중 가까운 값)"),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """
+    장소 사진 프록시
+    - 처음 요청만 Google Places Photo API 호출, 이후는 디스크 캐시에서 응답
+    - ETag(내용 해시) 일치 시 304
+    - Google이 찾지 못한 참조는 MISS_TTL 동안 바로 404
+    """
+    if not is_valid_reference(photo_reference):
+        raise HTTPException(status_code=400, detail="잘못된 사진 참조입니다")
+    if not GOOGLE_API_KEY:
+        raise HTTPException(status_code=503, detail="사진 API 키가 설정되지 않았습니다")
+    if _missing.get(photo_reference):
+        raise HTTPException(status_code=404, detail="사진을 찾을 수 없습니다")
+
+    store = get_photo_store()
+    try:
+        photo = await run_in_threadpool(store.get, photo_reference, w)
+    except RateLimitExceeded:
+        raise HTTPException(status_code=503, detail="사진 요청이 많습니다", headers={"Retry-After": "5"})
+    except requests.HTTPError as e:
+        status = getattr(e.response, "status_code", 502)
+        if status in (400, 403, 404):
+            _missing.set(photo_reference, True)
+            raise HTTPException(status_code=404, detail="사진을 찾을 수 없습니다")
+        raise HTTPException(status_code=502, detail="사진을 가져오지 못했습니다")
+    except requests.RequestException:
+        raise HTTPException(status_code=502, detail="사진을 가져오지 못했습니다")
+    except FileNotFoundError:
+        # 다른 워커가 막 evict한 경우
+        raise HTTPException(status_code=404, detail="사진을 찾을 수 없습니다")
+
+    etag = f'"{photo.etag}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    def read() -> bytes:
+        with open(photo.path, "rb") as f:
+            return f.read()
+
+    try:
+        content = await run_in_threadpool(read)
+    except FileNotFoundError:
+        # 다른 워커가 막 evict한 경우
+        raise HTTPException(status_code=404, detail="사진을 찾을 수 없습니다")
+    return Response(content=content, media_type=photo.content_type, headers=headers)
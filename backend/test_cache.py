@@ -0,0 +1,101 @@
+"""
+공용 캐시(agents/utils/cache.py) 동작 테스트 (API 키 불필요)
+LRU 제거, TTL 만료, stale-while-revalidate, 디스크 스필, @cached 데코레이터
+
+실행: python test_cache.py
+"""
+
+import os
+import time
+import asyncio
+import tempfile
+
+# 스필 파일은 임시 디렉터리에 (import 전에 설정)
+os.environ["CACHE_SPILL_PATH"] = os.path.join(tempfile.mkdtemp(), "cache_spill.db")
+
+from agents.utils.cache import TTLCache, cached
+
+
+print("=" * 60)
+print("🧪 공용 캐시 테스트")
+print("=" * 60)
+
+# 1. LRU: 최근에 조회한 항목은 남고 가장 오래 사용하지 않은 항목이 제거됨
+cache = TTLCache("test_lru", max_entries=2, ttl=60)
+cache.set("a", 1)
+cache.set("b", 2)
+cache.get("a")
+cache.set("c", 3)
+assert "b" not in cache and cache.get("a") == 1 and cache.get("c") == 3, "LRU - 가장 오래 사용하지 않은 항목 제거"
+assert cache.stats()["evictions"] == 1, "LRU - eviction 통계"
+
+# 2. max_bytes: 바이트 한도를 넘으면 제거
+cache = TTLCache("test_bytes", max_entries=100, ttl=60, max_bytes=3000)
+for i in range(5):
+    cache.set(i, "x" * 1000)
+assert cache.stats()["bytes"] <= 3000 and 0 not in cache, "max_bytes - 한도 안으로 유지"
+
+# 3. TTL 만료 (항목별 ttl)
+cache = TTLCache("test_ttl", ttl=60)
+cache.set("short", 1, ttl=0.05)
+cache.set("long", 2)
+time.sleep(0.1)
+assert cache.get("short") is None and cache.get("long") == 2, "TTL - 만료된 항목은 miss"
+
+# 4. get_or_load: None 결과는 저장하지 않음
+cache = TTLCache("test_load", ttl=60)
+calls = []
+cache.get_or_load("k", lambda: calls.append(1))
+cache.get_or_load("k", lambda: calls.append(1))
+assert len(calls) == 2, "get_or_load - None은 캐시하지 않음"
+
+# 5. stale-while-revalidate: stale 값을 바로 반환하고 백그라운드에서 한 번만 갱신
+cache = TTLCache("test_stale", ttl=0.05, stale_ttl=60)
+cache.set("k", "old")
+time.sleep(0.1)
+loads = []
+
+
+def slow_loader():
+    loads.append(1)
+    time.sleep(0.1)
+    return "new"
+
+
+first = cache.get_or_load("k", slow_loader)
+second = cache.get_or_load("k", slow_loader)
+time.sleep(0.3)
+assert first == "old" and second == "old", "stale - 이전 값을 즉시 반환"
+assert len(loads) == 1, "stale - 갱신은 한 번만"
+assert cache.get("k", allow_stale=True) == "new", "stale - 갱신 후 새 값"
+
+# 6. 디스크 스필: LRU로 밀려난 항목을 miss 시 복원
+cache = TTLCache("test_spill", max_entries=1, ttl=60, spill=True)
+cache.set("first", {"v": 1})
+cache.set("second", {"v": 2})
+assert cache.get("first") == {"v": 1}, "spill - 밀려난 항목 디스크에서 복원"
+assert cache.stats()["disk_hits"] == 1, "spill - disk_hits 통계"
+
+
+# 7. @cached: sync/async 함수가 같은 이름의 캐시 공유
+counter = {"sync": 0, "async": 0}
+
+
+@cached("test_decorator", ttl=60, key=lambda x: x)
+def double(x):
+    counter["sync"] += 1
+    return x * 2
+
+
+@cached("test_decorator", ttl=60, key=lambda x: x)
+async def adouble(x):
+    counter["async"] += 1
+    return x * 2
+
+
+double(3)
+double(3)
+assert counter["sync"] == 1, "@cached - 같은 인자는 한 번만 계산"
+assert asyncio.run(adouble(3)) == 6 and counter["async"] == 0, "@cached - async 버전이 같은 캐시 사용"
+
+print("\n완료!")
@@ -0,0 +1,62 @@
+"""
+Place Details 동시 요청 벤치마크
+결과 개수별 순차 gmaps.place 루프 vs PlacesGateway.place_many (Google API 키 필요)
+
+측정마다 새 PlacesGateway를 만들어 캐시 적중 없이 비교한다.
+
+실행: python test_details_fanout.py [지역]
+"""
+
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from agents.utils.places_gateway import PlacesGateway, DETAILS_CONCURRENCY
+
+REGION = sys.argv[1] if len(sys.argv) > 1 else "부산 해운대"
+COUNTS = [1, 5, 10, 20]
+FIELDS = ['formatted_phone_number', 'website', 'opening_hours', 'formatted_address', 'photo', 'price_level']
+
+api_key = os.getenv("GOOGLE_PLACES_API_KEY")
+if not api_key:
+    print("❌ GOOGLE_PLACES_API_KEY가 필요합니다")
+    sys.exit(1)
+
+# 후보 place_id 수집
+seed = PlacesGateway(api_key)
+coords = seed.geocode(f"{REGION}, 대한민국", language="ko")[0]['geometry']['location']
+nearby = seed.places_nearby(location=(coords['lat'], coords['lng']), radius=3000, type="restaurant", language="ko")
+place_ids = [place['place_id'] for place in nearby.get('results', [])]
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+print("=" * 60)
+print(f"🧪 Place Details 벤치마크 ({REGION}, 동시 요청 {DETAILS_CONCURRENCY})")
+print("=" * 60)
+print(f"{'개수':<6}{'순차(s)':>10}{'동시(s)':>10}{'단축':>8}")
+print("-" * 34)
+
+for count in COUNTS:
+    ids = place_ids[:count]
+    if len(ids) < count:
+        break
+
+    sequential = PlacesGateway(api_key)
+    seq_time = measure(lambda: [sequential.place(pid, fields=FIELDS, language='ko') for pid in ids])
+
+    concurrent = PlacesGateway(api_key)
+    fan_time = measure(lambda: concurrent.place_many(ids, fields=FIELDS, language='ko'))
+
+    saved = 100 * (1 - fan_time / seq_time) if seq_time else 0.0
+    print(f"{count:<6}{seq_time:>10.2f}{fan_time:>10.2f}{saved:>7.1f}%")
+
+print("\n완료!")
@@ -0,0 +1,48 @@
+"""
+Direct 모드 지연 시간 벤치마크
+하위 ReAct 에이전트 경유 vs 검색 함수 직접 호출 (Google/OpenAI API 키 필요)
+
+실행: python test_direct_mode.py [반복 횟수]
+"""
+
+import sys
+import time
+
+from agents.direct_search import direct_search
+
+REPEAT = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+# (agent, 그래프 로더, region, category)
+CASES = [
+    ("restaurant", "Langgraph.restaurant_langgraph", "restaurant_graph", "부산 해운대", "일식"),
+    ("dessert", "Langgraph.dessert_langgraph", "dessert_graph", "부산 광안리", "루프탑 카페"),
+    ("accommodation", "Langgraph.accommodation_langgraph", "accommodation_graph", "부산 해운대", "호텔"),
+    ("landmark", "Langgraph.landmark_langgraph", "landmark_graph", "부산", "자연"),
+]
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+print("=" * 60)
+print(f"🧪 Direct 모드 벤치마크 (반복 {REPEAT}회)")
+print("=" * 60)
+print(f"{'agent':<15}{'ReAct(s)':>10}{'Direct(s)':>11}{'단축':>8}")
+print("-" * 44)
+
+for agent, module_name, graph_name, region, category in CASES:
+    graph = getattr(__import__(module_name, fromlist=[graph_name]), graph_name)
+    query = f"{region} {category}"
+
+    react_times = [measure(lambda: graph.invoke({"user_input": query})) for _ in range(REPEAT)]
+    direct_times = [measure(lambda: direct_search(agent, region, category)) for _ in range(REPEAT)]
+
+    react_avg = sum(react_times) / REPEAT
+    direct_avg = sum(direct_times) / REPEAT
+    saved = 100 * (1 - direct_avg / react_avg) if react_avg else 0.0
+    print(f"{agent:<15}{react_avg:>10.2f}{direct_avg:>11.2f}{saved:>7.1f}%")
+
+print("\n완료!")
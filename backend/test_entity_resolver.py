@@ -0,0 +1,53 @@
+"""
+Entity resolver(agents/utils/entity_resolver.py) 동작 테스트 (API 키 불필요)
+이름 정규화, 유사도, 웹 이름 ↔ 후보 장소 1:1 매칭
+
+실행: python test_entity_resolver.py
+"""
+
+from agents.utils.entity_resolver import MATCH_THRESHOLD, EntityResolver, name_similarity, normalize_name
+
+
+print("=" * 60)
+print("🧪 Entity resolver 테스트")
+print("=" * 60)
+
+# 1. 정규화
+assert {"스타벅스", "starbucks"} <= normalize_name("스타벅스(Starbucks)"), "정규화 - 괄호 별칭 분리"
+assert "개미집" in normalize_name("[부산맛집] 개미집"), "정규화 - 말머리 태그 제거"
+assert "스타벅스" in normalize_name("스타벅스 광안점"), "정규화 - 지점 접미사 제거"
+assert "스타벅스" in normalize_name("스타벅스광안리본점"), "정규화 - 붙여 쓴 지점 접미사 제거"
+assert normalize_name("해운대암소갈비집 - 네이버 블로그") == {"해운대암소갈비집"}, "정규화 - 블로그 제목 꼬리 제거"
+assert "톤쇼우" in normalize_name("2. 톤쇼우 맛집 추천"), "정규화 - 앞 번호/일반 단어 제거"
+assert {"스타벅스", "starbucks"} <= normalize_name("스타벅스/Starbucks"), "정규화 - 슬래시 별칭"
+assert normalize_name("") == frozenset(), "정규화 - 빈 이름"
+
+# 2. 유사도
+assert name_similarity("스타벅스 광안점", "스타벅스 해운대점") == 1.0, "유사도 - 같은 가게 다른 지점"
+assert name_similarity("해운대암소갈비", "해운대 암소갈비집") >= MATCH_THRESHOLD, "유사도 - 포함 관계"
+assert name_similarity("Starbucks", "스타벅스(Starbucks) 광안점") == 1.0, "유사도 - 라틴/한글 별칭"
+assert name_similarity("금수복국", "톤쇼우") < MATCH_THRESHOLD, "유사도 - 다른 가게"
+assert name_similarity("해운", "해운대암소갈비집") < MATCH_THRESHOLD, "유사도 - 2글자 우연 포함은 제외"
+
+# 3. 1:1 매칭
+candidates = [
+    {"name": "톤쇼우 광안점"},
+    {"name": "해운대암소갈비집"},
+    {"name": "금수복국 해운대본점"},
+    {"name": "스타벅스 해운대점"},
+]
+resolver = EntityResolver(candidates)
+matches = resolver.resolve(["[부산맛집] 금수복국", "해운대 암소갈비 - 네이버 블로그", "없는가게", "톤쇼우"])
+assert [match.name_index for match in matches] == [0, 1, 3], "매칭 - 웹 이름 순서 유지"
+assert [match.candidate_index for match in matches] == [2, 1, 0], "매칭 - 올바른 후보"
+assert all(match.name != "없는가게" for match in matches), "매칭 - 임계값 미만 이름은 제외"
+
+# 한 후보가 여러 웹 이름에 중복 배정되지 않음 (점수 높은 쌍 우선)
+matches = resolver.resolve(["스타벅스", "스타벅스 해운대점"])
+assert len(matches) == 1 and matches[0].candidate_index == 3, "매칭 - 후보 중복 배정 없음"
+
+assert resolver.match("금수복국").candidate_index == 2, "match - 단건 매칭"
+assert resolver.match("전혀다른이름") is None, "match - 없으면 None"
+assert resolver.hits(["톤쇼우", "스타벅스"]) == [1.0, 0.0, 0.0, 1.0], "hits - 후보 순서대로 0/1"
+
+print("\n완료!")
@@ -0,0 +1,111 @@
+"""
+Fast path 시나리오 테스트
+부산 여행 계획 대화(19턴)를 순서대로 넣어 LLM 없이 처리되는 턴 수와 처리 시간 확인 (API 키 불필요)
+
+- fast path가 처리하지 못한 턴은 Coordinator Agent가 처리한 것처럼
+  agent_results/track_turn으로 흐름 상태만 진행시킨다 (하위 에이전트 응답은 고정 문자열)
+
+실행: python test_fast_path.py
+"""
+
+import json
+import time
+
+from agents.flow_state import TravelFlowState
+from agents.flow_tracker import track_turn
+from agents import fast_path
+
+
+class FakeAction:
+    """track_turn에 넘길 AgentAction 대용"""
+
+    def __init__(self, tool: str, tool_input: dict):
+        self.tool = tool
+        self.tool_input = tool_input
+
+
+RESULT_KEYS = {
+    "call_region_agent": "region_recommendations",
+    "call_restaurant_agent": "restaurant_recommendations",
+    "call_dessert_agent": "cafe_recommendations",
+    "call_accommodation_agent": "accommodation_recommendations",
+    "call_landmark_agent": "landmark_recommendations",
+}
+
+PLACES = "맛집 추천이다냥!\n\n**1. 해운대 암소갈비집** (⭐ 4.5)\n- 주소: ...\n**2. 톤쇼우** - 돈카츠\n3. 금수복국 (복국)\n"
+
+# (사용자 메시지, [(Coordinator가 호출했을 tool, query, tool 응답)])
+SCRIPT = [
+    ("부산", [("call_region_agent", "부산", "1. 해운대\n2. 광안리\n3. 남포동")]),
+    ("해운대", []),
+    ("광안리랑 남포동", []),
+    ("확정", []),
+    ("2025/12/13 ~ 12/15", []),
+    ("50", []),
+    ("2명이서", []),
+    ("오전 9시", []),
+    ("서울역", []),
+    ("일식", [("call_restaurant_agent", "부산 해운대 일식", PLACES)]),
+    ("2번", []),
+    ("한식", [("call_restaurant_agent", "부산 한식", PLACES)]),
+    ("첫번째", []),
+    ("루프탑", [("call_dessert_agent", "부산 루프탑 카페", PLACES)]),
+    ("1", []),
+    ("호텔", [("call_accommodation_agent", "부산 호텔", PLACES)]),
+    ("3번으로 할게", []),
+    ("자연", [("call_landmark_agent", "부산 자연", PLACES)]),
+    ("1,2", []),
+]
+
+print("=" * 60)
+print("🧪 Fast path 시나리오 테스트")
+print("=" * 60)
+
+flow_state = TravelFlowState()
+fast_turns = 0
+
+for message, tools in SCRIPT:
+    start = time.perf_counter()
+    response = fast_path.route(message, flow_state)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if response is not None:
+        fast_turns += 1
+        print(f"⚡ {message!r} ({elapsed_ms:.2f}ms) → {response.splitlines()[0]}")
+        continue
+
+    steps = []
+    for tool, query, output in tools:
+        flow_state.agent_results[RESULT_KEYS[tool]] = output
+        steps.append((FakeAction(tool, {"query": query}), output))
+    track_turn(flow_state, message, steps)
+    print(f"🤖 {message!r} → Coordinator (단계 {flow_state.current_step})")
+
+print("-" * 60)
+print(f"fast path: {fast_turns}/{len(SCRIPT)}턴")
+print(f"daily_selections: {flow_state.daily_selections}")
+print(f"collected_info: {flow_state.collected_info}")
+
+# 직렬화 왕복 후에도 선택 결과 유지
+restored = TravelFlowState.from_dict(json.loads(json.dumps(flow_state.to_dict())))
+assert restored.daily_selections == flow_state.daily_selections, "daily_selections 직렬화 불일치"
+
+
+def departure_state() -> TravelFlowState:
+    """출발 장소만 남은 상태 (인원/출발 시간 입력 완료)"""
+    state = TravelFlowState.from_dict(json.loads(json.dumps(flow_state.to_dict())))
+    state.current_step = TravelFlowState.STEP_PEOPLE
+    state.departure_location = None
+    return state
+
+
+# 출발 장소: 장소로 보이는 답만 fast path, 나머지는 Coordinator
+for message, expected in [("서울역이요", "서울역"), ("부산에서요!", "부산"), ("김포공항", "김포공항")]:
+    state = departure_state()
+    assert fast_path.route(message, state) is not None and state.departure_location == expected, message
+for message in ["몰라", "아무데나", "음", "잠깐만"]:
+    state = departure_state()
+    assert fast_path.route(message, state) is None and state.departure_location is None, message
+print("출발 장소 판별 확인")
+
+print("\n완료!")
@@ -0,0 +1,51 @@
+"""
+키워드 엔진(agents/utils/keyword_engine.py) 동작 테스트 (API 키 불필요)
+정규화, 라벨 우선순위, 라틴 키워드 단어 경계, 기존 분류 결과
+
+실행: python test_keyword_engine.py
+"""
+
+import unicodedata
+
+from agents.utils.keyword_engine import KeywordMatcher, match_keywords, normalize_text
+
+
+print("=" * 60)
+print("🧪 키워드 엔진 테스트")
+print("=" * 60)
+
+# 1. 정규화
+assert normalize_text("  GS25   근처 ") == "gs25 근처", "정규화 - 소문자/공백 정리"
+assert normalize_text("ＣＵ") == "cu", "정규화 - 전각 영문 → 반각"
+assert normalize_text(unicodedata.normalize("NFD", "편의점")) == "편의점", "정규화 - 자모 분리(NFD) 한글 → 음절"
+assert normalize_text("ㅋㅋ 편의점") == "ㅋㅋ 편의점", "정규화 - 단독 자모 유지"
+
+# 2. 라틴 키워드는 단어 경계에서만 매칭
+assert not match_keywords("Cucumber 샐러드").has("shopping_search"), "경계 - 'Cucumber 샐러드'는 편의점 검색 아님"
+assert not match_keywords("scuba 다이빙").has("shopping_search", "편의점"), "경계 - 'scuba'에 cu 안 걸림"
+assert match_keywords("근처 CU 어디").first("shopping_search") == "편의점", "경계 - 'CU 어디'는 편의점"
+assert match_keywords("cu에서 컵라면").has("shopping_search", "편의점"), "경계 - 한글이 바로 붙어도 매칭 ('cu에서')"
+assert match_keywords("가까운 cvs").has("shopping_search", "편의점"), "경계 - 문장 끝 키워드"
+assert match_keywords("7-ELEVEN 해운대점").has("store_chain", "편의점"), "경계 - 하이픈 포함 키워드 ('7-ELEVEN')"
+assert match_keywords("해운대편의점").has("shopping_search", "편의점"), "경계 - 한글 키워드는 붙여 써도 매칭"
+
+# 3. 기존 분류
+assert match_keywords("근처 약국 알려줘").first("shopping_store") == "약국", "분류 - 약국"
+assert match_keywords("두통약 사고 싶어").first("shopping_product") == "약국", "분류 - 상품으로 매장 유추"
+assert match_keywords("costco 가는 길").first("shopping_brand") == "코스트코", "분류 - 브랜드"
+assert match_keywords("부산 맛집 추천").has("intent", "restaurant"), "분류 - 의도"
+assert match_keywords("처음부터 다시").has("reset"), "분류 - 초기화"
+hits = match_keywords("크림 파스타 맛집 메뉴 후기")
+assert hits.has("food", "파스타") and hits.has("food_exclude", "스테이크") and hits.has("menu_info"), "분류 - 음식/제외어/메뉴 정보 한 번에"
+
+# 4. 라벨 우선순위 = 표 순서, 키워드는 등장 순
+hits = match_keywords("이마트 옆 다이소")
+assert hits.labels("shopping_store") == ["대형마트", "다이소"], "우선순위 - 표에 먼저 적은 라벨"
+assert hits.keywords("shopping_brand") == ["이마트", "다이소"], "keywords - 텍스트 등장 순"
+
+# 5. 겹치는 키워드 모두 발견 (Aho–Corasick 실패 링크)
+matcher = KeywordMatcher({"g": {"a": ["해운", "운대", "해운대역"], "b": ["대역"]}})
+found = sorted(hit.keyword for hit in matcher.scan("부산해운대역 근처").hits)
+assert found == ["대역", "운대", "해운", "해운대역"], "Aho–Corasick - 겹치는 키워드"
+
+print("\n완료!")
@@ -0,0 +1,52 @@
+"""
+장소 카탈로그(agents/utils/place_catalog.py) 동작 테스트 (API 키 불필요)
+필드 저장/조회, 필드별 TTL, open_now 제외, 장소 LRU 정리
+
+실행: python test_place_catalog.py
+"""
+
+import os
+import time
+import tempfile
+
+from agents.utils.place_catalog import FIELD_TTL, PlaceCatalog
+
+
+def new_catalog(**options) -> PlaceCatalog:
+    return PlaceCatalog(os.path.join(tempfile.mkdtemp(), "places.db"), **options)
+
+
+print("=" * 60)
+print("🧪 장소 카탈로그 테스트")
+print("=" * 60)
+
+# 1. 필드 저장/조회 (open_now는 저장하지 않음)
+catalog = new_catalog()
+catalog.upsert("p1", "ko", {"name": "금수복국", "opening_hours": {"open_now": True, "periods": []}})
+fields = catalog.get_fields("p1", "ko", ["name", "opening_hours", "rating"])
+assert set(fields) == {"name", "opening_hours"}, "필드 - 저장한 필드만 반환"
+assert "open_now" not in fields["opening_hours"], "필드 - open_now 제거"
+assert catalog.get_fields("p1", "en", ["name"]) == {}, "필드 - 다른 language는 별도"
+
+# 2. 필드별 TTL: 평점은 만료, 이름은 유지
+original_rating_ttl = FIELD_TTL["rating"]
+FIELD_TTL["rating"] = 0.05
+catalog.upsert("p2", "ko", {"name": "톤쇼우", "rating": 4.5})
+time.sleep(0.1)
+assert catalog.get_fields("p2", "ko", ["name", "rating"]) == {"name": "톤쇼우"}, "TTL - 만료된 필드만 빠짐"
+FIELD_TTL["rating"] = original_rating_ttl
+
+# 3. LRU: 최대 장소 수를 넘으면 오래 조회되지 않은 장소부터 삭제
+catalog = new_catalog(max_places=2)
+catalog.SWEEP_EVERY_WRITES = 1
+catalog.upsert("a", "ko", {"name": "A"})
+time.sleep(0.01)
+catalog.upsert("b", "ko", {"name": "B"})
+time.sleep(0.01)
+catalog.get_fields("a", "ko", ["name"])
+catalog.upsert("c", "ko", {"name": "C"})
+assert catalog.get_fields("b", "ko", ["name"]) == {}, "LRU - 오래 조회되지 않은 장소 삭제"
+assert catalog.get_fields("a", "ko", ["name"]) == {"name": "A"}, "LRU - 최근 조회 장소 유지"
+assert catalog.stats()["places"] == 2 and catalog.stats()["evictions"] == 1, "LRU - 통계"
+
+print("\n완료!")
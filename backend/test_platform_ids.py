@@ -0,0 +1,67 @@
+"""
+숙소 이름 → 예약 플랫폼 ID 저장(agents/utils/place_catalog.py) 동작 테스트 (API 키 불필요)
+찾은 ID / 찾지 못함 TTL, 이름 정규화, LRU 정리, 숙소 이름 매칭 임계값
+
+실행: python test_platform_ids.py
+"""
+
+import os
+import time
+import tempfile
+
+from agents.utils import place_catalog
+from agents.utils.place_catalog import PlaceCatalog
+from agents.utils.entity_resolver import EntityResolver
+
+
+def new_catalog(**options) -> PlaceCatalog:
+    return PlaceCatalog(os.path.join(tempfile.mkdtemp(), "places.db"), **options)
+
+
+print("=" * 60)
+print("🧪 예약 플랫폼 ID 테스트")
+print("=" * 60)
+
+# 1. 찾은 ID / 찾지 못함 / 미조회 구분
+catalog = new_catalog()
+catalog.save_platform_id("booking", "해운대 그랜드 호텔", 12345)
+catalog.save_platform_id("booking", "없는 호텔", None)
+assert catalog.lookup_platform_id("booking", "해운대 그랜드 호텔") == (True, "12345"), "찾은 ID"
+assert catalog.lookup_platform_id("booking", "  해운대   그랜드 호텔 ") == (True, "12345"), "이름 정규화 (공백)"
+assert catalog.lookup_platform_id("booking", "없는 호텔") == (True, None), "찾지 못함도 저장"
+assert catalog.lookup_platform_id("booking", "처음 보는 호텔") == (False, None), "미조회"
+assert catalog.lookup_platform_id("agoda", "해운대 그랜드 호텔") == (False, None), "플랫폼별 분리"
+stats = catalog.stats()
+assert (stats["platform_id_hits"], stats["platform_id_negative_hits"], stats["platform_id_misses"]) == (2, 1, 2), "통계"
+assert stats["platform_ids"] == 2, "저장 개수"
+
+# 2. 찾지 못함은 더 짧은 TTL 뒤 재검색
+original_miss_ttl = place_catalog.PLATFORM_ID_MISS_TTL
+place_catalog.PLATFORM_ID_MISS_TTL = 0.05
+time.sleep(0.1)
+assert catalog.lookup_platform_id("booking", "없는 호텔") == (False, None), "찾지 못함 TTL 만료"
+assert catalog.lookup_platform_id("booking", "해운대 그랜드 호텔") == (True, "12345"), "찾은 ID는 유지"
+place_catalog.PLATFORM_ID_MISS_TTL = original_miss_ttl
+
+# 3. LRU: 최대 개수를 넘으면 오래 조회되지 않은 플랫폼 ID부터 삭제
+catalog = new_catalog(max_places=2)
+catalog.SWEEP_EVERY_WRITES = 1
+catalog.save_platform_id("booking", "a 호텔", 1)
+time.sleep(0.01)
+catalog.save_platform_id("booking", "b 호텔", 2)
+time.sleep(0.01)
+catalog.lookup_platform_id("booking", "a 호텔")
+catalog.save_platform_id("booking", "c 호텔", 3)
+assert catalog.lookup_platform_id("booking", "b 호텔") == (False, None), "LRU - 오래 조회되지 않은 항목 삭제"
+assert catalog.lookup_platform_id("booking", "a 호텔") == (True, "1"), "LRU - 최근 조회 항목 유지"
+
+# 4. 숙소 이름 매칭: 임계값 미만이면 다른 숙소 (ID를 "찾지 못함"으로 저장)
+hotels = [
+    {"name": "Paradise Hotel Busan", "dest_id": "1"},
+    {"name": "파라다이스 호텔 부산", "dest_id": "2"},
+]
+match = EntityResolver(hotels).match("파라다이스호텔 부산")
+assert match is not None and match.place["dest_id"] == "2", "매칭 - 비슷한 이름"
+assert EntityResolver(hotels).match("해운대 게스트하우스") is None, "매칭 - 임계값 미만이면 None"
+
+print("\n완료!")
@@ -0,0 +1,55 @@
+"""
+Coordinator Prompt 토큰 벤치마크
+전체 COORDINATOR_PROMPT vs 단계별 조립 Prompt의 system 토큰 수 비교 (API 호출 없음)
+"""
+
+from agents.coordinator_prompt import COORDINATOR_PROMPT, SHARED_PROMPT, compose_step_prompt
+from agents.flow_state import TravelFlowState
+from agents.utils.token_counter import count_tokens
+
+# (라벨, current_step, current_day, total_days)
+CASES = [
+    ("1 목적지", TravelFlowState.STEP_DESTINATION, 1, 0),
+    ("2 세부 지역", TravelFlowState.STEP_REGIONS, 1, 0),
+    ("3 날짜", TravelFlowState.STEP_DATES, 1, 0),
+    ("4 예산", TravelFlowState.STEP_BUDGET, 1, 3),
+    ("5 인원/출발", TravelFlowState.STEP_PEOPLE, 1, 3),
+    ("6 맛집 (1일차)", TravelFlowState.STEP_RESTAURANT, 1, 3),
+    ("6 맛집 (중간 날)", TravelFlowState.STEP_RESTAURANT, 2, 3),
+    ("6 맛집 (마지막 날)", TravelFlowState.STEP_RESTAURANT, 3, 3),
+    ("7 카페", TravelFlowState.STEP_CAFE, 1, 3),
+    ("8 숙소", TravelFlowState.STEP_ACCOMMODATION, 1, 3),
+    ("9 관광지", TravelFlowState.STEP_LANDMARK, 1, 3),
+    ("10 일정 생성", TravelFlowState.STEP_ITINERARY, 3, 3),
+]
+
+full_tokens = count_tokens(COORDINATOR_PROMPT)
+shared_tokens = count_tokens(SHARED_PROMPT)
+
+print("=" * 60)
+print("🧪 Coordinator Prompt 토큰 벤치마크")
+print("=" * 60)
+print(f"전체 Prompt: {full_tokens} 토큰")
+print(f"공통 prefix (캐시 대상): {shared_tokens} 토큰\n")
+
+print(f"{'단계':<18}{'before':>8}{'after':>8}{'절감':>8}")
+print("-" * 42)
+
+total_after = 0
+for label, step, day, total_days in CASES:
+    step_prompt = compose_step_prompt(step, current_day=day, total_days=total_days)
+    after = shared_tokens + count_tokens(step_prompt)
+    total_after += after
+    saved = 100 * (1 - after / full_tokens)
+    print(f"{label:<18}{full_tokens:>8}{after:>8}{saved:>7.1f}%")
+
+print("-" * 42)
+average_after = total_after / len(CASES)
+print(f"{'평균':<18}{full_tokens:>8}{average_after:>8.0f}{100 * (1 - average_after / full_tokens):>7.1f}%")
+
+# 단계 섹션에는 공통 prefix 내용이 섞이지 않아야 함 (중복 전송 방지)
+assert all(
+    SHARED_PROMPT not in compose_step_prompt(step, day, total_days)
+    for _, step, day, total_days in CASES
+)
+print("\n✅ 단계 섹션과 공통 prefix 분리 확인")
@@ -0,0 +1,137 @@
+"""
+요청 governor(agents/utils/request_governor.py) 동작 테스트 (API 키/네트워크 불필요)
+토큰 버킷 대기/거절, 같은 요청 합치기(sync/async), 429 Retry-After 정지, backoff_delay
+
+실행: python test_request_governor.py
+"""
+
+import time
+import asyncio
+import threading
+
+from agents.utils.request_governor import RateLimitExceeded, Upstream, backoff_delay
+
+
+class FakeResponse:
+    """429 응답 대용"""
+
+    def __init__(self, status_code: int, retry_after: str = None):
+        self.status_code = status_code
+        self.headers = {"Retry-After": retry_after} if retry_after else {}
+
+
+print("=" * 60)
+print("🧪 요청 governor 테스트")
+print("=" * 60)
+
+# 1. 토큰 버킷: 버스트까지는 바로, 그 뒤로는 rate에 맞춰 대기
+upstream = Upstream("test_bucket", rate=20, burst=2)
+start = time.perf_counter()
+for _ in range(4):
+    upstream.call(lambda: None)
+elapsed = time.perf_counter() - start
+stats = upstream.stats()
+assert 0.08 <= elapsed < 0.5, "토큰 버킷 - 버스트 초과분은 대기 (2개 × 50ms)"
+assert stats["throttled"] == 2 and stats["calls"] == 4, "토큰 버킷 - throttled 통계"
+
+# 2. max_wait를 넘는 대기는 거절
+upstream = Upstream("test_reject", rate=1, burst=1, max_wait=0.1)
+upstream.call(lambda: None)
+try:
+    upstream.call(lambda: None)
+    rejected = False
+except RateLimitExceeded:
+    rejected = True
+assert rejected and upstream.stats()["rejected"] == 1, "max_wait 초과 - RateLimitExceeded"
+
+# 3. single-flight (sync): 같은 key 동시 요청은 한 번만 호출, 결과는 호출자별 복사본
+upstream = Upstream("test_flight", rate=100, burst=100)
+calls = []
+
+
+def slow_fetch():
+    calls.append(1)
+    time.sleep(0.1)
+    return {"items": [1, 2]}
+
+
+results = []
+threads = [
+    threading.Thread(target=lambda: results.append(upstream.call(slow_fetch, key="same")))
+    for _ in range(5)
+]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert len(calls) == 1 and upstream.stats()["coalesced"] == 4, "single-flight - 한 번만 호출"
+assert all(result == {"items": [1, 2]} for result in results), "single-flight - 모두 같은 결과"
+assert len({id(result) for result in results}) == 5, "single-flight - 결과는 서로 다른 객체"
+
+# 4. single-flight 에러는 대기자에게도 전달
+upstream = Upstream("test_flight_error", rate=100, burst=100)
+
+
+def failing_fetch():
+    time.sleep(0.1)
+    raise ValueError("boom")
+
+
+errors = []
+
+
+def call_failing():
+    try:
+        upstream.call(failing_fetch, key="same")
+    except ValueError as e:
+        errors.append(e)
+
+
+threads = [threading.Thread(target=call_failing) for _ in range(3)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert len(errors) == 3 and upstream.stats()["calls"] == 1, "single-flight - 에러도 공유"
+
+# 5. single-flight (async)
+upstream = Upstream("test_async_flight", rate=100, burst=100)
+async_calls = []
+
+
+async def aslow_fetch(value):
+    async_calls.append(value)
+    await asyncio.sleep(0.05)
+    return {"value": value}
+
+
+async def run_async_flight():
+    return await asyncio.gather(*[upstream.acall(aslow_fetch, 7, key="same") for _ in range(4)])
+
+
+async_results = asyncio.run(run_async_flight())
+assert async_calls == [7], "async single-flight - 한 번만 호출"
+assert all(result == {"value": 7} for result in async_results), "async single-flight - 모두 같은 결과"
+
+# 6. 429 응답: Retry-After 동안 버킷 정지
+upstream = Upstream("test_429", rate=100, burst=100, max_wait=0.5)
+upstream.call(lambda: FakeResponse(429, retry_after="5"))
+try:
+    upstream.call(lambda: None)
+    paused = False
+except RateLimitExceeded:
+    paused = True
+assert paused and upstream.stats()["rate_limited"] == 1, "429 - Retry-After 동안 정지 (max_wait 넘으면 거절)"
+
+upstream = Upstream("test_429_short", rate=100, burst=100)
+upstream.call(lambda: FakeResponse(429, retry_after="0.1"))
+start = time.perf_counter()
+upstream.call(lambda: None)
+assert time.perf_counter() - start >= 0.08, "429 - Retry-After 후 재개"
+
+# 7. backoff_delay: 지수 증가 + jitter, 상한 적용
+delays = [backoff_delay(attempt, base=1, cap=8) for attempt in range(6)]
+assert all(2 ** min(i, 3) / 2 <= d <= 2 ** min(i, 3) for i, d in enumerate(delays)), "backoff_delay - 각 시도 범위 안"
+assert max(backoff_delay(10, base=1, cap=8) for _ in range(50)) <= 8, "backoff_delay - 상한"
+
+print("\n완료!")
@@ -0,0 +1,78 @@
+"""
+공간 인덱스(agents/utils/spatial_index.py) 동작 테스트 (API 키 불필요)
+커버 표시 조건, 로컬 반경 검색, k-최근접 검색, LRU 제거
+
+실행: python test_spatial_index.py
+"""
+
+from agents.utils.spatial_index import PAGE_SIZE, SpatialIndex, haversine
+
+# 부산 해운대 근처
+CENTER = (35.1587, 129.1604)
+
+
+def make_places(count: int, prefix: str, step: float = 0.002, reviews: int = 100):
+    """중심에서 북동쪽으로 step도 간격으로 늘어선 장소"""
+    return [
+        {
+            "place_id": f"{prefix}{i}",
+            "name": f"{prefix} {i}",
+            "geometry": {"location": {"lat": CENTER[0] + step * i, "lng": CENTER[1] + step * i}},
+            "types": ["hospital"],
+            "user_ratings_total": reviews - i,
+            "opening_hours": {"open_now": True},
+        }
+        for i in range(count)
+    ]
+
+
+print("=" * 60)
+print("🧪 공간 인덱스 테스트")
+print("=" * 60)
+
+# 1. 꽉 찬 페이지(20개)는 커버 표시하지 않음
+#    5km 검색 결과 20개 중 1km 안에 2개뿐이어도, 1km 재검색은 네트워크로 가야 한다
+index = SpatialIndex()
+index.add(make_places(PAGE_SIZE, "far", step=0.01), "hospital", "ko", covered=(*CENTER, 5000))
+assert index.query_radius(*CENTER, 1000, "hospital", "ko") is None, "꽉 찬 페이지 - 좁은 반경 재검색은 로컬 응답 안 함"
+assert index.query_radius(*CENTER, 5000, "hospital", "ko") is None, "꽉 찬 페이지 - 같은 반경도 로컬 응답 안 함"
+
+# 2. 완전한 응답(20개 미만)은 커버 → 더 좁은 반경은 로컬 응답
+index = SpatialIndex()
+index.add(make_places(5, "near"), "hospital", "ko", covered=(*CENTER, 5000))
+results = index.query_radius(*CENTER, 1000, "hospital", "ko")
+inside = [p for p in make_places(5, "near")
+          if haversine(*CENTER, *p["geometry"]["location"].values()) <= 1000]
+assert results is not None and len(results) == len(inside), "완전한 응답 - 좁은 반경 로컬 응답"
+assert results is not None and results[0]["place_id"] == "near0", "완전한 응답 - 리뷰 수 순 정렬"
+
+# 3. 커버 영역 밖으로 나가면 miss
+assert index.query_radius(*CENTER, 8000, "hospital", "ko") is None, "커버 밖 반경은 miss"
+assert index.query_radius(*CENTER, 1000, "pharmacy", "ko") is None, "다른 type은 miss"
+assert index.query_radius(*CENTER, 1000, "hospital", "en") is None, "다른 language는 miss"
+
+# 4. 결과 0개도 커버 (빈 지역) → ZERO_RESULTS를 로컬에서 응답
+index = SpatialIndex()
+index.add([], "hospital", "ko", covered=(*CENTER, 3000))
+assert index.query_radius(*CENTER, 1000, "hospital", "ko") == [], "0개 응답 - 빈 결과 로컬 응답"
+
+# 5. covered 없이 추가한 장소(다음 페이지가 있던 응답)는 저장만 하고 커버하지 않음
+index = SpatialIndex()
+index.add(make_places(3, "paged"), "hospital", "ko", covered=None)
+assert index.query_radius(*CENTER, 1000, "hospital", "ko") is None, "covered 없음 - 로컬 응답 안 함"
+assert index.stats()["places"] == 3, "covered 없음 - 장소는 저장"
+
+# 6. k-최근접
+index = SpatialIndex()
+index.add(make_places(5, "near"), "hospital", "ko", covered=(*CENTER, 5000))
+nearest = index.nearest(*CENTER, 2, "hospital", "ko", max_radius=3000)
+assert nearest is not None and [p["place_id"] for _, p in nearest] == ["near0", "near1"], "nearest - 가까운 순 k개"
+assert nearest is not None and nearest[0][0] <= nearest[1][0], "nearest - 거리 오름차순"
+
+# 7. LRU: 최대 장소 수를 넘으면 오래 사용하지 않은 타일부터 제거
+index = SpatialIndex(max_places=3)
+index.add(make_places(5, "lru", step=0.02), "hospital", "ko")
+stats = index.stats()
+assert stats["places"] <= 3 and stats["evictions"] == 2, "LRU - 최대 장소 수 유지"
+
+print("\n완료!")